@@ -109,7 +109,9 @@ from edgar.storage import (
     cleanup_storage,
     clear_cache,
     download_edgar_data,
+    download_filing_index,
     download_filings,
+    fetch_filings,
     is_using_datamule_storage,
     is_using_local_storage,
     optimize_storage,
@@ -260,7 +262,7 @@ __all__ = [
 
     # -- Local and cloud storage ---------------------------------------------
     "use_local_storage", "is_using_local_storage", "set_local_storage_path",
-    "download_edgar_data", "download_filings",
+    "download_edgar_data", "download_filings", "download_filing_index", "fetch_filings",
     "use_cloud_storage", "is_cloud_storage_enabled", "sync_to_cloud",
     "use_datamule_storage", "is_using_datamule_storage",
     "storage_info", "StorageInfo", "analyze_storage", "StorageAnalysis",
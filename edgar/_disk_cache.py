@@ -0,0 +1,145 @@
+"""
+The on-disk side of edgartools' persistent caches.
+
+XBRLCache and DocumentCache decide what goes into an entry and how it is read
+back. Both keep one file per entry in a directory, bounded in total bytes, and
+evict the least recently used entries first; that part lives here.
+"""
+
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import BinaryIO, Callable, List, Optional, Tuple
+
+log = logging.getLogger(__name__)
+
+__all__ = ['DiskLRU']
+
+
+class DiskLRU:
+    """
+    Entry files in one directory, bounded in total size, least recently used evicted first.
+
+    Writes keep a running total of the bytes on disk, so the directory is only
+    scanned once the cache may be over its limit. The scan also corrects the
+    total for entries written or deleted by other processes.
+
+    Parameters:
+        directory: Directory holding the entries
+        suffix: File suffix that marks an entry
+        max_size_bytes: Total size the entries may grow to before evicting
+        name: What the entries are, for log messages
+    """
+
+    def __init__(self, directory: Path, suffix: str, max_size_bytes: int, name: str = 'cache'):
+        self.directory = Path(directory)
+        self.suffix = suffix
+        self.max_size_bytes = max_size_bytes
+        self.name = name
+        self._lock = threading.Lock()
+        # Running total of the bytes on disk. None until first needed.
+        self._size: Optional[int] = None
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def write(self, path: Path, write: Callable[[BinaryIO], None]) -> None:
+        """
+        Write an entry through a temporary file, so readers never see part of one,
+        then evict if the cache went over its limit.
+
+        Raises:
+            OSError: If the entry could not be written
+        """
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            replaced_size = path.stat().st_size
+        except OSError:
+            replaced_size = 0
+        try:
+            with open(temp_path, 'wb') as f:
+                write(f)
+            size = temp_path.stat().st_size
+            os.replace(temp_path, path)
+        except OSError:
+            self.delete(temp_path)
+            raise
+
+        with self._lock:
+            if self._size is None:
+                self._size = sum(stat.st_size for _, stat in self._stat_entries())
+            else:
+                self._size += size - replaced_size
+            over_limit = self._size > self.max_size_bytes
+        if over_limit:
+            self.evict()
+
+    @staticmethod
+    def touch(path: Path) -> None:
+        """Mark an entry as just used."""
+        # The modification time is the LRU clock; access times are unreliable on noatime mounts
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def evict(self) -> int:
+        """
+        Delete least recently used entries until the cache fits in max_size_bytes.
+
+        Returns:
+            The number of entries deleted
+        """
+        with self._lock:
+            entries = []
+            total = 0
+            for entry, stat in self._stat_entries():
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+
+            deleted = 0
+            if total > self.max_size_bytes:
+                for _, size, path in sorted(entries):
+                    if total <= self.max_size_bytes:
+                        break
+                    if self.delete(Path(path)):
+                        total -= size
+                        deleted += 1
+                log.debug("Evicted %d %s entries", deleted, self.name)
+            self._size = total
+            return deleted
+
+    def clear(self) -> None:
+        """Delete every entry."""
+        with self._lock:
+            for entry in self.scan():
+                self.delete(Path(entry.path))
+            self._size = None
+
+    def sizes(self) -> List[int]:
+        """The size in bytes of each entry."""
+        return [stat.st_size for _, stat in self._stat_entries()]
+
+    def scan(self) -> List[os.DirEntry]:
+        try:
+            with os.scandir(self.directory) as it:
+                return [entry for entry in it if entry.name.endswith(self.suffix) and entry.is_file()]
+        except OSError:
+            return []
+
+    def _stat_entries(self) -> List[Tuple[os.DirEntry, os.stat_result]]:
+        """Each entry with its stat, skipping entries another process removed since the scan."""
+        entries = []
+        for entry in self.scan():
+            try:
+                entries.append((entry, entry.stat()))
+            except OSError:
+                continue
+        return entries
+
+    @staticmethod
+    def delete(path: Path) -> bool:
+        try:
+            path.unlink()
+            return True
+        except OSError:
+            return False
@@ -29,6 +29,7 @@ from rich.status import Status
 from rich.table import Table
 from rich.text import Text
 
+from edgar._filings_lookup import FilingsLookup, intersect_rows
 from edgar._markdown import text_to_markdown
 from edgar._party import Address
 from edgar.attachments import Attachment, Attachments, AttachmentServer, FilingHomepage
@@ -63,9 +64,9 @@ from edgar.files.htmltools import html_sections
 from edgar.files.markdown import to_markdown
 from edgar.filesystem import EdgarPath
 from edgar.filtering import filter_by_accession_number, filter_by_cik, filter_by_date, filter_by_exchange, \
-    filter_by_form, filter_by_ticker
+    expand_forms, filter_by_form, filter_by_ticker
 from edgar.headers import FilingDirectory, IndexHeaders
-from edgar.httprequests import UNREACHABLE_ERRORS, download_file, download_text, download_text_between_tags, is_unreachable
+from edgar.httprequests import MAX_CONCURRENT_DOWNLOADS, UNREACHABLE_ERRORS, download_file, download_text, download_text_between_tags, is_unreachable
 from edgar.reference import describe_form
 from edgar.reference.tickers import Exchange, find_ticker, find_ticker_safe
 from edgar.richtools import Docs, print_rich, repr_rich
@@ -320,24 +321,52 @@ COMPANY_INDEX_FORM_COLUMN = -4
 INDEX_COLUMN_NAMES = ['form', 'company', 'cik', 'filing_date', 'accession_number']
 
 
-def read_fixed_width_index(index_text: str,
+def _index_data_lines(index_text: Union[str, bytes]) -> pa.Array:
+    """
+    Split the data lines of a fixed width index into an arrow string array.
+
+    The header, up to and including the line of dashes, is skipped. The line
+    offsets are found with numpy and the array is built directly over the raw
+    bytes, so no Python string is created per line.
+    """
+    buffer = index_text.encode() if isinstance(index_text, str) else bytes(index_text)
+    # Find where the data starts
+    start = 0
+    dashes = 0 if buffer.startswith(b"-----") else buffer.find(b"\n-----")
+    if dashes != -1:
+        header_end = buffer.find(b"\n", dashes + 1)
+        start = header_end + 1 if header_end != -1 else len(buffer)
+    end = len(buffer)
+    while end > start and buffer[end - 1] == ord("\n"):
+        end -= 1
+    if end == start:
+        return pa.array([], type=pa.string())
+
+    # Each line runs from one line start to the next, so keeps its newline until trimmed
+    data = np.frombuffer(buffer, dtype=np.uint8, count=end - start, offset=start)
+    newlines = np.flatnonzero(data == ord("\n"))
+    large = end - start >= 2 ** 31
+    offsets = np.empty(len(newlines) + 2, dtype=np.int64 if large else np.int32)
+    offsets[0] = 0
+    offsets[1:-1] = newlines + 1
+    offsets[-1] = end - start
+    lines = pa.Array.from_buffers(pa.large_string() if large else pa.string(),
+                                  len(offsets) - 1,
+                                  [None, pa.py_buffer(offsets), pa.py_buffer(buffer).slice(start, end - start)])
+    if not isinstance(index_text, str):
+        lines.validate(full=True)
+    return pc.utf8_rtrim(lines, characters="\n")
+
+
+def read_fixed_width_index(index_text: Union[str, bytes],
                            file_specs: FileSpecs) -> pa.Table:
     """
     Read the index text as a fixed width file
-    :param index_text: The index text as downloaded from SEC Edgar
+    :param index_text: The index text or raw bytes as downloaded from SEC Edgar
     :param file_specs: The file specs containing the column definitions
     :return:
     """
-    # Treat as a single array
-    lines = index_text.rstrip('\n').split('\n')
-    # Find where the data starts
-    data_start = 0
-    for index, line in enumerate(lines):
-        if line.startswith("-----"):
-            data_start = index + 1
-            break
-    data_lines = lines[data_start:]
-    array = pa.array(data_lines)
+    array = _index_data_lines(index_text)
 
     # Then split into separate arrays by file specs
     arrays = [
@@ -365,51 +394,54 @@ def read_fixed_width_index(index_text: str,
     )
 
 
-def read_index_file(index_text: str,
+def read_index_file(index_text: Union[str, bytes],
                     form_column: int = FORM_INDEX_FORM_COLUMN,
                     filing_date_format: str = "%Y-%m-%d") -> pa.Table:
     """
     Read the index text using multiple spaces as delimiter
+
+    Every step runs as an arrow compute kernel over all the lines at once, so a
+    quarterly index of several hundred thousand lines is parsed without a Python loop.
     """
-    # Split into lines and find the data start
-    lines = index_text.rstrip('\n').split('\n')
-    data_start = 0
-    for index, line in enumerate(lines):
-        if line.startswith("-----"):
-            data_start = index + 1
-            break
-
-    # Process data lines
-    data_lines = lines[data_start:]
-
-    # Handle empty lines
-    if not data_lines:
+    lines = pc.utf8_trim_whitespace(_index_data_lines(index_text))
+    lines = lines.filter(pc.not_equal(lines, ""))
+    if len(lines) == 0:
         return _empty_filing_index()
 
-    # The form and company name can both contain spaces the remaining fields cannot.
-    # It is assumed that the form will only contain runs of a single space (e.g. "1-A POS")
-    # so splitting on runs of 2 spaces or more will keep form names intact.
-    rows = [re.split(index_field_delimiter_re, line.strip()) for line in data_lines if line.strip()]
-
-    # Form names are in a different column depending on the index type.
-    forms = pa.array([row[form_column] for row in rows])
+    # The CIK, date and file name never contain spaces, so they are split off the end of each line
+    fields = pc.ascii_split_whitespace(lines, max_splits=3, reverse=True)
+    if pc.min(pc.list_value_length(fields)).as_py() < 4:
+        bad_line = lines.filter(pc.less(pc.list_value_length(fields), 4))[0].as_py()
+        raise ValueError(f"Cannot read the index line {bad_line!r}")
 
     # CIKs are always the third-to-last field
-    ciks = pa.array([int(row[-3]) for row in rows], type=pa.int32())
+    ciks = pc.cast(pc.list_element(fields, 1), pa.int32())
 
     # Dates are always second-to-last field
-    dates = pc.strptime(pa.array([row[-2] for row in rows]), filing_date_format, 'us')
+    dates = pc.strptime(pc.list_element(fields, 2), filing_date_format, 'us')
     dates = pc.cast(dates, pa.date32())
 
     # Accession numbers are in the file path
-    accession_numbers = pa.array([row[-1][-24:-4] for row in rows])
+    accession_numbers = pc.utf8_slice_codeunits(pc.list_element(fields, 3), start=-24, stop=-4)
 
-    # Company names may have runs of more than one space so anything which hasn't already
-    # been extracted is concatenated to form the company name.
+    # The form and company name can both contain spaces the remaining fields cannot.
+    # It is assumed that the form will only contain runs of a single space (e.g. "1-A POS")
+    # so the first run of 2 spaces or more after the form (or the last before it) separates the two.
+    # Padding with a separator means a line without a company name still splits into two parts.
+    names = pc.list_element(fields, 0)
     if form_column == 0:
-        companies = pa.array([" ".join(row[1:-3]) for row in rows])
+        names = pc.split_pattern(pc.binary_join_element_wise(names, "  ", ""), "  ", max_splits=1)
+        forms, companies = pc.list_element(names, 0), pc.list_element(names, 1)
     else:
-        companies = pa.array([" ".join(row[0:form_column]) for row in rows])
+        names = pc.split_pattern(pc.binary_join_element_wise("  ", names, ""), "  ", max_splits=1, reverse=True)
+        companies, forms = pc.list_element(names, 0), pc.list_element(names, 1)
+
+    # Company names may have runs of more than one space, which are collapsed to one
+    companies = pc.utf8_trim_whitespace(companies)
+    spaced = pc.match_substring(companies, "  ")
+    if pc.any(spaced).as_py():
+        collapsed = pc.replace_substring_regex(companies.filter(spaced), pattern=" {2,}", replacement=" ")
+        companies = pc.replace_with_mask(companies, spaced, collapsed)
 
     return pa.Table.from_arrays(
         [forms, companies, ciks, dates, accession_numbers],
@@ -471,7 +503,7 @@ def fetch_daily_filing_index(date: str,
                              index: str = 'form'):
     year, month, day = date.split("-")
     quarter = (int(month) - 1) // 3 + 1
-    url = build_daily_index_url(int(year), quarter, date.replace("-", ""), "idx")
+    url = build_daily_index_url(int(year), quarter, f"{index}.{date.replace('-', '')}", "idx")
     index_table = fetch_filing_index_at_url(url, index, filing_date_format='%Y%m%d')
     return index_table
 
@@ -511,26 +543,56 @@ def _empty_filing_index():
 
 
 def get_filings_for_quarters(year_and_quarters: YearAndQuarters,
-                             index="form") -> pa.Table:
+                             index="form",
+                             forms: Optional[List[str]] = None,
+                             ciks: Optional[List[int]] = None) -> pa.Table:
     """
     Get the filings for the quarters
+
+    Quarters held in the local filing index warehouse (see edgar.storage.download_filing_index)
+    are read from disk with forms and ciks pushed down into the scan. Other quarters are
+    downloaded, and added to the warehouse if there is one. forms and ciks only narrow what
+    is read from the warehouse, so callers still filter the result.
+
     :param year_and_quarters:
     :param index: The index to use - "form", "company", or "xbrl"
+    :param forms: Exact form names the caller will filter to
+    :param ciks: CIKs the caller will filter to
     :return: The filings as a pyarrow table
     """
+    from edgar.storage._filing_index import (
+        is_filing_index_warehoused,
+        read_filing_index,
+        store_quarter,
+        warehouse_quarters,
+    )
 
-    if len(year_and_quarters) == 1:
-        _, final_index_table = fetch_filing_index(year_and_quarter=year_and_quarters[0],
-                                                  index=index)
-    else:
+    local_quarters = warehouse_quarters(year_and_quarters, index=index)
+    remote_quarters = [yq for yq in year_and_quarters if yq not in local_quarters]
+
+    index_tables = []
+    if local_quarters:
+        index_tables.append(read_filing_index(local_quarters, index=index, forms=forms, ciks=ciks))
+
+    if len(remote_quarters) == 1:
+        quarters_and_indexes = [fetch_filing_index(year_and_quarter=remote_quarters[0], index=index)]
+    elif remote_quarters:
         quarters_and_indexes = parallel_thread_map(
             lambda yq: fetch_filing_index(year_and_quarter=yq, index=index),
-            year_and_quarters
+            remote_quarters
         )
-        quarter_and_indexes_sorted = sorted(quarters_and_indexes, key=lambda d: d[0])
-        index_tables = [fd[1] for fd in quarter_and_indexes_sorted]
-        final_index_table: pa.Table = pa.concat_tables(index_tables, mode="default")
-    return final_index_table
+    else:
+        quarters_and_indexes = []
+
+    quarter_and_indexes_sorted = sorted(quarters_and_indexes, key=lambda d: d[0])
+    if quarter_and_indexes_sorted and is_filing_index_warehoused(index):
+        for year_and_quarter, index_table in quarter_and_indexes_sorted:
+            store_quarter(index, year_and_quarter, index_table)
+    index_tables.extend(fd[1] for fd in quarter_and_indexes_sorted)
+
+    if len(index_tables) == 1:
+        return index_tables[0]
+    return pa.concat_tables(index_tables, mode="default")
 
 
 class Filings:
@@ -546,11 +608,30 @@ class Filings:
         # This keeps track of where the index should start in case this is just a page in the Filings
         self._original_state = original_state or PagingState(0, len(self.data))
         self._hash = None
+        self._filings_lookup: Optional[FilingsLookup] = None
 
     @property
     def docs(self):
         return Docs(self)
 
+    @property
+    def _lookup(self) -> FilingsLookup:
+        """The accession number, cik and form indexes over this filing index, built as they are needed"""
+        lookup = getattr(self, '_filings_lookup', None)
+        if lookup is None or lookup.data is not self.data:
+            self._filings_lookup = FilingsLookup(self.data)
+        return self._filings_lookup
+
+    def _taken(self, filings: 'Filings', positions) -> 'Filings':
+        """Carry the indexes over to filings taken from this filing index at these row positions"""
+        filings._filings_lookup = self._lookup.take(positions, filings.data)
+        return filings
+
+    def _sliced(self, filings: 'Filings', offset: int) -> 'Filings':
+        """Carry the indexes over to filings sliced from this filing index at this offset"""
+        filings._filings_lookup = self._lookup.slice(offset, filings.data)
+        return filings
+
     def to_pandas(self, *columns) -> pd.DataFrame:
         """Return the filing index as a python dataframe"""
         df = self.data.to_pandas()
@@ -591,6 +672,39 @@ class Filings:
                          upload_to_cloud=upload_to_cloud,
                          disable_progress=disable_progress)
 
+    def fetch_all(self, data_directory: Optional[str] = None,
+                  overwrite_existing: bool = False,
+                  compress: bool = True,
+                  compression_level: int = 6,
+                  max_concurrent: Optional[int] = None,
+                  disable_progress: bool = False):
+        """
+        Download the full submission of each of these filings into local storage.
+
+        Unlike `download()`, which extracts the daily feed archives covering these filings,
+        this fetches only the submissions themselves, concurrently and within the SEC rate limit.
+        Progress is checkpointed, so running it again after an interruption resumes the job.
+
+        Args:
+            data_directory: Directory to save the submissions. Defaults to the Edgar data directory.
+            overwrite_existing: If True, download submissions that are already stored. Default is False.
+            compress: Whether to gzip the submissions. Default is True.
+            compression_level: Compression level for gzip (1-9). Default is 6.
+            max_concurrent: The most submissions downloaded at once.
+            disable_progress: If True, suppress the progress bar. Default is False.
+
+        Returns:
+            FetchResult: Counts, failures and throughput for the job
+        """
+        from edgar.storage import fetch_filings
+        return fetch_filings(self,
+                             data_directory=data_directory,
+                             overwrite_existing=overwrite_existing,
+                             compress=compress,
+                             compression_level=compression_level,
+                             max_concurrent=max_concurrent or MAX_CONCURRENT_DOWNLOADS,
+                             disable_progress=disable_progress)
+
     def get_filing_at(self, item: int, enrich: bool = True):
         """Get filing at index, optionally enriching with related entities"""
         # Get the primary filing data
@@ -647,7 +761,7 @@ class Filings:
         sort_indices = pc.sort_indices(self.data, sort_keys=[("filing_date", "descending")])
         sort_indices_top = sort_indices[:min(n, len(sort_indices))]
         latest_filing_index = pc.take(data=self.data, indices=sort_indices_top)
-        filings = Filings(latest_filing_index)
+        filings = self._taken(Filings(latest_filing_index), sort_indices_top.to_numpy())
 
         # Warn if data appears stale (>1 day old)
         if len(filings) > 0:
@@ -704,10 +818,31 @@ class Filings:
         if isinstance(forms, list):
             forms = [str(f) for f in forms]
 
+        # Answer the form, cik and accession number filters from the column indexes once they are built.
+        # The rows found are positions in self.data, so they are taken before any of the scans below
+        indexed_rows: Dict[str, np.ndarray] = {}
+        if filing_index.num_rows > 0:
+            lookup_values = {
+                'form': expand_forms(forms, amendments=amendments if amendments is not None else False)
+                if forms else None,
+                'cik': listify(cik) if cik else None,
+                'accession_number': listify(accession_number) if accession_number else None,
+            }
+            for column, values in lookup_values.items():
+                if values is not None:
+                    rows = self._lookup.rows_for(column, values)
+                    if rows is not None:
+                        indexed_rows[column] = rows
+        selected_rows = None
+        if indexed_rows:
+            selected_rows = intersect_rows(list(indexed_rows.values()))
+            filing_index = filing_index.take(selected_rows)
+
         # Filter by form
         if forms:
-            filing_index = filter_by_form(filing_index, form=forms,
-                                          amendments=amendments if amendments is not None else False)
+            if 'form' not in indexed_rows:
+                filing_index = filter_by_form(filing_index, form=forms,
+                                              amendments=amendments if amendments is not None else False)
         elif amendments is not None and filing_index.num_rows > 0:
             # Get the unique values of the form as a pylist
             forms = list(set([form.replace("/A", "") for form in pc.unique(filing_index['form']).to_pylist()]))
@@ -728,7 +863,7 @@ class Filings:
                 return Filings(_empty_filing_index())
 
         # Filter by cik
-        if cik:
+        if cik and 'cik' not in indexed_rows:
             filing_index = filter_by_cik(filing_index, cik)
 
         # Filter by exchange
@@ -745,10 +880,16 @@ class Filings:
             filing_index = filter_by_ticker(filing_index, ticker)
 
         # Filter by accession number
-        if accession_number:
+        if accession_number and 'accession_number' not in indexed_rows:
             filing_index = filter_by_accession_number(filing_index, accession_number=accession_number)
 
-        return Filings(filing_index)
+        filings = Filings(filing_index)
+        # The indexes carry over when the rows are known, i.e. when no scan removed any of the selected rows
+        if filing_index is self.data:
+            filings._filings_lookup = self._lookup
+        elif selected_rows is not None and filing_index.num_rows == len(selected_rows):
+            self._taken(filings, selected_rows)
+        return filings
 
     def _head(self, n):
         assert n > 0, "The number of filings to select - `n`, should be greater than 0"
@@ -757,7 +898,7 @@ class Filings:
     def head(self, n: int):
         """Get the first n filings"""
         selection = self._head(n)
-        return Filings(selection)
+        return self._sliced(Filings(selection), 0)
 
     def _tail(self, n):
         assert n > 0, "The number of filings to select - `n`, should be greater than 0"
@@ -766,7 +907,7 @@ class Filings:
     def tail(self, n: int):
         """Get the last n filings"""
         selection = self._tail(n)
-        return Filings(selection)
+        return self._sliced(Filings(selection), len(self.data) - len(selection))
 
     def _sample(self, n: int):
         assert len(self) >= n > 0, \
@@ -794,7 +935,7 @@ class Filings:
             return None
         start_index, _ = self.data_pager._current_range
         filings_state = PagingState(page_start=start_index, num_records=len(self))
-        return Filings(data_page, original_state=filings_state)
+        return self._sliced(Filings(data_page, original_state=filings_state), start_index)
 
     def previous(self):
         """
@@ -807,11 +948,18 @@ class Filings:
             return None
         start_index, _ = self.data_pager._current_range
         filings_state = PagingState(page_start=start_index, num_records=len(self))
-        return Filings(data_page, original_state=filings_state)
+        return self._sliced(Filings(data_page, original_state=filings_state), start_index)
 
-    def _get_by_accession_number(self, accession_number: str):
+    def _index_of_accession_number(self, accession_number: str) -> int:
+        """The row of the first filing with this accession number or -1 if there is none"""
+        rows = self._lookup.rows_for('accession_number', [accession_number])
+        if rows is not None:
+            return int(rows[0]) if len(rows) > 0 else -1
         mask = pc.equal(self.data['accession_number'], accession_number)
-        idx = mask.index(True).as_py()
+        return mask.index(True).as_py()
+
+    def _get_by_accession_number(self, accession_number: str):
+        idx = self._index_of_accession_number(accession_number)
         if idx > -1:
             return self.get_filing_at(idx)
 
@@ -832,8 +980,7 @@ class Filings:
             return self.get_filing_at(int(index_or_accession_number))
         else:
             accession_number = index_or_accession_number.strip()
-            mask = pc.equal(self.data['accession_number'], accession_number)
-            idx = mask.index(True).as_py()
+            idx = self._index_of_accession_number(accession_number)
             if idx > -1:
                 return self.get_filing_at(idx)
             if not accession_number_re.match(accession_number):
@@ -862,7 +1009,7 @@ class Filings:
                 return [self.get_filing_at(i) for i in range(start, stop, step)]
             length = max(0, stop - start)
             sliced_data = self.data.slice(start, length)
-            return Filings(sliced_data)
+            return self._sliced(Filings(sliced_data), start)
         return self.get_filing_at(item)
 
     def __len__(self):
@@ -1219,20 +1366,15 @@ def sort_filings_by_priority(filing_table: pa.Table,
         priority_forms = ['10-Q', '10-Q/A', '10-K', '10-K/A', '8-K', '8-K/A',
                           '6-K', '6-K/A', '13F-HR', '144', '4', 'D', 'SC 13D', 'SC 13G']
 
-    # Create form priority values
-    forms_array = filing_table['form']
-    priorities = []
-    for form_type in forms_array.to_pylist():
-        try:
-            priority = priority_forms.index(form_type)
-        except ValueError:
-            priority = len(priority_forms)
-        priorities.append(priority)
+    # Create form priority values: the position in priority_forms, or after all of them
+    priorities = pc.fill_null(
+        pc.index_in(filing_table['form'], value_set=pa.array(priority_forms, type=pa.string())),
+        len(priority_forms))
 
     # Add priority column
     with_priority = filing_table.append_column(
         'form_priority',
-        pa.array(priorities, type=pa.int32())
+        pc.cast(priorities, pa.int32())
     )
 
     # Sort by date (descending), priority (ascending), form name (ascending)
@@ -1252,7 +1394,8 @@ def get_filings(year: Optional[Years] = None,
                 amendments: bool = True,
                 filing_date: Optional[str] = None,
                 index="form",
-                priority_sorted_forms: Optional[List[str]] = None) -> Optional[Filings]:
+                priority_sorted_forms: Optional[List[str]] = None,
+                cik: Optional[Union[IntString, List[IntString]]] = None) -> Optional[Filings]:
     """
     Downloads the filing index for a given year or list of years, and a quarter or list of quarters.
 
@@ -1289,6 +1432,11 @@ def get_filings(year: Optional[Years] = None,
     >>> filings_ = get_filings(2021, 4, filing_date="2021-10-01:2021-10-10") # Get filings for 2021 Q4 between
                                                                             # "2021-10-01" and "2021-10-10"
 
+    >>> filings_ = get_filings(range(1995, 2025), form="10-K", cik=320193) # Apple's 10-Ks over 30 years
+
+    With a local filing index warehouse (see edgar.storage.download_filing_index) the quarters
+    are read from disk instead of downloaded, so queries across decades need no network.
+
     For today's filings:
     >>> from edgar import get_current_filings
     >>> current = get_current_filings(form="10-K", page_size=None)  # All current filings
@@ -1302,6 +1450,7 @@ def get_filings(year: Optional[Years] = None,
                 e.g. filing_date="2022-01-17" or filing_date="2022-01-17:2022-02-28"
     :param index The index type - "form" or "company" or "xbrl"
     :param priority_sorted_forms: A list of forms to sort by priority. This presents these forms first for each day.
+    :param cik The CIK or list of CIKs to filter by
     :return:
     """
     # Check if defaults were used
@@ -1311,7 +1460,8 @@ def get_filings(year: Optional[Years] = None,
                      amendments is True and
                      filing_date is None and
                      index == "form" and
-                     priority_sorted_forms is None)
+                     priority_sorted_forms is None and
+                     cik is None)
     if filing_date:
         if not is_valid_filing_date(filing_date):
             print_warning(
@@ -1337,12 +1487,14 @@ def get_filings(year: Optional[Years] = None,
             f"Valid range: 1993-{datetime.now().year}, quarters 1-4. Example: get_filings(2023, 1)"
         )
         return None
-    filing_index = get_filings_for_quarters(year_and_quarters, index=index)
+    filing_index = get_filings_for_quarters(year_and_quarters, index=index,
+                                            forms=expand_forms(form, amendments=amendments) if form else None,
+                                            ciks=[int(c) for c in listify(cik)] if cik else None)
 
     filings = Filings(filing_index)
 
-    if form or filing_date:
-        filings = filings.filter(form=form, amendments=amendments, filing_date=filing_date)
+    if form or filing_date or cik:
+        filings = filings.filter(form=form, amendments=amendments, filing_date=filing_date, cik=cik)
 
     # Warn if using defaults and data appears stale
     if defaults_used and filings and len(filings) > 0:
@@ -1849,12 +2001,25 @@ class Filing:
             This method is cached - subsequent calls return the same Document object.
             For simple text extraction, use filing.text() instead.
             For XBRL data, use filing.xbrl() instead.
+            With the document cache enabled (EDGAR_DOCUMENT_CACHE=1), a filing parsed
+            before is loaded from disk instead of being fetched and parsed again.
         """
+        from edgar.documents.cache import PRIMARY_DOCUMENT, get_document_cache
+        config = ParserConfig(form=self.form)
+        document_cache = get_document_cache()
+        if document_cache is not None:
+            document = document_cache.get(self.accession_no, PRIMARY_DOCUMENT, config)
+            if document is not None:
+                return document
+
         html_content = self.html()
         if not html_content or not is_probably_html(html_content):
             return None
-        parser = HTMLParser(ParserConfig(form=self.form))
-        return parser.parse(html_content)
+        document = HTMLParser(config).parse(html_content)
+
+        if document_cache is not None:
+            document_cache.put(self.accession_no, PRIMARY_DOCUMENT, config, document)
+        return document
 
     def xbrl(self) -> Optional[XBRL]:
         """
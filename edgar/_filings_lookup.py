@@ -0,0 +1,156 @@
+"""
+Hash-style lookup indexes over the columns of a filing index table.
+
+`Filings.get`, `Filings.find` and `Filings.filter(cik=, form=, accession_number=)` used to
+scan the whole arrow table with `pc.is_in` or `pc.equal` on every call, so looking up
+thousands of accession numbers against a multi-year `Filings` was O(n·m).
+
+A `ColumnIndex` sorts one column once and keeps the sorted keys next to the row numbers
+they came from. Looking up any number of keys is then a pair of binary searches per key
+and a gather of the matching row ranges. `FilingsLookup` holds the indexes for one table,
+builds each column's index lazily, and can derive the indexes of a table taken or sliced
+from it so that `filter`, `head`, `latest` and paging don't have to rebuild them.
+"""
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+__all__ = ['ColumnIndex', 'FilingsLookup', 'INDEXED_COLUMNS']
+
+# The columns that get an index, and the type lookup keys are coerced to
+INDEXED_COLUMNS = {
+    'accession_number': str,
+    'cik': int,
+    'form': str,
+}
+
+# A column is scanned on its first lookup and indexed on the next one. A single lookup
+# is cheaper as a scan than as a sort, so one-off filters don't pay for an index.
+LOOKUPS_BEFORE_INDEXING = 1
+
+
+class ColumnIndex:
+    """
+    The rows of a table grouped by the value of one column.
+
+    `keys` holds the non-null values of the column in sorted order and `rows` holds the
+    row each of them came from, so the rows for a key are one contiguous range of `rows`.
+    """
+
+    def __init__(self, keys: np.ndarray, rows: np.ndarray):
+        self.keys = keys
+        self.rows = rows
+
+    @classmethod
+    def build(cls, column: pa.ChunkedArray) -> 'ColumnIndex':
+        """Index a column by sorting it once"""
+        # Nulls sort last, so dropping them leaves the valid values
+        order = pc.sort_indices(column)
+        num_valid = len(column) - column.null_count
+        order = order.slice(0, num_valid)
+        # Strings come back as an object array, which numpy can still binary search
+        keys = pc.take(column, order).to_numpy()
+        return cls(keys=keys, rows=order.to_numpy().astype(np.int64))
+
+    def __len__(self):
+        return len(self.rows)
+
+    def lookup(self, values: Iterable) -> np.ndarray:
+        """
+        The rows holding any of the values, in table order.
+
+        This is the same selection `pc.is_in(column, values)` would make.
+        """
+        values = list(dict.fromkeys(values))
+        if len(values) == 0 or len(self.keys) == 0:
+            return np.empty(0, dtype=np.int64)
+        probe = np.array(values, dtype=self.keys.dtype)
+        starts = np.searchsorted(self.keys, probe, side='left')
+        ends = np.searchsorted(self.keys, probe, side='right')
+        found = ends > starts
+        if not found.any():
+            return np.empty(0, dtype=np.int64)
+        rows = np.concatenate([self.rows[start:end] for start, end in zip(starts[found], ends[found], strict=True)])
+        rows.sort()
+        return rows
+
+    def first(self, value) -> int:
+        """The first row holding the value or -1 if there is none"""
+        rows = self.lookup([value])
+        return int(rows[0]) if len(rows) > 0 else -1
+
+    def take(self, positions: np.ndarray, num_rows: int) -> 'ColumnIndex':
+        """
+        The index of the table made by taking `positions` from the indexed table.
+
+        Each indexed row is mapped to its position in the new table and rows that were not
+        taken are dropped. The keys stay sorted, so nothing needs to be re-sorted.
+        """
+        new_position = np.full(num_rows, -1, dtype=np.int64)
+        new_position[positions] = np.arange(len(positions), dtype=np.int64)
+        mapped = new_position[self.rows]
+        kept = mapped >= 0
+        return ColumnIndex(keys=self.keys[kept], rows=mapped[kept])
+
+
+class FilingsLookup:
+    """
+    The lazily built column indexes for one filing index table
+    """
+
+    def __init__(self, data: pa.Table, indexes: Optional[Dict[str, ColumnIndex]] = None):
+        self.data = data
+        self._indexes: Dict[str, ColumnIndex] = indexes or {}
+        self._lookups: Dict[str, int] = {}
+
+    def is_indexed(self, column: str) -> bool:
+        return column in self._indexes
+
+    def index_for(self, column: str) -> Optional[ColumnIndex]:
+        """
+        The index for the column, or None if the caller should scan the table instead.
+
+        The index is built on a repeated lookup of the same column.
+        """
+        if column not in INDEXED_COLUMNS or column not in self.data.column_names:
+            return None
+        index = self._indexes.get(column)
+        if index is None:
+            lookups = self._lookups.get(column, 0)
+            self._lookups[column] = lookups + 1
+            if lookups < LOOKUPS_BEFORE_INDEXING:
+                return None
+            index = ColumnIndex.build(self.data[column])
+            self._indexes[column] = index
+        return index
+
+    def rows_for(self, column: str, values: Iterable) -> Optional[np.ndarray]:
+        """The rows in table order where the column is one of the values, or None to scan instead"""
+        index = self.index_for(column)
+        if index is None:
+            return None
+        to_key = INDEXED_COLUMNS[column]
+        return index.lookup(to_key(value) for value in values)
+
+    def take(self, positions: np.ndarray, data: pa.Table) -> 'FilingsLookup':
+        """The lookup for `data`, which was taken from this table at `positions`"""
+        positions = np.asarray(positions, dtype=np.int64)
+        indexes = {column: index.take(positions, len(self.data))
+                   for column, index in self._indexes.items()}
+        return FilingsLookup(data, indexes=indexes)
+
+    def slice(self, offset: int, data: pa.Table) -> 'FilingsLookup':
+        """The lookup for `data`, which was sliced from this table starting at `offset`"""
+        if not self._indexes:
+            return FilingsLookup(data)
+        return self.take(np.arange(offset, offset + len(data), dtype=np.int64), data)
+
+
+def intersect_rows(selections: List[np.ndarray]) -> np.ndarray:
+    """The rows present in every one of the sorted row selections"""
+    rows = selections[0]
+    for selection in selections[1:]:
+        rows = np.intersect1d(rows, selection, assume_unique=True)
+    return rows
@@ -6,6 +6,7 @@ Side-by-side comparison of multiple companies or industry analysis.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any, Optional
 
@@ -147,12 +148,17 @@ async def edgar_compare(
                 suggestions=["Add more tickers to identifiers"]
             )
 
+        # Resolve each company once and load all their facts in one batch
+        companies, facts = await asyncio.to_thread(_load_companies, companies_to_compare)
+
         # Compare companies
         comparisons = []
         errors = []
 
         for ident in companies_to_compare:
-            company_data = await _compare_company(ident, metrics, periods, annual)
+            company = companies.get(ident)
+            company_data = await _compare_company(ident, metrics, periods, annual, company=company,
+                                                  facts=facts.get(company.cik) if company is not None else None)
             if "error" in company_data:
                 errors.append({"identifier": ident, "error": company_data["error"]})
             else:
@@ -213,15 +219,44 @@ async def _get_industry_companies(industry: str, limit: int) -> list[str]:
         return []
 
 
+def _load_companies(identifiers: list[str]) -> tuple[dict[str, Any], dict[int, Any]]:
+    """
+    Resolve each identifier to a company, then download and parse their facts concurrently.
+
+    Returns the companies by identifier and the facts that loaded by CIK. Identifiers
+    that cannot be resolved are left out; _compare_company() reports them.
+    """
+    from edgar.entity.facts_loader import load_company_facts
+
+    companies = {}
+    for identifier in identifiers:
+        try:
+            companies[identifier] = resolve_company(identifier)
+        except Exception as e:
+            logger.debug("Could not resolve %s: %s", identifier, e)
+
+    facts = {}
+    if len(companies) > 1:
+        facts, _ = load_company_facts(company.cik for company in companies.values())
+    return companies, facts
+
+
 async def _compare_company(
     identifier: str,
     metrics: list[str],
     periods: int,
-    annual: bool
+    annual: bool,
+    company: Optional[Any] = None,
+    facts: Optional[Any] = None
 ) -> dict:
-    """Get comparison data for a single company, extracting requested metrics."""
+    """
+    Get comparison data for a single company, extracting requested metrics.
+
+    The company and its facts are looked up unless already loaded.
+    """
     try:
-        company = resolve_company(identifier)
+        if company is None:
+            company = resolve_company(identifier)
 
         result = {
             "identifier": identifier,
@@ -230,7 +265,8 @@ async def _compare_company(
         }
 
         try:
-            facts = company.get_facts()
+            if facts is None:
+                facts = company.get_facts()
         except Exception as e:
             result["financials_error"] = str(e)
             return result
@@ -6,6 +6,7 @@ A high-performance, semantically-aware HTML parser for SEC filings.
 
 from typing import Optional
 
+from edgar.documents.batch import ParseResult, parse_many
 from edgar.documents.config import ParserConfig
 from edgar.documents.cross_reference_index import (
     CrossReferenceIndex,
@@ -36,6 +37,8 @@ __all__ = [
     'MarkdownRenderer',
     'TextRenderer',
     'parse_html',
+    'parse_many',
+    'ParseResult',
     'CrossReferenceIndex',
     'PageRange',
     'IndexEntry',
@@ -0,0 +1,244 @@
+"""
+Batch parsing of many documents in a process pool.
+
+Parsing a filing's primary document is CPU bound, so parsing a quarter's worth of
+10-Ks one ``Filing.parse()`` at a time leaves every core but one idle.
+``parse_many`` fans ``HTMLParser.parse`` out over a process pool and yields a
+``ParseResult`` for each document as soon as it is done.
+
+Shipping a whole parsed Document back from a worker means pickling its node
+tree, which costs a noticeable fraction of the parse itself, and callers
+usually want only part of it. Workers therefore return just the artifacts asked
+for: the document, its text, the text of each section, its tables as DataFrames
+or its markdown.
+"""
+
+import logging
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from edgar.documents.config import ParserConfig
+from edgar.documents.document import Document
+from edgar.documents.parser import HTMLParser
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from edgar._filings import Filing
+
+log = logging.getLogger(__name__)
+
+__all__ = ['ARTIFACTS', 'ParseResult', 'parse_many']
+
+# What a worker can send back for each document
+ARTIFACTS = ('document', 'text', 'sections', 'tables', 'markdown')
+
+
+@dataclass
+class ParseResult:
+    """
+    The outcome of parsing one document with parse_many.
+
+    Only the artifacts that were asked for are filled in. A document that could
+    not be fetched or parsed has ``error`` set and no artifacts.
+
+    Attributes:
+        index: Position of the document in the input
+        accession_no: Accession number, when the input was a Filing
+        document: The parsed Document
+        text: Plain text of the document
+        sections: Section name to section text
+        tables: Each table as a DataFrame
+        markdown: The document as markdown
+        parse_time: Seconds spent parsing, in the worker
+        total_time: Seconds spent parsing and extracting artifacts, in the worker
+        error: Why the document failed, as "ExceptionType: message"
+    """
+    index: int
+    accession_no: Optional[str] = None
+    document: Optional[Document] = None
+    text: Optional[str] = None
+    sections: Optional[Dict[str, str]] = None
+    tables: Optional[List['pd.DataFrame']] = None
+    markdown: Optional[str] = None
+    parse_time: float = 0.0
+    total_time: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+# index, accession number, html, config
+_Job = Tuple[int, Optional[str], Union[str, bytes], ParserConfig]
+
+
+def _describe(error: BaseException) -> str:
+    return f"{type(error).__name__}: {error}"
+
+
+def _parse_document(job: _Job, artifacts: Tuple[str, ...]) -> ParseResult:
+    """Process pool entry point: parse one document and extract the requested artifacts."""
+    index, accession_no, html, config = job
+    result = ParseResult(index=index, accession_no=accession_no)
+    start = time.perf_counter()
+    try:
+        document = HTMLParser(config).parse(html)
+        result.parse_time = time.perf_counter() - start
+        if 'text' in artifacts:
+            result.text = document.text()
+        if 'sections' in artifacts:
+            result.sections = {name: section.text() for name, section in document.sections.items()}
+        if 'tables' in artifacts:
+            result.tables = [table.to_dataframe() for table in document.tables]
+        if 'markdown' in artifacts:
+            result.markdown = document.to_markdown()
+        if 'document' in artifacts:
+            result.document = document
+    except Exception as e:
+        result = ParseResult(index=index, accession_no=accession_no, error=_describe(e))
+    result.total_time = time.perf_counter() - start
+    return result
+
+
+def _prepare(index: int, item: Union['Filing', str, bytes], config: ParserConfig) -> Union[_Job, ParseResult]:
+    """
+    Turn one input into a parse job, fetching a filing's HTML in this process.
+
+    A filing that has no HTML document, or whose HTML cannot be fetched, becomes a
+    failed ParseResult straight away.
+    """
+    if isinstance(item, (str, bytes)):
+        return index, None, item, config
+
+    from edgar.core import is_probably_html
+
+    accession_no = getattr(item, 'accession_no', None)
+    try:
+        html = item.html()
+    except Exception as e:
+        return ParseResult(index=index, accession_no=accession_no, error=_describe(e))
+    if not html or not is_probably_html(html):
+        return ParseResult(index=index, accession_no=accession_no, error="ValueError: Filing has no HTML document")
+    if config.form is None:
+        config = replace(config, form=item.form)
+    return index, accession_no, html, config
+
+
+def _default_workers(items: Iterable) -> int:
+    workers = os.cpu_count() or 1
+    if hasattr(items, '__len__'):
+        workers = min(workers, len(items))
+    return max(1, workers)
+
+
+def parse_many(items: Iterable[Union['Filing', str, bytes]],
+               workers: Optional[int] = None,
+               artifacts: Sequence[str] = ('document',),
+               config: Optional[ParserConfig] = None) -> Iterator[ParseResult]:
+    """
+    Parse many documents in a process pool, yielding each result as it completes.
+
+    Args:
+        items: Filings, or HTML as str or bytes. A filing's primary HTML document is
+               fetched in this process, one at a time, while the pool parses the ones
+               already fetched. Items are read lazily, so a generator works.
+        workers: Processes to parse in. Defaults to one per CPU, capped at the number
+                 of items when that is known. 1 parses in this process.
+        artifacts: What to send back for each document, any of ``ARTIFACTS``. Ask for
+                   'text', 'sections', 'tables' or 'markdown' rather than 'document'
+                   when that is all you need: a whole Document is slow to pickle.
+        config: Parser configuration. A filing's form is filled in when the config
+                does not set one, as Filing.parse() does.
+
+    Yields:
+        A ParseResult per document, in completion order. ``result.index`` is the
+        document's position in ``items``. Failures are yielded too, with ``error`` set.
+
+    Example:
+        >>> filings = get_filings(form="10-K").head(100)
+        >>> for result in parse_many(filings, artifacts=['sections']):
+        ...     if result.ok:
+        ...         risk_factors = result.sections.get('part_i_item_1a')
+    """
+    artifacts = tuple(artifacts)
+    unknown = [artifact for artifact in artifacts if artifact not in ARTIFACTS]
+    if unknown:
+        raise ValueError(f"Unknown artifacts {unknown}. Choose from {list(ARTIFACTS)}")
+    config = config or ParserConfig()
+    workers = workers or _default_workers(items)
+
+    prepared = (_prepare(index, item, config) for index, item in enumerate(items))
+    if workers == 1:
+        return (job if isinstance(job, ParseResult) else _parse_document(job, artifacts) for job in prepared)
+    return _parse_in_pool(prepared, workers, artifacts)
+
+
+def _parse_in_pool(prepared: Iterator[Union[_Job, ParseResult]],
+                   workers: int,
+                   artifacts: Tuple[str, ...]) -> Iterator[ParseResult]:
+    """
+    Feed jobs to a process pool as they are prepared and yield results as they complete.
+
+    At most two jobs per worker are in flight, so a long input is never held in
+    memory all at once. If the pool breaks, the jobs it had not finished, and any
+    still to come, are parsed in this process.
+    """
+    max_in_flight = workers * 2
+    in_flight: Dict[Future, _Job] = {}
+    try:
+        executor = ProcessPoolExecutor(max_workers=workers)
+    except OSError as e:
+        log.debug("Document process pool unavailable, parsing in process: %s", e)
+        executor = None
+    try:
+        for job in prepared:
+            if isinstance(job, ParseResult):
+                yield job
+                continue
+            if executor is not None:
+                try:
+                    in_flight[executor.submit(_parse_document, job, artifacts)] = job
+                except BrokenProcessPool as e:
+                    log.debug("Document process pool broke, parsing in process: %s", e)
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    executor = None
+            if executor is None:
+                yield _parse_document(job, artifacts)
+            if len(in_flight) >= max_in_flight or (executor is None and in_flight):
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                executor, results = _collect(done, in_flight, executor, artifacts)
+                yield from results
+
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            executor, results = _collect(done, in_flight, executor, artifacts)
+            yield from results
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _collect(done, in_flight: Dict[Future, _Job], executor: Optional[ProcessPoolExecutor],
+             artifacts: Tuple[str, ...]) -> Tuple[Optional[ProcessPoolExecutor], List[ParseResult]]:
+    """Results of the completed futures. A broken pool is shut down and its jobs parsed here."""
+    results = []
+    for future in done:
+        job = in_flight.pop(future)
+        try:
+            results.append(future.result())
+        except BrokenProcessPool as e:
+            if executor is not None:
+                log.debug("Document process pool broke, parsing in process: %s", e)
+                executor.shutdown(wait=False, cancel_futures=True)
+                executor = None
+            results.append(_parse_document(job, artifacts))
+        except Exception as e:
+            # The result could not be sent back, e.g. a document that does not pickle
+            results.append(ParseResult(index=job[0], accession_no=job[1], error=_describe(e)))
+    return executor, results
@@ -0,0 +1,423 @@
+"""
+Persistent cache of parsed Documents.
+
+Filing.parse() runs the whole HTML pipeline (preprocessing, lxml, the document
+builder, table processing) every time it is called, so every notebook or agent
+session reparses the filings it has seen before. A filing's documents never
+change once filed, so the parsed node tree is stored on disk and reopening a
+filing becomes a load measured in milliseconds.
+
+Entries are keyed by accession number, attachment and a hash of the
+ParserConfig, one file each. They are not pickles. A file is laid out as:
+
+    EDGARDOC <version>\\n            version tag line
+    <8 bytes, little endian>        length of the tree segment
+    <tree segment>                  zlib-compressed JSON: the node tree as a flat
+                                    table in document order, with styles and the
+                                    field names of each node class stored once
+    <original HTML, UTF-8>          the raw HTML section detection reads
+
+The file is memory-mapped on load. The node tree is rebuilt straight away, but
+the original HTML is only decoded when something reads
+``document.metadata.original_html``, which is section detection on first
+access to ``document.sections``. Sections themselves are not stored; they are
+detected again from that HTML, as they are for an unpickled Document.
+
+An entry written by another edgartools version or DOCUMENT_CACHE_FORMAT is
+discarded on read, so a parser upgrade never serves trees it did not build. A
+document holding something the format cannot represent is simply not cached.
+The cache is bounded in bytes and evicts the least recently used entries first.
+
+The cache is off unless enabled, either with set_document_cache(DocumentCache())
+or by setting the EDGAR_DOCUMENT_CACHE environment variable:
+
+    export EDGAR_DOCUMENT_CACHE=1
+    export EDGAR_DOCUMENT_CACHE_MAX_MB=4096   # optional, defaults to 2048
+"""
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import re
+import struct
+import zlib
+from dataclasses import asdict, fields
+from enum import Enum
+from functools import partial
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from edgar._disk_cache import DiskLRU
+from edgar.documents.config import ParserConfig
+from edgar.documents.document import Document, DocumentMetadata
+from edgar.documents.nodes import (
+    ContainerNode,
+    DocumentNode,
+    HeadingNode,
+    ImageNode,
+    LinkNode,
+    ListItemNode,
+    ListNode,
+    Node,
+    ParagraphNode,
+    SectionNode,
+    TextNode,
+)
+from edgar.documents.table_nodes import Cell, Row, TableNode
+from edgar.documents.types import NodeType, SemanticType, Style, TableType, XBRLFact
+
+log = logging.getLogger(__name__)
+
+__all__ = ['DocumentCache', 'get_document_cache', 'set_document_cache', 'DOCUMENT_CACHE_FORMAT',
+           'PRIMARY_DOCUMENT']
+
+# Bump when the shape of the node tree changes without an edgartools release
+DOCUMENT_CACHE_FORMAT = 1
+
+ENV_DOCUMENT_CACHE = 'EDGAR_DOCUMENT_CACHE'
+ENV_DOCUMENT_CACHE_MAX_MB = 'EDGAR_DOCUMENT_CACHE_MAX_MB'
+DEFAULT_MAX_SIZE_MB = 2048
+
+# Attachment name Filing.parse() caches its primary document under
+PRIMARY_DOCUMENT = 'primary'
+
+_SUFFIX = '.edoc'
+_LENGTH = struct.Struct('<Q')
+
+_NODE_CLASSES = {cls.__name__: cls for cls in (
+    DocumentNode, TextNode, ParagraphNode, HeadingNode, ContainerNode, SectionNode,
+    ListNode, ListItemNode, LinkNode, ImageNode, TableNode,
+)}
+_ENUMS = {cls.__name__: cls for cls in (NodeType, SemanticType, TableType)}
+
+# Node fields the tree table stores in its own columns, or that are rebuilt on load
+_STRUCTURAL_FIELDS = {'id', 'type', 'parent', 'children', 'metadata', 'style', '_text_cache',
+                      'headers', 'rows', 'footer'}
+_STYLE_FIELDS = [f.name for f in fields(Style)]
+_XBRL_FACT_FIELDS = [f.name for f in fields(XBRLFact)]
+_METADATA_FIELDS = [f.name for f in fields(DocumentMetadata) if f.name not in ('original_html', 'xbrl_data')]
+
+
+def _default_version() -> str:
+    from edgar.__about__ import __version__
+    return f"{__version__}/{DOCUMENT_CACHE_FORMAT}"
+
+
+def config_hash(config: ParserConfig) -> str:
+    """A stable hash of every setting in a ParserConfig."""
+    settings = json.dumps(asdict(config), sort_keys=True, default=repr)
+    return hashlib.sha256(settings.encode()).hexdigest()[:16]
+
+
+def _node_fields(cls) -> List[str]:
+    # TableNode's semantic_type is a property over table_type, so it is not stored twice
+    return [f.name for f in fields(cls)
+            if f.name not in _STRUCTURAL_FIELDS and not isinstance(getattr(cls, f.name, None), property)]
+
+
+def _encode(value: Any) -> Any:
+    """A node field or metadata value as JSON. Raises TypeError for anything else."""
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    if isinstance(value, Enum) and type(value).__name__ in _ENUMS:
+        return {'__enum__': type(value).__name__, 'value': value.value}
+    if isinstance(value, (list, tuple)):
+        return [_encode(item) for item in value]
+    if isinstance(value, dict) and all(isinstance(key, str) for key in value):
+        return {key: _encode(item) for key, item in value.items()}
+    raise TypeError(f"Cannot store {type(value).__name__} in the document cache")
+
+
+def _decode(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    if isinstance(value, dict):
+        if '__enum__' in value:
+            return _ENUMS[value['__enum__']](value['value'])
+        return {key: _decode(item) for key, item in value.items()}
+    return value
+
+
+def _encode_cells(cells: List[Cell]) -> List[list]:
+    encoded = []
+    for cell in cells:
+        if not isinstance(cell.content, str):
+            raise TypeError(f"Cannot store a {type(cell.content).__name__} table cell in the document cache")
+        encoded.append([cell.content, cell.colspan, cell.rowspan, cell.is_header, cell.align])
+    return encoded
+
+
+def _decode_cells(cells: List[list]) -> List[Cell]:
+    return [Cell(content, colspan, rowspan, is_header, align) for content, colspan, rowspan, is_header, align in cells]
+
+
+def _encode_tree(document: Document) -> Dict[str, Any]:
+    """The document as a JSON-ready dict, nodes flattened in document order."""
+    classes: Dict[str, int] = {}
+    class_table: List[list] = []
+    styles: Dict[Tuple, int] = {}
+    style_table: List[list] = []
+    index: Dict[int, int] = {}
+    nodes: List[list] = []
+
+    for node in document.root.walk():
+        cls = type(node)
+        if _NODE_CLASSES.get(cls.__name__) is not cls:
+            raise TypeError(f"Cannot store a {cls.__name__} in the document cache")
+        class_index = classes.get(cls.__name__)
+        if class_index is None:
+            class_index = classes[cls.__name__] = len(class_table)
+            class_table.append([cls.__name__, _node_fields(cls)])
+
+        style = node.style
+        style_key = tuple(getattr(style, name) for name in _STYLE_FIELDS)
+        style_index = styles.get(style_key)
+        if style_index is None:
+            style_index = styles[style_key] = len(style_table)
+            style_table.append(list(style_key))
+
+        parent = -1 if node.parent is None else index[id(node.parent)]
+        index[id(node)] = len(nodes)
+        record = [class_index, parent, style_index, _encode(node.metadata) if node.metadata else None,
+                  [_encode(getattr(node, name)) for name in class_table[class_index][1]]]
+        if cls is TableNode:
+            record.append([[_encode_cells(header) for header in node.headers],
+                           [[row.is_header, _encode_cells(row.cells)] for row in node.rows],
+                           [[row.is_header, _encode_cells(row.cells)] for row in node.footer]])
+        nodes.append(record)
+
+    metadata = document.metadata
+    return {
+        'classes': class_table,
+        'styles': style_table,
+        'nodes': nodes,
+        'metadata': {name: _encode(getattr(metadata, name)) for name in _METADATA_FIELDS},
+        'xbrl_data': None if metadata.xbrl_data is None else
+        [[_encode(getattr(fact, name)) for name in _XBRL_FACT_FIELDS] for fact in metadata.xbrl_data],
+    }
+
+
+def _decode_tree(tree: Dict[str, Any], config: ParserConfig) -> Document:
+    classes = [(_NODE_CLASSES[name], names) for name, names in tree['classes']]
+    styles = [Style(*values) for values in tree['styles']]
+    nodes: List[Node] = []
+    for record in tree['nodes']:
+        class_index, parent, style_index, metadata, values = record[:5]
+        cls, names = classes[class_index]
+        node = cls()
+        for name, value in zip(names, values, strict=True):
+            setattr(node, name, _decode(value))
+        node.style = styles[style_index]
+        if metadata is not None:
+            node.metadata = _decode(metadata)
+        if cls is TableNode:
+            headers, rows, footer = record[5]
+            node.headers = [_decode_cells(header) for header in headers]
+            node.rows = [Row(_decode_cells(cells), is_header) for is_header, cells in rows]
+            node.footer = [Row(_decode_cells(cells), is_header) for is_header, cells in footer]
+            node._config = config
+        if parent >= 0:
+            node.parent = nodes[parent]
+            nodes[parent].children.append(node)
+        nodes.append(node)
+
+    metadata = DocumentMetadata(**{name: _decode(tree['metadata'][name]) for name in _METADATA_FIELDS})
+    if tree['xbrl_data'] is not None:
+        metadata.xbrl_data = [XBRLFact(*[_decode(value) for value in values]) for values in tree['xbrl_data']]
+    document = Document(root=nodes[0], metadata=metadata)
+    document._config = config
+
+    from edgar.documents.processors.postprocessor import DocumentPostprocessor
+    metadata._set_statistics_loader(partial(DocumentPostprocessor._calculate_statistics, document,
+                                            include_section_count=config.eager_section_extraction))
+    return document
+
+
+def _read_original_html(mapped: mmap.mmap, start: int) -> str:
+    try:
+        return str(mapped[start:], 'utf-8')
+    finally:
+        mapped.close()
+
+
+class DocumentCache:
+    """
+    On-disk cache of parsed Documents with LRU eviction.
+
+    Parameters:
+        cache_dir: Directory for cache entries (default: <edgar data dir>/document_cache)
+        max_size_mb: Total size the cache may grow to before evicting (default: 2048)
+        version: Version tag entries must carry to be read back (default: edgartools
+                 version and DOCUMENT_CACHE_FORMAT)
+    """
+
+    def __init__(self,
+                 cache_dir: Optional[Union[str, Path]] = None,
+                 max_size_mb: float = DEFAULT_MAX_SIZE_MB,
+                 version: Optional[str] = None):
+        if cache_dir is None:
+            from edgar.settings import get_edgar_data_directory
+            cache_dir = get_edgar_data_directory() / 'document_cache'
+        self.cache_dir = Path(cache_dir)
+        self.version = version or _default_version()
+        self._header = f"EDGARDOC {self.version}\n".encode()
+        self._files = DiskLRU(self.cache_dir, _SUFFIX, int(max_size_mb * 1024 * 1024), name='document cache')
+
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def max_size_bytes(self) -> int:
+        return self._files.max_size_bytes
+
+    @max_size_bytes.setter
+    def max_size_bytes(self, value: int):
+        self._files.max_size_bytes = value
+
+    def path_for(self, accession_no: str, attachment: str, config: ParserConfig) -> Path:
+        """The cache file for an attachment of a filing parsed with a config."""
+        name = re.sub(r'[^0-9A-Za-z.-]', '_', f"{accession_no}_{attachment}")
+        return self.cache_dir / f"{name}_{config_hash(config)}{_SUFFIX}"
+
+    def get(self, accession_no: str, attachment: str, config: ParserConfig) -> Optional[Document]:
+        """
+        Load a parsed Document.
+
+        Args:
+            accession_no: The filing's accession number
+            attachment: The attachment's document name, or PRIMARY_DOCUMENT
+            config: The configuration the document was parsed with
+
+        Returns:
+            The Document, or None if it is not cached, is from another version,
+            or cannot be read
+        """
+        path = self.path_for(accession_no, attachment, config)
+        try:
+            with open(path, 'rb') as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            self._misses += 1
+            return None
+
+        header = self._header
+        if mapped[:len(header)] != header:
+            log.debug("Discarding document cache entry %s written by another version", path.name)
+            mapped.close()
+            self._files.delete(path)
+            self._misses += 1
+            return None
+
+        try:
+            start = len(header) + _LENGTH.size
+            (length,) = _LENGTH.unpack_from(mapped, len(header))
+            tree = json.loads(zlib.decompress(mapped[start:start + length]))
+            document = _decode_tree(tree, config)
+        except Exception as e:
+            log.warning("Could not read the document cache entry %s: %s", path.name, e)
+            mapped.close()
+            self._files.delete(path)
+            self._misses += 1
+            return None
+
+        html_start = start + length
+        if html_start < len(mapped):
+            document.metadata._set_original_html_loader(partial(_read_original_html, mapped, html_start))
+        else:
+            mapped.close()
+
+        self._files.touch(path)
+        self._hits += 1
+        return document
+
+    def put(self, accession_no: str, attachment: str, config: ParserConfig, document: Document) -> None:
+        """Store a parsed Document, then evict down to the size limit."""
+        try:
+            tree = zlib.compress(json.dumps(_encode_tree(document), separators=(',', ':')).encode(), 1)
+            original_html = document.metadata.original_html
+            html = original_html.encode('utf-8') if original_html else b''
+        except Exception as e:
+            log.debug("Could not serialize the document for %s %s: %s", accession_no, attachment, e)
+            return
+
+        def write(f):
+            f.write(self._header)
+            f.write(_LENGTH.pack(len(tree)))
+            f.write(tree)
+            f.write(html)
+
+        try:
+            self._files.write(self.path_for(accession_no, attachment, config), write)
+        except OSError as e:
+            log.warning("Could not write the document cache entry for %s %s: %s", accession_no, attachment, e)
+
+    def __contains__(self, key: Tuple[str, str, ParserConfig]) -> bool:
+        return self.path_for(*key).exists()
+
+    def evict(self) -> int:
+        """
+        Delete least recently used entries until the cache fits in max_size_mb.
+
+        Returns:
+            The number of entries deleted
+        """
+        return self._files.evict()
+
+    def clear(self) -> None:
+        """Delete every cache entry."""
+        self._files.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with cache statistics
+        """
+        sizes = self._files.sizes()
+        total_requests = self._hits + self._misses
+        return {
+            "entries": len(sizes),
+            "size_mb": sum(sizes) / (1024 * 1024),
+            "max_size_mb": self.max_size_bytes / (1024 * 1024),
+            "cache_hits": self._hits,
+            "cache_misses": self._misses,
+            "hit_rate": self._hits / total_requests if total_requests > 0 else 0.0,
+            "version": self.version,
+        }
+
+
+# Global cache instance, created from the environment on first use
+_global_cache: Optional[DocumentCache] = None
+_global_cache_configured = False
+
+
+def get_document_cache() -> Optional[DocumentCache]:
+    """
+    Get the global document cache.
+
+    Returns:
+        The DocumentCache set with set_document_cache, or one created on first call
+        when EDGAR_DOCUMENT_CACHE is set. None when the cache is disabled.
+    """
+    global _global_cache, _global_cache_configured
+    if not _global_cache_configured:
+        if os.getenv(ENV_DOCUMENT_CACHE, '').lower() in ('1', 'true', 'yes', 'on'):
+            max_size_mb = float(os.getenv(ENV_DOCUMENT_CACHE_MAX_MB, DEFAULT_MAX_SIZE_MB))
+            _global_cache = DocumentCache(max_size_mb=max_size_mb)
+        _global_cache_configured = True
+    return _global_cache
+
+
+def set_document_cache(cache: Optional[DocumentCache]) -> None:
+    """
+    Set the global document cache.
+
+    Args:
+        cache: Cache instance to use globally (None to disable)
+    """
+    global _global_cache, _global_cache_configured
+    _global_cache = cache
+    _global_cache_configured = True
@@ -25,8 +25,13 @@ class CacheableMixin:
                     # Generate text logic here
                     return "generated text"
                 return self._get_cached_text(generator)
+
+    The mixin declares no slots of its own, so slotted nodes stay slotted. They
+    declare a ``_text_cache`` field for the cache to live in.
     """
 
+    __slots__ = ()
+
     def _get_cached_text(self, generator_func: Callable[[], Any], *args, **kwargs) -> Any:
         """
         Get cached text or generate and cache it.
@@ -69,10 +69,26 @@ class DocumentMetadata:
         self.__dict__.pop("_statistics", None)
         self.__dict__["_statistics_loader"] = loader
 
+    def _set_original_html_loader(self, loader: Callable[[], Optional[str]]) -> None:
+        """Defer reading the original HTML until it is first accessed."""
+        self.__dict__.pop("original_html", None)
+        self.__dict__["_original_html_loader"] = loader
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for original_html once _set_original_html_loader has deferred it
+        if name == "original_html":
+            loader = self.__dict__.pop("_original_html_loader", None)
+            original_html = loader() if loader is not None else None
+            self.__dict__["original_html"] = original_html
+            return original_html
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
     def __getstate__(self) -> Dict[str, Any]:
-        """Materialize deferred statistics before serializing metadata."""
+        """Materialize deferred statistics and HTML before serializing metadata."""
         if "_statistics_loader" in self.__dict__:
             _ = self.statistics
+        if "_original_html_loader" in self.__dict__:
+            _ = self.original_html
         return self.__dict__.copy()
 
     def to_dict(self) -> Dict[str, Any]:
@@ -93,6 +109,10 @@ class DocumentMetadata:
         }
 
 
+# Without a class-level default, a deferred original_html falls through to __getattr__
+del DocumentMetadata.original_html
+
+
 @dataclass
 class Section:
     """
@@ -876,10 +896,18 @@ class Document:
         return self._nav_patterns
 
     def __getstate__(self) -> Dict[str, Any]:
-        """Materialize lazy metadata before serializing a stable document state."""
+        """Materialize lazy metadata before serializing a stable document state.
+
+        Detected sections and the section extractor are left out: they hold lxml
+        trees and extraction callbacks, which do not pickle, and both are rebuilt
+        from the original HTML on first access.
+        """
         if "_statistics_loader" in self.metadata.__dict__:
             _ = self.metadata.statistics
-        return self.__dict__.copy()
+        state = self.__dict__.copy()
+        state['_sections'] = None
+        state['_section_extractor'] = None
+        return state
 
     @property
     def sections(self) -> Sections:
@@ -7,6 +7,7 @@ from typing import List, Optional, Set
 
 from edgar.documents.document import Document
 from edgar.documents.nodes import HeadingNode, ImageNode, Node, ParagraphNode, TextNode
+from edgar.documents.renderers.fast_table import FastTableRenderer, TableStyle
 from edgar.documents.table_nodes import TableNode
 
 
@@ -234,10 +235,11 @@ class TextExtractor:
                 parts.append(caption_text)
 
         # Extract table text - PRESERVE FORMATTING (like old parser's TableBlock.get_text())
-        # Use custom max_col_width if specified for AI-friendly rendering
-        if self.table_max_col_width is not None:
-            from edgar.documents.renderers.fast_table import FastTableRenderer, TableStyle
-            style = TableStyle.simple()
+        # Use custom max_col_width if specified for AI-friendly rendering. A width that
+        # matches the table's own fast rendering reuses its cached text() instead.
+        style = TableStyle.simple()
+        if (self.table_max_col_width is not None and
+                (self.table_max_col_width != style.max_col_width or not table._uses_fast_rendering())):
             style.max_col_width = self.table_max_col_width
             renderer = FastTableRenderer(style)
             table_text = renderer.render_table_node(table)
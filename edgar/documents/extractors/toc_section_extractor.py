@@ -17,6 +17,7 @@ from lxml import html as lxml_html
 from edgar.documents.document import Document
 from edgar.documents.nodes import Node
 from edgar.documents.utils.anchor_targets import find_anchor_targets, is_anchor_match
+from edgar.documents.utils.section_text_index import BLOCK_ELEMENTS, SectionTextIndex
 from edgar.documents.utils.tree_traversal import document_order_path, iterwalk_from, precedes
 from edgar.documents.utils.toc_analyzer import TOCAnalyzer
 
@@ -93,6 +94,8 @@ class SECSectionExtractor:
         self.toc_analyzer = TOCAnalyzer(form=form)
         self._tree = None  # Cached parsed lxml tree (set by _analyze_sections)
         self._clean_html = None  # HTML with XML declaration stripped
+        self._text_index = None  # One-pass section text index over the cached tree
+        self._section_texts = {}  # Extracted text per (section, include_subsections, clean)
         self._analyze_sections()
 
     def _parse_html(self, html_content: str):
@@ -103,6 +106,12 @@ class SECSectionExtractor:
         self._tree = lxml_html.fromstring(html_content)
         return self._tree
 
+    def _get_text_index(self) -> SectionTextIndex:
+        """The text index over the cached tree, built on first use."""
+        if self._text_index is None:
+            self._text_index = SectionTextIndex.build(self._tree)
+        return self._text_index
+
     def _analyze_sections(self) -> None:
         """
         Analyze the document using TOC structure to identify section boundaries.
@@ -676,6 +685,17 @@ class SECSectionExtractor:
         if normalized_name not in self.section_boundaries:
             return None
 
+        # Detection extracts each section once to measure it, and the caller asking
+        # for that section's text afterwards gets the same text back.
+        key = (normalized_name, include_subsections, clean)
+        if key not in self._section_texts:
+            self._section_texts[key] = self._get_section_text(section_name, normalized_name,
+                                                              include_subsections, clean)
+        return self._section_texts[key]
+
+    def _get_section_text(self, section_name: str, normalized_name: str,
+                          include_subsections: bool, clean: bool) -> Optional[str]:
+        """Extract the text of a section known to have a boundary."""
         boundary = self.section_boundaries[normalized_name]
 
         # Extract content between boundaries using HTML parsing
@@ -804,16 +824,22 @@ class SECSectionExtractor:
             if end_elements and precedes(end_elements[0], start_elements[0]):
                 return ""
 
+        # Detection extracts every section, so slice the shared one-pass text index
+        # instead of walking the tree once per section. Boundaries the index can't
+        # answer exactly (an anchorless hard end, sibling cut-offs) walk as before.
+        combined_text = None
+        if tree is self._tree and include_subsections and boundary.end_element is None:
+            combined_text = self._get_text_index().section_text(tree, boundary.anchor_id,
+                                                                boundary.end_element_id)
+        if combined_text is not None:
+            return self._clean_section_text(combined_text) if clean else combined_text
+
         # Use document-order traversal (iterwalk) to collect all text between anchors
         # This correctly handles multi-container sections where start and end anchors
         # are in different parent containers
         all_text = []
         in_range = False
 
-        # Block-level elements that should have paragraph breaks
-        block_elements = {'p', 'div', 'table', 'tr', 'li', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
-                         'blockquote', 'pre', 'section', 'article', 'header', 'footer'}
-
         # Walk from the start anchor rather than the document root. iterwalk always
         # begins at the root, so each section used to pay for every element ahead
         # of its own anchor and discard it — 80% of the traversal on a 9.8MB 10-K,
@@ -859,7 +885,7 @@ class SECSectionExtractor:
 
             elif event == 'end':
                 # Add paragraph break after block-level elements
-                if in_range and tag_name in block_elements:
+                if in_range and tag_name in BLOCK_ELEMENTS:
                     all_text.append('\n\n')
 
                 # Collect tail text (text after closing tag)
@@ -111,7 +111,14 @@ def _ends_with_tail_whitespace(node) -> bool:
 # was the only answer equality could give that was not a crash. Nodes also
 # become hashable again — eq=True sets __hash__ to None, so sets and dicts of
 # nodes had to be keyed on id() (edgartools-llmp.10).
-@dataclass(eq=False)
+#
+# slots=True on Node and its subclasses: a large filing builds hundreds of
+# thousands of nodes, and the per-instance __dict__ was the biggest part of each
+# one (296 of ~560 bytes for an empty TextNode). Attributes a node can hold are
+# exactly its fields; the text cache is a field on the classes that cache.
+# TableNode stays dict-backed: its `semantic_type` property shadows the Node
+# field, which a slotted dataclass would discard, and tables are few.
+@dataclass(eq=False, slots=True)
 class Node(ABC):
     """
     Base node class for document tree.
@@ -239,10 +246,11 @@ class Node(ABC):
         return key in self.metadata
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class DocumentNode(Node, CacheableMixin):
     """Root document node."""
     type: NodeType = field(default=NodeType.DOCUMENT, init=False)
+    _text_cache: Optional[str] = field(default=None, init=False, repr=False)
 
     def text(self) -> str:
         """Extract all text from document with caching."""
@@ -271,7 +279,7 @@ class DocumentNode(Node, CacheableMixin):
 </html>"""
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class TextNode(Node):
     """Plain text content node."""
     type: NodeType = field(default=NodeType.TEXT, init=False)
@@ -291,10 +299,11 @@ class TextNode(Node):
         return text
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class ParagraphNode(Node, CacheableMixin):
     """Paragraph node."""
     type: NodeType = field(default=NodeType.PARAGRAPH, init=False)
+    _text_cache: Optional[str] = field(default=None, init=False, repr=False)
 
     def text(self) -> str:
         """Extract paragraph text with intelligent spacing and caching."""
@@ -401,7 +410,7 @@ class ParagraphNode(Node, CacheableMixin):
         return ''
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class HeadingNode(Node):
     """Heading node with level."""
     type: NodeType = field(default=NodeType.HEADING, init=False)
@@ -438,10 +447,11 @@ class HeadingNode(Node):
         return ''
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class ContainerNode(Node, CacheableMixin):
     """Generic container node (div, section, etc.)."""
     type: NodeType = field(default=NodeType.CONTAINER, init=False)
+    _text_cache: Optional[str] = field(default=None, init=False, repr=False)
     tag_name: str = 'div'
 
     def text(self) -> str:
@@ -481,7 +491,7 @@ class ContainerNode(Node, CacheableMixin):
         return ''
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class SectionNode(ContainerNode):
     """Document section node."""
     type: NodeType = field(default=NodeType.SECTION, init=False)
@@ -493,7 +503,7 @@ class SectionNode(ContainerNode):
             self.set_metadata('section_name', self.section_name)
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class ListNode(Node):
     """List node (ordered or unordered)."""
     type: NodeType = field(default=NodeType.LIST, init=False)
@@ -519,7 +529,7 @@ class ListNode(Node):
         return f'<{tag}>\n{items}\n</{tag}>'
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class ListItemNode(Node):
     """List item node."""
     type: NodeType = field(default=NodeType.LIST_ITEM, init=False)
@@ -539,7 +549,7 @@ class ListItemNode(Node):
         return f'<li>{content}</li>'
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class LinkNode(Node):
     """Hyperlink node."""
     type: NodeType = field(default=NodeType.LINK, init=False)
@@ -566,7 +576,7 @@ class LinkNode(Node):
         return f'<a{href_attr}{title_attr}>{content}</a>'
 
 
-@dataclass(eq=False)
+@dataclass(eq=False, slots=True)
 class ImageNode(Node):
     """Image node."""
     type: NodeType = field(default=NodeType.IMAGE, init=False)
@@ -23,6 +23,7 @@ from edgar.documents.utils.html_utils import (
     create_lxml_parser,
     remove_xml_declaration,
     terminate_unclosed_comments,
+    utf8_length,
 )
 
 logger = logging.getLogger(__name__)
@@ -101,12 +102,19 @@ class HTMLParser:
         if not isinstance(html, (str, bytes)):
             raise TypeError(f"HTML must be string or bytes, got {type(html).__name__}")
 
-        # Convert bytes to string if needed
+        # Size the document from the input as given, before any copy of it is made:
+        # bytes by their length, a str without encoding a second copy of it
+        doc_size = len(html) if isinstance(html, bytes) else utf8_length(html)
+        if doc_size > self.config.max_document_size:
+            raise DocumentTooLargeError(doc_size, self.config.max_document_size)
+
+        # Decode once. This string is the original HTML that section detection
+        # reads later; it is shared with metadata, never copied.
         if isinstance(html, bytes):
             html = html.decode('utf-8', errors='replace')
 
         # Handle empty HTML
-        if not html.strip():
+        if not html or html.isspace():
             # Return empty document
             root = DocumentNode()
             metadata = DocumentMetadata(
@@ -116,11 +124,6 @@ class HTMLParser:
             )
             return Document(root=root, metadata=metadata)
 
-        # Check document size
-        doc_size = len(html.encode('utf-8'))
-        if doc_size > self.config.max_document_size:
-            raise DocumentTooLargeError(doc_size, self.config.max_document_size)
-
         # Extract XBRL data BEFORE preprocessing (to preserve ix:hidden content).
         # Deliberately outside the try below: this step is best-effort and
         # already swallows its own errors, so it must not be able to surface as
@@ -130,7 +133,7 @@ class HTMLParser:
             xbrl_facts = self._extract_xbrl_pre_process(html)
 
         try:
-            # Store original HTML BEFORE preprocessing (needed for TOC analysis)
+            # Keep a reference to the original HTML (needed for TOC analysis)
             original_html = html
 
             # Preprocessing (will remove ix:hidden for rendering)
@@ -49,8 +49,11 @@ class HTMLPreprocessor:
             'nested_p_open': re.compile(r'<p>\s*<p>', re.IGNORECASE),
             'nested_p_close': re.compile(r'</p>\s*</p>', re.IGNORECASE),
 
-            # Whitespace normalization
-            'multiple_spaces': re.compile(r'[ \t]+'),
+            # Whitespace normalization. A lone space is already normal, so it is left
+            # out of the match: as '[ \t]+' every word gap in the document was a
+            # substitution of ' ' for ' ', and each pass rebuilt the whole string
+            # out of them.
+            'multiple_spaces': re.compile(r' [ \t]+|\t[ \t]*'),
             'multiple_newlines': re.compile(r'\n{3,}'),
             # Whitespace around tags is collapsed to a single space, never deleted:
             # in HTML rendering, whitespace touching a tag boundary is still a word
@@ -58,9 +61,9 @@ class HTMLPreprocessor:
             # These previously deleted text-adjacent runs outright, which glued
             # words together across inline elements ('STATESSECURITIES') in a way
             # nothing downstream could recover (edgartools-tlj1).
-            'spaces_between_tags': re.compile(r'(?<=>)\s+(?=<)'),
-            'spaces_before_tags': re.compile(r'(?<!>)\s+(?=<)'),
-            'spaces_after_tags': re.compile(r'(?<=>)\s+(?!<)'),
+            # One pass covers runs after a tag and runs before one, and the leading
+            # lookahead skips a run that is already a lone space, as above.
+            'spaces_around_tags': re.compile(r'(?=[^\S ]| \s)(?:(?<=>)\s+|\s+(?=<))'),
 
             # Block element newlines - combined pattern for opening tags
             'block_open_tags': re.compile(
@@ -222,9 +225,7 @@ class HTMLPreprocessor:
 
         # Collapse whitespace around tags to a single space (see pattern comments:
         # deleting it destroys word boundaries at inline-element edges)
-        html = self._compiled_patterns['spaces_between_tags'].sub(' ', html)
-        html = self._compiled_patterns['spaces_before_tags'].sub(' ', html)
-        html = self._compiled_patterns['spaces_after_tags'].sub(' ', html)
+        html = self._compiled_patterns['spaces_around_tags'].sub(' ', html)
 
         # Add newlines around block elements for readability
         # Using combined patterns instead of looping over individual tags
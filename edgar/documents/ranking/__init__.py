@@ -11,6 +11,7 @@ from edgar.documents.ranking.cache import (
     get_search_cache,
     set_search_cache,
 )
+from edgar.documents.ranking.corpus import CorpusIndex, CorpusResult
 from edgar.documents.ranking.ranking import (
     BM25Engine,
     HybridEngine,
@@ -31,4 +32,6 @@ __all__ = [
     'CacheEntry',
     'get_search_cache',
     'set_search_cache',
+    'CorpusIndex',
+    'CorpusResult',
 ]
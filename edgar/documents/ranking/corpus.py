@@ -0,0 +1,547 @@
+"""
+Corpus-level search index spanning many documents.
+
+DocumentSearch.ranked_search() builds its BM25 index from one Document's nodes,
+so asking a question of a few hundred filings means parsing every one of them
+and tokenizing every node again. CorpusIndex tokenizes each document once, when
+it is added, and keeps the result on disk as an inverted index that queries
+read without touching the documents.
+
+The index is a directory of immutable segments, one per add(), like a Lucene
+index. A segment holds:
+
+    terms.json      the segment's vocabulary, sorted
+    offsets.npy     where each term's postings start and end
+    postings.npy    passage ids and term frequencies, int32, grouped by term
+    passages.npy    one record per passage: document, length, text offsets and
+                    the query-independent parts of the hybrid semantic score
+    text.bin        passage text, UTF-8, for snippets
+    meta.json       the segment's documents and section names
+
+The numpy arrays and text are memory-mapped, so opening an index costs a few
+small JSON reads and a query pages in only the postings of its terms.
+
+A passage is what ranked_search() ranks: a leaf node with text. Scores use
+corpus-wide statistics, so BM25 matches BM25Engine over all passages of all
+documents, and the hybrid score combines it with the same structure signals
+HybridEngine uses.
+
+Example:
+    >>> index = CorpusIndex('~/edgar_index/10k_2024')
+    >>> for filing in get_filings(form="10-K", year=2024).head(200):
+    ...     index.add_filing(filing)
+    >>> for result in index.search("supply chain concentration", top_k=5):
+    ...     print(result.key, result.score, result.snippet)
+"""
+
+import json
+import math
+import os
+import re
+import shutil
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from edgar.documents.ranking.preprocessing import preprocess_text, tokenize
+from edgar.documents.ranking.semantic import (
+    SECTION_IMPORTANCE,
+    _detect_cross_references,
+    _detect_gateway_content,
+    _get_item_header_boost,
+    _get_node_section,
+    _get_node_type_boost,
+    _get_quality_boost,
+    _get_semantic_type_boost,
+    _get_xbrl_boost,
+)
+
+if TYPE_CHECKING:
+    from edgar._filings import Filing
+    from edgar.documents.document import Document
+
+__all__ = ['CorpusIndex', 'CorpusResult', 'CORPUS_INDEX_FORMAT']
+
+# Bump when the segment layout changes
+CORPUS_INDEX_FORMAT = 1
+
+_MANIFEST = 'index.json'
+
+_PASSAGE_DTYPE = np.dtype([
+    ('document', '<i4'),       # Index into the segment's documents
+    ('ordinal', '<i4'),        # Position among the document's passages
+    ('length', '<i4'),         # Tokens, BM25's document length
+    ('text_start', '<i8'),     # Byte range of the passage text in text.bin
+    ('text_end', '<i8'),
+    ('node_type', '<i1'),      # Index into _NODE_TYPES
+    ('item_header', '?'),      # Heading that names an Item, boosted for Item queries
+    ('section', '<i4'),        # Index into the segment's section names, -1 for none
+    ('section_boost', '<f4'),  # Built-in SECTION_IMPORTANCE boost for the section
+    ('structure', '<f4'),      # Every other semantic signal, summed
+])
+_POSTING_DTYPE = np.dtype([('passage', '<i4'), ('tf', '<i4')])
+
+
+@dataclass
+class CorpusResult:
+    """
+    A passage found by CorpusIndex.search().
+
+    Attributes:
+        key: The document's key, its accession number when added with add_filing()
+        passage: Position of the passage among the document's passages, the leaf
+                 nodes with text in document order
+        score: Relevance score (higher is better)
+        rank: Position in results (1-indexed)
+        text: The passage text
+        node_type: The passage node's type, e.g. 'paragraph', 'table', 'heading'
+        section: Heading of the section the passage is in, when known
+        bm25_score: BM25 score, normalized to the best match for hybrid searches
+        semantic_score: Structure score (hybrid searches only)
+        metadata: The document's metadata, e.g. form, company, filing_date
+    """
+    key: str
+    passage: int
+    score: float
+    rank: int
+    text: str
+    node_type: str
+    section: Optional[str] = None
+    bm25_score: Optional[float] = None
+    semantic_score: Optional[float] = None
+    metadata: Optional[Dict[str, Any]] = None
+
+    @property
+    def snippet(self) -> str:
+        """Get text snippet (first 200 chars)."""
+        if len(self.text) <= 200:
+            return self.text
+        return self.text[:197] + "..."
+
+
+def _node_types() -> List[str]:
+    from edgar.documents.types import NodeType
+    return [node_type.value for node_type in NodeType]
+
+
+_NODE_TYPES = _node_types()
+
+
+def document_passages(document: 'Document') -> List[Any]:
+    """The nodes ranked_search() ranks: leaf nodes with text, in document order."""
+    passages = []
+    for node in document.root.walk():
+        if node.children:
+            continue
+        text = node.text()
+        if text and text.strip():
+            passages.append(node)
+    return passages
+
+
+class _Segment:
+    """One immutable batch of documents, memory-mapped from disk."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        with open(path / 'meta.json') as f:
+            meta = json.load(f)
+        self.documents: List[Dict[str, Any]] = meta['documents']
+        self.sections: List[str] = meta['sections']
+        self.token_count: int = meta['tokens']
+        self.passages = np.load(path / 'passages.npy', mmap_mode='r')
+        self._terms: Optional[Dict[str, int]] = None
+        self._offsets = None
+        self._postings = None
+        self._text = None
+
+    @property
+    def passage_count(self) -> int:
+        return len(self.passages)
+
+    def _load_terms(self):
+        with open(self.path / 'terms.json') as f:
+            self._terms = {term: i for i, term in enumerate(json.load(f))}
+        self._offsets = np.load(self.path / 'offsets.npy', mmap_mode='r')
+        self._postings = np.load(self.path / 'postings.npy', mmap_mode='r')
+
+    def vocabulary(self) -> Dict[str, int]:
+        if self._terms is None:
+            self._load_terms()
+        return self._terms
+
+    def postings(self, term: str) -> Optional[np.ndarray]:
+        """The postings of a term, or None when the segment does not have it."""
+        index = self.vocabulary().get(term)
+        if index is None:
+            return None
+        return self._postings[self._offsets[index]:self._offsets[index + 1]]
+
+    def document_frequencies(self) -> np.ndarray:
+        """Passages containing each term of vocabulary(), in vocabulary order."""
+        self.vocabulary()
+        return np.diff(self._offsets)
+
+    def text(self, passage: int) -> str:
+        if self._text is None:
+            self._text = np.memmap(self.path / 'text.bin', dtype=np.uint8, mode='r') \
+                if (self.path / 'text.bin').stat().st_size else np.zeros(0, dtype=np.uint8)
+        record = self.passages[passage]
+        return bytes(self._text[record['text_start']:record['text_end']]).decode('utf-8')
+
+
+class CorpusIndex:
+    """
+    A persistent BM25 index over the passages of many documents.
+
+    Documents are added incrementally and searched together, without loading
+    them again. Documents cannot be removed or replaced; build a new index
+    for that.
+
+    Parameters:
+        path: Directory for the index (default: <edgar cache dir>/search/corpus)
+        k1: BM25 term frequency saturation (default: 1.5)
+        b: BM25 length normalization (default: 0.75)
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None, k1: float = 1.5, b: float = 0.75):
+        if path is None:
+            from edgar.paths import get_search_cache_directory
+            path = get_search_cache_directory(create=False) / 'corpus'
+        self.path = Path(path).expanduser()
+        self.k1 = k1
+        self.b = b
+        self.epsilon = 0.25  # BM25Okapi's floor for negative idf, as a fraction of the average idf
+        self.path.mkdir(parents=True, exist_ok=True)
+
+        self._segments: List[_Segment] = []
+        self._keys: Dict[str, Tuple[int, int]] = {}
+        self._average_idf: Optional[float] = None
+        self._load()
+
+    def _load(self):
+        manifest_path = self.path / _MANIFEST
+        if not manifest_path.exists():
+            return
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        if manifest.get('format') != CORPUS_INDEX_FORMAT:
+            raise ValueError(f"{self.path} is a corpus index in format {manifest.get('format')}, "
+                             f"this version of edgartools reads format {CORPUS_INDEX_FORMAT}. Rebuild the index.")
+        for name in manifest['segments']:
+            self._open_segment(self.path / name)
+
+    def _open_segment(self, path: Path):
+        segment = _Segment(path)
+        for position, document in enumerate(segment.documents):
+            self._keys[document['key']] = (len(self._segments), position)
+        self._segments.append(segment)
+        self._average_idf = None
+
+    def _write_manifest(self):
+        temp_path = self.path / f"{_MANIFEST}.{os.getpid()}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump({'format': CORPUS_INDEX_FORMAT,
+                       'segments': [segment.path.name for segment in self._segments]}, f)
+        os.replace(temp_path, self.path / _MANIFEST)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._keys
+
+    @property
+    def passage_count(self) -> int:
+        return sum(segment.passage_count for segment in self._segments)
+
+    def keys(self) -> List[str]:
+        """Keys of the indexed documents, in the order they were added."""
+        return [document['key'] for segment in self._segments for document in segment.documents]
+
+    def add_filing(self, filing: 'Filing') -> bool:
+        """
+        Parse a filing's primary document and add it, keyed by accession number.
+
+        Returns:
+            True if added, False if the filing is already indexed or has no HTML document
+        """
+        if filing.accession_no in self:
+            return False
+        document = filing.parse()
+        if document is None:
+            return False
+        return self.add(filing.accession_no, document, form=filing.form, company=filing.company,
+                        filing_date=str(filing.filing_date))
+
+    def add(self, key: str, document: 'Document', **metadata) -> bool:
+        """
+        Add one document to the index.
+
+        Args:
+            key: Unique key for the document, e.g. its accession number
+            document: The parsed Document
+            **metadata: JSON-serializable values returned with each result, e.g. form
+
+        Returns:
+            True if added, False if the key is already indexed or the document
+            has no text passages
+        """
+        return self.add_many([(key, document, metadata)]) == 1
+
+    def add_many(self, items: Iterable[Tuple[str, 'Document', Dict[str, Any]]]) -> int:
+        """
+        Add documents to the index as one new segment.
+
+        Adding documents in batches keeps the number of segments, and so the
+        per-query overhead, down.
+
+        Args:
+            items: (key, document, metadata) tuples
+
+        Returns:
+            The number of documents added. Keys already indexed are skipped, and
+            nothing is written if none of the documents has a text passage.
+        """
+        builder = _SegmentBuilder()
+        for key, document, metadata in items:
+            if key in self._keys or key in builder.keys:
+                continue
+            builder.add(key, document, metadata or {})
+        if not builder.records:
+            return 0
+
+        number = max((int(segment.path.name.split('-')[1]) for segment in self._segments), default=0) + 1
+        name = f"segment-{number:06d}"
+        temp_path = self.path / f"{name}.{os.getpid()}.tmp"
+        try:
+            builder.write(temp_path)
+            os.replace(temp_path, self.path / name)
+        except BaseException:
+            shutil.rmtree(temp_path, ignore_errors=True)
+            raise
+        self._open_segment(self.path / name)
+        self._write_manifest()
+        return len(builder.documents)
+
+    def search(self,
+               query: str,
+               top_k: int = 10,
+               algorithm: str = "bm25",
+               keys: Optional[Iterable[str]] = None,
+               boost_sections: Optional[List[str]] = None,
+               **metadata) -> List[CorpusResult]:
+        """
+        Rank every passage in the index against a query.
+
+        Args:
+            query: Search query
+            top_k: Maximum results to return
+            algorithm: "bm25", or "hybrid" for BM25 combined with structure signals
+                       the way HybridEngine does (0.8 BM25, 0.2 structure)
+            keys: Only return passages of these documents
+            boost_sections: Section names to boost (hybrid only)
+            **metadata: Only return passages of documents whose metadata has these
+                        values, e.g. form="10-K"
+
+        Returns:
+            Results sorted by score, best first
+        """
+        algorithm = algorithm.lower()
+        if algorithm not in ("bm25", "hybrid"):
+            raise ValueError(f"Unsupported algorithm: {algorithm}")
+        query_tokens = tokenize(preprocess_text(query))
+        if not query_tokens or self.passage_count == 0:
+            return []
+
+        scores = self._bm25_scores(query_tokens)
+        candidates = []
+        for segment_index, (segment, segment_scores) in enumerate(zip(self._segments, scores, strict=True)):
+            allowed = self._allowed_documents(segment, keys, metadata)
+            matched = np.flatnonzero(segment_scores > 0)
+            if allowed is not None:
+                matched = matched[np.isin(segment.passages['document'][matched], allowed)]
+            candidates.extend((segment_index, int(passage), float(segment_scores[passage])) for passage in matched)
+        if not candidates:
+            return []
+
+        if algorithm == "hybrid":
+            return self._hybrid_results(query, candidates, top_k, boost_sections or [])
+
+        candidates.sort(key=lambda candidate: candidate[2], reverse=True)
+        return [self._result(segment_index, passage, score, rank, bm25_score=score)
+                for rank, (segment_index, passage, score) in enumerate(candidates[:top_k], start=1)]
+
+    def _bm25_scores(self, query_tokens: List[str]) -> List[np.ndarray]:
+        """BM25Okapi scores of every passage, one array per segment."""
+        corpus_size = self.passage_count
+        token_count = sum(segment.token_count for segment in self._segments)
+        # Passages can be all stop words, leaving no tokens at all; their lengths are then 0 too
+        average_length = token_count / corpus_size if token_count else 1.0
+        scores = [np.zeros(segment.passage_count) for segment in self._segments]
+        for token in query_tokens:
+            postings = [segment.postings(token) for segment in self._segments]
+            frequency = sum(len(p) for p in postings if p is not None)
+            if frequency == 0:
+                continue
+            idf = math.log(corpus_size - frequency + 0.5) - math.log(frequency + 0.5)
+            if idf < 0:
+                idf = self.epsilon * self._get_average_idf()
+            for segment, segment_postings, segment_scores in zip(self._segments, postings, scores, strict=True):
+                if segment_postings is None:
+                    continue
+                passages = segment_postings['passage']
+                tf = segment_postings['tf'].astype(np.float64)
+                lengths = segment.passages['length'][passages]
+                segment_scores[passages] += idf * (tf * (self.k1 + 1) /
+                                                   (tf + self.k1 * (1 - self.b + self.b * lengths / average_length)))
+        return scores
+
+    def _get_average_idf(self) -> float:
+        """Average idf over the whole vocabulary, only needed for terms in most passages."""
+        if self._average_idf is None:
+            if len(self._segments) == 1:
+                frequencies = self._segments[0].document_frequencies()
+            else:
+                merged: Counter = Counter()
+                for segment in self._segments:
+                    merged.update(dict(zip(segment.vocabulary(), segment.document_frequencies().tolist(),
+                                           strict=True)))
+                frequencies = np.fromiter(merged.values(), dtype=np.int64, count=len(merged))
+            corpus_size = self.passage_count
+            idf = np.log(corpus_size - frequencies + 0.5) - np.log(frequencies + 0.5)
+            self._average_idf = float(idf.sum() / len(idf))
+        return self._average_idf
+
+    def _allowed_documents(self, segment: _Segment, keys, metadata) -> Optional[np.ndarray]:
+        """Positions of the segment's documents a search is restricted to, None for all."""
+        if keys is None and not metadata:
+            return None
+        keys = set(keys) if keys is not None else None
+        return np.array([position for position, document in enumerate(segment.documents)
+                         if (keys is None or document['key'] in keys)
+                         and all(document['metadata'].get(name) == value for name, value in metadata.items())],
+                        dtype=np.int32)
+
+    def _hybrid_results(self, query: str, candidates, top_k: int, boost_sections: List[str]) -> List[CorpusResult]:
+        bm25_weight, semantic_weight = 0.8, 0.2
+        is_item_query = bool(re.search(r'item\s+\d+[a-z]?', query.lower()))
+        boosts = [section.lower() for section in boost_sections]
+        max_bm25 = max(candidate[2] for candidate in candidates)
+
+        scored = []
+        for segment_index, passage, bm25_score in candidates:
+            segment = self._segments[segment_index]
+            record = segment.passages[passage]
+            score = float(record['structure'])
+            section_boost = float(record['section_boost'])
+            if not section_boost and boosts and record['section'] >= 0:
+                section_lower = segment.sections[record['section']].lower()
+                if any(boost in section_lower for boost in boosts):
+                    section_boost = 1.5
+            score += section_boost
+            if is_item_query and record['item_header']:
+                score += 1.5
+            semantic_score = min(score / 7.0, 1.0)
+            normalized = bm25_score / max_bm25 if max_bm25 > 0 else bm25_score
+            scored.append((bm25_weight * normalized + semantic_weight * semantic_score,
+                           segment_index, passage, normalized, semantic_score))
+
+        scored.sort(key=lambda item: item[0], reverse=True)
+        return [self._result(segment_index, passage, score, rank, bm25_score=normalized,
+                             semantic_score=semantic_score)
+                for rank, (score, segment_index, passage, normalized, semantic_score)
+                in enumerate(scored[:top_k], start=1)]
+
+    def _result(self, segment_index: int, passage: int, score: float, rank: int, **scores) -> CorpusResult:
+        segment = self._segments[segment_index]
+        record = segment.passages[passage]
+        document = segment.documents[record['document']]
+        return CorpusResult(
+            key=document['key'],
+            passage=int(record['ordinal']),
+            score=score,
+            rank=rank,
+            text=segment.text(passage),
+            node_type=_NODE_TYPES[record['node_type']],
+            section=segment.sections[record['section']] if record['section'] >= 0 else None,
+            metadata=document['metadata'],
+            **scores,
+        )
+
+
+class _SegmentBuilder:
+    """Accumulates documents in memory and writes them out as a segment."""
+
+    def __init__(self):
+        self.documents: List[Dict[str, Any]] = []
+        self.keys = set()
+        self.records: List[tuple] = []
+        self.texts: List[bytes] = []
+        self.text_size = 0
+        self.tokens = 0
+        self.sections: Dict[str, int] = {}
+        self.postings: Dict[str, List[Tuple[int, int]]] = {}
+
+    def add(self, key: str, document: 'Document', metadata: Dict[str, Any]):
+        document_index = len(self.documents)
+        self.documents.append({'key': key, 'metadata': metadata})
+        self.keys.add(key)
+
+        for ordinal, node in enumerate(document_passages(document)):
+            text = node.text()
+            tokens = tokenize(preprocess_text(text))
+            passage = len(self.records)
+            for term, tf in Counter(tokens).items():
+                self.postings.setdefault(term, []).append((passage, tf))
+            self.tokens += len(tokens)
+
+            encoded = text.encode('utf-8')
+            self.texts.append(encoded)
+            text_start = self.text_size
+            self.text_size += len(encoded)
+
+            section = _get_node_section(node)
+            section_index = -1
+            section_boost = 0.0
+            if section:
+                section_index = self.sections.setdefault(section, len(self.sections))
+                section_lower = section.lower()
+                section_boost = next((boost for name, boost in SECTION_IMPORTANCE.items() if name in section_lower),
+                                     0.0)
+            # Everything compute_semantic_scores() adds up that depends on neither the
+            # query nor boost_sections
+            structure = (_get_node_type_boost(node) + _get_semantic_type_boost(node) +
+                         _detect_cross_references(node) + _detect_gateway_content(node, '') +
+                         _get_xbrl_boost(node) + _get_quality_boost(node))
+
+            self.records.append((document_index, ordinal, len(tokens), text_start, self.text_size,
+                                 _NODE_TYPES.index(node.type.value), _get_item_header_boost(node) > 0,
+                                 section_index, section_boost, structure))
+
+    def write(self, path: Path):
+        path.mkdir(parents=True)
+        terms = sorted(self.postings)
+        offsets = np.zeros(len(terms) + 1, dtype=np.int64)
+        postings = np.empty(sum(len(p) for p in self.postings.values()), dtype=_POSTING_DTYPE)
+        position = 0
+        for i, term in enumerate(terms):
+            term_postings = self.postings[term]
+            postings[position:position + len(term_postings)] = term_postings
+            position += len(term_postings)
+            offsets[i + 1] = position
+
+        with open(path / 'terms.json', 'w') as f:
+            json.dump(terms, f, separators=(',', ':'))
+        np.save(path / 'offsets.npy', offsets)
+        np.save(path / 'postings.npy', postings)
+        np.save(path / 'passages.npy', np.array(self.records, dtype=_PASSAGE_DTYPE))
+        with open(path / 'text.bin', 'wb') as f:
+            f.writelines(self.texts)
+        with open(path / 'meta.json', 'w') as f:
+            json.dump({'documents': self.documents,
+                       'sections': sorted(self.sections, key=self.sections.get),
+                       'tokens': self.tokens}, f)
@@ -124,23 +124,17 @@ class FastTableRenderer:
         matrix = TableMatrix()
         matrix.build_from_rows(table_node.headers, table_node.rows)
 
-        # Extract headers from expanded matrix
-        headers = []
-        if table_node.headers:
-            for row_idx in range(len(table_node.headers)):
-                expanded_row = matrix.get_expanded_row(row_idx)
-                # Convert Cell objects to strings, handling None values
-                row_texts = [cell.text().strip() if cell else '' for cell in expanded_row]
-                headers.append(row_texts)
-
-        # Extract data rows from expanded matrix
-        rows = []
-        start_row = len(table_node.headers) if table_node.headers else 0
-        for row_idx in range(start_row, matrix.row_count):
-            expanded_row = matrix.get_expanded_row(row_idx)
-            # Convert Cell objects to strings, handling None values
-            row_texts = [cell.text().strip() if cell else '' for cell in expanded_row]
-            rows.append(row_texts)
+        # Read each row's text straight off the grid, as get_expanded_row() would
+        # expand it: a cell's text at its origin, '' where a span continues or
+        # nothing was placed
+        texts = [
+            ['' if mc.original_cell is None or mc.is_spanned else mc.original_cell.text().strip()
+             for mc in matrix_row]
+            for matrix_row in matrix.matrix
+        ]
+        header_count = len(table_node.headers) if table_node.headers else 0
+        headers = texts[:header_count]
+        rows = texts[header_count:]
 
         # Render the table
         table_text = self.render_table_data(headers, rows)
@@ -436,17 +430,24 @@ class FastTableRenderer:
         """Calculate optimal column widths based on content."""
         col_widths = [self.style.min_col_width] * max_cols
 
+        padding = self.style.padding * 2
+        max_col_width = self.style.max_col_width
+
         # Find the maximum content width for each column
         for row in all_rows:
             for col_idx in range(min(len(row), max_cols)):
                 content = str(row[col_idx]) if row[col_idx] else ""
                 # Handle multi-line content
-                max_line_width = max((len(line) for line in content.split('\n')), default=0)
-                content_width = max_line_width + (self.style.padding * 2)
+                if '\n' in content:
+                    max_line_width = max(len(line) for line in content.split('\n'))
+                else:
+                    max_line_width = len(content)
+                content_width = max_line_width + padding
 
                 # Apply limits
-                content_width = min(content_width, self.style.max_col_width)
-                col_widths[col_idx] = max(col_widths[col_idx], content_width)
+                content_width = min(content_width, max_col_width)
+                if content_width > col_widths[col_idx]:
+                    col_widths[col_idx] = content_width
 
         return col_widths
 
@@ -541,10 +542,16 @@ class FastTableRenderer:
         """Format a single row with proper alignment and padding."""
         cells = []
         border = self.style.border_char
+        padding = self.style.padding
+        pad = ' ' * padding
+        row_length = len(row)
+        alignment_count = len(alignments)
 
         for col_idx, width in enumerate(col_widths):
             # Get cell content
-            content = str(row[col_idx]) if col_idx < len(row) else ""
+            content = row[col_idx] if col_idx < row_length else ""
+            if not isinstance(content, str):
+                content = str(content)
 
             # Handle multi-line content (take first line only for table)
             if '\n' in content:
@@ -553,25 +560,24 @@ class FastTableRenderer:
             content = content.strip()
 
             # Calculate available width for content
-            available_width = width - (self.style.padding * 2)
+            available_width = width - (padding * 2)
 
             # Truncate if too long
             if len(content) > available_width:
                 content = content[:available_width-3] + "..."
 
             # Apply alignment
-            alignment = alignments[col_idx] if col_idx < len(alignments) else Alignment.LEFT
+            alignment = alignments[col_idx] if col_idx < alignment_count else Alignment.LEFT
 
-            if alignment == Alignment.RIGHT:
+            if alignment is Alignment.RIGHT:
                 aligned_content = content.rjust(available_width)
-            elif alignment == Alignment.CENTER:
+            elif alignment is Alignment.CENTER:
                 aligned_content = content.center(available_width)
             else:  # LEFT
                 aligned_content = content.ljust(available_width)
 
             # Add padding
-            padded_cell = ' ' * self.style.padding + aligned_content + ' ' * self.style.padding
-            cells.append(padded_cell)
+            cells.append(pad + aligned_content + pad)
 
         # Join with borders. Trailing run trimmed: padding the final column out
         # to its width serves column alignment, and nothing follows it on the
@@ -590,6 +596,10 @@ class FastTableRenderer:
 
         Returns a list of formatted lines, one for each line of text in the cells.
         """
+        # Most rows have no multi-line cell and are a single line
+        if not any('\n' in content for content in row if content):
+            return [self._format_row([content or '' for content in row], col_widths, alignments)]
+
         # Split each cell by newlines
         cell_lines = []
         max_lines = 1
@@ -2,7 +2,8 @@
 Document builder that converts parsed HTML tree into document nodes.
 """
 
-from typing import Any, Dict, Optional
+from dataclasses import replace
+from typing import Any, Dict, Optional, Tuple
 
 from lxml.html import HtmlElement
 
@@ -51,6 +52,15 @@ class DocumentBuilder:
         'ix:nonfraction', 'ix:footnote', 'ix:fraction'
     }
 
+    # Styles implied by the tag itself
+    TAG_STYLES = {
+        'b': ('font_weight', 'bold'),
+        'strong': ('font_weight', 'bold'),
+        'i': ('font_style', 'italic'),
+        'em': ('font_style', 'italic'),
+        'u': ('text_decoration', 'underline'),
+    }
+
     # Elements to skip
     SKIP_ELEMENTS = {
         'script', 'style', 'meta', 'link', 'noscript',
@@ -70,6 +80,8 @@ class DocumentBuilder:
         self.strategies = strategies
         self.style_parser = StyleParser()
         self.context = ParseContext()
+        # One Style per distinct (style attribute, tag style, align), shared by every node using it
+        self._styles: Dict[Tuple[str, Optional[Tuple[str, str]], Optional[str]], Style] = {}
 
         # Track XBRL context
         self.xbrl_context_stack = []
@@ -551,24 +563,31 @@ class DocumentBuilder:
         return any(phrase in text_content for phrase in nav_phrases)
 
     def _extract_style(self, element: HtmlElement) -> Style:
-        """Extract style from element."""
-        style_str = element.get('style', '')
-        style = self.style_parser.parse(style_str)
-
-        # Add tag-specific styles
-        tag = element.tag.lower()
-        if tag == 'b' or tag == 'strong':
-            style.font_weight = 'bold'
-        elif tag == 'i' or tag == 'em':
-            style.font_style = 'italic'
-        elif tag == 'u':
-            style.text_decoration = 'underline'
-
-        # Handle alignment
-        align = element.get('align')
-        if align:
-            style.text_align = align
+        """Extract style from element.
 
+        Styles are interned: elements with the same style attribute, tag and
+        alignment share one Style. Nodes never modify their style, so the shared
+        object is safe, and a large filing needs a few hundred Styles instead of
+        one per node. The tag and alignment are applied to a copy, never to the
+        parser's cached Style, which every element with that attribute shares.
+        """
+        style_str = element.get('style', '')
+        tag_style = self.TAG_STYLES.get(element.tag.lower())
+        align = element.get('align') or None
+        key = (style_str, tag_style, align)
+        style = self._styles.get(key)
+        if style is None:
+            style = self.style_parser.parse(style_str)
+            overrides = {}
+            # Add tag-specific styles
+            if tag_style:
+                overrides[tag_style[0]] = tag_style[1]
+            # Handle alignment
+            if align:
+                overrides['text_align'] = align
+            if overrides:
+                style = replace(style, **overrides)
+            self._styles[key] = style
         return style
 
     def _get_element_text(self, element: HtmlElement) -> str:
@@ -127,7 +127,7 @@ class Cell:
             return None
 
 
-@dataclass
+@dataclass(slots=True)
 class Row:
     """Table row representation."""
     cells: List[Cell]
@@ -204,17 +204,20 @@ class TableNode(Node, CacheableMixin):
     def text(self) -> str:
         """Convert table to text representation with caching for performance."""
         def _generate_text():
-            # Check if we should use fast rendering
-            config = getattr(self, '_config', None)
-            if config and getattr(config, 'fast_table_rendering', False):
+            if self._uses_fast_rendering():
                 return self._fast_text_rendering()
             else:
-                # Use Rich renderer (current behavior)
+                # Rich renderer, for configs that opt out of fast rendering
                 rich_table = self.render(width=195)
                 return rich_to_text(rich_table)
 
         return self._get_cached_text(_generate_text)
 
+    def _uses_fast_rendering(self) -> bool:
+        """Whether text() renders with FastTableRenderer, which is the default even without a config."""
+        config = getattr(self, '_config', None)
+        return config is None or getattr(config, 'fast_table_rendering', True)
+
     def _fast_text_rendering(self) -> str:
         """
         Fast text rendering using FastTableRenderer with simple() style (clean, borderless).
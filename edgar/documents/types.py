@@ -49,7 +49,9 @@ class TableType(Enum):
     EXHIBIT_INDEX = auto()
 
 
-@dataclass
+# slots=True: every node references a Style. They are interned per document by
+# DocumentBuilder, but one per distinct style attribute still adds up.
+@dataclass(slots=True)
 class Style:
     """Unified style representation."""
     font_size: Optional[float] = None
@@ -12,6 +12,7 @@ from edgar.documents.utils.html_utils import (
     create_lxml_parser,
     remove_xml_declaration,
     terminate_unclosed_comments,
+    utf8_length,
 )
 from edgar.documents.utils.table_matrix import ColumnAnalyzer, MatrixCell, TableMatrix
 
@@ -35,6 +36,7 @@ __all__ = [
     # 'CacheableMixin',  # Not exported - import directly to avoid circular imports
     'remove_xml_declaration',
     'terminate_unclosed_comments',
+    'utf8_length',
     'create_lxml_parser',
     # 'process_table_matrix'  # Not exported - import directly to avoid circular imports
 ]
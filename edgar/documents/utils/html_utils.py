@@ -5,10 +5,13 @@ This module consolidates common HTML processing utilities used across
 the parser, preprocessor, and simple parser implementations.
 """
 
+import re
 from typing import Optional
 
 import lxml.html
 
+_XML_DECLARATION = re.compile(r'\s*<\?xml')
+
 
 def remove_xml_declaration(html: str) -> str:
     """
@@ -35,8 +38,8 @@ def remove_xml_declaration(html: str) -> str:
         >>> remove_xml_declaration(html)
         '<!DOCTYPE html><html>...'
     """
-    html_stripped = html.strip()
-    if html_stripped.startswith('<?xml'):
+    # Matched in place: stripping first would copy the whole document just to look at its start
+    if _XML_DECLARATION.match(html):
         xml_end = html.find('?>') + 2
         return html[xml_end:]
     return html
@@ -71,11 +74,19 @@ def terminate_unclosed_comments(html: str) -> str:
         >>> terminate_unclosed_comments('<!-- note --><p>hi</p>')  # already closed
         '<!-- note --><p>hi</p>'
     """
-    if '<!--' not in html:
+    # Find the first comment that is never closed. Documents without one are
+    # returned as they are instead of being rebuilt piece by piece.
+    start = html.find('<!--')
+    while start != -1:
+        end = html.find('-->', start + 4)
+        if end == -1:
+            break
+        start = html.find('<!--', end + 3)
+    if start == -1:
         return html
 
-    out = []
-    pos = 0
+    out = [html[:start]]
+    pos = start
     while True:
         start = html.find('<!--', pos)
         if start == -1:
@@ -101,6 +112,33 @@ def terminate_unclosed_comments(html: str) -> str:
     return ''.join(out)
 
 
+def utf8_length(text: str) -> int:
+    """
+    Size of text in bytes once encoded as UTF-8, without encoding it whole.
+
+    ASCII text (most SEC filings, which spell everything else as entities) is
+    sized by its length. Other text is encoded a chunk at a time, so sizing a
+    large document never allocates a second full copy of it.
+
+    Args:
+        text: Text to size
+
+    Returns:
+        Number of bytes in the UTF-8 encoding of text
+
+    Examples:
+        >>> utf8_length('<p>10-K</p>')
+        11
+
+        >>> utf8_length('caf\u00e9')
+        5
+    """
+    if text.isascii():
+        return len(text)
+    chunk = 1 << 20
+    return sum(len(text[i:i + chunk].encode('utf-8')) for i in range(0, len(text), chunk))
+
+
 def create_lxml_parser(
     remove_blank_text: bool = False,
     remove_comments: bool = True,
@@ -0,0 +1,93 @@
+"""A one-pass text index over an lxml tree for anchor-bounded section text.
+
+TOC section detection extracts the text of every section it finds: the size,
+header-only and successor guardrails are all calibrated on that text. Each
+extraction used to walk the tree from the section's start anchor to its end
+anchor, so a 10-K with 24 TOC sections paid for 24 walks covering the filing
+roughly twice over (Part containers include their items), and then paid again
+when the caller asked for the one section it wanted.
+
+``SectionTextIndex`` walks the tree once and records the text fragments the
+per-section walk would have collected, in document order, along with where each
+anchor element falls in that sequence. A section's text is then a slice of the
+fragment list between two anchor positions. Only the walk's raw text is indexed:
+nothing is rendered, and tables contribute their cell text exactly as the walk
+did.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from lxml import etree
+
+from edgar.documents.utils.anchor_targets import find_anchor_targets
+
+__all__ = ['BLOCK_ELEMENTS', 'SectionTextIndex']
+
+# Block-level elements that end with a paragraph break in section text
+BLOCK_ELEMENTS = frozenset({'p', 'div', 'table', 'tr', 'li', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+                            'blockquote', 'pre', 'section', 'article', 'header', 'footer'})
+
+
+class SectionTextIndex:
+    """The text fragments of a tree in document order, with anchor positions.
+
+    For every element carrying an ``id`` (or an ``<a name>``) the index keeps its
+    place in document order and two positions in ``fragments``: before and after
+    the element's own ``.text``. Anchor-bounded sections start after their start anchor's own text and stop
+    before their end anchor's, which is what the section walk did.
+    """
+
+    def __init__(self, fragments: List[str], positions: Dict[object, Tuple[int, int, int]]):
+        self.fragments = fragments
+        self._positions = positions
+
+    @classmethod
+    def build(cls, tree) -> 'SectionTextIndex':
+        """Index ``tree`` with a single document-order walk."""
+        fragments: List[str] = []
+        positions: Dict[object, Tuple[int, int, int]] = {}
+        append = fragments.append
+        # The section walk climbs out of the start anchor's container, so index the whole document
+        root = tree.getroottree().getroot()
+        for order, (event, el) in enumerate(etree.iterwalk(root, events=('start', 'end'))):
+            if event == 'start':
+                before = len(fragments)
+                if el.text:
+                    append(el.text)
+                if el.get('id') or (el.tag == 'a' and el.get('name')):
+                    positions[el] = (order, before, len(fragments))
+            else:
+                tag = el.tag.lower() if isinstance(el.tag, str) else ''
+                if tag in BLOCK_ELEMENTS:
+                    append('\n\n')
+                if el.tail:
+                    append(el.tail)
+        return cls(fragments, positions)
+
+    def section_text(self, tree, anchor_id: str, end_element_id: Optional[str] = None) -> Optional[str]:
+        """The raw text from ``anchor_id`` up to ``end_element_id``.
+
+        Returns None when the boundary is one the index cannot answer exactly,
+        so the caller falls back to walking the tree: a start anchor that
+        resolves to several elements (the walk restarts the section at each
+        repeat) or an end that shares the start's id.
+        """
+        start_elements = find_anchor_targets(tree, anchor_id)
+        if len(start_elements) != 1 or end_element_id == anchor_id:
+            return None
+        start = self._positions.get(start_elements[0])
+        if start is None:
+            return None
+        start_order, _, begin = start
+
+        end = len(self.fragments)
+        if end_element_id:
+            # The first element carrying the end id after the start anchor
+            for element in find_anchor_targets(tree, end_element_id):
+                position = self._positions.get(element)
+                if position is None:
+                    return None
+                if position[0] > start_order:
+                    end = position[1]
+                    break
+        return ''.join(self.fragments[begin:end])
@@ -93,23 +93,20 @@ class TableMatrix:
     def _calculate_dimensions(self, rows: List[List[Cell]]):
         """Calculate the actual dimensions considering colspan.
 
-        Note this runs before the grid is materialised, so `_is_occupied` has
-        nothing to consult and always reports False here. Rowspan occupancy is
-        resolved for real in `_place_cells`, which widens the grid if needed.
+        Note this runs before the grid is materialised, so rowspan occupancy
+        from rows above cannot be known yet and each row is measured by its
+        colspans alone. Rowspan occupancy is resolved for real in
+        `_place_cells`, which widens the grid if needed.
         """
         max_cols = 0
 
-        for row_idx, row in enumerate(rows):
+        for row in rows:
             col_pos = 0
             for cell in row:
-                # Skip positions that might be occupied by rowspan from above
-                while col_pos < max_cols and self._is_occupied(row_idx, col_pos):
-                    col_pos += 1
-
                 # This cell will occupy from col_pos to col_pos + colspan
-                col_end = min(col_pos + cell.colspan, self.MAX_COLUMNS)
-                max_cols = max(max_cols, col_end)
-                col_pos = col_end
+                col_pos = min(col_pos + cell.colspan, self.MAX_COLUMNS)
+                if col_pos > max_cols:
+                    max_cols = col_pos
 
         if max_cols >= self.MAX_COLUMNS:
             logger.debug("Table width capped at %d columns", self.MAX_COLUMNS)
@@ -136,51 +133,42 @@ class TableMatrix:
 
     def _place_cells(self, rows: List[List[Cell]]):
         """Place cells in the matrix handling colspan and rowspan"""
+        matrix = self.matrix
         for row_idx, row in enumerate(rows):
             col_pos = 0
+            matrix_row = matrix[row_idx]
 
-            for cell_idx, cell in enumerate(row):
+            for cell in row:
                 # Find next available column position
-                while col_pos < self.col_count and self.matrix[row_idx][col_pos].original_cell is not None:
+                while col_pos < self.col_count and matrix_row[col_pos].original_cell is not None:
                     col_pos += 1
 
                 if col_pos >= self.col_count:
                     # Need to expand matrix
                     self._expand_columns(col_pos + cell.colspan)
 
-                # Special handling for cells with colspan > 1 containing numeric values
-                # Only apply this logic for Table 15-style alignment issues
-                # Check if this looks like a financial value that should be right-aligned
-                cell_text = cell.text().strip()
-
-                # Check for numeric values that need special alignment
-                # This is specifically for cases like "167,045" that should align with "$167,045"
-                has_comma_separator = ',' in cell_text
-                digit_ratio = sum(c.isdigit() for c in cell_text) / len(cell_text) if cell_text else 0
-
-                # Only apply special placement for colspan=2 numeric values in data rows
-                # This handles Table 15's specific case without breaking Table 13
-                is_special_numeric = (cell.colspan == 2 and  # Specifically colspan=2
-                                    has_comma_separator and
-                                    digit_ratio > 0.5 and  # More than 50% digits
-                                    not cell_text.startswith('$') and
-                                    not any(month in cell_text.lower() for month in
-                                           ['jan', 'feb', 'mar', 'apr', 'may', 'jun',
-                                            'jul', 'aug', 'sep', 'oct', 'nov', 'dec']) and
-                                    row_idx > 1)  # Not a header row (allow for multi-row headers)
+                colspan = cell.colspan
+                rowspan = cell.rowspan
+
+                # The common case, a plain cell, needs none of the span handling below
+                if colspan == 1 and rowspan == 1:
+                    if col_pos < self.col_count:
+                        matrix_row[col_pos] = MatrixCell(cell, False, row_idx, col_pos)
+                    col_pos += 1
+                    continue
 
                 # Spans can only ever reach the edge of the grid, so bound the
                 # loops rather than iterating a corrupt span and discarding it
-                span_rows = max(0, min(cell.rowspan, self.row_count - row_idx))
-                span_cols = max(0, min(cell.colspan, self.col_count - col_pos))
+                span_rows = max(0, min(rowspan, self.row_count - row_idx))
+                span_cols = max(0, min(colspan, self.col_count - col_pos))
 
-                if is_special_numeric:
+                if colspan == 2 and row_idx > 1 and self._is_special_numeric(cell):
                     # Place empty cell at first position, content at second position
                     # This is specifically for Table 15 alignment
                     for r in range(span_rows):
                         # First column of span: empty
                         if row_idx + r < self.row_count and col_pos < self.col_count:
-                            self.matrix[row_idx + r][col_pos] = MatrixCell()
+                            matrix[row_idx + r][col_pos] = MatrixCell()
 
                         # Second column of span: the actual content
                         if row_idx + r < self.row_count and col_pos + 1 < self.col_count:
@@ -190,7 +178,7 @@ class TableMatrix:
                                 row_origin=row_idx,
                                 col_origin=col_pos + 1
                             )
-                            self.matrix[row_idx + r][col_pos + 1] = matrix_cell
+                            matrix[row_idx + r][col_pos + 1] = matrix_cell
 
                         # Remaining columns of span: mark as spanned (though colspan=2 has no remaining)
                         for c in range(2, span_cols):
@@ -201,7 +189,7 @@ class TableMatrix:
                                     row_origin=row_idx,
                                     col_origin=col_pos + 1
                                 )
-                                self.matrix[row_idx + r][col_pos + c] = matrix_cell
+                                matrix[row_idx + r][col_pos + c] = matrix_cell
                 else:
                     # Normal placement for other cells
                     for r in range(span_rows):
@@ -213,9 +201,28 @@ class TableMatrix:
                                     row_origin=row_idx,
                                     col_origin=col_pos
                                 )
-                                self.matrix[row_idx + r][col_pos + c] = matrix_cell
+                                matrix[row_idx + r][col_pos + c] = matrix_cell
 
-                col_pos += cell.colspan
+                col_pos += colspan
+
+    @staticmethod
+    def _is_special_numeric(cell: Cell) -> bool:
+        """
+        Whether a colspan=2 data cell holds a financial value that belongs in its second column.
+
+        This is specifically for cases like "167,045" that should align with
+        "$167,045" (Table 15-style alignment), without breaking Table 13.
+        """
+        cell_text = cell.text().strip()
+        if ',' not in cell_text or cell_text.startswith('$'):
+            return False
+        # More than 50% digits
+        if sum(c.isdigit() for c in cell_text) / len(cell_text) <= 0.5:
+            return False
+        lowered = cell_text.lower()
+        return not any(month in lowered for month in
+                       ['jan', 'feb', 'mar', 'apr', 'may', 'jun',
+                        'jul', 'aug', 'sep', 'oct', 'nov', 'dec'])
 
     def _expand_columns(self, new_col_count: int):
         """Expand matrix to accommodate more columns"""
@@ -21,6 +21,7 @@ from edgar.entity.entity_facts import (
     CompanyFactsNotFoundError,
     get_company_facts,
 )
+from edgar.entity.facts_loader import get_company_facts_many
 from edgar.entity.filings import EntityFiling, EntityFilings
 from edgar.entity.search import CompanySearchIndex, CompanySearchResults, find_company
 from edgar.entity.submissions import (
@@ -86,6 +87,7 @@ __all__ = [
 
     # Fact functions
     'get_company_facts',
+    'get_company_facts_many',
 
     # Exceptions
     'CompanyNotFoundError',
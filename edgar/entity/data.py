@@ -137,12 +137,14 @@ def create_company_filings(filings_json: Dict[str, Any], cik: int, company_name:
     return EntityFilings(recent_filings, cik=cik, company_name=company_name)
 
 
-def parse_entity_submissions(cjson: Dict[str, Any]) -> 'CompanyData':
+def parse_entity_submissions(cjson: Dict[str, Any], filing_table: Optional[pa.Table] = None) -> 'CompanyData':
     """
     Parse entity submissions from the SEC API.
 
     Args:
         cjson: The JSON data from the SEC submissions API
+        filing_table: The entity's filings, when they are already in a table, instead of
+                      the recent filings in the JSON
 
     Returns:
         A CompanyData object representing the entity
@@ -185,7 +187,9 @@ def parse_entity_submissions(cjson: Dict[str, Any]) -> 'CompanyData':
             state_or_country=business_addr['stateOrCountry'],
             zipcode=business_addr['zipCode'],
         ),
-        filings=create_company_filings(cjson['filings'], cik=cik, company_name=company_name),
+        filings=(EntityFilings(filing_table, cik=cik, company_name=company_name)
+                 if filing_table is not None
+                 else create_company_filings(cjson['filings'], cik=cik, company_name=company_name)),
         insider_transaction_for_owner_exists=bool(cjson['insiderTransactionForOwnerExists']),
         insider_transaction_for_issuer_exists=bool(cjson['insiderTransactionForIssuerExists']),
         ein=cjson['ein'],
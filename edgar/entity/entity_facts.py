@@ -9,7 +9,7 @@ import warnings
 from collections import OrderedDict, defaultdict
 from datetime import date
 from functools import cached_property
-from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Union as TypingUnion
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Mapping, Optional, Union as TypingUnion
 
 if TYPE_CHECKING:
     from edgar.entity.query import FactQuery
@@ -21,6 +21,7 @@ if TYPE_CHECKING:
 from typing import Union
 
 import httpx
+import numpy as np
 import orjson as json
 import pandas as pd
 from pandas.core.interchange.dataframe_protocol import DataFrame
@@ -34,6 +35,7 @@ from rich.text import Text
 
 from edgar.core import log
 from edgar.entity.enhanced_statement import MultiPeriodStatement
+from edgar.entity.fact_table import FactTable
 from edgar.entity.models import FinancialFact
 from edgar.entity.utils import normalize_period_to_entity_facts
 from edgar.httprequests import download_json
@@ -86,6 +88,8 @@ def load_company_facts_from_local(cik: int) -> Dict[str, Any]:
     return json.loads(company_facts_file.read_text())
 
 
+# How many companies' EntityFacts stay in memory. One by default, since each can take 40-80 MB;
+# raise it with set_company_facts_cache_size() to keep a peer group loaded.
 _COMPANY_FACTS_CACHE_MAXSIZE = 1
 
 _company_facts_cache: OrderedDict[int, 'EntityFacts'] = OrderedDict()
@@ -101,6 +105,19 @@ def clear_company_facts_cache():
     _company_facts_cache.clear()
 
 
+def set_company_facts_cache_size(maxsize: int):
+    """Set how many companies' EntityFacts the in-memory cache keeps, evicting the least recently used beyond it.
+
+    Batch loads with load_company_facts() cache under the same bound, so raise it
+    to look a loaded peer group up again without reloading it.
+    """
+    global _COMPANY_FACTS_CACHE_MAXSIZE
+    if maxsize < 0:
+        raise ValueError(f"maxsize must be zero or more, not {maxsize}")
+    _COMPANY_FACTS_CACHE_MAXSIZE = maxsize
+    _evict_company_facts()
+
+
 def get_company_facts(cik: int):
     """
     Get company facts for a given CIK.
@@ -114,9 +131,8 @@ def get_company_facts(cik: int):
     Raises:
         CompanyFactsNotFoundError: If no facts are found for the given CIK
     """
-    cached = _company_facts_cache.get(cik)
+    cached = _cached_company_facts(cik)
     if cached is not None:
-        _company_facts_cache.move_to_end(cik)
         return cached
 
     if is_using_local_storage():
@@ -133,13 +149,31 @@ def get_company_facts(cik: int):
     from edgar.entity.parser import EntityFactsParser
     result = EntityFactsParser.parse_company_facts(company_facts_json)
     if result is not None:
-        _company_facts_cache[cik] = result
-        # Evict oldest entry if cache exceeds max size
-        while len(_company_facts_cache) > _COMPANY_FACTS_CACHE_MAXSIZE:
-            _company_facts_cache.popitem(last=False)
+        _cache_company_facts(cik, result)
     return result
 
 
+def _cached_company_facts(cik: int) -> Optional['EntityFacts']:
+    """The EntityFacts in the in-memory cache for a cik, marked as the most recently used."""
+    cached = _company_facts_cache.get(cik)
+    if cached is not None:
+        _company_facts_cache.move_to_end(cik)
+    return cached
+
+
+def _cache_company_facts(cik: int, facts: 'EntityFacts'):
+    """Add EntityFacts to the in-memory cache, evicting the least recently used beyond _COMPANY_FACTS_CACHE_MAXSIZE."""
+    _company_facts_cache[cik] = facts
+    _company_facts_cache.move_to_end(cik)
+    _evict_company_facts()
+
+
+def _evict_company_facts():
+    # Evict oldest entries while the cache exceeds max size
+    while len(_company_facts_cache) > _COMPANY_FACTS_CACHE_MAXSIZE:
+        _company_facts_cache.popitem(last=False)
+
+
 class EntityFacts:
     """
     AI-ready company facts with investment-focused analytics.
@@ -149,8 +183,9 @@ class EntityFacts:
     consumption patterns.
     """
 
-    def __init__(self, cik: int, name: str, facts: List[FinancialFact],
-                 sic_code: Optional[str] = None, ticker: Optional[str] = None):
+    def __init__(self, cik: int, name: str, facts: Optional[List[FinancialFact]] = None,
+                 sic_code: Optional[str] = None, ticker: Optional[str] = None,
+                 fact_table: Optional[FactTable] = None):
         """
         Initialize EntityFacts with company information and facts.
 
@@ -161,14 +196,51 @@ class EntityFacts:
             sic_code: Optional SIC code for industry-specific statement enhancements
             ticker: Optional ticker symbol for industry lookup (for curated industries
                    like payment_networks where SIC codes don't map cleanly)
+            fact_table: The facts as columns, in place of facts. FinancialFact objects
+                   are then only built for the facts that are used.
         """
         self.cik = cik
         self.name = name
-        self._facts = facts
+        self._fact_list = facts if facts is not None or fact_table is not None else []
+        self._fact_table = fact_table
+        self._index = None
         self._sic_code = sic_code
         self._ticker = ticker
         self._sic_resolver = None
-        self._fact_index = self._build_indices()
+
+    @property
+    def _facts(self) -> List[FinancialFact]:
+        """All facts as a list, built from the fact table the first time it is needed."""
+        if self._fact_list is None:
+            self._fact_list = self._fact_table.facts()
+        return self._fact_list
+
+    @_facts.setter
+    def _facts(self, facts: List[FinancialFact]):
+        self._fact_list = facts
+        self._fact_table = None
+        self._index = None
+
+    @property
+    def _table(self) -> FactTable:
+        """The facts as columns. A list of facts that has grown or shrunk gets a new table."""
+        facts = self.__dict__.get('_fact_list')
+        table = self.__dict__.get('_fact_table')
+        if table is None or (facts is not None and len(facts) != table.num_rows):
+            table = self._fact_table = FactTable.from_facts(facts)
+            self._index = None
+        return table
+
+    @property
+    def _fact_index(self) -> Mapping[str, Mapping]:
+        """Indices over the facts by concept, period, statement, form, fiscal year and fiscal period."""
+        if self.__dict__.get('_index') is None:
+            self._index = self._table.index
+        return self._index
+
+    @_fact_index.setter
+    def _fact_index(self, index: Mapping[str, Mapping]):
+        self._index = index
 
     def _resolve_industry_info(self):
         """Lazily resolve SIC code and ticker for industry-specific statement enhancements.
@@ -187,55 +259,17 @@ class EntityFacts:
         all_concepts = [k for k in self._fact_index['by_concept'] if ':' in k or k[0:1].isupper()]
         return difflib.get_close_matches(query, all_concepts, n=n, cutoff=0.4)
 
-    def _build_indices(self) -> Dict[str, Dict]:
+    def _build_indices(self) -> Mapping[str, Mapping]:
         """Build optimized indices for fast querying"""
-        by_concept = defaultdict(list)
-        by_period = defaultdict(list)
-        by_statement = defaultdict(list)
-        by_form = defaultdict(list)
-        by_fiscal_year = defaultdict(list)
-        by_fiscal_period = defaultdict(list)
-
-        # Cache period key strings: only ~50-100 unique keys across 20K+ facts
-        _period_key_cache: Dict[tuple, str] = {}
-
-        for fact in self._facts:
-            # Index by concept
-            by_concept[fact.concept].append(fact)
-            if fact.label:
-                by_concept[fact.label.lower()].append(fact)
-
-            # Index by period (intern keys to avoid 24K+ redundant string allocations)
-            pk_tuple = (fact.fiscal_year, fact.fiscal_period)
-            period_key = _period_key_cache.get(pk_tuple)
-            if period_key is None:
-                period_key = f"{fact.fiscal_year}-{fact.fiscal_period}"
-                _period_key_cache[pk_tuple] = period_key
-            by_period[period_key].append(fact)
-
-            # Index by fiscal year and period
-            by_fiscal_year[fact.fiscal_year].append(fact)
-            by_fiscal_period[fact.fiscal_period].append(fact)
-
-            # Index by statement type
-            if fact.statement_type:
-                by_statement[fact.statement_type].append(fact)
-
-            # Index by form type
-            by_form[fact.form_type].append(fact)
-
-        return {
-            'by_concept': by_concept,
-            'by_period': by_period,
-            'by_statement': by_statement,
-            'by_form': by_form,
-            'by_fiscal_year': by_fiscal_year,
-            'by_fiscal_period': by_fiscal_period,
-        }
+        if self._fact_list is not None:
+            self._fact_table = FactTable.from_facts(self._fact_list)
+        return self._table.index
 
     def __len__(self) -> int:
         """Return the total number of facts"""
-        return len(self._facts)
+        if self._fact_list is None:
+            return self._fact_table.num_rows
+        return len(self._fact_list)
 
     def __iter__(self) -> Iterator[FinancialFact]:
         """Iterate over all facts"""
@@ -290,45 +324,30 @@ class EntityFacts:
             >>> revenue = df[(df['concept'] == 'Revenues') & (df['filing_date'] <= as_of)]
             >>> latest = revenue.sort_values('filing_date').groupby('period_end').last()
         """
-        # Build records from facts
-        records = []
-        for fact in self._facts:
-            record = {
-                'concept': fact.concept,
-                'label': fact.label,
-                'value': fact.value,
-                'numeric_value': fact.numeric_value,
-                'unit': fact.unit,
-                'period_type': fact.period_type,
-                'period_start': fact.period_start,
-                'period_end': fact.period_end,
-                'fiscal_year': fact.fiscal_year,
-                'fiscal_period': fact.fiscal_period
-            }
+        # Build the columns a record of each fact would have, in record order
+        record_columns = ['concept', 'label', 'value', 'numeric_value', 'unit', 'period_type',
+                          'period_start', 'period_end', 'fiscal_year', 'fiscal_period']
 
-            # PIT mode: include filing_date and form_type as standard columns
-            if pit_mode:
-                record['filing_date'] = fact.filing_date
-                record['form_type'] = fact.form_type
-
-            # Add metadata if requested
-            if include_metadata:
-                record.update({
-                    'accession': fact.accession,
-                    'filing_date': fact.filing_date,
-                    'form_type': fact.form_type,
-                    'statement_type': fact.statement_type,
-                    'taxonomy': fact.taxonomy,
-                    'scale': fact.scale,
-                    'data_quality': fact.data_quality.value if fact.data_quality else None,
-                    'is_audited': fact.is_audited,
-                    'confidence_score': fact.confidence_score
-                })
+        # PIT mode: include filing_date and form_type as standard columns
+        if pit_mode:
+            record_columns += ['filing_date', 'form_type']
 
-            records.append(record)
+        # Add metadata if requested
+        if include_metadata:
+            record_columns += [column for column in ('accession', 'filing_date', 'form_type', 'statement_type',
+                                                     'taxonomy', 'scale', 'data_quality', 'is_audited',
+                                                     'confidence_score')
+                               if column not in record_columns]
 
         # Create DataFrame
-        df = pd.DataFrame(records)
+        table = self._table
+        if table.num_rows == 0:
+            df = pd.DataFrame()
+        else:
+            df = table.to_dataframe([column for column in record_columns if column != 'data_quality'])
+            if 'data_quality' in record_columns:
+                df.insert(record_columns.index('data_quality'), 'data_quality',
+                          [quality.value if quality else None for quality in table.column('data_quality')])
 
         # Filter to specific columns if requested
         if columns is not None:
@@ -364,16 +383,18 @@ class EntityFacts:
             >>> annual_facts = facts.filter_by_period_type('annual')
             >>> quarterly_facts = facts.filter_by_period_type(PeriodType.QUARTERLY)
         """
-        # Use the query interface to filter facts
-        filtered_facts = self.query().by_period_type(period_type).execute()
+        from edgar.entity.query import period_type_months
+
+        # Keep the rows whose period is as long as the period type's, as FactQuery.by_period_type does
+        rows = self._table.period_length_rows(period_type_months(period_type))
 
-        # Create a new EntityFacts instance with the filtered facts
+        # Create a new EntityFacts instance over the same facts
         filtered = EntityFacts(
             cik=self.cik,
             name=self.name,
-            facts=filtered_facts,
             sic_code=self._sic_code,
-            ticker=self._ticker
+            ticker=self._ticker,
+            fact_table=self._table.take(rows)
         )
         filtered._sic_resolver = self._sic_resolver
         return filtered
@@ -734,14 +755,21 @@ class EntityFacts:
             DataFrame with columns ``[period_start, period_end, duration_days,
             numeric_value, fiscal_period, fiscal_year]``.
         """
-        from edgar.entity.query import FactQuery
-        query = FactQuery(self._facts, self._fact_index)
+        table = self._table
 
-        df = query \
-            .by_concept(concept, exact=":" in concept) \
-            .sort_by('filing_date', ascending=False) \
-            .to_dataframe('period_start', 'period_end', 'numeric_value',
-                          'fiscal_period', 'fiscal_year') \
+        # The facts FactQuery.by_concept() would match, newest filing first
+        if ":" in concept:
+            rows = np.unique(table.concept_rows(concept))
+        else:
+            rows = table.matching_concept_rows(concept)
+        if len(rows) == 0:
+            return pd.DataFrame()
+        filing_days = table.dates('filing_date')[rows].astype(np.int64)
+        filing_days[np.isnat(table.dates('filing_date')[rows])] = np.iinfo(np.int64).min + 1
+        rows = rows[np.argsort(-filing_days, kind='stable')]
+
+        df = table.to_dataframe(['period_start', 'period_end', 'numeric_value', 'fiscal_period', 'fiscal_year'],
+                                rows=rows) \
             .head(periods)
 
         if not df.empty:
@@ -1349,7 +1377,6 @@ class EntityFacts:
             >>> facts.available_periods()           # all periods
             >>> facts.available_periods("Revenue")  # periods with Revenue data
         """
-        from collections import defaultdict
         from edgar.entity.models import PeriodEntry, PeriodSummary
 
         # Determine which facts to scan
@@ -1357,20 +1384,16 @@ class EntityFacts:
             facts_to_scan = self._fact_index['by_concept'].get(concept, [])
             if not facts_to_scan:
                 facts_to_scan = self._fact_index['by_concept'].get(concept.lower(), [])
+            table = FactTable.from_facts(facts_to_scan)
         else:
-            facts_to_scan = self._facts
+            table = self._table
 
-        # Group by period key
-        period_data: Dict[str, dict] = defaultdict(lambda: {
-            'year': 0, 'period': '', 'count': 0, 'concepts': set()
-        })
-        for fact in facts_to_scan:
-            key = f"{fact.fiscal_year}-{fact.fiscal_period}"
-            info = period_data[key]
-            info['year'] = fact.fiscal_year
-            info['period'] = fact.fiscal_period
-            info['count'] += 1
-            info['concepts'].add(fact.concept)
+        # Count facts and concepts in each period
+        period_data: Dict[str, dict] = {}
+        for year, period, count, concept_count in table.period_counts():
+            period_data.setdefault(f"{year}-{period}", {
+                'year': year, 'period': period, 'count': count, 'concepts': concept_count
+            })
 
         # Sort: year descending, then FY > Q4 > Q3 > Q2 > Q1
         period_order = {'FY': 0, 'Q4': 1, 'Q3': 2, 'Q2': 3, 'Q1': 4}
@@ -1381,7 +1404,7 @@ class EntityFacts:
                 fiscal_year=info['year'],
                 fiscal_period=info['period'],
                 fact_count=info['count'],
-                concept_count=len(info['concepts']),
+                concept_count=info['concepts'],
             )
             for key, info in period_data.items()
             if info['year']  # skip entries with no fiscal year
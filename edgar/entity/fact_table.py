@@ -0,0 +1,446 @@
+"""
+Columnar storage for the facts of an EntityFacts.
+
+A FactTable keeps one NumPy array per FinancialFact field, so whole-company
+operations (to_dataframe, time series, period filters) run over arrays rather
+than a list of fact objects. FinancialFact objects are only built when a fact
+is handed out, and each row is built once, so the same row is always the
+same object.
+
+The indexes EntityFacts looks facts up by (by concept, by period, ...) are
+built on first use from sorted group codes over the columns.
+"""
+
+import sys
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from edgar.entity.models import DataQuality, FinancialFact
+
+__all__ = ['FactTable', 'FactIndex', 'ConceptInfo', 'ARROW_SCHEMA']
+
+# Fields stored as columns, in the order of the to_dataframe() columns they feed
+COLUMNS = (
+    'concept', 'label', 'value', 'numeric_value', 'unit', 'period_type',
+    'period_start', 'period_end', 'fiscal_year', 'fiscal_period',
+    'filing_date', 'form_type', 'accession', 'statement_type', 'taxonomy',
+)
+
+# The columns of to_arrow(): the fields of a fact that make sense side by side across companies
+ARROW_SCHEMA = pa.schema([
+    ('concept', pa.string()),
+    ('taxonomy', pa.string()),
+    ('label', pa.string()),
+    ('unit', pa.string()),
+    ('period_type', pa.string()),
+    ('period_start', pa.date32()),  # Null for instant facts
+    ('period_end', pa.date32()),
+    ('numeric_value', pa.float64()),  # Null for facts that are not numbers
+    ('fiscal_year', pa.int32()),
+    ('fiscal_period', pa.string()),
+    ('form_type', pa.string()),
+    ('accession', pa.string()),
+    ('filing_date', pa.date32()),
+    ('statement_type', pa.string()),
+])
+
+_HIGH_QUALITY_PERIODS = frozenset(('FY', 'Q1', 'Q2', 'Q3', 'Q4'))
+
+
+class ConceptInfo(NamedTuple):
+    """What every fact of a concept shares, for building its FinancialFact objects."""
+    concept: str
+    taxonomy: str
+    label: str
+    statement_type: Optional[str]
+    semantic_tags: Sequence[str]
+    depth: Optional[int]
+    parent_concept: Optional[str]
+    section: Optional[str]
+    is_abstract: bool
+    is_total: bool
+    presentation_order: Optional[float]
+
+
+class FactTable:
+    """
+    The facts of a company as columns.
+
+    Build it from parsed company facts with from_columns(), where facts are
+    built from the columns when first asked for, or from existing facts with
+    from_facts(), where the facts given are the ones handed out.
+    """
+
+    def __init__(self,
+                 columns: Dict[str, np.ndarray],
+                 objects: np.ndarray,
+                 concepts: Optional[List[ConceptInfo]] = None,
+                 concept_ids: Optional[np.ndarray] = None,
+                 business_context: Optional[np.ndarray] = None,
+                 parent: Optional[Tuple['FactTable', np.ndarray]] = None):
+        self._columns = columns
+        self._objects = objects
+        self._concepts = concepts
+        self._concept_ids = concept_ids
+        self._business_context = business_context
+        self._parent = parent
+        self._index: Optional['FactIndex'] = None
+
+    @classmethod
+    def from_facts(cls, facts: Sequence[FinancialFact]) -> 'FactTable':
+        """A table over existing facts. The facts keep their values as they are."""
+        objects = object_array(facts)
+        columns = {name: object_array([getattr(fact, name) for fact in facts]) for name in COLUMNS}
+        return cls(columns, objects)
+
+    @classmethod
+    def from_columns(cls,
+                     columns: Dict[str, np.ndarray],
+                     concepts: List[ConceptInfo],
+                     concept_ids: np.ndarray,
+                     business_context: np.ndarray) -> 'FactTable':
+        """
+        A table of parsed facts, where concept, label, taxonomy and statement_type
+        come from the concept of each row.
+        """
+        columns = dict(columns)
+        for name in ('concept', 'taxonomy', 'label', 'statement_type'):
+            columns[name] = object_array([getattr(info, name) for info in concepts])[concept_ids]
+        objects = np.empty(len(concept_ids), dtype=object)
+        return cls(columns, objects, concepts=concepts, concept_ids=concept_ids, business_context=business_context)
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    @property
+    def num_rows(self) -> int:
+        return len(self._objects)
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        A column as Python values, the way FinancialFact holds them: dates as
+        date objects, missing values as None.
+        """
+        values = self._columns.get(name)
+        if values is None:
+            values = self._columns[name] = self._derived_column(name)
+        elif values.dtype.kind == 'M':
+            self._columns[f'{name}:datetime64'] = values
+            values = self._columns[name] = values.astype(object)
+        return values
+
+    def dates(self, name: str) -> np.ndarray:
+        """A date column as datetime64[D], with NaT for missing dates."""
+        key = f'{name}:datetime64'
+        values = self._columns.get(key)
+        if values is None:
+            values = self._columns[name]
+            if values.dtype.kind != 'M':
+                values = np.array(values, dtype='datetime64[D]')
+            self._columns[key] = values
+        return values
+
+    def _derived_column(self, name: str) -> np.ndarray:
+        """A field that is not stored as a column, from the facts or from the fiscal period."""
+        if self._parent is not None:
+            parent, rows = self._parent
+            return parent.column(name)[rows]
+        if self._concepts is None:
+            return object_array([getattr(fact, name) for fact in self.facts()])
+        # Parsed facts: quality follows from the fiscal period, and nothing is scaled
+        fiscal_period = self.column('fiscal_period')
+        is_annual = fiscal_period == 'FY'
+        high_quality = np.isin(fiscal_period, list(_HIGH_QUALITY_PERIODS))
+        if name == 'data_quality':
+            return object_array([DataQuality.MEDIUM, DataQuality.HIGH])[high_quality.astype(np.int64)]
+        if name == 'confidence_score':
+            return object_array([0.7, 0.9])[high_quality.astype(np.int64)]
+        if name == 'is_audited':
+            return object_array([False, True])[is_annual.astype(np.int64)]
+        if name == 'scale':
+            return object_array([None] * self.num_rows)
+        raise KeyError(name)
+
+    # Facts
+
+    def fact(self, row: int) -> FinancialFact:
+        fact = self._objects[row]
+        if fact is None:
+            fact = self.facts(np.array([row]))[0]
+        return fact
+
+    def facts(self, rows: Optional[Sequence[int]] = None) -> List[FinancialFact]:
+        """The facts of the rows given, in that order, or of every row."""
+        rows = np.arange(self.num_rows) if rows is None else np.asarray(rows, dtype=np.int64)
+        objects = self._objects[rows]
+        missing = np.flatnonzero(np.equal(objects, None))
+        if len(missing):
+            missing_rows = np.unique(rows[missing])
+            if self._parent is not None:
+                parent, parent_rows = self._parent
+                built = parent.facts(parent_rows[missing_rows])
+            else:
+                built = self._build_facts(missing_rows)
+            self._objects[missing_rows] = object_array(built)
+            objects = self._objects[rows]
+        return objects.tolist()
+
+    def take(self, rows: np.ndarray) -> 'FactTable':
+        """A table of some of the rows. Its facts are the same objects as this table's."""
+        rows = np.asarray(rows, dtype=np.int64)
+        columns = {name: values[rows] for name, values in self._columns.items()}
+        return FactTable(columns, self._objects[rows], parent=(self, rows))
+
+    @property
+    def index(self) -> 'FactIndex':
+        if self._index is None:
+            self._index = FactIndex(self)
+        return self._index
+
+    def _build_facts(self, rows: np.ndarray) -> List[FinancialFact]:
+        """New FinancialFact objects for rows of parsed facts, built a column at a time."""
+        def values(name):
+            return self.column(name)[rows].tolist()
+
+        infos = [self._concepts[concept_id] for concept_id in self._concept_ids[rows].tolist()]
+        return [
+            FinancialFact(
+                concept=info.concept,
+                taxonomy=info.taxonomy,
+                label=info.label,
+                value=value,
+                numeric_value=numeric_value,
+                unit=unit,
+                period_start=period_start,
+                period_end=period_end,
+                period_type=period_type,
+                fiscal_year=fiscal_year,
+                fiscal_period=fiscal_period,
+                filing_date=filing_date,
+                form_type=form_type,
+                accession=accession,
+                data_quality=data_quality,
+                is_audited=is_audited,
+                confidence_score=confidence_score,
+                semantic_tags=info.semantic_tags,
+                business_context=business_context,
+                statement_type=info.statement_type,
+                depth=info.depth,
+                parent_concept=info.parent_concept,
+                section=info.section,
+                is_abstract=info.is_abstract,
+                is_total=info.is_total,
+                presentation_order=info.presentation_order,
+            )
+            for (info, value, numeric_value, unit, period_start, period_end, period_type, fiscal_year,
+                 fiscal_period, filing_date, form_type, accession, data_quality, is_audited, confidence_score,
+                 business_context)
+            in zip(infos, values('value'), values('numeric_value'), values('unit'), values('period_start'),
+                   values('period_end'), values('period_type'), values('fiscal_year'), values('fiscal_period'),
+                   values('filing_date'), values('form_type'), values('accession'), values('data_quality'),
+                   values('is_audited'), values('confidence_score'), self._business_context[rows].tolist(),
+                   strict=True)
+        ]
+
+    # Vectorized selections
+
+    def concept_rows(self, key: str) -> np.ndarray:
+        """The rows whose concept is key, or whose lowercased label is, in row order."""
+        return self.index.rows('by_concept', key)
+
+    def matching_concept_rows(self, text: str) -> np.ndarray:
+        """The rows whose concept or label contains text, ignoring case."""
+        text = text.lower()
+        concepts, concept_codes = _factorize(self._columns['concept'])
+        labels, label_codes = _factorize(self._columns['label'])
+        concept_match = np.array([text in concept.lower() for concept in concepts], dtype=bool)
+        label_match = np.array([bool(label) and text in label.lower() for label in labels], dtype=bool)
+        mask = _lookup(concept_match, concept_codes) | _lookup(label_match, label_codes)
+        return np.flatnonzero(mask)
+
+    def period_length_rows(self, months: int) -> np.ndarray:
+        """The duration facts whose period is within a month of months long."""
+        start = self.dates('period_start')
+        end = self.dates('period_end')
+        is_duration = ~np.isnat(start) & ~np.isnat(end) & (self._columns['period_type'] == 'duration')
+        month_diff = (end.astype('datetime64[M]').astype(np.int64) -
+                      start.astype('datetime64[M]').astype(np.int64) + 1)
+        return np.flatnonzero(is_duration & (np.abs(month_diff - months) <= 1))
+
+    def period_counts(self) -> List[Tuple[Any, Any, int, int]]:
+        """
+        (fiscal_year, fiscal_period, facts, concepts) for each fiscal period, in
+        the order the periods first appear.
+        """
+        years, year_codes = _factorize(self.column('fiscal_year'))
+        periods, period_codes = _factorize(self.column('fiscal_period'))
+        pairs, pair_codes = _factorize(year_codes * len(periods) + period_codes)
+        _, concept_codes = _factorize(self.column('concept'))
+        fact_counts = np.bincount(pair_codes, minlength=len(pairs))
+        concept_pairs = np.unique(pair_codes * (int(concept_codes.max(initial=0)) + 1) + concept_codes)
+        concept_counts = np.bincount(concept_pairs // (int(concept_codes.max(initial=0)) + 1), minlength=len(pairs))
+        return [(years[pair // len(periods)], periods[pair % len(periods)], int(facts), int(concepts))
+                for pair, facts, concepts in zip(pairs, fact_counts, concept_counts, strict=True)]
+
+    def to_arrow(self) -> pa.Table:
+        """The columns of ARROW_SCHEMA as a pyarrow Table."""
+        arrays = [pa.array(self.dates(field.name) if pa.types.is_date(field.type) else self.column(field.name),
+                           type=field.type, from_pandas=True)
+                  for field in ARROW_SCHEMA]
+        return pa.Table.from_arrays(arrays, schema=ARROW_SCHEMA)
+
+    def to_dataframe(self, columns: Sequence[str], rows: Optional[np.ndarray] = None) -> pd.DataFrame:
+        """
+        Columns of the table, for the rows given, as a DataFrame built from the
+        same Python values a DataFrame of the facts would be built from.
+        """
+        data = {}
+        for name in columns:
+            values = self.column(name)
+            data[name] = (values if rows is None else values[rows]).tolist()
+        return pd.DataFrame(data)
+
+
+class FactIndex(Mapping):
+    """
+    The indexes EntityFacts keeps over its facts, each built the first time it
+    is used. Each index maps a key to the list of facts with that key, in the
+    order of the facts.
+    """
+
+    NAMES = ('by_concept', 'by_period', 'by_statement', 'by_form', 'by_fiscal_year', 'by_fiscal_period')
+
+    def __init__(self, table: FactTable):
+        self._table = table
+        self._groups: Dict[str, '_Groups'] = {}
+
+    def __getitem__(self, name: str) -> '_Groups':
+        groups = self._groups.get(name)
+        if groups is None:
+            if name not in self.NAMES:
+                raise KeyError(name)
+            groups = self._groups[name] = _Groups(self._table, *self._keys(name))
+        return groups
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.NAMES)
+
+    def __len__(self) -> int:
+        return len(self.NAMES)
+
+    def rows(self, name: str, key: Any) -> np.ndarray:
+        return self[name].rows(key)
+
+    def _keys(self, name: str) -> Tuple[np.ndarray, np.ndarray]:
+        """The key of each entry in an index, and the row it points to."""
+        table = self._table
+        rows = np.arange(table.num_rows)
+        if name == 'by_concept':
+            # A fact is found by its concept and by its label in lower case
+            labels, label_codes = _factorize(table.column('label'))
+            lowered = object_array([label.lower() if label else None for label in labels])[label_codes]
+            has_label = np.array([bool(label) for label in labels], dtype=bool)[label_codes]
+            keys = np.concatenate([table.column('concept'), lowered[has_label]])
+            return keys, np.concatenate([rows, rows[has_label]])
+        if name == 'by_period':
+            years, year_codes = _factorize(table.column('fiscal_year'))
+            periods, period_codes = _factorize(table.column('fiscal_period'))
+            pairs, codes = _factorize(year_codes * len(periods) + period_codes)
+            period_keys = object_array([f"{years[pair // len(periods)]}-{periods[pair % len(periods)]}"
+                                         for pair in pairs])
+            return period_keys[codes], rows
+        if name == 'by_statement':
+            statement_types = table.column('statement_type')
+            present = np.array([bool(value) for value in statement_types], dtype=bool)
+            return statement_types[present], rows[present]
+        field = {'by_form': 'form_type', 'by_fiscal_year': 'fiscal_year', 'by_fiscal_period': 'fiscal_period'}[name]
+        return table.column(field), rows
+
+
+class _Groups(Mapping):
+    """One index: keys to the rows with that key, as a stable sort of the keys' codes."""
+
+    def __init__(self, table: FactTable, keys: np.ndarray, rows: np.ndarray):
+        self._table = table
+        uniques, codes = _factorize(keys)
+        order = np.lexsort((rows, codes))
+        self._rows = rows[order]
+        counts = np.bincount(codes, minlength=len(uniques))
+        starts = np.concatenate([[0], np.cumsum(counts)[:-1]]) if len(uniques) else counts
+        self._slices = {key: (int(start), int(start + count))
+                        for key, start, count in zip(uniques, starts, counts, strict=True)}
+
+    def rows(self, key: Any) -> np.ndarray:
+        bounds = self._slices.get(key)
+        if bounds is None:
+            return self._rows[:0]
+        return self._rows[bounds[0]:bounds[1]]
+
+    def __getitem__(self, key: Any) -> List[FinancialFact]:
+        if key not in self._slices:
+            raise KeyError(key)
+        return self._table.facts(self.rows(key))
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        if key not in self._slices:
+            return default
+        return self._table.facts(self.rows(key))
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._slices
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._slices)
+
+    def __len__(self) -> int:
+        return len(self._slices)
+
+
+def object_array(values: Sequence[Any]) -> np.ndarray:
+    """An object array of values, without NumPy turning sequences into dimensions."""
+    return np.fromiter(values, dtype=object, count=len(values))
+
+
+def _factorize(values: np.ndarray) -> Tuple[list, np.ndarray]:
+    """
+    The distinct values in first-seen order, as Python values, and the code of
+    each value. None gets a code of its own, as any other value does.
+    """
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    uniques = uniques.tolist() if hasattr(uniques, 'tolist') else list(uniques)
+    uniques = [None if _is_missing(value) else value for value in uniques]
+    return uniques, codes.astype(np.int64, copy=False)
+
+
+def _is_missing(value: Any) -> bool:
+    return value is None or (isinstance(value, float) and value != value)
+
+
+def _lookup(per_unique: np.ndarray, codes: np.ndarray) -> np.ndarray:
+    return per_unique[codes] if len(per_unique) else np.zeros(len(codes), dtype=bool)
+
+
+def interned_strings(values: List[Any]) -> np.ndarray:
+    """
+    Strings as an object array holding one object per distinct string, with ''
+    for missing values.
+    """
+    uniques, codes = _factorize(object_array(values))
+    return object_array([sys.intern(value) if isinstance(value, str) else (value or '')
+                         for value in uniques])[codes]
+
+
+def parse_dates(values: List[Optional[str]], parse_date) -> np.ndarray:
+    """
+    Date strings as datetime64[D], with NaT where there is no date. ISO dates
+    convert in one step; anything else goes through parse_date one at a time.
+    """
+    try:
+        return np.array(values, dtype='datetime64[D]')
+    except (ValueError, TypeError):
+        return np.array([parse_date(value) if isinstance(value, str) else value for value in values],
+                        dtype='datetime64[D]')
@@ -0,0 +1,224 @@
+"""
+Company Facts - Batch Loader
+
+Loading facts for a peer group or a screen used to be one get_company_facts()
+call per company, each a serial download-then-parse cycle. This module splits
+the two:
+
+1. The companyfacts JSON is fetched concurrently with the async HTTP client,
+   which shares the global rate limiter and HTTP cache with every other request.
+   With local storage the files are read from disk instead.
+2. Each company's JSON is parsed into EntityFacts in a process pool as soon as
+   it arrives, since parsing is CPU bound. Only a few companies per worker are
+   in flight at once, so the JSON of a long list is never all in memory.
+
+Parsed EntityFacts go into the in-memory cache get_company_facts() reads, under
+the bound set with set_company_facts_cache_size().
+
+Example:
+    >>> import pyarrow.compute as pc
+    >>> from edgar.entity import get_company_facts_many
+    >>> facts = get_company_facts_many([320193, 789019, 1652044])
+    >>> revenue = facts.filter(pc.equal(facts['concept'], 'us-gaap:Revenues'))
+"""
+
+import asyncio
+import contextlib
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple, Union
+
+import pyarrow as pa
+
+from edgar.entity.fact_table import ARROW_SCHEMA
+from edgar.httprequests import MAX_CONCURRENT_DOWNLOADS
+
+if TYPE_CHECKING:
+    from edgar.entity.entity_facts import EntityFacts
+
+log = logging.getLogger(__name__)
+
+__all__ = ['get_company_facts_many', 'load_company_facts', 'COMPANY_FACTS_SCHEMA']
+
+# Companies downloaded or parsing at once, per worker. Enough to keep every worker
+# busy while the next download arrives; the JSON held in memory is bounded by it.
+JOBS_IN_FLIGHT_PER_WORKER = 2
+
+COMPANY_FACTS_SCHEMA = pa.schema([pa.field('cik', pa.int64())] + list(ARROW_SCHEMA))
+
+
+def _parse_company_facts(cik: int, content: Optional[str]) -> Optional['EntityFacts']:
+    """Process pool entry point: parse one company's facts, reading them from local storage if there is no content."""
+    import orjson
+
+    from edgar.entity.entity_facts import load_company_facts_from_local
+    from edgar.entity.parser import EntityFactsParser
+
+    company_facts_json = load_company_facts_from_local(cik) if content is None else orjson.loads(content)
+    return EntityFactsParser.parse_company_facts(company_facts_json)
+
+
+def _default_workers(job_count: int) -> int:
+    return max(1, min(job_count, os.cpu_count() or 1))
+
+
+async def _download_and_parse(ciks: List[int], workers: int) -> Dict[int, object]:
+    """
+    Download the companyfacts JSON of each cik and parse it as soon as it arrives.
+
+    Parsing runs in a process pool, or in a thread with one worker. At most
+    JOBS_IN_FLIGHT_PER_WORKER jobs per worker are downloading or parsing at once,
+    so a long list of companies is never held in memory as JSON all at once. With
+    local storage nothing is downloaded: the files are read where they are parsed.
+    If the pool cannot start or breaks, the remaining companies are parsed in a thread.
+
+    Returns the EntityFacts (None if there were none), or the exception that
+    stopped it loading, per cik.
+    """
+    import httpx
+
+    from edgar.exceptions import CompanyFactsNotFoundError, TransportError, http_status
+    from edgar.httpclient import async_http_client
+    from edgar.httprequests import download_file_async
+    from edgar.storage import is_using_local_storage
+    from edgar.urls import build_company_facts_url
+
+    in_flight = asyncio.Semaphore(workers * JOBS_IN_FLIGHT_PER_WORKER)
+    downloads = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
+    executor: Optional[ProcessPoolExecutor] = None
+    if workers > 1 and len(ciks) > 1:
+        try:
+            executor = ProcessPoolExecutor(max_workers=workers)
+        except OSError as e:
+            log.debug("Company facts process pool unavailable, parsing in process: %s", e)
+
+    def pool_broke(e: Exception):
+        nonlocal executor
+        if executor is not None:
+            log.debug("Company facts process pool broke, parsing in process: %s", e)
+            # Jobs already submitted finish, or fail with BrokenProcessPool and fall back here
+            executor.shutdown(wait=False)
+            executor = None
+
+    async def parse(cik: int, content: Optional[str]):
+        if executor is not None:
+            try:
+                future = asyncio.wrap_future(executor.submit(_parse_company_facts, cik, content))
+            except (BrokenProcessPool, OSError) as e:
+                pool_broke(e)
+            else:
+                try:
+                    return await future
+                except BrokenProcessPool as e:
+                    pool_broke(e)
+        return await asyncio.to_thread(_parse_company_facts, cik, content)
+
+    async def load(client, cik: int) -> object:
+        async with in_flight:
+            content = None
+            if client is not None:
+                try:
+                    async with downloads:
+                        content = await download_file_async(client, build_company_facts_url(cik), as_text=True)
+                except Exception as e:
+                    # A 404 means the company has no facts, as in download_company_facts_from_sec()
+                    if isinstance(e, (httpx.HTTPStatusError, TransportError)) and http_status(e) == 404:
+                        return CompanyFactsNotFoundError(cik=cik)
+                    return e
+            try:
+                return await parse(cik, content)
+            except Exception as e:
+                return e
+
+    try:
+        async with contextlib.AsyncExitStack() as stack:
+            client = None if is_using_local_storage() else await stack.enter_async_context(async_http_client())
+            results = await asyncio.gather(*[load(client, cik) for cik in ciks])
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+    return dict(zip(ciks, results, strict=True))
+
+
+def load_company_facts(ciks: Iterable[Union[int, str]],
+                       workers: Optional[int] = None) -> Tuple[Dict[int, 'EntityFacts'], Dict[int, Exception]]:
+    """
+    Load the facts of many companies, downloading and parsing concurrently.
+
+    Loaded companies go into the in-memory cache get_company_facts() reads, which
+    keeps as many as set_company_facts_cache_size() allows (one by default).
+
+    Args:
+        ciks: The company CIKs
+        workers: Processes used to parse the facts. Defaults to one per CPU,
+                 capped at the number of companies. 1 parses in this process.
+
+    Returns:
+        The EntityFacts of each cik that loaded, in the order of ``ciks``, and a
+        dict of cik to the exception for each cik that did not
+    """
+    from edgar.core import run_async_or_sync
+    from edgar.entity.entity_facts import _cache_company_facts, _cached_company_facts
+    from edgar.exceptions import CompanyFactsNotFoundError
+
+    ciks = list(dict.fromkeys(int(cik) for cik in ciks))
+    loaded: Dict[int, 'EntityFacts'] = {}
+    failed: Dict[int, Exception] = {}
+
+    # Companies already in the cache need neither a download nor a parse
+    for cik in ciks:
+        facts = _cached_company_facts(cik)
+        if facts is not None:
+            loaded[cik] = facts
+
+    to_load = [cik for cik in ciks if cik not in loaded]
+    if to_load:
+        results = run_async_or_sync(_download_and_parse(to_load, workers or _default_workers(len(to_load))))
+        for cik, facts in results.items():
+            if facts is None:
+                facts = CompanyFactsNotFoundError(cik=cik)
+            if isinstance(facts, Exception):
+                failed[cik] = facts
+            else:
+                loaded[cik] = facts
+
+    # Cache in input order, so the last companies stay as loading them one by one would have left them
+    for cik in ciks:
+        if cik in loaded:
+            _cache_company_facts(cik, loaded[cik])
+
+    if failed:
+        log.warning("Could not load company facts for %d of %d companies: %s",
+                    len(failed), len(ciks), ", ".join(str(cik) for cik in failed))
+
+    return {cik: loaded[cik] for cik in ciks if cik in loaded}, failed
+
+
+def get_company_facts_many(ciks: Iterable[Union[int, str]],
+                           workers: Optional[int] = None) -> pa.Table:
+    """
+    The facts of many companies as one table, for comparing companies with each other.
+
+    Companies are downloaded and parsed concurrently by load_company_facts().
+    Companies with no facts, or whose facts could not be loaded, are left out
+    and logged.
+
+    Args:
+        ciks: The company CIKs
+        workers: Processes used to parse the facts. Defaults to one per CPU.
+
+    Returns:
+        A pyarrow Table with one row per fact and the columns of
+        COMPANY_FACTS_SCHEMA: the cik, then the fields of the fact
+    """
+    loaded, _ = load_company_facts(ciks, workers=workers)
+    tables = []
+    for cik, facts in loaded.items():
+        table = facts._table.to_arrow()
+        tables.append(table.add_column(0, COMPANY_FACTS_SCHEMA.field('cik'), pa.array([cik] * table.num_rows,
+                                                                                      type=pa.int64())))
+    if not tables:
+        return COMPANY_FACTS_SCHEMA.empty_table()
+    return pa.concat_tables(tables)
@@ -201,7 +201,7 @@ class EntityFilings(Filings):
                 return [self.get_filing_at(i) for i in range(start, stop, step)]
             length = max(0, stop - start)
             sliced_data = self.data.slice(start, length)
-            return EntityFilings(data=sliced_data, cik=self.cik, company_name=self.company_name)
+            return self._sliced(EntityFilings(data=sliced_data, cik=self.cik, company_name=self.company_name), start)
         return self.get_filing_at(item)
 
     @property
@@ -265,7 +265,10 @@ class EntityFilings(Filings):
                 pc.is_in(res.data['fileNumber'], pa.array(listify(file_number))))
         else:
             data = res.data
-        return EntityFilings(data=data, cik=self.cik, company_name=self.company_name)
+        filings = EntityFilings(data=data, cik=self.cik, company_name=self.company_name)
+        if data is res.data:
+            filings._filings_lookup = res._filings_lookup
+        return filings
 
     def latest(self, n: int = 1):
         """
@@ -280,9 +283,10 @@ class EntityFilings(Filings):
         sort_indices = pc.sort_indices(self.data, sort_keys=[("filing_date", "descending")])
         sort_indices_top = sort_indices[:min(n, len(sort_indices))]
         latest_filing_index = pc.take(data=self.data, indices=sort_indices_top)
-        filings = EntityFilings(latest_filing_index,
-                               cik=self.cik,
-                               company_name=self.company_name)
+        filings = self._taken(EntityFilings(latest_filing_index,
+                                            cik=self.cik,
+                                            company_name=self.company_name),
+                              sort_indices_top.to_numpy())
         if filings.empty:
             return None
         if len(filings) == 1:
@@ -301,7 +305,7 @@ class EntityFilings(Filings):
             EntityFilings containing the first n filings
         """
         selection = self._head(n)
-        return EntityFilings(data=selection, cik=self.cik, company_name=self.company_name)
+        return self._sliced(EntityFilings(data=selection, cik=self.cik, company_name=self.company_name), 0)
 
     def tail(self, n: int):
         """
@@ -314,7 +318,8 @@ class EntityFilings(Filings):
             EntityFilings containing the last n filings
         """
         selection = self._tail(n)
-        return EntityFilings(data=selection, cik=self.cik, company_name=self.company_name)
+        return self._sliced(EntityFilings(data=selection, cik=self.cik, company_name=self.company_name),
+                            len(self.data) - len(selection))
 
     def sample(self, n: int):
         """
@@ -362,10 +367,11 @@ class EntityFilings(Filings):
             return None
         start_index, _ = self.data_pager._current_range
         filings_state = PagingState(page_start=start_index, num_records=len(self))
-        return EntityFilings(data_page,
-                            cik=self.cik,
-                            company_name=self.company_name,
-                            original_state=filings_state)
+        return self._sliced(EntityFilings(data_page,
+                                          cik=self.cik,
+                                          company_name=self.company_name,
+                                          original_state=filings_state),
+                            start_index)
 
     def previous(self):
         """
@@ -380,10 +386,11 @@ class EntityFilings(Filings):
             return None
         start_index, _ = self.data_pager._current_range
         filings_state = PagingState(page_start=start_index, num_records=len(self))
-        return EntityFilings(data_page,
-                            cik=self.cik,
-                            company_name=self.company_name,
-                            original_state=filings_state)
+        return self._sliced(EntityFilings(data_page,
+                                          cik=self.cik,
+                                          company_name=self.company_name,
+                                          original_state=filings_state),
+                            start_index)
 
     def __str__(self):
         """Compact string representation optimized for LLMs."""
@@ -10,9 +10,11 @@ import sys
 from datetime import date, datetime
 from typing import Any, Dict, List, Optional
 
+import numpy as np
+
 from edgar.entity.entity_facts import EntityFacts
+from edgar.entity.fact_table import ConceptInfo, FactTable, interned_strings, object_array, parse_dates
 from edgar.entity.mappings_loader import load_learned_mappings
-from edgar.entity.models import DataQuality, FinancialFact
 
 log = logging.getLogger(__name__)
 
@@ -56,8 +58,6 @@ class EntityFactsParser:
             cik = int(json_data.get('cik', 0))
             entity_name = json_data.get('entityName', 'Unknown')
 
-            facts = []
-
             # String interning: many string fields repeat across thousands of facts.
             # For example, taxonomy (~3 unique), unit (~5), fiscal_period (~5),
             # form_type (~5), concept (~500-1000) each appear on every fact.
@@ -74,6 +74,22 @@ class EntityFactsParser:
                 _intern_cache[s] = interned
                 return interned
 
+            # Facts are collected column by column; FinancialFact objects are
+            # built from the columns by the FactTable when they are used.
+            concepts: List[ConceptInfo] = []
+            group_concepts: List[int] = []  # Per concept and unit
+            group_units: List[str] = []
+            group_contexts: List[str] = []
+            row_groups: List[int] = []
+            values: List[Any] = []
+            starts: List[Optional[str]] = []
+            ends: List[Optional[str]] = []
+            filed: List[Optional[str]] = []
+            fiscal_years: List[Any] = []
+            fiscal_periods: List[Any] = []
+            forms: List[Any] = []
+            accessions: List[Any] = []
+
             # Process facts from different taxonomies
             facts_data = json_data.get('facts', {})
 
@@ -100,157 +116,98 @@ class EntityFactsParser:
                     statement_type = _determine_statement_type(interned_concept)
                     if statement_type:
                         statement_type = _fast_intern(statement_type)
-                    semantic_tags = _get_semantic_tags(interned_concept)
-                    # Note: structural_info is shared across all facts for this concept.
-                    # It is only read (via .get()) in _parse_single_fact — do not mutate per-fact.
                     structural_info = _get_structural_info(interned_concept)
-                    if structural_info.get('parent'):
-                        structural_info['parent'] = _fast_intern(structural_info['parent'])
-                    if structural_info.get('section'):
-                        structural_info['section'] = _fast_intern(structural_info['section'])
+                    concept_id = len(concepts)
+                    concepts.append(ConceptInfo(
+                        concept=_fast_intern(f"{interned_taxonomy}:{interned_concept}"),
+                        taxonomy=interned_taxonomy,
+                        label=interned_label,
+                        statement_type=statement_type,
+                        semantic_tags=_get_semantic_tags(interned_concept),
+                        depth=structural_info.get('depth'),
+                        parent_concept=_fast_intern(structural_info['parent']) if structural_info.get('parent')
+                        else structural_info.get('parent'),
+                        section=_fast_intern(structural_info['section']) if structural_info.get('section')
+                        else structural_info.get('section'),
+                        is_abstract=structural_info.get('is_abstract', False),
+                        is_total=structural_info.get('is_total', False),
+                        presentation_order=structural_info.get('avg_depth'),
+                    ))
 
                     for unit, unit_facts in units.items():
                         interned_unit = _fast_intern(unit)
-                        clean_unit = _fast_intern(_clean_unit(interned_unit)) if interned_unit else ''
-                        business_context = _fast_intern(
+                        group_concepts.append(concept_id)
+                        group_units.append(_fast_intern(_clean_unit(interned_unit)) if interned_unit else '')
+                        group_contexts.append(_fast_intern(
                             _generate_business_context(interned_label, description, interned_unit)
-                        ) if interned_label or description else ''
+                        ) if interned_label or description else '')
 
+                        count = len(values)
                         for fact_data in unit_facts:
-                            fact = cls._parse_single_fact(
-                                concept=interned_concept,
-                                taxonomy=interned_taxonomy,
-                                label=interned_label,
-                                unit=clean_unit,
-                                fact_data=fact_data,
-                                _fast_intern=_fast_intern,
-                                statement_type=statement_type,
-                                semantic_tags=semantic_tags,
-                                structural_info=structural_info,
-                                business_context=business_context,
-                            )
-                            if fact:
-                                facts.append(fact)
-
-            if not facts:
+                            get = fact_data.get
+                            value = get('val')
+                            # Facts without a value are skipped
+                            if value is None:
+                                continue
+                            values.append(value)
+                            starts.append(get('start'))
+                            ends.append(get('end'))
+                            filed.append(get('filed'))
+                            fiscal_years.append(get('fy'))
+                            fiscal_periods.append(get('fp'))
+                            forms.append(get('form'))
+                            accessions.append(get('accn'))
+                        row_groups.extend([len(group_units) - 1] * (len(values) - count))
+
+            if not values:
                 log.warning("No facts found for CIK %s", cik)
                 return None
 
-            return EntityFacts(cik=cik, name=entity_name, facts=facts)
+            return EntityFacts(cik=cik, name=entity_name, fact_table=cls._fact_table(
+                concepts, group_concepts, group_units, group_contexts, row_groups, values,
+                starts, ends, filed, fiscal_years, fiscal_periods, forms, accessions))
 
         except Exception as e:
             log.error("Error parsing company facts: %s", e)
             return None
 
     @classmethod
-    def _parse_single_fact(cls,
-                          concept: str,
-                          taxonomy: str,
-                          label: str,
-                          unit: str,
-                          fact_data: Dict[str, Any],
-                          _fast_intern=None,
-                          statement_type: Optional[str] = None,
-                          semantic_tags: Optional[List[str]] = None,
-                          structural_info: Optional[Dict[str, Any]] = None,
-                          business_context: str = '') -> Optional[FinancialFact]:
-        """
-        Parse a single fact from SEC data.
-
-        Args:
-            concept: Concept identifier (already interned)
-            taxonomy: Taxonomy namespace (already interned)
-            label: Human-readable label (already interned)
-            unit: Clean unit string (already interned)
-            fact_data: Raw fact data from SEC JSON
-            _fast_intern: Optional interning function for string deduplication
-            statement_type: Pre-computed statement type (per-concept)
-            semantic_tags: Pre-computed semantic tags (per-concept)
-            structural_info: Pre-computed structural metadata (per-concept)
-            business_context: Pre-computed business context (per-concept+unit)
+    def _fact_table(cls, concepts, group_concepts, group_units, group_contexts, row_groups, values,
+                    starts, ends, filed, fiscal_years, fiscal_periods, forms, accessions) -> FactTable:
+        """Turn the fact fields collected by parse_company_facts() into the columns of a FactTable."""
+        row_groups = np.array(row_groups, dtype=np.int64)
+        period_start = parse_dates(starts, cls._parse_date)
+        _parse_fiscal_year = cls._parse_fiscal_year
+        columns = {
+            'value': object_array(values),
+            'numeric_value': object_array([cls._numeric_value(value) for value in values]),
+            'unit': object_array(group_units)[row_groups],
+            # A fact with a start date covers a duration, otherwise it is at an instant
+            'period_type': object_array(['instant', 'duration'])[(~np.isnat(period_start)).astype(np.int64)],
+            'period_start': period_start,
+            'period_end': parse_dates(ends, cls._parse_date),
+            'filing_date': parse_dates(filed, cls._parse_date),
+            'fiscal_year': np.array([fy if type(fy) is int else _parse_fiscal_year(fy) for fy in fiscal_years],
+                                    dtype=np.int64),
+            'fiscal_period': interned_strings(fiscal_periods),
+            'form_type': interned_strings(forms),
+            'accession': interned_strings(accessions),
+        }
+        return FactTable.from_columns(columns, concepts,
+                                      concept_ids=np.array(group_concepts, dtype=np.int64)[row_groups],
+                                      business_context=object_array(group_contexts)[row_groups])
 
-        Returns:
-            FinancialFact or None if parsing fails
-        """
-
-        # Extract core values
-        value = fact_data.get('val')
-        if value is None:
-            return None
-
-        # Parse dates
-        period_end = cls._parse_date(fact_data.get('end'))
-        period_start = cls._parse_date(fact_data.get('start'))
-        filing_date = cls._parse_date(fact_data.get('filed'))
-
-        # Determine period type
-        if period_start:
-            period_type = 'duration'
-        else:
-            period_type = 'instant'
-
-        # Parse fiscal period info
-        fiscal_year = cls._parse_fiscal_year(fact_data.get('fy'))
-        fiscal_period = fact_data.get('fp', '')
-
-        # Determine numeric value
-        numeric_value = None
+    @staticmethod
+    def _numeric_value(value: Any) -> Optional[float]:
+        """The value of a fact as a number, if it is one"""
         if isinstance(value, (int, float)):
-            numeric_value = float(value)
-        elif isinstance(value, str) and value.replace('-', '').replace('.', '').isdigit():
+            return float(value)
+        if isinstance(value, str) and value.replace('-', '').replace('.', '').isdigit():
             try:
-                numeric_value = float(value)
+                return float(value)
             except ValueError:
                 pass
-
-        # Determine data quality (per-fact: depends on fiscal_period)
-        data_quality = cls._assess_data_quality(fact_data, fiscal_period)
-
-        if structural_info is None:
-            structural_info = {}
-        if semantic_tags is None:
-            semantic_tags = cls._EMPTY_TAGS
-
-        # Intern per-fact strings to deduplicate memory
-        if _fast_intern is not None:
-            full_concept = _fast_intern(f"{taxonomy}:{concept}")
-            fiscal_period = _fast_intern(fiscal_period) if fiscal_period else ''
-            period_type = _fast_intern(period_type)
-            form_type = _fast_intern(fact_data.get('form', ''))
-            accession = _fast_intern(fact_data.get('accn', ''))
-        else:
-            full_concept = f"{taxonomy}:{concept}"
-            form_type = fact_data.get('form', '')
-            accession = fact_data.get('accn', '')
-
-        return FinancialFact(
-                concept=full_concept,
-                taxonomy=taxonomy,
-                label=label,
-                value=value,
-                numeric_value=numeric_value,
-                unit=unit,
-                period_start=period_start,
-                period_end=period_end,
-                period_type=period_type,
-                fiscal_year=fiscal_year,
-                fiscal_period=fiscal_period,
-                filing_date=filing_date,
-                form_type=form_type,
-                accession=accession,
-                data_quality=data_quality,
-                is_audited=fiscal_period == 'FY',
-                confidence_score=0.9 if data_quality == DataQuality.HIGH else 0.7,
-                semantic_tags=semantic_tags,
-                business_context=business_context,
-                statement_type=statement_type,
-                depth=structural_info.get('depth'),
-                parent_concept=structural_info.get('parent'),
-                section=structural_info.get('section'),
-                is_abstract=structural_info.get('is_abstract', False),
-                is_total=structural_info.get('is_total', False),
-                presentation_order=structural_info.get('avg_depth')
-            )
+        return None
 
     @staticmethod
     def _parse_date(date_str: Optional[str]) -> Optional[date]:
@@ -345,20 +302,6 @@ class EntityFactsParser:
 
         return {}
 
-    @staticmethod
-    def _assess_data_quality(fact_data: Dict[str, Any], fiscal_period: str) -> DataQuality:
-        """Assess the quality of a fact"""
-        # Annual data is typically higher quality
-        if fiscal_period == 'FY':
-            return DataQuality.HIGH
-
-        # Quarterly data
-        if fiscal_period in ['Q1', 'Q2', 'Q3', 'Q4']:
-            return DataQuality.HIGH
-
-        # Other data
-        return DataQuality.MEDIUM
-
     @staticmethod
     def _generate_business_context(label: str, description: str, unit: str) -> str:
         """Generate business context for a fact"""
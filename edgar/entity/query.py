@@ -25,6 +25,48 @@ if TYPE_CHECKING:
     from edgar.enums import PeriodType
 
 
+def period_type_months(period_type: Union[str, 'PeriodType']) -> int:
+    """
+    The length in months of the periods of a period type ('annual', 'quarterly'
+    or 'monthly').
+
+    Raises:
+        NotImplementedError: For TTM and YTD, which need calculating rather than filtering
+        ValueError: For anything that is not a period type
+    """
+    # Import here to avoid circular imports
+    try:
+        from edgar.enums import validate_period_type
+    except ImportError:
+        # Fallback if enums not available
+        def validate_period_type(p):
+            if isinstance(p, str) and p.lower() in ['annual', 'quarterly', 'monthly']:
+                return p.lower()
+            raise ValueError(f"Invalid period type: {p}")
+
+    validated_period = validate_period_type(period_type)
+
+    # Map period types to period lengths (in months)
+    period_mapping = {
+        'annual': 12,
+        'quarterly': 3,
+        'monthly': 1
+    }
+
+    if validated_period in period_mapping:
+        return period_mapping[validated_period]
+    elif validated_period in ['ttm', 'ytd']:
+        # TTM and YTD require special calculation logic not yet implemented
+        raise NotImplementedError(
+            f"Period type '{validated_period}' requires calculation logic not yet implemented. "
+            f"For trailing twelve months data, use .by_period_length(12) to get 12-month periods, "
+            f"or use facts.income_statement(annual=False, periods=4) for quarterly aggregation."
+        )
+    else:
+        # This shouldn't happen if validate_period_type works correctly
+        raise ValueError(f"Unsupported period type: {validated_period}")
+
+
 class FactQuery:
     """
     Fluent query builder for financial facts with AI-ready features.
@@ -230,38 +272,8 @@ class FactQuery:
             supported by this method. Use .by_period_length(12) for 12-month periods
             or implement custom TTM/YTD calculation logic.
         """
-        # Import here to avoid circular imports
-        try:
-            from edgar.enums import validate_period_type
-        except ImportError:
-            # Fallback if enums not available
-            def validate_period_type(p):
-                if isinstance(p, str) and p.lower() in ['annual', 'quarterly', 'monthly']:
-                    return p.lower()
-                raise ValueError(f"Invalid period type: {p}")
-
-        validated_period = validate_period_type(period_type)
-
-        # Map period types to period lengths (in months)
-        period_mapping = {
-            'annual': 12,
-            'quarterly': 3,
-            'monthly': 1
-        }
-
-        if validated_period in period_mapping:
-            # Delegate to existing by_period_length method
-            return self.by_period_length(period_mapping[validated_period])
-        elif validated_period in ['ttm', 'ytd']:
-            # TTM and YTD require special calculation logic not yet implemented
-            raise NotImplementedError(
-                f"Period type '{validated_period}' requires calculation logic not yet implemented. "
-                f"For trailing twelve months data, use .by_period_length(12) to get 12-month periods, "
-                f"or use facts.income_statement(annual=False, periods=4) for quarterly aggregation."
-            )
-        else:
-            # This shouldn't happen if validate_period_type works correctly
-            raise ValueError(f"Unsupported period type: {validated_period}")
+        # Delegate to existing by_period_length method
+        return self.by_period_length(period_type_months(period_type))
 
     def date_range(self, start: Union[date, str, None] = None, end: Union[date, str, None] = None) -> 'FactQuery':
         """
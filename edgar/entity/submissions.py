@@ -155,6 +155,13 @@ def get_entity_submissions(cik: int) -> Optional[Any]:
     """
     # Check the environment var EDGAR_USE_LOCAL_DATA
     if is_using_local_storage():
+        # A built submissions dataset has every filing in one table, no JSON to merge,
+        # unless the entity's JSON was downloaded again since the dataset was built
+        from edgar.reference.submissions_dataset import load_entity_data_from_dataset
+        submissions_file = get_edgar_data_directory() / "submissions" / f"CIK{int(cik):010}.json"
+        entity_data = load_entity_data_from_dataset(cik, source=submissions_file)
+        if entity_data is not None:
+            return entity_data
         submissions_json = load_company_submissions_from_local(cik)
         if not submissions_json:
             submissions_json = download_entity_submissions_from_sec(cik)
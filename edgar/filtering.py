@@ -72,6 +72,18 @@ def filter_by_accession_number(data: pa.Table,
 
 
 
+def expand_forms(form: Union[IntString, List[IntString]],
+                 amendments: bool = True) -> List[str]:
+    """Return the form names a form filter matches, with or without amendments"""
+    # Ensure that forms is a list of strings ... it can accept int like form 3, 4, 5
+    forms = [str(el) for el in listify(form)]
+    # Expand friendly aliases (e.g. 'N-PORT' -> 'NPORT-P') to real SEC form names.
+    forms = _expand_form_aliases(forms)
+    if amendments:
+        return list(set(forms + [f"{val}/A" for val in forms]))
+    return list(set([val.replace("/A", "") for val in forms]))
+
+
 def filter_by_form(data: pa.Table,
                    form: Union[str, List[str]],
                    amendments: bool = True) -> pa.Table:
@@ -79,14 +91,7 @@ def filter_by_form(data: pa.Table,
     # Handle empty tables - return early to avoid type mismatch errors
     if data.num_rows == 0:
         return data
-    # Ensure that forms is a list of strings ... it can accept int like form 3, 4, 5
-    forms = [str(el) for el in listify(form)]
-    # Expand friendly aliases (e.g. 'N-PORT' -> 'NPORT-P') to real SEC form names.
-    forms = _expand_form_aliases(forms)
-    if amendments:
-        forms = list(set(forms + [f"{val}/A" for val in forms]))
-    else:
-        forms = list(set([val.replace("/A", "") for val in forms]))
+    forms = expand_forms(form, amendments=amendments)
     data = data.filter(pc.is_in(data['form'], pa.array(forms)))
     return data
 
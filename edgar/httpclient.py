@@ -1,10 +1,15 @@
 import locale
 import os
 import re
+import threading
+import time
+from collections import deque
 from contextlib import asynccontextmanager, contextmanager
-from typing import AsyncGenerator, Generator, Literal, Optional
+from pathlib import Path
+from typing import AsyncGenerator, Generator, Literal, Optional, Union
 
 import httpx
+from pyrate_limiter import Limiter
 
 # Fix for issue #457: Force C locale for httpxthrottlecache to avoid locale-dependent date parsing
 # httpxthrottlecache uses time.strptime() which is locale-dependent. On non-English systems
@@ -202,23 +207,164 @@ def get_edgar_rate_limit_per_sec():
     return int(os.environ.get("EDGAR_RATE_LIMIT_PER_SEC", "9"))
 
 
-def _create_rate_limiter(requests_per_second: int):
+# Where the rate limit is kept.
+# - memory: in this process only. Each worker process gets the full rate to itself.
+# - sqlite: in a SQLite database shared, under a file lock, by every process on the host
+#   that points at the same file, so N workers share one rate instead of getting N of them.
+RATE_LIMIT_BACKENDS = ("memory", "sqlite")
+
+
+def get_edgar_rate_limit_backend() -> str:
+    """
+    Returns the rate limiter backend from EDGAR_RATE_LIMIT_BACKEND, 'memory' (the default) or 'sqlite'.
+    Use 'sqlite' when several processes on one host download from the SEC at the same time.
+    """
+    backend = os.environ.get("EDGAR_RATE_LIMIT_BACKEND", "memory").strip().lower()
+    if backend not in RATE_LIMIT_BACKENDS:
+        log.warning("Unknown EDGAR_RATE_LIMIT_BACKEND %r, using 'memory'. Choose one of %s",
+                    backend, ", ".join(RATE_LIMIT_BACKENDS))
+        return "memory"
+    return backend
+
+
+def get_edgar_rate_limit_path() -> Path:
+    """
+    Returns the database shared by the 'sqlite' rate limiter backend.
+    Set EDGAR_RATE_LIMIT_PATH to share a limiter between processes with different data directories.
+    """
+    path = os.environ.get("EDGAR_RATE_LIMIT_PATH")
+    if path:
+        return Path(path)
+    return get_edgar_data_directory() / "ratelimiter.sqlite"
+
+
+class RateLimitStats:
+    """
+    How long requests waited for the rate limiter.
+
+    The totals cover every request since the stats were last reset and the percentiles
+    cover the most recent requests. Waits that are a large share of request time mean
+    more workers will not download any faster.
+    """
+
+    RECENT_WAITS = 10_000
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.requests = 0
+            self.total_wait = 0.0
+            self.max_wait = 0.0
+            self._recent_waits = deque(maxlen=self.RECENT_WAITS)
+
+    def record(self, wait: float):
+        with self._lock:
+            self.requests += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+            self._recent_waits.append(wait)
+
+    def percentile(self, percent: float) -> float:
+        with self._lock:
+            waits = sorted(self._recent_waits)
+        if not waits:
+            return 0.0
+        return waits[min(len(waits) - 1, int(len(waits) * percent / 100))]
+
+    def to_dict(self) -> dict:
+        requests = self.requests
+        return {
+            "requests": requests,
+            "total_wait_seconds": self.total_wait,
+            "mean_wait_seconds": self.total_wait / requests if requests else 0.0,
+            "p50_wait_seconds": self.percentile(50),
+            "p95_wait_seconds": self.percentile(95),
+            "max_wait_seconds": self.max_wait,
+        }
+
+
+class MeteredLimiter(Limiter):
+    """A rate limiter that records how long each request waits for a slot"""
+
+    def __init__(self, *args, backend: str = "memory", requests_per_second: int = 9,
+                 path: Optional[Path] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.backend = backend
+        self.requests_per_second = requests_per_second
+        self.path = path
+        self.stats = RateLimitStats()
+
+    def try_acquire(self, *args, **kwargs):
+        start = time.perf_counter()
+        acquired = super().try_acquire(*args, **kwargs)
+        self.stats.record(time.perf_counter() - start)
+        return acquired
+
+    async def try_acquire_async(self, *args, **kwargs):
+        start = time.perf_counter()
+        acquired = await super().try_acquire_async(*args, **kwargs)
+        self.stats.record(time.perf_counter() - start)
+        return acquired
+
+
+def _create_rate_limiter(requests_per_second: int,
+                         backend: Optional[str] = None,
+                         path: Optional[Union[str, Path]] = None) -> MeteredLimiter:
     """Create a rate limiter compatible with both pyrate-limiter 3.x and 4.x.
 
     pyrate-limiter 4.0 removed max_delay, raise_when_fail, and retry_until_max_delay
     parameters from Limiter.__init__(). This function handles both API versions.
     See: https://github.com/dgunning/edgartools/issues/640
+
+    The 'sqlite' backend keeps the bucket in a SQLite database guarded by a file lock and
+    timed by the database clock, so every process using the same file shares one rate.
     """
-    from pyrate_limiter import Duration, InMemoryBucket, Limiter, Rate
+    from pyrate_limiter import Duration, InMemoryBucket, Rate, SQLiteBucket
 
+    backend = backend or get_edgar_rate_limit_backend()
     rate = Rate(requests_per_second, Duration.SECOND)
-    bucket = InMemoryBucket([rate])
+    if backend == "sqlite":
+        path = Path(path) if path else get_edgar_rate_limit_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        bucket = SQLiteBucket.init_from_file([rate], db_path=str(path), use_file_lock=True)
+    else:
+        path = None
+        bucket = InMemoryBucket([rate])
+    metering = dict(backend=backend, requests_per_second=requests_per_second, path=path)
     try:
         # pyrate-limiter 3.x API
-        return Limiter(bucket, max_delay=Duration.DAY, raise_when_fail=False, retry_until_max_delay=True)
+        return MeteredLimiter(bucket, max_delay=Duration.DAY, raise_when_fail=False, retry_until_max_delay=True,
+                              **metering)
     except TypeError:
         # pyrate-limiter 4.0+ removed these parameters
-        return Limiter(bucket)
+        return MeteredLimiter(bucket, **metering)
+
+
+def get_rate_limit_stats() -> dict:
+    """
+    Get how long requests in this process have waited for the rate limiter.
+
+    Use it to size worker pools: once the mean wait approaches the time a request takes,
+    the shared rate limit is the bottleneck and more workers will not help.
+
+    Example:
+        >>> from edgar.httpclient import get_rate_limit_stats
+        >>> get_rate_limit_stats()["mean_wait_seconds"]
+    """
+    limiter = HTTP_MGR.rate_limiter
+    stats = limiter.stats.to_dict() if isinstance(limiter, MeteredLimiter) else {}
+    stats["backend"] = getattr(limiter, "backend", None)
+    stats["requests_per_second"] = getattr(limiter, "requests_per_second", HTTP_MGR.request_per_sec_limit)
+    return stats
+
+
+def reset_rate_limit_stats() -> None:
+    """Start counting rate limiter waits afresh"""
+    if isinstance(HTTP_MGR.rate_limiter, MeteredLimiter):
+        HTTP_MGR.rate_limiter.stats.reset()
 
 
 def get_http_mgr(cache_enabled: bool = True, request_per_sec_limit: int = 9) -> HttpxThrottleCache:
@@ -289,6 +435,8 @@ def configure_http(
     proxy: Optional[str] = None,
     timeout: Optional[float] = None,
     http2: Optional[bool] = None,
+    rate_limit_backend: Optional[str] = None,
+    rate_limit_path: Optional[Union[str, Path]] = None,
 ) -> None:
     """
     Configure HTTP client settings at runtime.
@@ -313,6 +461,12 @@ def configure_http(
                connection, so a mid-stream reset from cloud egress fails every
                in-flight request at once (InvalidBodyLengthError /
                ConnectionTerminated). Set to True to opt back into HTTP/2.
+        rate_limit_backend: Where the rate limit is kept. "memory" limits this process only.
+                            "sqlite" shares one limit between every process on the host
+                            that uses the same rate_limit_path, so worker pools stay under
+                            the SEC limit together.
+        rate_limit_path: The database file for the "sqlite" backend.
+                         Defaults to ratelimiter.sqlite in the Edgar data directory.
 
     Examples:
         # Use OS certificate store (recommended for corporate networks)
@@ -331,6 +485,9 @@ def configure_http(
         # Opt back into HTTP/2 (default is HTTP/1.1)
         configure_http(http2=True)
 
+        # Share the SEC rate limit between worker processes
+        configure_http(rate_limit_backend="sqlite")
+
     Note:
         Changes take effect immediately for new requests.
         If an HTTP client was already created, it will be recreated with the new settings.
@@ -372,6 +529,17 @@ def configure_http(
         HTTP_MGR.httpx_params["timeout"] = Timeout(timeout, connect=10.0)
         settings_changed = True
 
+    if rate_limit_backend is not None or rate_limit_path is not None:
+        if rate_limit_backend is not None and rate_limit_backend not in RATE_LIMIT_BACKENDS:
+            raise ValueError(f"rate_limit_backend must be one of {', '.join(RATE_LIMIT_BACKENDS)}")
+        # A database path on its own implies the shared backend
+        backend = rate_limit_backend or ("sqlite" if rate_limit_path is not None
+                                         else getattr(HTTP_MGR.rate_limiter, "backend", None))
+        HTTP_MGR.rate_limiter = _create_rate_limiter(HTTP_MGR.request_per_sec_limit,
+                                                     backend=backend,
+                                                     path=rate_limit_path)
+        settings_changed = True
+
     # Force client recreation if settings changed and client already exists
     # This ensures new settings take effect even if client was already created
     if settings_changed and HTTP_MGR._client is not None:
@@ -427,6 +595,8 @@ def get_http_config() -> dict:
         "proxy": params.get("proxy"),
         "timeout": params.get("timeout"),
         "http2": params.get("http2", False),
+        "rate_limit_backend": getattr(HTTP_MGR.rate_limiter, "backend", None),
+        "rate_limit_path": getattr(HTTP_MGR.rate_limiter, "path", None),
     }
 
 
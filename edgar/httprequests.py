@@ -1,3 +1,4 @@
+import asyncio
 import gzip
 import inspect
 import logging
@@ -5,6 +6,7 @@ import os
 import shutil
 import tarfile
 import tempfile
+import threading
 import uuid
 import zipfile
 from dataclasses import dataclass
@@ -12,7 +14,7 @@ from enum import Enum
 from functools import wraps
 from io import BytesIO
 from pathlib import Path
-from typing import Optional, Union, cast
+from typing import Any, Dict, Hashable, Optional, Union, cast
 
 import httpcore
 import orjson as json
@@ -58,6 +60,7 @@ __all__ = [
     "TRANSPORT_ERRORS",
     "UNREACHABLE_ERRORS",
     "is_unreachable",
+    "get_coalescing_stats",
 ]
 
 attempts = 6
@@ -80,6 +83,10 @@ BULK_WAIT_MAX = 120  # max 2min delay
 # Connect stays short (10s), but read timeout is generous (5 min per chunk)
 BULK_TIMEOUT = Timeout(300.0, connect=10.0)
 
+# Concurrent async downloads of large documents (full submissions, companyfacts JSON).
+# Bounds how many are in flight at once; the rate limiter decides how fast requests go out.
+MAX_CONCURRENT_DOWNLOADS = 8
+
 # SSL errors - retry once in case of transient issues, then fail with helpful message
 SSL_RETRY_ATTEMPTS = 2  # 1 retry = 2 total attempts
 SSL_WAIT_MAX = 5  # Short delay for SSL retries
@@ -798,6 +805,171 @@ def async_with_identity(func):
     return wrapper
 
 
+class _Flight:
+    """One in-flight call that other callers with the same key wait on"""
+
+    def __init__(self, leader: Hashable):
+        self.leader = leader
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+def _is_cancelling(task: Optional[asyncio.Task]) -> bool:
+    """True if the task has been asked to cancel. Python 3.10 cannot tell, so assume it has not."""
+    cancelling = getattr(task, 'cancelling', None)
+    return cancelling is not None and cancelling() > 0
+
+
+class SingleFlight:
+    """
+    Share one in-flight call between concurrent callers asking for the same thing.
+
+    The first caller for a key makes the call and every caller that arrives for that key
+    before it finishes gets its result, or its exception, instead of making a call of its
+    own. Nothing is cached: once the call finishes the next caller makes a new one.
+
+    Threads wait on the call made by another thread. Coroutines wait on the call made by
+    another task on the same event loop.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._futures: Dict[Hashable, asyncio.Future] = {}
+        self._future_leaders: Dict[Hashable, Optional[asyncio.Task]] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    def do(self, key: Hashable, func, *args, **kwargs):
+        thread = threading.get_ident()
+        with self._lock:
+            self.calls += 1
+            flight = self._flights.get(key)
+            # A leader asking for its own key again (a redirect back to the same url) must not wait on itself
+            if flight is not None and flight.leader != thread:
+                self.coalesced += 1
+                leading = False
+            else:
+                flight = _Flight(leader=thread)
+                self._flights.setdefault(key, flight)
+                leading = True
+        if not leading:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+        try:
+            flight.result = func(*args, **kwargs)
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+            flight.done.set()
+
+    async def do_async(self, key: Hashable, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        task = asyncio.current_task()
+        flight_key = (id(loop), key)
+        with self._lock:
+            self.calls += 1
+            future = self._futures.get(flight_key)
+            if future is not None and self._future_leaders.get(flight_key) is not task:
+                self.coalesced += 1
+                leading = False
+            else:
+                future = loop.create_future()
+                if flight_key not in self._futures:
+                    self._futures[flight_key] = future
+                    self._future_leaders[flight_key] = task
+                leading = True
+        if not leading:
+            try:
+                # A waiter being cancelled must not cancel the call the others are waiting on
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # The leader was cancelled, not this caller, which still wants the result: make the call again
+                if future.cancelled() and not _is_cancelling(task):
+                    return await self.do_async(key, func, *args, **kwargs)
+                raise
+        try:
+            result = await func(*args, **kwargs)
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark the exception retrieved so a call nobody else waited on is not logged as unhandled
+            future.exception()
+            raise
+        finally:
+            with self._lock:
+                if self._futures.get(flight_key) is future:
+                    del self._futures[flight_key]
+                    del self._future_leaders[flight_key]
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"requests": self.calls, "coalesced": self.coalesced, "in_flight": len(self._flights) + len(self._futures)}
+
+
+_single_flight = SingleFlight()
+
+
+def _request_key(url, kwargs) -> Hashable:
+    """Requests are the same when the url and every argument to the request are the same"""
+    return url, repr(sorted(kwargs.items(), key=lambda item: item[0]))
+
+
+def coalesce_requests(func):
+    """
+    Concurrent identical GETs from different threads share one request.
+
+    Several threads asking for the same company_tickers.json or submissions JSON at once
+    would otherwise each spend rate limit budget on the same response. Apply this
+    outermost, so that the shared call includes the retries.
+    """
+    @wraps(func)
+    def wrapper(url, *args, **kwargs):
+        return _single_flight.do(_request_key(url, kwargs) + args, func, url, *args, **kwargs)
+
+    return wrapper
+
+
+def coalesce_requests_async(func):
+    """
+    Concurrent identical GETs from tasks on the same event loop share one request.
+
+    Only requests made with the same client are shared, since clients can differ in
+    headers, auth and caching.
+    """
+    @wraps(func)
+    async def wrapper(client, url, *args, **kwargs):
+        key = _request_key(url, kwargs) + (id(client),) + args
+        return await _single_flight.do_async(key, func, client, url, *args, **kwargs)
+
+    return wrapper
+
+
+def get_coalescing_stats() -> Dict[str, int]:
+    """
+    Get how many GET requests were made and how many of them shared another caller's request.
+
+    Example:
+        >>> from edgar.httprequests import get_coalescing_stats
+        >>> get_coalescing_stats()
+        {'requests': 120, 'coalesced': 14, 'in_flight': 0}
+    """
+    return _single_flight.stats()
+
+
+@coalesce_requests
 @wrap_transport_errors
 @retry(
     on=should_retry,
@@ -842,6 +1014,7 @@ def get_with_retry(url, identity=None, identity_callable=None, **kwargs):
         raise
 
 
+@coalesce_requests_async
 @wrap_transport_errors
 @retry(
     on=should_retry,
@@ -1212,10 +1385,11 @@ async def download_file_async(
         # Download as binary
         content = response.content
 
-        # Check if the content is gzip-compressed
-        if response.headers.get("Content-Encoding") == "gzip":
+        # httpx has already decoded a gzip Content-Encoding, so only decompress content that is still gzip
+        if response.headers.get("Content-Encoding") == "gzip" and content[:2] == b"\x1f\x8b":
             content = gzip.decompress(content)
 
+    path = Path(path) if path else None
     if path and path.is_dir():
         path = path / os.path.basename(url)
 
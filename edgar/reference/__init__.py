@@ -6,6 +6,12 @@ from edgar.reference.company_dataset import (
     is_individual_from_json,
     to_duckdb,
 )
+from edgar.reference.company_facts_dataset import (
+    build_company_facts_dataset,
+    facts_frame,
+    get_company_facts_from_dataset,
+    load_company_facts_from_dataset,
+)
 from edgar.reference.company_subsets import (
     # Classes and Enums
     CompanySubset,
@@ -52,6 +58,13 @@ from edgar.reference._codes import (
     is_us_company,
 )
 from edgar.reference.forms import describe_form
+from edgar.reference.submissions_dataset import (
+    build_submissions_dataset,
+    read_submissions_entities,
+    read_submissions_filings,
+    refresh_submissions_dataset,
+    update_submissions_dataset,
+)
 from edgar.reference.tickers import cusip_ticker_mapping, get_icon_from_ticker, get_ticker_from_cusip
 
 # A dict of state abbreviations and their full names
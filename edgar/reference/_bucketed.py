@@ -0,0 +1,99 @@
+"""
+Parquet tables split into a fixed number of buckets, as the company facts and
+submissions datasets store them:
+
+    <dataset>/<table>/bucket=NN/part-0.parquet
+
+Rows are bucketed by cik (or another key) by the dataset that writes them, and
+read back with a bucket filter, so a lookup opens one file.
+"""
+
+import os
+import shutil
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+# Rows buffered per bucket before they are written out as a row group
+ROW_GROUP_SIZE = 64 * 1024
+
+_BUCKET_PARTITIONING = ds.partitioning(pa.schema([('bucket', pa.int32())]), flavor='hive')
+
+
+def bucket_path(directory: Path, table_name: str, bucket: int) -> Path:
+    return directory / table_name / f"bucket={bucket:02d}" / 'part-0.parquet'
+
+
+class BucketedWriter:
+    """
+    A Parquet writer per table and bucket, buffering whole row groups.
+
+    Rows keep the order they are appended in, so appending companies in cik
+    order leaves every bucket sorted by cik.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self._writers: Dict[Tuple[str, int], pq.ParquetWriter] = {}
+        self._pending: Dict[Tuple[str, int], List[pa.RecordBatch]] = {}
+        self._pending_rows: Dict[Tuple[str, int], int] = {}
+
+    def append(self, table_name: str, bucket: int, batch: pa.RecordBatch):
+        key = (table_name, bucket)
+        self._pending.setdefault(key, []).append(batch)
+        self._pending_rows[key] = self._pending_rows.get(key, 0) + batch.num_rows
+        if self._pending_rows[key] >= ROW_GROUP_SIZE:
+            self._flush(key)
+
+    def close(self):
+        for key in list(self._pending):
+            self._flush(key)
+        for writer in self._writers.values():
+            writer.close()
+        self._writers.clear()
+
+    def _flush(self, key: Tuple[str, int]):
+        batches = self._pending.pop(key, None)
+        self._pending_rows.pop(key, None)
+        if not batches:
+            return
+        writer = self._writers.get(key)
+        if writer is None:
+            path = bucket_path(self.directory, *key)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            writer = self._writers[key] = pq.ParquetWriter(path, batches[0].schema, compression='zstd')
+        table = pa.Table.from_batches(batches)
+        writer.write_table(table, row_group_size=max(ROW_GROUP_SIZE, table.num_rows))
+
+
+def bucketed_dataset(path: Path, schema: pa.Schema) -> ds.Dataset:
+    """A bucketed table as a dataset, with 'bucket' as a column to filter on."""
+    return ds.dataset(path, schema=schema.append(pa.field('bucket', pa.int32())), format='parquet',
+                      partitioning=_BUCKET_PARTITIONING)
+
+
+def write_bucket(directory: Path, table_name: str, bucket: int, table: pa.Table):
+    """Replace one bucket file, writing it beside the old one first."""
+    path = bucket_path(directory, table_name, bucket)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Dataset discovery skips names starting with '.', so readers never open a partly written file
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        pq.write_table(table, temp_path, compression='zstd', row_group_size=ROW_GROUP_SIZE)
+        os.replace(temp_path, path)
+    except BaseException:
+        # A failed write must not leave a bucket-sized file behind for every update that fails
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def replace_directory(source: Path, target: Path):
+    """Move a finished directory into place, removing the one it replaces."""
+    old = target.with_name(f"{target.name}.{os.getpid()}.old")
+    if target.exists():
+        os.replace(target, old)
+    os.replace(source, target)
+    shutil.rmtree(old, ignore_errors=True)
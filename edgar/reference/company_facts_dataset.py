@@ -0,0 +1,468 @@
+"""
+Company Facts Dataset for EdgarTools
+
+Converts the SEC companyfacts bulk data (one JSON file per company, ~18,000
+files) into a Parquet dataset with one row per reported fact, so that facts
+can be read for a company or compared across companies without parsing JSON.
+
+Layout of the dataset directory:
+    facts/bucket=NN/part-0.parquet     One row per fact, sorted by cik
+    concepts/bucket=NN/part-0.parquet  Label and description of each concept per company
+    frames/bucket=NN/part-0.parquet    The facts that have an SEC frame, bucketed and
+                                       sorted by concept, for cross-company queries
+    entities.parquet                   cik, entity_name, fact_count
+    dataset.json                       Format version and build statistics
+
+Companies are spread over the buckets by cik, and each bucket file is sorted by
+cik, so reading one company touches one bucket and only the row groups whose
+cik range covers it. facts_frame() works the same way on the frames table, by
+concept.
+
+Example:
+    >>> from edgar.reference import build_company_facts_dataset, facts_frame
+    >>> build_company_facts_dataset()            # once, after download_facts()
+    >>>
+    >>> # Revenue of every filer for calendar 2023
+    >>> revenue = facts_frame('Revenues', 'CY2023')
+    >>>
+    >>> # EntityFacts for one company, without its JSON
+    >>> from edgar.reference import get_company_facts_from_dataset
+    >>> facts = get_company_facts_from_dataset(320193)
+"""
+
+import gzip
+import json
+import os
+import shutil
+import zipfile
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple, Union
+
+import orjson
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from tqdm import tqdm
+
+from edgar.core import log
+from edgar.exceptions import CompanyFactsNotFoundError
+from edgar.reference._bucketed import ROW_GROUP_SIZE, BucketedWriter, bucketed_dataset, replace_directory
+from edgar.settings import get_edgar_data_directory
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from edgar.entity.entity_facts import EntityFacts
+
+__all__ = [
+    'build_company_facts_dataset',
+    'load_company_facts_from_dataset',
+    'get_company_facts_from_dataset',
+    'facts_frame',
+    'FACTS_SCHEMA',
+    'CONCEPTS_SCHEMA',
+]
+
+# Bump when the layout or schema of the dataset changes
+FACTS_DATASET_FORMAT = 1
+
+DEFAULT_BUCKETS = 16
+
+FACTS_SCHEMA = pa.schema([
+    ('cik', pa.int32()),
+    ('taxonomy', pa.string()),
+    ('concept', pa.string()),
+    ('unit', pa.string()),
+    ('period_start', pa.date32()),  # Null for instant facts
+    ('period_end', pa.date32()),
+    ('value', pa.float64()),
+    ('fy', pa.int32()),
+    ('fp', pa.string()),
+    ('form', pa.string()),
+    ('accn', pa.string()),
+    ('filed', pa.date32()),
+    ('frame', pa.string()),  # SEC frame the fact is the latest value for, e.g. CY2023Q1I
+])
+
+CONCEPTS_SCHEMA = pa.schema([
+    ('cik', pa.int32()),
+    ('taxonomy', pa.string()),
+    ('concept', pa.string()),
+    ('label', pa.string()),
+    ('description', pa.string()),
+])
+
+ENTITIES_SCHEMA = pa.schema([
+    ('cik', pa.int32()),
+    ('entity_name', pa.string()),
+    ('fact_count', pa.int64()),
+])
+
+_DATE_COLUMNS = ('period_start', 'period_end', 'filed')
+
+
+def get_company_facts_dataset_directory() -> Path:
+    """Where build_company_facts_dataset() writes by default."""
+    return get_edgar_data_directory() / 'companyfacts_dataset'
+
+
+def build_company_facts_dataset(
+    source: Optional[Union[str, Path]] = None,
+    output_dir: Optional[Union[str, Path]] = None,
+    buckets: int = DEFAULT_BUCKETS,
+    show_progress: bool = True
+) -> Path:
+    """
+    Build the company facts Parquet dataset from companyfacts JSON.
+
+    The dataset is written next to the final location and moved into place when
+    complete, so an existing dataset stays readable until the new one replaces it.
+
+    Args:
+        source: The companyfacts directory of CIK*.json (or CIK*.json.gz) files,
+                or companyfacts.zip. Defaults to the companyfacts directory that
+                download_facts() fills.
+        output_dir: Where to write the dataset. Defaults to
+                    ~/.edgar/companyfacts_dataset
+        buckets: Number of files the facts are spread over, by cik
+        show_progress: Show progress bar (default: True)
+
+    Returns:
+        Path to the dataset directory
+
+    Raises:
+        FileNotFoundError: If the source has no companyfacts files
+
+    Example:
+        >>> from edgar.storage import download_facts
+        >>> download_facts()
+        >>> build_company_facts_dataset()
+    """
+    source = Path(source) if source else get_edgar_data_directory() / 'companyfacts'
+    output_dir = Path(output_dir) if output_dir else get_company_facts_dataset_directory()
+    if not source.exists():
+        raise FileNotFoundError(
+            f"Company facts not found: {source}\n\n"
+            "Please download company facts first:\n"
+            "  from edgar.storage import download_facts\n"
+            "  download_facts()\n"
+        )
+
+    names = _company_files(source)
+    if not names:
+        raise FileNotFoundError(
+            f"No company facts files found in: {source}\n"
+            "Expected CIK*.json files"
+        )
+    log.info(f"Building company facts dataset from {len(names):,} files")
+
+    output_dir.parent.mkdir(parents=True, exist_ok=True)
+    temp_dir = output_dir.with_name(f"{output_dir.name}.{os.getpid()}.tmp")
+    shutil.rmtree(temp_dir, ignore_errors=True)
+    for table_name in ('facts', 'concepts', 'frames'):
+        (temp_dir / table_name).mkdir(parents=True)
+
+    writer = BucketedWriter(temp_dir)
+    entities: Dict[str, list] = {name: [] for name in ENTITIES_SCHEMA.names}
+    errors = 0
+    try:
+        # Files are named by zero-padded cik, so sorted names keep each bucket sorted by cik
+        companies = _read_company_files(source, names)
+        for name, content in tqdm(companies, total=len(names), desc="Processing company facts", disable=not show_progress):
+            try:
+                data = orjson.loads(content)
+                facts, concepts = _company_columns(data)
+                if facts is None:
+                    continue
+                # Built before anything is written, so a company with a value the schema
+                # cannot hold is counted as an error rather than failing the whole build
+                facts_batch = _record_batch(facts, FACTS_SCHEMA)
+                concepts_batch = pa.RecordBatch.from_pydict(concepts, schema=CONCEPTS_SCHEMA)
+            except Exception as e:
+                errors += 1
+                log.debug(f"Error processing {name}: {e}")
+                continue
+            _write_company(writer, buckets, facts_batch, concepts_batch)
+            entities['cik'].append(facts['cik'][0])
+            entities['entity_name'].append(data.get('entityName'))
+            entities['fact_count'].append(facts_batch.num_rows)
+        writer.close()
+        _sort_frames(temp_dir)
+    except BaseException:
+        writer.close()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        raise
+
+    pq.write_table(pa.Table.from_pydict(entities, schema=ENTITIES_SCHEMA), temp_dir / 'entities.parquet')
+    with (temp_dir / 'dataset.json').open('w') as f:
+        json.dump({
+            'format': FACTS_DATASET_FORMAT,
+            'buckets': buckets,
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'source': str(source),
+            'companies': len(entities['cik']),
+            'facts': sum(entities['fact_count']),
+        }, f, indent=2)
+
+    replace_directory(temp_dir, output_dir)
+
+    log.info(f"Processed {len(names):,} files:")
+    log.info(f"  - Companies: {len(entities['cik']):,}")
+    log.info(f"  - Facts: {sum(entities['fact_count']):,}")
+    if errors > 0:
+        log.warning(f"  - Errors: {errors:,}")
+    return output_dir
+
+
+def load_company_facts_from_dataset(cik: int, dataset_dir: Optional[Union[str, Path]] = None) -> Dict[str, Any]:
+    """
+    Read a company's facts from the dataset in the shape of its companyfacts JSON.
+
+    Only the company's bucket is read, and of it only the row groups that can
+    hold the cik.
+
+    Args:
+        cik: The company CIK
+        dataset_dir: The dataset directory. Defaults to ~/.edgar/companyfacts_dataset
+
+    Returns:
+        dict with cik, entityName and facts, as the SEC companyfacts API returns.
+        Numbers are read back as int when they are whole.
+
+    Raises:
+        FileNotFoundError: If the dataset has not been built
+        CompanyFactsNotFoundError: If the dataset has no facts for the cik
+    """
+    dataset_dir, manifest = _open_dataset(dataset_dir)
+    cik = int(cik)
+    bucket = cik % manifest['buckets']
+
+    company_filter = (pc.field('bucket') == bucket) & (pc.field('cik') == cik)
+    facts = bucketed_dataset(dataset_dir / 'facts', FACTS_SCHEMA).to_table(filter=company_filter)
+    if facts.num_rows == 0:
+        raise CompanyFactsNotFoundError(cik=cik)
+    concepts = bucketed_dataset(dataset_dir / 'concepts', CONCEPTS_SCHEMA).to_table(filter=company_filter)
+    entity = pq.read_table(dataset_dir / 'entities.parquet', filters=[('cik', '=', cik)])
+    entity_name = entity['entity_name'][0].as_py() if entity.num_rows else None
+
+    descriptions = {
+        (taxonomy, concept): (label, description)
+        for taxonomy, concept, label, description in zip(*(concepts[name].to_pylist()
+                                                            for name in ('taxonomy', 'concept', 'label', 'description')),
+                                                          strict=True)
+    }
+    columns = {name: facts[name] for name in FACTS_SCHEMA.names if name != 'cik'}
+    for name in _DATE_COLUMNS:
+        columns[name] = columns[name].cast(pa.string())
+    columns = {name: column.to_pylist() for name, column in columns.items()}
+
+    taxonomies: Dict[str, Dict[str, Any]] = {}
+    for (taxonomy, concept, unit, start, end, value, fy, fp, form, accn, filed, frame) in zip(
+            columns['taxonomy'], columns['concept'], columns['unit'], columns['period_start'],
+            columns['period_end'], columns['value'], columns['fy'], columns['fp'], columns['form'],
+            columns['accn'], columns['filed'], columns['frame'], strict=True):
+        concepts_data = taxonomies.setdefault(taxonomy, {})
+        concept_data = concepts_data.get(concept)
+        if concept_data is None:
+            label, description = descriptions.get((taxonomy, concept), (None, None))
+            concept_data = concepts_data[concept] = {'label': label, 'description': description, 'units': {}}
+        fact = {'end': end, 'val': int(value) if value.is_integer() else value,
+                'accn': accn, 'fy': fy, 'fp': fp, 'form': form, 'filed': filed}
+        if start is not None:
+            fact['start'] = start
+        if frame is not None:
+            fact['frame'] = frame
+        concept_data['units'].setdefault(unit, []).append(fact)
+
+    return {'cik': cik, 'entityName': entity_name, 'facts': taxonomies}
+
+
+def get_company_facts_from_dataset(cik: int, dataset_dir: Optional[Union[str, Path]] = None) -> Optional['EntityFacts']:
+    """
+    Build EntityFacts for a company from the dataset instead of its companyfacts JSON.
+
+    Args:
+        cik: The company CIK
+        dataset_dir: The dataset directory. Defaults to ~/.edgar/companyfacts_dataset
+
+    Returns:
+        EntityFacts, or None if the facts could not be parsed
+
+    Raises:
+        FileNotFoundError: If the dataset has not been built
+        CompanyFactsNotFoundError: If the dataset has no facts for the cik
+    """
+    from edgar.entity.parser import EntityFactsParser
+    return EntityFactsParser.parse_company_facts(load_company_facts_from_dataset(cik, dataset_dir))
+
+
+def facts_frame(
+    concept: str,
+    period: str,
+    unit: str = 'USD',
+    taxonomy: str = 'us-gaap',
+    dataset_dir: Optional[Union[str, Path]] = None
+) -> 'pd.DataFrame':
+    """
+    One value of a concept per company for a period, across all companies.
+
+    This is the SEC frames API answered from the local dataset: each company's
+    fact for a frame is the latest filed value for that calendar period.
+
+    Args:
+        concept: Concept name without taxonomy prefix, e.g. 'Revenues'
+        period: SEC frame, e.g. 'CY2023' (annual), 'CY2023Q2' (quarter) or
+                'CY2023Q4I' (instant, for balance sheet concepts)
+        unit: Unit of the values, e.g. 'USD', 'shares', 'USD/shares'
+        taxonomy: Taxonomy of the concept, e.g. 'us-gaap', 'dei', 'ifrs-full'
+        dataset_dir: The dataset directory. Defaults to ~/.edgar/companyfacts_dataset
+
+    Returns:
+        DataFrame with cik, entity_name, value, period_start, period_end, fy, fp,
+        form, accn and filed, sorted by cik
+
+    Example:
+        >>> assets = facts_frame('Assets', 'CY2023Q4I')
+        >>> assets.nlargest(10, 'value')
+    """
+    dataset_dir, manifest = _open_dataset(dataset_dir)
+    frame_filter = ((pc.field('bucket') == _concept_bucket(concept, manifest['buckets'])) &
+                    (pc.field('taxonomy') == taxonomy) & (pc.field('concept') == concept) &
+                    (pc.field('unit') == unit) & (pc.field('frame') == period))
+    columns = ['cik', 'value', 'period_start', 'period_end', 'fy', 'fp', 'form', 'accn', 'filed']
+    facts = bucketed_dataset(dataset_dir / 'frames', FACTS_SCHEMA).to_table(columns=columns, filter=frame_filter)
+    entities = pq.read_table(dataset_dir / 'entities.parquet', columns=['cik', 'entity_name'])
+    frame = facts.join(entities, 'cik', join_type='left outer').sort_by('cik')
+    return frame.select(['cik', 'entity_name'] + columns[1:]).to_pandas()
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+def _company_files(source: Path) -> List[str]:
+    """The company file names in a companyfacts directory or zip, in cik order."""
+    if source.is_file() and zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as archive:
+            return sorted(name for name in archive.namelist() if _is_company_file(Path(name).name))
+    return sorted(path.name for path in source.iterdir() if _is_company_file(path.name))
+
+
+def _read_company_files(source: Path, names: List[str]) -> Iterator[Tuple[str, bytes]]:
+    """The name and JSON bytes of each company file, reading the zip through one handle."""
+    if source.is_file():
+        with zipfile.ZipFile(source) as archive:
+            for name in names:
+                yield name, archive.read(name)
+        return
+    for name in names:
+        path = source / name
+        if name.endswith('.gz'):
+            with gzip.open(path, 'rb') as f:
+                yield name, f.read()
+        else:
+            yield name, path.read_bytes()
+
+
+def _is_company_file(name: str) -> bool:
+    return name.startswith('CIK') and (name.endswith('.json') or name.endswith('.json.gz'))
+
+
+def _company_columns(data: dict) -> Tuple[Optional[Dict[str, list]], Optional[Dict[str, list]]]:
+    """
+    The facts and concepts of one company as columns.
+
+    Returns (None, None) when the company has no facts. Facts without a numeric
+    value are left out; EntityFactsParser skips them too.
+    """
+    cik = int(data.get('cik', 0))
+    facts: Dict[str, list] = {name: [] for name in FACTS_SCHEMA.names}
+    concepts: Dict[str, list] = {name: [] for name in CONCEPTS_SCHEMA.names}
+    for taxonomy, taxonomy_facts in (data.get('facts') or {}).items():
+        for concept, concept_data in taxonomy_facts.items():
+            concepts['taxonomy'].append(taxonomy)
+            concepts['concept'].append(concept)
+            concepts['label'].append(concept_data.get('label'))
+            concepts['description'].append(concept_data.get('description'))
+            for unit, unit_facts in (concept_data.get('units') or {}).items():
+                for fact in unit_facts:
+                    value = fact.get('val')
+                    if not isinstance(value, (int, float)) or isinstance(value, bool):
+                        continue
+                    facts['taxonomy'].append(taxonomy)
+                    facts['concept'].append(concept)
+                    facts['unit'].append(unit)
+                    facts['period_start'].append(fact.get('start'))
+                    facts['period_end'].append(fact.get('end'))
+                    facts['value'].append(value)
+                    facts['fy'].append(fact.get('fy'))
+                    facts['fp'].append(fact.get('fp'))
+                    facts['form'].append(fact.get('form'))
+                    facts['accn'].append(fact.get('accn'))
+                    facts['filed'].append(fact.get('filed'))
+                    facts['frame'].append(fact.get('frame'))
+    if not facts['taxonomy']:
+        return None, None
+    facts['cik'] = [cik] * len(facts['taxonomy'])
+    concepts['cik'] = [cik] * len(concepts['taxonomy'])
+    return facts, concepts
+
+
+def _write_company(writer: BucketedWriter, buckets: int, batch: pa.RecordBatch, concepts: pa.RecordBatch):
+    """Append a company's facts and concepts to its cik bucket, and its framed facts to their concept buckets."""
+    bucket = batch['cik'][0].as_py() % buckets
+    writer.append('facts', bucket, batch)
+    writer.append('concepts', bucket, concepts)
+
+    framed = batch.filter(pc.is_valid(batch['frame']))
+    if framed.num_rows:
+        concept_buckets = pa.array([_concept_bucket(concept, buckets)
+                                    for concept in framed['concept'].to_pylist()], type=pa.int32())
+        for concept_bucket in pc.unique(concept_buckets).to_pylist():
+            writer.append('frames', concept_bucket, framed.filter(pc.equal(concept_buckets, concept_bucket)))
+
+
+def _sort_frames(directory: Path):
+    """
+    Sort each frames file by concept, unit and frame, so that a frame query
+    reads only the row groups that can hold its concept.
+    """
+    sort_keys = [(name, 'ascending') for name in ('taxonomy', 'concept', 'unit', 'frame', 'cik')]
+    for path in sorted((directory / 'frames').glob('bucket=*/part-0.parquet')):
+        table = pq.read_table(path).sort_by(sort_keys)
+        pq.write_table(table, path, compression='zstd', row_group_size=ROW_GROUP_SIZE)
+
+
+def _record_batch(facts: Dict[str, list], schema: pa.Schema) -> pa.RecordBatch:
+    """Facts columns as a record batch, with the ISO date strings parsed to dates."""
+    arrays = []
+    for field in schema:
+        if field.name in _DATE_COLUMNS:
+            arrays.append(pa.array(facts[field.name], type=pa.string()).cast(pa.date32()))
+        else:
+            arrays.append(pa.array(facts[field.name], type=field.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def _concept_bucket(concept: str, buckets: int) -> int:
+    """The frames bucket of a concept. crc32 rather than hash(), which changes between processes."""
+    return zlib.crc32(concept.encode('utf-8')) % buckets
+
+
+def _open_dataset(dataset_dir: Optional[Union[str, Path]]) -> Tuple[Path, dict]:
+    """The dataset directory and its manifest. A dataset of an older format counts as not built."""
+    dataset_dir = Path(dataset_dir) if dataset_dir else get_company_facts_dataset_directory()
+    try:
+        manifest = json.loads((dataset_dir / 'dataset.json').read_text())
+    except (OSError, ValueError):
+        manifest = None
+    if manifest is None or manifest.get('format') != FACTS_DATASET_FORMAT:
+        raise FileNotFoundError(
+            f"Company facts dataset not found: {dataset_dir}\n\n"
+            "Please build it first:\n"
+            "  from edgar.reference import build_company_facts_dataset\n"
+            "  build_company_facts_dataset()\n"
+        )
+    return dataset_dir, manifest
@@ -0,0 +1,525 @@
+"""
+Submissions Dataset for EdgarTools
+
+Converts the SEC submissions bulk data (a CIK##########.json file per entity,
+plus CIK##########-submissions-NNN.json pages of older filings for busy filers)
+into two Parquet tables:
+
+    entities/bucket=NN/part-0.parquet  One row per entity: name, sic, tickers, ... and
+                                       the rest of its submissions JSON
+    filings/bucket=NN/part-0.parquet   One row per filing, every page merged, with the
+                                       columns of EntityFilings
+    dataset.json                       Format version, and the filing date the
+                                       dataset is up to date through
+
+Entities and filings are bucketed and sorted by cik, so an entity's filings
+are a slice of one file. With local storage on, Company(cik) reads its filings
+from here when the dataset is built, instead of merging JSON pages.
+
+refresh_submissions_dataset() keeps the dataset current: it reads the SEC daily
+indexes published since the dataset was last brought up to date, downloads the
+submissions of the entities that filed, and rewrites only their buckets.
+
+Example:
+    >>> from edgar.storage import download_submissions
+    >>> from edgar.reference import build_submissions_dataset, read_submissions_filings
+    >>> download_submissions()
+    >>> build_submissions_dataset()
+    >>>
+    >>> # Every 10-K filed in 2023, without opening a JSON file
+    >>> tenks = read_submissions_filings(forms=['10-K'], filing_date='2023-01-01:2023-12-31')
+"""
+
+import json
+import os
+import shutil
+import zipfile
+from datetime import date, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+import httpx
+import orjson
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from tqdm import tqdm
+
+from edgar.core import log
+from edgar.exceptions import TransportError, http_status
+from edgar.reference._bucketed import BucketedWriter, bucket_path, bucketed_dataset, replace_directory, write_bucket
+from edgar.reference.company_dataset import _list_submission_files
+from edgar.settings import get_edgar_data_directory
+
+if TYPE_CHECKING:
+    from edgar.entity.data import EntityData
+
+__all__ = [
+    'build_submissions_dataset',
+    'update_submissions_dataset',
+    'refresh_submissions_dataset',
+    'read_submissions_entities',
+    'read_submissions_filings',
+    'FILINGS_SCHEMA',
+    'ENTITIES_SCHEMA',
+]
+
+# Bump when the layout or schema of the dataset changes
+SUBMISSIONS_DATASET_FORMAT = 1
+
+DEFAULT_BUCKETS = 16
+
+# The columns of EntityFilings (see edgar.entity.data.extract_company_filings_table), after cik
+FILINGS_SCHEMA = pa.schema([
+    ('cik', pa.int32()),
+    ('accession_number', pa.string()),
+    ('filing_date', pa.date32()),
+    ('reportDate', pa.string()),
+    ('acceptanceDateTime', pa.timestamp('us', tz='UTC')),
+    ('act', pa.string()),
+    ('form', pa.string()),
+    ('fileNumber', pa.string()),
+    ('items', pa.string()),
+    ('size', pa.int64()),
+    ('isXBRL', pa.int64()),
+    ('isInlineXBRL', pa.int64()),
+    ('primaryDocument', pa.string()),
+    ('primaryDocDescription', pa.string()),
+])
+
+ENTITIES_SCHEMA = pa.schema([
+    ('cik', pa.int32()),
+    ('name', pa.string()),
+    ('entity_type', pa.string()),
+    ('sic', pa.string()),
+    ('sic_description', pa.string()),
+    ('tickers', pa.list_(pa.string())),
+    ('exchanges', pa.list_(pa.string())),
+    ('state_of_incorporation', pa.string()),
+    ('fiscal_year_end', pa.string()),
+    ('filing_count', pa.int64()),
+    ('latest_filing_date', pa.date32()),
+    ('submissions', pa.string()),  # The submissions JSON without its filings
+])
+
+
+def get_submissions_dataset_directory() -> Path:
+    """Where build_submissions_dataset() writes by default."""
+    return get_edgar_data_directory() / 'submissions_dataset'
+
+
+def build_submissions_dataset(
+    source: Optional[Union[str, Path]] = None,
+    output_dir: Optional[Union[str, Path]] = None,
+    buckets: int = DEFAULT_BUCKETS,
+    show_progress: bool = True
+) -> Path:
+    """
+    Build the submissions Parquet dataset from the submissions bulk data.
+
+    The dataset is written next to the final location and moved into place when
+    complete, so an existing dataset stays readable until the new one replaces it.
+
+    Args:
+        source: The submissions directory that download_submissions() fills, or
+                submissions.zip. Defaults to the submissions directory.
+        output_dir: Where to write the dataset. Defaults to
+                    ~/.edgar/submissions_dataset
+        buckets: Number of files the entities and filings are spread over, by cik
+        show_progress: Show progress bar (default: True)
+
+    Returns:
+        Path to the dataset directory
+
+    Raises:
+        FileNotFoundError: If the source has no submissions files
+    """
+    source = Path(source) if source else get_edgar_data_directory() / 'submissions'
+    output_dir = Path(output_dir) if output_dir else get_submissions_dataset_directory()
+    names = _list_submission_files(source)
+    log.info(f"Building submissions dataset from {len(names):,} entities")
+
+    output_dir.parent.mkdir(parents=True, exist_ok=True)
+    temp_dir = output_dir.with_name(f"{output_dir.name}.{os.getpid()}.tmp")
+    shutil.rmtree(temp_dir, ignore_errors=True)
+    for table_name in ('entities', 'filings'):
+        (temp_dir / table_name).mkdir(parents=True)
+
+    writer = BucketedWriter(temp_dir)
+    entities = filings = errors = 0
+    through: Optional[date] = None
+    try:
+        with _SubmissionsReader(source) as read:
+            # Files are named by zero-padded cik, so sorted names keep each bucket sorted by cik
+            for name in tqdm(names, desc="Processing submissions", disable=not show_progress):
+                try:
+                    submissions = orjson.loads(read(name))
+                    pages = [orjson.loads(read(page['name']))
+                             for page in submissions.get('filings', {}).get('files', [])
+                             if read.exists(page['name'])]
+                    entity, filing_table = _entity_rows(submissions, pages)
+                except Exception as e:
+                    errors += 1
+                    log.debug(f"Error processing {name}: {e}")
+                    continue
+                bucket = entity['cik'] % buckets
+                writer.append('entities', bucket, pa.RecordBatch.from_pylist([entity], schema=ENTITIES_SCHEMA))
+                if filing_table.num_rows:
+                    for batch in filing_table.to_batches():
+                        writer.append('filings', bucket, batch)
+                entities += 1
+                filings += filing_table.num_rows
+                if entity['latest_filing_date'] and (through is None or entity['latest_filing_date'] > through):
+                    through = entity['latest_filing_date']
+        writer.close()
+    except BaseException:
+        writer.close()
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        raise
+
+    _save_manifest(temp_dir, {
+        'format': SUBMISSIONS_DATASET_FORMAT,
+        'buckets': buckets,
+        'source': str(source),
+        'entities': entities,
+        'filings': filings,
+        'through': through.isoformat() if through else None,
+    })
+    replace_directory(temp_dir, output_dir)
+
+    log.info(f"Processed {len(names):,} files:")
+    log.info(f"  - Entities: {entities:,}")
+    log.info(f"  - Filings: {filings:,}")
+    if errors > 0:
+        log.warning(f"  - Errors: {errors:,}")
+    return output_dir
+
+
+def update_submissions_dataset(submissions: Iterable[Dict[str, Any]],
+                               dataset_dir: Optional[Union[str, Path]] = None) -> int:
+    """
+    Bring entities in the dataset up to date from their current submissions JSON.
+
+    Each entity's row is replaced, and the filings in its JSON replace the ones
+    with the same accession number. Filings the JSON does not list are kept:
+    the submissions API lists the most recent filings, and older ones stay in
+    the dataset from the bulk data. Only the buckets of the entities given are
+    rewritten.
+
+    Args:
+        submissions: Submissions JSON as the SEC submissions API returns it, one
+                     per entity. Pages of older filings are not read.
+        dataset_dir: The dataset directory. Defaults to ~/.edgar/submissions_dataset
+
+    Returns:
+        The number of entities updated
+    """
+    dataset_dir, manifest = _open_dataset(dataset_dir)
+    buckets = manifest['buckets']
+
+    by_bucket: Dict[int, Dict[int, Tuple[Dict[str, Any], pa.Table]]] = {}
+    for entity_submissions in submissions:
+        if not entity_submissions:
+            continue
+        entity, filing_table = _entity_rows(entity_submissions, [])
+        by_bucket.setdefault(entity['cik'] % buckets, {})[entity['cik']] = (entity, filing_table)
+
+    for bucket, updates in by_bucket.items():
+        ciks = pa.array(list(updates), type=pa.int32())
+        old_entities = _read_bucket(dataset_dir, 'entities', bucket, ENTITIES_SCHEMA)
+        old_filings = _read_bucket(dataset_dir, 'filings', bucket, FILINGS_SCHEMA)
+
+        filing_tables = [old_filings.filter(pc.invert(pc.is_in(old_filings['cik'], ciks)))]
+        entity_rows = []
+        for cik, (entity, filing_table) in updates.items():
+            older = old_filings.filter(pc.equal(old_filings['cik'], cik))
+            older = older.filter(pc.invert(pc.is_in(older['accession_number'], filing_table['accession_number'])))
+            merged = pa.concat_tables([filing_table, older])
+            entity['filing_count'] = merged.num_rows
+            if merged.num_rows:
+                entity['latest_filing_date'] = pc.max(merged['filing_date']).as_py()
+            entity_rows.append(entity)
+            filing_tables.append(merged)
+
+        entities_table = pa.concat_tables([
+            old_entities.filter(pc.invert(pc.is_in(old_entities['cik'], ciks))),
+            pa.Table.from_pylist(entity_rows, schema=ENTITIES_SCHEMA),
+        ])
+        # The sort is stable, so each entity's filings keep their newest-first order
+        write_bucket(dataset_dir, 'filings', bucket, pa.concat_tables(filing_tables).sort_by('cik'))
+        write_bucket(dataset_dir, 'entities', bucket, entities_table.sort_by('cik'))
+
+    updated = sum(len(updates) for updates in by_bucket.values())
+    if updated:
+        manifest['entities'] = sum(pq.read_metadata(path).num_rows
+                                   for path in (dataset_dir / 'entities').glob('bucket=*/part-0.parquet'))
+        manifest['filings'] = sum(pq.read_metadata(path).num_rows
+                                  for path in (dataset_dir / 'filings').glob('bucket=*/part-0.parquet'))
+        _save_manifest(dataset_dir, manifest)
+    return updated
+
+
+def refresh_submissions_dataset(dataset_dir: Optional[Union[str, Path]] = None,
+                                show_progress: bool = True) -> int:
+    """
+    Bring the dataset up to date with the filings published since it was built
+    or last refreshed.
+
+    The SEC daily form indexes since the dataset's 'through' date give the
+    entities that filed. Their submissions are downloaded and merged in with
+    update_submissions_dataset().
+
+    Args:
+        dataset_dir: The dataset directory. Defaults to ~/.edgar/submissions_dataset
+        show_progress: Show progress bar (default: True)
+
+    Returns:
+        The number of entities updated
+    """
+    from edgar._filings import fetch_daily_filing_index
+    from edgar.entity.submissions import download_entity_submissions_from_sec
+
+    dataset_dir, manifest = _open_dataset(dataset_dir)
+    today = date.today()
+    through = date.fromisoformat(manifest['through']) if manifest.get('through') else today - timedelta(days=1)
+
+    ciks = set()
+    day = through + timedelta(days=1)
+    while day <= today:
+        if day.weekday() < 5:
+            try:
+                daily_index = fetch_daily_filing_index(day.isoformat(), index='form')
+            except (httpx.HTTPStatusError, TransportError) as e:
+                # Holidays have no index, and today's is not published until the evening
+                if http_status(e) not in (403, 404):
+                    raise
+                daily_index = None
+            if daily_index is not None and daily_index.num_rows:
+                ciks.update(pc.unique(daily_index['cik']).to_pylist())
+                through = day
+        day += timedelta(days=1)
+
+    submissions = (download_entity_submissions_from_sec(cik)
+                   for cik in tqdm(sorted(ciks), desc="Refreshing submissions", disable=not show_progress))
+    updated = update_submissions_dataset(submissions, dataset_dir)
+
+    manifest = _load_manifest(dataset_dir)
+    manifest['through'] = through.isoformat()
+    _save_manifest(dataset_dir, manifest)
+    log.info(f"Refreshed {updated:,} entities in the submissions dataset through {through}")
+    return updated
+
+
+def read_submissions_entities(ciks: Optional[Iterable[int]] = None,
+                              dataset_dir: Optional[Union[str, Path]] = None) -> pa.Table:
+    """
+    Read entities from the dataset.
+
+    Args:
+        ciks: Only read these entities. Defaults to all of them.
+        dataset_dir: The dataset directory. Defaults to ~/.edgar/submissions_dataset
+
+    Returns:
+        The entities, without the submissions JSON column
+    """
+    dataset_dir, manifest = _open_dataset(dataset_dir)
+    columns = [name for name in ENTITIES_SCHEMA.names if name != 'submissions']
+    return bucketed_dataset(dataset_dir / 'entities', ENTITIES_SCHEMA).to_table(
+        columns=columns, filter=_cik_filter(ciks, manifest['buckets']))
+
+
+def read_submissions_filings(ciks: Optional[Iterable[int]] = None,
+                             forms: Optional[Iterable[str]] = None,
+                             filing_date: Optional[Union[str, Tuple[Optional[str], Optional[str]]]] = None,
+                             dataset_dir: Optional[Union[str, Path]] = None) -> pa.Table:
+    """
+    Read filings across entities from the dataset.
+
+    The cik, form and filing date filters are applied inside the Parquet scan,
+    and a cik filter opens only the buckets of those ciks.
+
+    Args:
+        ciks: Only read filings by these entities
+        forms: Only read filings of these exact form names
+        filing_date: A filing date or range, e.g. "2023-01-01:2023-12-31"
+        dataset_dir: The dataset directory. Defaults to ~/.edgar/submissions_dataset
+
+    Returns:
+        The filings with a cik column, sorted by cik and, for each entity, newest first
+    """
+    from edgar.dates import extract_dates
+
+    dataset_dir, manifest = _open_dataset(dataset_dir)
+    condition = _cik_filter(ciks, manifest['buckets'])
+    if forms:
+        form_condition = pc.field('form').isin(list(forms))
+        condition = form_condition if condition is None else condition & form_condition
+    if filing_date:
+        start_date, end_date, is_range = extract_dates(filing_date)
+        if is_range:
+            date_conditions = []
+            if start_date:
+                date_conditions.append(pc.field('filing_date') >= pc.scalar(start_date.date()))
+            if end_date:
+                date_conditions.append(pc.field('filing_date') <= pc.scalar(end_date.date()))
+        else:
+            date_conditions = [pc.field('filing_date') == pc.scalar(start_date.date())]
+        for date_condition in date_conditions:
+            condition = date_condition if condition is None else condition & date_condition
+    return bucketed_dataset(dataset_dir / 'filings', FILINGS_SCHEMA).to_table(
+        columns=FILINGS_SCHEMA.names, filter=condition)
+
+
+def load_entity_data_from_dataset(cik: int,
+                                  dataset_dir: Optional[Union[str, Path]] = None,
+                                  source: Optional[Path] = None) -> Optional['EntityData']:
+    """
+    Build an entity's data, with all its filings, from the dataset.
+
+    Args:
+        cik: The entity CIK
+        dataset_dir: The dataset directory. Defaults to ~/.edgar/submissions_dataset
+        source: The entity's submissions JSON. If it was written after the dataset
+                was last built or updated, the dataset is stale for this entity
+                and None is returned, so the JSON is read instead.
+
+    Returns:
+        The EntityData, or None if there is no dataset, the entity is not in it,
+        or its source JSON is newer
+    """
+    try:
+        dataset_dir, manifest = _open_dataset(dataset_dir)
+    except FileNotFoundError:
+        return None
+    if source is not None and _is_newer(source, dataset_dir / 'dataset.json'):
+        return None
+    from edgar.entity.data import parse_entity_submissions
+
+    cik = int(cik)
+    entity_filter = (pc.field('bucket') == cik % manifest['buckets']) & (pc.field('cik') == cik)
+    entity = bucketed_dataset(dataset_dir / 'entities', ENTITIES_SCHEMA).to_table(
+        columns=['submissions'], filter=entity_filter)
+    if entity.num_rows == 0:
+        return None
+    filing_table = bucketed_dataset(dataset_dir / 'filings', FILINGS_SCHEMA).to_table(
+        columns=FILINGS_SCHEMA.names[1:], filter=entity_filter)
+
+    submissions = json.loads(entity['submissions'][0].as_py())
+    submissions['filings'] = {'recent': {}, 'files': []}
+    return parse_entity_submissions(submissions, filing_table=filing_table)
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+class _SubmissionsReader:
+    """Reads submissions files by name from a directory or zip, keeping the zip open."""
+
+    def __init__(self, source: Path):
+        self.source = source
+        self._archive: Optional[zipfile.ZipFile] = None
+        self._names: Optional[set] = None
+        self.exists: Callable[[str], bool]
+
+    def __enter__(self) -> '_SubmissionsReader':
+        if self.source.is_file():
+            self._archive = zipfile.ZipFile(self.source)
+            self._names = set(self._archive.namelist())
+            self.exists = self._names.__contains__
+        else:
+            self.exists = lambda name: (self.source / name).exists()
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._archive is not None:
+            self._archive.close()
+
+    def __call__(self, name: str) -> bytes:
+        if self._archive is not None:
+            return self._archive.read(name)
+        return (self.source / name).read_bytes()
+
+
+def _entity_rows(submissions: Dict[str, Any], pages: List[Dict[str, Any]]) -> Tuple[Dict[str, Any], pa.Table]:
+    """An entity's row and its filings, from its submissions JSON and pages of older filings."""
+    from edgar.entity.data import extract_company_filings_table
+
+    cik = int(submissions['cik'])
+    filings = submissions.get('filings') or {}
+    tables = [extract_company_filings_table(filings.get('recent') or {})]
+    tables.extend(extract_company_filings_table(page) for page in pages)
+    tables = [table for table in tables if table.num_rows]
+    if tables:
+        filing_table = pa.concat_tables(tables)
+        filing_table = filing_table.add_column(0, 'cik', pa.array([cik] * filing_table.num_rows, type=pa.int32()))
+        filing_table = filing_table.cast(FILINGS_SCHEMA)
+    else:
+        filing_table = FILINGS_SCHEMA.empty_table()
+
+    entity_json = {key: value for key, value in submissions.items() if key != 'filings'}
+    entity = {
+        'cik': cik,
+        'name': submissions.get('name'),
+        'entity_type': submissions.get('entityType'),
+        'sic': submissions.get('sic'),
+        'sic_description': submissions.get('sicDescription'),
+        'tickers': [ticker for ticker in submissions.get('tickers') or [] if ticker],
+        'exchanges': [exchange for exchange in submissions.get('exchanges') or [] if exchange],
+        'state_of_incorporation': submissions.get('stateOfIncorporation'),
+        'fiscal_year_end': submissions.get('fiscalYearEnd'),
+        'filing_count': filing_table.num_rows,
+        'latest_filing_date': pc.max(filing_table['filing_date']).as_py() if filing_table.num_rows else None,
+        'submissions': orjson.dumps(entity_json).decode('utf-8'),
+    }
+    return entity, filing_table
+
+
+def _read_bucket(dataset_dir: Path, table_name: str, bucket: int, schema: pa.Schema) -> pa.Table:
+    path = bucket_path(dataset_dir, table_name, bucket)
+    if not path.exists():
+        return schema.empty_table()
+    return pq.read_table(path, schema=schema)
+
+
+def _cik_filter(ciks: Optional[Iterable[int]], buckets: int):
+    if ciks is None:
+        return None
+    ciks = sorted({int(cik) for cik in ciks})
+    return (pc.field('bucket').isin(sorted({cik % buckets for cik in ciks})) &
+            pc.field('cik').isin(pa.array(ciks, type=pa.int32())))
+
+
+def _is_newer(path: Path, than: Path) -> bool:
+    """True if path exists and was modified after than. The manifest is rewritten on every build and update."""
+    try:
+        return path.stat().st_mtime > than.stat().st_mtime
+    except OSError:
+        return False
+
+
+def _load_manifest(dataset_dir: Path) -> Optional[dict]:
+    try:
+        return json.loads((dataset_dir / 'dataset.json').read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def _save_manifest(dataset_dir: Path, manifest: dict):
+    temp_path = dataset_dir / f"dataset.json.{os.getpid()}.tmp"
+    temp_path.write_text(json.dumps(manifest, indent=2))
+    os.replace(temp_path, dataset_dir / 'dataset.json')
+
+
+def _open_dataset(dataset_dir: Optional[Union[str, Path]]) -> Tuple[Path, dict]:
+    """The dataset directory and its manifest. A dataset of an older format counts as not built."""
+    dataset_dir = Path(dataset_dir) if dataset_dir else get_submissions_dataset_directory()
+    manifest = _load_manifest(dataset_dir)
+    if manifest is None or manifest.get('format') != SUBMISSIONS_DATASET_FORMAT:
+        raise FileNotFoundError(
+            f"Submissions dataset not found: {dataset_dir}\n\n"
+            "Please build it first:\n"
+            "  from edgar.reference import build_submissions_dataset\n"
+            "  build_submissions_dataset()\n"
+        )
+    return dataset_dir, manifest
@@ -1,4 +1,5 @@
 import logging
+import mmap
 import zipfile
 from collections import defaultdict
 from functools import cached_property
@@ -8,12 +9,13 @@ from typing import TYPE_CHECKING, DefaultDict, Dict, Iterator, List, Optional, T
 if TYPE_CHECKING:
     from edgar._filings import Filing
     from edgar.filesystem import EdgarPath
+    from edgar.storage._seekable import SeekableGzip
 
 from edgar.attachments import Attachment, Attachments, get_document_type
 from edgar.httprequests import stream_with_retry
 from edgar.sgml.filing_summary import FilingSummary
 from edgar.sgml.sgml_header import FilingHeader
-from edgar.sgml.sgml_parser import SGMLDocument, SGMLFormatType, SGMLParser, parse_document
+from edgar.sgml.sgml_parser import SGMLDocument, SGMLFormatType, SGMLParser, SubmissionContent, _decode, parse_document
 from edgar.sgml.text_extraction import decode_document_content, primary_document_text
 from edgar.sgml.tools import is_xml
 
@@ -122,6 +124,51 @@ def read_content_as_string(source: Union[str, Path], bypass_cache: bool = False)
     return ''.join(lines)
 
 
+def read_content_as_bytes(source: Union[str, Path, 'EdgarPath'], bypass_cache: bool = False) -> Union[bytes, mmap.mmap]:
+    """
+    Read content from a URL, file path, or EdgarPath as undecoded bytes.
+
+    A local uncompressed file is memory-mapped rather than read, so parsing it
+    touches only the pages that are scanned, and documents are read from the
+    file when their content is accessed. Gzip-compressed files are decompressed.
+
+    Args:
+        source: Either a URL string, a file path, or an EdgarPath (for cloud storage)
+        bypass_cache: If True, bypass the HTTP cache for URL sources. Defaults to False.
+
+    Returns:
+        The content as bytes, or as a read-only mmap for a local file
+
+    Raises:
+        TooManyRequestsError: If the server returns a 429 response
+        FileNotFoundError: If the file path doesn't exist
+        gzip.BadGzipFile: If the file is not a valid gzip file
+    """
+    from edgar.filesystem import EdgarPath
+
+    if isinstance(source, str) and (source.startswith('http://') or source.startswith('https://')):
+        for response in stream_with_retry(source, bypass_cache=bypass_cache):
+            return response.read()
+        return b''
+    elif isinstance(source, EdgarPath):
+        import gzip
+        with source.open('rb') as f:
+            data = f.read()
+        return gzip.decompress(data) if source.full_path.endswith('.gz') else data
+    else:
+        path = Path(source)
+        if str(path).endswith('.gz'):
+            import gzip
+            with gzip.open(path, 'rb') as file:
+                return file.read()
+        with path.open('rb') as file:
+            try:
+                return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # An empty file can't be mapped
+                return b''
+
+
 def iter_documents(source: Union[str, Path]) -> Iterator[SGMLDocument]:
     """
     Stream SGML documents from either a URL or file path, yielding parsed documents.
@@ -139,7 +186,7 @@ def iter_documents(source: Union[str, Path]) -> Iterator[SGMLDocument]:
     """
     from edgar.sgml.sgml_parser import iter_documents as _iter_docs
     try:
-        content = ''.join(read_content(source))
+        content = read_content_as_bytes(source)
         yield from _iter_docs(content)
     except (ValueError, ConnectionError, FileNotFoundError) as e:
         raise type(e)(f"Error processing source {source}: {str(e)}") from e
@@ -169,12 +216,13 @@ def parse_file(source: Union[str, Path]) -> list[SGMLDocument]:
     """
     return list(iter_documents(source))
 
-def parse_submission_text(content: str) -> Tuple[FilingHeader, DefaultDict[str, List[SGMLDocument]]]:
+def parse_submission_text(content: SubmissionContent) -> Tuple[FilingHeader, DefaultDict[str, List[SGMLDocument]]]:
     """
     Parses the raw submission text and returns the filing header along with
     a dictionary mapping document sequence numbers to lists of SGMLDocument objects.
     Args:
-        content (str): The raw text content of the submission.
+        content (str): The raw text content of the submission, or its bytes. Documents
+            parsed from bytes are decoded only when their content is read.
     Returns:
         Tuple[FilingHeader, DefaultDict[str, List[SGMLDocument]]]:
             A tuple where the first element is the FilingHeader object representing
@@ -194,18 +242,7 @@ def parse_submission_text(content: str) -> Tuple[FilingHeader, DefaultDict[str,
     # Create parser and get structure including header and documents
     parser = SGMLParser()
     parsed_data = parser.parse(content)
-
-    # Create FilingHeader using already parsed data
-    if parsed_data['format'] == SGMLFormatType.SUBMISSION:
-        # For submission format, we already have parsed filer data
-        header = FilingHeader.parse_submission_format_header(parsed_data=parsed_data)
-    else:
-        # For SEC-DOCUMENT format, pass the header text to the
-        # specialized header parser since we need additional processing
-        try:
-            header = FilingHeader.parse_from_sgml_text(parsed_data['header'])
-        except (KeyError, ValueError, IndexError, AttributeError):
-            header = FilingHeader.parse_from_sgml_text(parsed_data['header'], preprocess=True)
+    header = _create_filing_header(parsed_data)
 
     # Create document dictionary with lazy content references
     documents = defaultdict(list)
@@ -222,6 +259,48 @@ def parse_submission_text(content: str) -> Tuple[FilingHeader, DefaultDict[str,
             doc = SGMLDocument.from_parsed_data(doc_data)
         documents[doc.sequence].append(doc)
 
+    _check_document_count(header, documents)
+    return header, documents
+
+
+def parse_indexed_submission(submission: 'SeekableGzip') -> Tuple[FilingHeader, DefaultDict[str, List[SGMLDocument]]]:
+    """
+    Parse a submission stored as a seekable gzip file using its document index.
+
+    Only the header is decompressed. Each document refers to the compressed file
+    and decompresses just its own blocks when its content is read.
+    """
+    header_text = _decode(submission[:submission.header_end])
+    parsed_data = SGMLParser().parse_header(header_text, SGMLFormatType(submission.sgml_format))
+    header = _create_filing_header(parsed_data)
+
+    documents = defaultdict(list)
+    for doc_type, sequence, filename, description, start, end in submission.documents:
+        doc = SGMLDocument(type=doc_type, sequence=sequence, filename=filename, description=description,
+                           _content_ref=submission, _content_start=start, _content_end=end)
+        documents[doc.sequence].append(doc)
+
+    _check_document_count(header, documents)
+    return header, documents
+
+
+def _create_filing_header(parsed_data: dict) -> FilingHeader:
+    """Create the FilingHeader from the parser's output."""
+    if parsed_data['format'] == SGMLFormatType.SUBMISSION:
+        # For submission format, we already have parsed filer data
+        header = FilingHeader.parse_submission_format_header(parsed_data=parsed_data)
+    else:
+        # For SEC-DOCUMENT format, pass the header text to the
+        # specialized header parser since we need additional processing
+        try:
+            header = FilingHeader.parse_from_sgml_text(parsed_data['header'])
+        except (KeyError, ValueError, IndexError, AttributeError):
+            header = FilingHeader.parse_from_sgml_text(parsed_data['header'], preprocess=True)
+    return header
+
+
+def _check_document_count(header: FilingHeader, documents: DefaultDict[str, List[SGMLDocument]]):
+    """Warn when markedly fewer documents were parsed than the header declares."""
     # Cross-check the header's declared count against what was actually parsed
     # (edgartools-r5ye). Markedly fewer parsed than declared means documents
     # were lost — truncation inside a document raises in the parser, but a cut
@@ -240,7 +319,6 @@ def parse_submission_text(content: str) -> Tuple[FilingHeader, DefaultDict[str,
             "(accession %s). The submission may be truncated or malformed.",
             declared_count, parsed_count, header.accession_number,
         )
-    return header, documents
 
 
 
@@ -486,12 +564,23 @@ class FilingSGML:
             ValueError: If header section cannot be found
             IOError: If file cannot be read
         """
-        # Read content once
-        content = read_content_as_string(source)
+        is_url = isinstance(source, str) and source.startswith("http")
+
+        # A submission compressed with compress_filing(seekable=True) is read through
+        # its index, decompressing each document only when it is read
+        if not is_url and isinstance(source, (str, Path)) and str(source).endswith('.gz'):
+            from edgar.storage._seekable import SeekableGzip
+            submission = SeekableGzip.open(source)
+            if submission is not None and submission.documents is not None:
+                header, documents = parse_indexed_submission(submission)
+                return cls(header=header, documents=documents)
+
+        # Read content once, as bytes: only the header is decoded up front and each
+        # document's content is decoded, or uudecoded, when it is read
+        content = read_content_as_bytes(source)
 
         # If content is empty/truncated and source is a URL, the cache may have stored
         # a bad response from a transient SEC outage. Retry with a direct fetch.
-        is_url = isinstance(source, str) and source.startswith("http")
         if is_url and len(content.strip()) < 50:
             import logging
             logging.getLogger(__name__).info(
@@ -571,14 +660,18 @@ class FilingSGML:
     def from_filing(cls, filing: 'Filing') -> 'FilingSGML':
         """Create from a Filing object that provides text_url."""
         filing_sgml = cls.from_source(filing.text_url)
-        if not filing_sgml.accession_number:
-            filing_sgml.header.filing_metadata.update('ACCESSION NUMBER', filing.accession_no)
-        if not filing_sgml.header.filing_metadata.get("CIK"):
-            filing_sgml.header.filing_metadata.update('CIK', str(filing.cik).zfill(10))
-        if not filing_sgml.header.form:
-            filing_sgml.header.filing_metadata.update("CONFORMED SUBMISSION TYPE", filing.form)
+        filing_sgml._apply_filing_defaults(filing)
         return filing_sgml
 
+    def _apply_filing_defaults(self, filing: 'Filing'):
+        """Fill header fields the submission text left empty from the Filing it belongs to."""
+        if not self.accession_number:
+            self.header.filing_metadata.update('ACCESSION NUMBER', filing.accession_no)
+        if not self.header.filing_metadata.get("CIK"):
+            self.header.filing_metadata.update('CIK', str(filing.cik).zfill(10))
+        if not self.header.form:
+            self.header.filing_metadata.update("CONFORMED SUBMISSION TYPE", filing.form)
+
     def __str__(self) -> str:
         """String representation with basic filing info."""
         doc_count = len(self._documents_by_name)
@@ -1,10 +1,11 @@
 import logging
+import mmap
 import re
 import warnings
 from dataclasses import dataclass, field
 from enum import Enum
 from io import BytesIO
-from typing import Iterator, Optional
+from typing import Iterator, Optional, Union
 
 from edgar.core import has_html_content
 from edgar.sgml.tools import get_content_between_tags
@@ -26,6 +27,17 @@ _XML_RE = re.compile(r'<XML>([\s\S]*?)</XML>', re.DOTALL | re.IGNORECASE)
 _HTML_RE = re.compile(r'<HTML>([\s\S]*?)</HTML>', re.DOTALL | re.IGNORECASE)
 _XBRL_RE = re.compile(r'<XBRL>([\s\S]*?)</XBRL>', re.DOTALL | re.IGNORECASE)
 
+# The payload tags get_content_between_tags() looks for, most nested first, for
+# finding a payload in the bytes of a submission without decoding the document
+_PAYLOAD_RES = tuple(re.compile(rb'<%s>(.*?)</%s>' % (tag, tag), re.DOTALL)
+                     for tag in (b'PDF', b'XBRL', b'XML', b'TEXT'))
+# What str.strip() strips that can begin a uuencoded payload
+_ASCII_WHITESPACE = b' \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f'
+
+# Submission content: the text, or its undecoded bytes, possibly memory-mapped from a file.
+# Documents can also refer to any object that slices to bytes, like a SeekableGzip.
+SubmissionContent = Union[str, bytes, mmap.mmap]
+
 # Document metadata tags and their lengths
 _DOC_META_TAGS = (
     ('<TYPE>', 6),
@@ -54,6 +66,24 @@ class SGMLFormatType(Enum):
     SUBMISSION = "submission"  # <SUBMISSION>...<FILER> style
 
 
+def _decode(data: bytes) -> str:
+    """
+    Decode part of a submission the way reading it as text does: UTF-8 with
+    replacement characters and universal newlines.
+    """
+    text = data.decode('utf-8', errors='replace')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def _document_tags(content: SubmissionContent):
+    """The <DOCUMENT> open and close tags, as str or bytes to match the content."""
+    if isinstance(content, str):
+        return '<DOCUMENT>', '</DOCUMENT>'
+    return b'<DOCUMENT>', b'</DOCUMENT>'
+
+
 def _extract_tag_value(content: str, tag: str, tag_len: int, search_start: int, search_end: int) -> str:
     """Extract value after a tag using str.find(). Returns empty string if not found."""
     idx = content.find(tag, search_start, search_end)
@@ -66,9 +96,12 @@ def _extract_tag_value(content: str, tag: str, tag_len: int, search_start: int,
     return content[val_start:val_end].strip()
 
 
-def _extract_doc_metadata(content: str, start: int, end: int) -> dict:
+def _extract_doc_metadata(content: SubmissionContent, start: int, end: int) -> dict:
     """Extract TYPE, SEQUENCE, FILENAME, DESCRIPTION from first ~500 chars of a document."""
     search_end = min(start + 500, end)
+    if not isinstance(content, str):
+        content = _decode(content[start:search_end])
+        start, search_end = 0, len(content)
     return {
         'type': _extract_tag_value(content, '<TYPE>', 6, start, search_end),
         'sequence': _extract_tag_value(content, '<SEQUENCE>', 10, start, search_end),
@@ -83,13 +116,16 @@ class SGMLDocument:
     sequence: str
     filename: str
     description: str
-    # Lazy content: store reference + offsets instead of copying
-    _content_ref: str = field(default="", repr=False)
+    # Lazy content: store reference + offsets instead of copying. The reference is
+    # the submission text, or its bytes, in which case the offsets are byte offsets
+    # and the document is decoded only when its content is read.
+    _content_ref: SubmissionContent = field(default="", repr=False)
     _content_start: int = field(default=0, repr=False)
     _content_end: Optional[int] = field(default=None, repr=False)
 
     @classmethod
-    def from_content_ref(cls, metadata: dict, content_ref: str, start: int, end: int) -> 'SGMLDocument':
+    def from_content_ref(cls, metadata: dict, content_ref: SubmissionContent, start: int,
+                         end: int) -> 'SGMLDocument':
         """Create document with lazy content reference (zero-copy)."""
         return cls(
             type=metadata['type'],
@@ -118,9 +154,13 @@ class SGMLDocument:
     @property
     def raw_content(self) -> str:
         """Content materialized from reference on access."""
-        if self._content_end is None:
-            return self._content_ref
-        return self._content_ref[self._content_start:self._content_end]
+        content_ref = self._content_ref
+        if isinstance(content_ref, str):
+            if self._content_end is None:
+                return content_ref
+            return content_ref[self._content_start:self._content_end]
+        end = len(content_ref) if self._content_end is None else self._content_end
+        return _decode(content_ref[self._content_start:end])
 
     @raw_content.setter
     def raw_content(self, value: str):
@@ -131,16 +171,45 @@ class SGMLDocument:
 
     @property
     def content(self):
+        if not isinstance(self._content_ref, str):
+            return self._content_from_bytes()
         raw_content = get_content_between_tags(self.raw_content)
         if raw_content:
             if raw_content.startswith("begin"):
-                warnings.filterwarnings('ignore')
-                input_stream = BytesIO(raw_content.encode("utf-8"))
-                output_stream = BytesIO()
-                uu.decode(input_stream, output_stream, quiet=True)
-                return output_stream.getvalue()
+                return _uudecode(raw_content.encode("utf-8"))
             return raw_content
 
+    def _content_from_bytes(self):
+        """
+        The content of a document held as bytes, found without decoding the whole
+        document, so a uuencoded binary goes straight from the submission's bytes
+        to the decoded file.
+        """
+        content_ref, start = self._content_ref, self._content_start
+        end = len(content_ref) if self._content_end is None else self._content_end
+        if not isinstance(content_ref, (bytes, mmap.mmap)):
+            content_ref, start, end = content_ref[start:end], 0, end - start
+        for pattern in _PAYLOAD_RES:
+            match = pattern.search(content_ref, start, end)
+            if match:
+                payload = match.group(1)
+                if payload.lstrip(_ASCII_WHITESPACE).startswith(b"begin"):
+                    if b'\r' in payload:
+                        payload = payload.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+                    return _uudecode(payload)
+                return _decode(payload).strip() or None
+        return None
+
+    def __getstate__(self):
+        # A memory-mapped submission can't be pickled, so pickle the document's own bytes
+        state = self.__dict__.copy()
+        if isinstance(self._content_ref, mmap.mmap):
+            end = len(self._content_ref) if self._content_end is None else self._content_end
+            state['_content_ref'] = self._content_ref[self._content_start:end]
+            state['_content_start'] = 0
+            state['_content_end'] = None
+        return state
+
     def __str__(self):
         return f"Document(type={self.type}, sequence={self.sequence}, filename={self.filename}, description={self.description})"
 
@@ -178,6 +247,14 @@ class SGMLDocument:
             return 'xbrl'
         return 'text'
 
+def _uudecode(data: bytes) -> bytes:
+    """Decode a uuencoded payload."""
+    warnings.filterwarnings('ignore')
+    output_stream = BytesIO()
+    uu.decode(BytesIO(data), output_stream, quiet=True)
+    return output_stream.getvalue()
+
+
 def _raise_sec_html_error(content: str):
     """
     Analyze HTML/XML error content from SEC and raise appropriate specific exception.
@@ -317,26 +394,41 @@ class SGMLParser:
             f"Preview: {preview!r}"
         )
 
-    def parse(self, content: str) -> dict:
+    def parse(self, content: SubmissionContent) -> dict:
         """Main entry point for parsing.
 
         Returns a dict with keys: format, header, documents.
         For SUBMISSION format, also includes parsed header structure (FILER, etc.).
         Documents are dicts with: type, sequence, filename, description, content,
         plus _content_start and _content_end offsets into the original content string.
+
+        The content can also be the submission's bytes, or a memory-mapped file.
+        Then only the header is decoded, the documents are found by scanning the
+        bytes, and their offsets are byte offsets.
         """
         if len(content) > _MAX_CONTENT_SIZE:
             raise ValueError(
                 f"Content size ({len(content):,} bytes) exceeds maximum ({_MAX_CONTENT_SIZE:,} bytes). "
                 "This may indicate corrupted input."
             )
-        format_type = self.detect_format(content)
+        if isinstance(content, str):
+            format_type = self.detect_format(content)
+        else:
+            # The format shows in the header, up to and including the first <DOCUMENT>
+            first_doc = content.find(b'<DOCUMENT>')
+            format_type = self.detect_format(_decode(content[:first_doc + 10] if first_doc >= 0 else content[:]))
 
         if format_type == SGMLFormatType.SUBMISSION:
             return self._parse_submission_format(content)
         else:
             return self._parse_sec_document_format(content)
 
+    def parse_header(self, header: str, format_type: SGMLFormatType) -> dict:
+        """Parse a header already split from its documents, in a known format."""
+        if format_type == SGMLFormatType.SUBMISSION:
+            return self._parse_submission_format(header)
+        return self._parse_sec_document_format(header)
+
     def _parse_submission_format(self, content):
         parser = SubmissionFormatParser()
         return parser.parse(content)
@@ -469,20 +561,22 @@ class SubmissionFormatParser:
             else:
                 current_context[tag] = value
 
-    def parse(self, content: str) -> dict:
+    def parse(self, content: SubmissionContent) -> dict:
         """Parse SGML content in SUBMISSION format.
 
         Header is parsed line-by-line for structure.
         Documents are extracted using fast str.find() scanning.
         """
         # Find the first <DOCUMENT> to split header from documents
-        first_doc = content.find('<DOCUMENT>')
+        first_doc = content.find(_document_tags(content)[0])
 
         # Parse header section line-by-line (typically small, <2KB)
         if first_doc >= 0:
             header_text = content[:first_doc]
         else:
-            header_text = content
+            header_text = content[:]
+        if not isinstance(header_text, str):
+            header_text = _decode(header_text)
 
         self.data['header'] = header_text
         for line in header_text.splitlines():
@@ -510,46 +604,54 @@ class SecDocumentFormatParser:
             'filer': {}
         }
 
-    def parse(self, content: str) -> dict:
+    def parse(self, content: SubmissionContent) -> dict:
         """Parse SGML content in SEC-DOCUMENT format."""
+        first_doc = content.find(_document_tags(content)[0])
+
+        # The header comes before the documents, so only that much of a submission's
+        # bytes needs decoding
+        header_text = content
+        if not isinstance(content, str):
+            header_text = _decode(content[:first_doc] if first_doc >= 0 else content[:])
+
         # Extract header using str.find()
         for hdr_start_tag, hdr_end_tag in (
             ('<SEC-HEADER>', '</SEC-HEADER>'),
             ('<IMS-HEADER>', '</IMS-HEADER>'),
         ):
-            hdr_start = content.find(hdr_start_tag)
+            hdr_start = header_text.find(hdr_start_tag)
             if hdr_start >= 0:
-                hdr_end = content.find(hdr_end_tag, hdr_start)
+                hdr_end = header_text.find(hdr_end_tag, hdr_start)
                 if hdr_end >= 0:
                     # Extract header text (skip the tag line itself)
-                    inner_start = content.find('\n', hdr_start)
+                    inner_start = header_text.find('\n', hdr_start)
                     if inner_start >= 0 and inner_start < hdr_end:
-                        self.data['header'] = content[inner_start + 1:hdr_end]
+                        self.data['header'] = header_text[inner_start + 1:hdr_end]
                     else:
-                        self.data['header'] = content[hdr_start + len(hdr_start_tag):hdr_end]
+                        self.data['header'] = header_text[hdr_start + len(hdr_start_tag):hdr_end]
                 break
 
         # Extract documents using str.find() offset scanning
-        first_doc = content.find('<DOCUMENT>')
         if first_doc >= 0:
             self.data['documents'] = _extract_all_documents(content, first_doc)
 
         return self.data
 
 
-def _extract_all_documents(content: str, start_pos: int = 0) -> list:
+def _extract_all_documents(content: SubmissionContent, start_pos: int = 0) -> list:
     """Extract all documents from content using str.find() offset scanning.
 
     Returns list of dicts with metadata + content reference offsets.
     """
     documents = []
     pos = start_pos
+    open_tag, close_tag = _document_tags(content)
 
     while True:
-        doc_start = content.find('<DOCUMENT>', pos)
+        doc_start = content.find(open_tag, pos)
         if doc_start < 0:
             break
-        doc_end = content.find('</DOCUMENT>', doc_start)
+        doc_end = content.find(close_tag, doc_start)
         if doc_end < 0:
             # Structural proof of truncation, not a heuristic: EDGAR always closes
             # <DOCUMENT>. Continuing here silently returned a partial submission —
@@ -574,7 +676,7 @@ def _extract_all_documents(content: str, start_pos: int = 0) -> list:
     return documents
 
 
-def list_documents(content: str) -> list[SGMLDocument]:
+def list_documents(content: SubmissionContent) -> list[SGMLDocument]:
     """
     Convenience method to parse all documents from content into a list.
 
@@ -587,22 +689,23 @@ def list_documents(content: str) -> list[SGMLDocument]:
     return list(iter_documents(content))
 
 
-def iter_documents(content: str) -> Iterator[SGMLDocument]:
+def iter_documents(content: SubmissionContent) -> Iterator[SGMLDocument]:
     """
     Yield SGMLDocument objects from SGML content using fast str.find() scanning.
 
     Args:
-        content: The content string to parse
+        content: The content string to parse, or its bytes
 
     Yields:
         SGMLDocument objects containing the parsed content
     """
     pos = 0
+    open_tag, close_tag = _document_tags(content)
     while True:
-        doc_start = content.find('<DOCUMENT>', pos)
+        doc_start = content.find(open_tag, pos)
         if doc_start < 0:
             break
-        doc_end = content.find('</DOCUMENT>', doc_start)
+        doc_end = content.find(close_tag, doc_start)
         if doc_end < 0:
             # Same truncation contract as _extract_all_documents (edgartools-88ml).
             raise ValueError(
@@ -3,10 +3,14 @@ Storage providers for EdgarTools.
 
 Re-exports from:
 - _local: Local disk storage (download, compress, path helpers)
+- _filing_index: Local Parquet warehouse of the quarterly filing indexes
+- _fetch: Concurrent download of individual full submissions
 - _management: Analytics, optimization, cleanup
 - datamule: Datamule tar-based filing source
 """
 
 from edgar.storage._local import *
+from edgar.storage._filing_index import *
+from edgar.storage._fetch import *
 from edgar.storage._management import *
 from edgar.storage.datamule import use_datamule_storage, is_using_datamule_storage
@@ -0,0 +1,265 @@
+"""
+Concurrent download of individual full submissions into local storage.
+
+download_filings() works from the daily feed archives, which is the right tool for
+a whole day or quarter of filings but wasteful for a targeted set - 20,000 specific
+8-Ks spread over ten years would pull down thousands of feed archives. fetch_filings()
+downloads just the full submission (.txt) of each filing instead:
+
+* Submissions are fetched concurrently with the async HTTP client, which shares the
+  global rate limiter with every other request, so it runs as fast as the SEC allows.
+* Each submission is written to the layout local storage reads from,
+  <data dir>/filings/YYYYMMDD/<accession>.nc[.gz], so Filing.sgml() and everything
+  built on it finds it once use_local_storage() is on.
+* Progress is checkpointed to a manifest in the data directory. Re-running an
+  interrupted job skips what is already on disk and retries what failed.
+
+    from edgar import get_filings
+    filings = get_filings(2024, form="8-K").filter(cik=ciks)
+    result = filings.fetch_all()
+"""
+
+import asyncio
+import gzip
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple, Union
+
+from tqdm.auto import tqdm
+
+from edgar.core import log
+from edgar.httprequests import MAX_CONCURRENT_DOWNLOADS
+from edgar.settings import get_edgar_data_directory
+from edgar.storage._local import _run_coroutine
+from edgar.urls import build_archive_url
+
+if TYPE_CHECKING:
+    from edgar._filings import Filings
+
+__all__ = ['fetch_filings', 'FetchResult', 'FetchManifest']
+
+MANIFEST_NAME = 'fetch-manifest.jsonl'
+
+
+@dataclass
+class FetchResult:
+    """What a fetch_filings() job did"""
+    requested: int
+    downloaded: int = 0
+    skipped: int = 0
+    bytes_downloaded: int = 0
+    elapsed: float = 0.0
+    failed: Dict[str, str] = field(default_factory=dict)
+    manifest: Optional[Path] = None
+
+    @property
+    def filings_per_second(self) -> float:
+        return self.downloaded / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def megabytes_per_second(self) -> float:
+        return self.bytes_downloaded / 1_000_000 / self.elapsed if self.elapsed > 0 else 0.0
+
+    def __str__(self):
+        return (f"Fetched {self.downloaded:,} of {self.requested:,} filings "
+                f"({self.skipped:,} already stored, {len(self.failed):,} failed) "
+                f"in {self.elapsed:.1f}s at {self.filings_per_second:.1f} filings/s, "
+                f"{self.megabytes_per_second:.2f} MB/s")
+
+
+class FetchManifest:
+    """
+    An append-only record of the submissions a fetch job has stored or failed to fetch.
+
+    Each line is a JSON object with the accession number and status. The last line for an
+    accession number wins, so a failure followed by a successful retry reads as stored.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.status: Dict[str, str] = {}
+        # An interrupted job can leave the last line cut short, and the next entry must not be appended to it
+        self._ends_mid_line = False
+        if path.exists():
+            text = path.read_text(encoding='utf-8')
+            self._ends_mid_line = len(text) > 0 and not text.endswith('\n')
+            for line in text.splitlines():
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                self.status[entry['accession_number']] = entry['status']
+
+    @property
+    def stored(self) -> Set[str]:
+        return {accession_number for accession_number, status in self.status.items() if status == 'stored'}
+
+    def record(self, accession_number: str, status: str, **details):
+        self.status[accession_number] = status
+        entry = {'accession_number': accession_number, 'status': status, **details}
+        with self.path.open('a', encoding='utf-8') as f:
+            if self._ends_mid_line:
+                f.write('\n')
+                self._ends_mid_line = False
+            f.write(json.dumps(entry) + '\n')
+
+
+@dataclass
+class _Submission:
+    accession_number: str
+    url: str
+    path: Path
+
+
+def _submission_path(data_directory: Path, filing_date: Union[str, date], accession_number: str) -> Path:
+    """The path a submission is stored at, matching local_filing_path()"""
+    if isinstance(filing_date, (date, datetime)):
+        filing_date = filing_date.strftime('%Y-%m-%d')
+    return data_directory / str(filing_date).replace('-', '') / f"{accession_number}.nc"
+
+
+def _stored_path(path: Path) -> Optional[Path]:
+    """The compressed or uncompressed submission if either is on disk"""
+    compressed_path = Path(f"{path}.gz")
+    if compressed_path.exists():
+        return compressed_path
+    if path.exists():
+        return path
+    return None
+
+
+def _write_submission(content: bytes, path: Path, compress: bool, compression_level: int) -> Path:
+    """Write the submission through a temporary file so an interrupted write never looks complete"""
+    if compress:
+        content = gzip.compress(content, compresslevel=compression_level)
+        path = Path(f"{path}.gz")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial_path = path.with_name(path.name + '.part')
+    partial_path.write_bytes(content)
+    os.replace(partial_path, path)
+    return path
+
+
+def _submissions_to_fetch(filings: 'Filings', data_directory: Path) -> List[_Submission]:
+    """One submission per accession number; filings with several filers share a submission"""
+    submissions: Dict[str, _Submission] = {}
+    data = filings.data
+    for accession_number, cik, filing_date in zip(data['accession_number'].to_pylist(),
+                                                  data['cik'].to_pylist(),
+                                                  data['filing_date'].to_pylist(), strict=True):
+        if accession_number in submissions:
+            continue
+        url = build_archive_url(f"data/{cik}/{accession_number.replace('-', '')}/{accession_number}.txt")
+        submissions[accession_number] = _Submission(accession_number=accession_number,
+                                                    url=url,
+                                                    path=_submission_path(data_directory, filing_date, accession_number))
+    return list(submissions.values())
+
+
+async def _fetch_submissions(submissions: List[_Submission],
+                             manifest: FetchManifest,
+                             result: FetchResult,
+                             compress: bool,
+                             compression_level: int,
+                             max_concurrent: int,
+                             disable_progress: bool):
+    from edgar.httpclient import async_http_client
+    from edgar.httprequests import download_file_async
+
+    semaphore = asyncio.Semaphore(max_concurrent)
+    start = time.monotonic()
+
+    async def fetch(client, submission: _Submission) -> Tuple[_Submission, Optional[Path], int, Optional[Exception]]:
+        try:
+            async with semaphore:
+                content = await download_file_async(client, submission.url, as_text=False)
+            # Compressing a large submission takes long enough to stall the other downloads
+            path = await asyncio.to_thread(_write_submission, content, submission.path, compress, compression_level)
+            return submission, path, len(content), None
+        except Exception as e:
+            return submission, None, 0, e
+
+    with tqdm(total=len(submissions), desc="Fetching filings", unit="filing", disable=disable_progress) as progress:
+        async with async_http_client() as client:
+            tasks = [fetch(client, submission) for submission in submissions]
+            for completed in asyncio.as_completed(tasks):
+                submission, path, size, error = await completed
+                if error is None:
+                    result.downloaded += 1
+                    result.bytes_downloaded += size
+                    manifest.record(submission.accession_number, 'stored', path=str(path), bytes=size)
+                else:
+                    result.failed[submission.accession_number] = str(error)
+                    manifest.record(submission.accession_number, 'failed', error=str(error))
+                    log.warning("Failed to fetch %s: %s", submission.url, error)
+                elapsed = time.monotonic() - start
+                progress.set_postfix(MBps=f"{result.bytes_downloaded / 1_000_000 / max(elapsed, 1e-9):.2f}",
+                                     failed=len(result.failed), refresh=False)
+                progress.update(1)
+
+
+def fetch_filings(filings: 'Filings',
+                  data_directory: Optional[Union[str, Path]] = None,
+                  overwrite_existing: bool = False,
+                  compress: bool = True,
+                  compression_level: int = 6,
+                  max_concurrent: int = MAX_CONCURRENT_DOWNLOADS,
+                  manifest_path: Optional[Union[str, Path]] = None,
+                  disable_progress: bool = False) -> FetchResult:
+    """
+    Download the full submission of each filing into local storage.
+
+    Submissions already on disk are skipped unless overwrite_existing is True, so an
+    interrupted job resumes where it stopped when it is run again.
+
+    Args:
+        filings: The filings to fetch
+        data_directory: The local storage filings directory. Defaults to <Edgar data directory>/filings.
+        overwrite_existing: If True, download submissions that are already stored
+        compress: Whether to gzip the submissions. Default is True.
+        compression_level: Compression level for gzip (1-9). Default is 6.
+        max_concurrent: The most submissions downloaded at once
+        manifest_path: Where to checkpoint progress. Defaults to fetch-manifest.jsonl in the data directory.
+        disable_progress: If True, suppress the progress bar
+
+    Returns:
+        FetchResult: Counts, failures and throughput for the job
+    """
+    data_directory = Path(data_directory) if data_directory else get_edgar_data_directory() / 'filings'
+    data_directory.mkdir(parents=True, exist_ok=True)
+    manifest = FetchManifest(Path(manifest_path) if manifest_path else data_directory / MANIFEST_NAME)
+
+    submissions = _submissions_to_fetch(filings, data_directory)
+    result = FetchResult(requested=len(submissions), manifest=manifest.path)
+
+    if not overwrite_existing:
+        to_fetch = []
+        for submission in submissions:
+            stored_path = _stored_path(submission.path)
+            if stored_path is None:
+                to_fetch.append(submission)
+                continue
+            if manifest.status.get(submission.accession_number) != 'stored':
+                # Stored by another job or by download_filings(); note it so the manifest is complete
+                manifest.record(submission.accession_number, 'stored', path=str(stored_path))
+            result.skipped += 1
+        submissions = to_fetch
+
+    log.info("Fetching %d of %d filings into %s (%d already stored)",
+             len(submissions), result.requested, data_directory, result.skipped)
+    if submissions:
+        start = time.monotonic()
+        _run_coroutine(_fetch_submissions(submissions,
+                                          manifest=manifest,
+                                          result=result,
+                                          compress=compress,
+                                          compression_level=compression_level,
+                                          max_concurrent=max_concurrent,
+                                          disable_progress=disable_progress))
+        result.elapsed = time.monotonic() - start
+    log.info("%s", result)
+    return result
@@ -0,0 +1,294 @@
+"""
+Local warehouse of the SEC quarterly filing indexes.
+
+get_filings() downloads and parses a fixed-width index for every quarter it
+covers, so a query spanning decades costs over a hundred downloads. The
+warehouse keeps the parsed indexes on disk as a year/quarter partitioned
+Parquet dataset under the Edgar data directory:
+
+    <data dir>/filing-index/form/year=2024/quarter=1/part-0.parquet
+
+Once a quarter is in the warehouse, get_filings() reads it with pyarrow dataset
+filters instead of the network. Only the partitions for the requested quarters
+are opened, and form and CIK filters are pushed down into the Parquet scan.
+The form index is sorted by form, so a form filter also skips row groups.
+
+Quarters that have ended are downloaded once. The quarter in progress is kept
+current by appending the SEC daily indexes.
+
+    from edgar.storage import download_filing_index
+    download_filing_index()                      # every quarter since 1993
+    download_filing_index(range(2015, 2025))     # or just some years
+"""
+
+import json
+import os
+import shutil
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import httpx
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from tqdm.auto import tqdm
+
+from edgar.core import log
+from edgar.exceptions import TransportError, http_status
+from edgar.settings import get_edgar_data_directory
+
+__all__ = ['download_filing_index',
+           'filing_index_directory',
+           'filing_index_quarters',
+           'read_filing_index']
+
+YearAndQuarter = Tuple[int, int]
+
+# Indexes the warehouse can hold. The xbrl index has no daily counterpart.
+WAREHOUSE_INDEXES = ('form', 'company', 'xbrl')
+DAILY_INDEXES = ('form', 'company')
+
+# Rows per Parquet row group. Small enough that a form filter skips most row groups.
+ROW_GROUP_SIZE = 16_384
+
+# The SEC finishes a quarter's full index a day or two after the quarter ends
+QUARTER_SETTLE_DAYS = 3
+
+_MANIFEST = 'manifest.json'
+
+
+def filing_index_directory(index: str = 'form') -> Path:
+    """The directory of the filing index warehouse for an index type."""
+    return get_edgar_data_directory() / 'filing-index' / index
+
+
+def _quarter_key(year_and_quarter: YearAndQuarter) -> str:
+    year, quarter = year_and_quarter
+    return f"{year}Q{quarter}"
+
+
+def _quarter_end(year_and_quarter: YearAndQuarter) -> date:
+    year, quarter = year_and_quarter
+    if quarter == 4:
+        return date(year, 12, 31)
+    return date(year, quarter * 3 + 1, 1) - timedelta(days=1)
+
+
+def _is_settled(year_and_quarter: YearAndQuarter, on: date) -> bool:
+    """True if the quarter's full index was final by the given date."""
+    return on > _quarter_end(year_and_quarter) + timedelta(days=QUARTER_SETTLE_DAYS)
+
+
+def _partition_directory(index: str, year_and_quarter: YearAndQuarter) -> Path:
+    year, quarter = year_and_quarter
+    return filing_index_directory(index) / f"year={year}" / f"quarter={quarter}"
+
+
+def _load_manifest(index: str) -> Dict[str, dict]:
+    path = filing_index_directory(index) / _MANIFEST
+    try:
+        return json.loads(path.read_text()).get('quarters', {})
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_manifest(index: str, quarters: Dict[str, dict]) -> None:
+    directory = filing_index_directory(index)
+    directory.mkdir(parents=True, exist_ok=True)
+    temp_path = directory / f"{_MANIFEST}.{os.getpid()}.tmp"
+    temp_path.write_text(json.dumps({'quarters': quarters}, indent=1, sort_keys=True))
+    os.replace(temp_path, directory / _MANIFEST)
+
+
+def filing_index_quarters(index: str = 'form') -> List[YearAndQuarter]:
+    """The quarters held in the filing index warehouse, oldest first."""
+    quarters = []
+    for key in _load_manifest(index):
+        year, quarter = key.split('Q')
+        quarters.append((int(year), int(quarter)))
+    return sorted(quarters)
+
+
+def _is_current(entry: Optional[dict], today: date) -> bool:
+    """True if a manifest entry can be served without asking the SEC for newer data."""
+    if not entry:
+        return False
+    return entry.get('complete', False) or entry.get('updated') == today.isoformat()
+
+
+def _write_parquet(table: pa.Table, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    pq.write_table(table, temp_path, row_group_size=ROW_GROUP_SIZE, compression='zstd')
+    os.replace(temp_path, path)
+
+
+def store_quarter(index: str,
+                  year_and_quarter: YearAndQuarter,
+                  index_table: pa.Table,
+                  today: Optional[date] = None) -> None:
+    """
+    Replace a quarter in the warehouse with its full quarterly index.
+
+    Args:
+        index: The index type - "form", "company" or "xbrl"
+        year_and_quarter: The quarter the index is for
+        index_table: The quarter's index as read by fetch_filing_index
+        today: The date the index was downloaded (defaults to today)
+    """
+    today = today or date.today()
+    partition = _partition_directory(index, year_and_quarter)
+    if partition.exists():
+        shutil.rmtree(partition)
+    _write_parquet(index_table, partition / 'part-0.parquet')
+
+    quarters = _load_manifest(index)
+    through = None
+    if index_table.num_rows and 'filing_date' in index_table.column_names:
+        latest = pc.max(index_table['filing_date']).as_py()
+        through = latest.isoformat() if latest else None
+    quarters[_quarter_key(year_and_quarter)] = {
+        'complete': _is_settled(year_and_quarter, today),
+        'rows': index_table.num_rows,
+        'through': through,
+        'updated': today.isoformat(),
+    }
+    _save_manifest(index, quarters)
+
+
+def _append_daily_indexes(index: str, year_and_quarter: YearAndQuarter, today: date) -> int:
+    """
+    Append the daily indexes published since the quarter was last updated.
+
+    Returns:
+        The number of filings appended
+    """
+    from edgar._filings import fetch_daily_filing_index
+
+    quarters = _load_manifest(index)
+    entry = quarters[_quarter_key(year_and_quarter)]
+    through = date.fromisoformat(entry['through']) if entry.get('through') else None
+    year, quarter = year_and_quarter
+    day = (through + timedelta(days=1)) if through else date(year, (quarter - 1) * 3 + 1, 1)
+    last_day = min(today, _quarter_end(year_and_quarter))
+
+    appended = 0
+    while day <= last_day:
+        if day.weekday() < 5:
+            try:
+                daily_table = fetch_daily_filing_index(day.isoformat(), index=index)
+            except (httpx.HTTPStatusError, TransportError) as e:
+                # Holidays have no index, and today's is not published until the evening
+                if http_status(e) not in (403, 404):
+                    raise
+                daily_table = None
+            if daily_table is not None and daily_table.num_rows:
+                partition = _partition_directory(index, year_and_quarter)
+                _write_parquet(daily_table, partition / f"daily-{day:%Y%m%d}.parquet")
+                appended += daily_table.num_rows
+                entry['rows'] = entry.get('rows', 0) + daily_table.num_rows
+                entry['through'] = day.isoformat()
+        day += timedelta(days=1)
+
+    entry['updated'] = today.isoformat()
+    _save_manifest(index, quarters)
+    return appended
+
+
+def download_filing_index(years: Optional[Union[int, Iterable[int]]] = None,
+                          index: str = 'form',
+                          disable_progress: bool = False) -> Path:
+    """
+    Download the quarterly filing indexes into the local warehouse, or bring it up to date.
+
+    Quarters that are already complete in the warehouse are skipped. A quarter
+    still in progress is brought up to date from the SEC daily indexes, and is
+    downloaded again in full once it has ended.
+
+    Args:
+        years: The years to download. Defaults to every year since 1993.
+        index: The index type - "form", "company" or "xbrl"
+        disable_progress: If True, suppress progress bars
+
+    Returns:
+        The warehouse directory for the index type
+    """
+    from edgar._filings import available_quarters, fetch_filing_index
+
+    if index not in WAREHOUSE_INDEXES:
+        raise ValueError(f"index must be one of {WAREHOUSE_INDEXES}, not {index!r}")
+
+    today = date.today()
+    wanted_years = None
+    if years is not None:
+        wanted_years = {years} if isinstance(years, int) else set(years)
+    year_and_quarters = [yq for yq in available_quarters() if wanted_years is None or yq[0] in wanted_years]
+
+    quarters = _load_manifest(index)
+    pending = [yq for yq in year_and_quarters if not quarters.get(_quarter_key(yq), {}).get('complete')]
+
+    for year_and_quarter in tqdm(pending, desc=f"Downloading {index} index", disable=disable_progress):
+        entry = quarters.get(_quarter_key(year_and_quarter))
+        # A quarter in progress only needs the days since it was last updated
+        if entry and index in DAILY_INDEXES and not _is_settled(year_and_quarter, today):
+            _append_daily_indexes(index, year_and_quarter, today)
+            continue
+        _, index_table = fetch_filing_index(year_and_quarter, index)
+        store_quarter(index, year_and_quarter, index_table, today=today)
+
+    log.info(f"Filing index warehouse for {len(year_and_quarters)} quarters at {filing_index_directory(index)}")
+    return filing_index_directory(index)
+
+
+def warehouse_quarters(year_and_quarters: Iterable[YearAndQuarter],
+                       index: str = 'form') -> List[YearAndQuarter]:
+    """The quarters among those given that the warehouse can serve without the network."""
+    quarters = _load_manifest(index)
+    if not quarters:
+        return []
+    today = date.today()
+    return [yq for yq in year_and_quarters if _is_current(quarters.get(_quarter_key(yq)), today)]
+
+
+def is_filing_index_warehoused(index: str = 'form') -> bool:
+    """True if a filing index warehouse has been created for the index type."""
+    return (filing_index_directory(index) / _MANIFEST).exists()
+
+
+def read_filing_index(year_and_quarters: Iterable[YearAndQuarter],
+                      index: str = 'form',
+                      forms: Optional[List[str]] = None,
+                      ciks: Optional[List[int]] = None) -> pa.Table:
+    """
+    Read quarters of the filing index from the warehouse.
+
+    Only the partitions of the requested quarters are opened, and the form and
+    CIK filters are applied inside the Parquet scan.
+
+    Args:
+        year_and_quarters: The quarters to read, which must be in the warehouse
+        index: The index type - "form", "company" or "xbrl"
+        forms: Only read filings of these exact form names
+        ciks: Only read filings by these CIKs
+
+    Returns:
+        The filing index for the quarters, in quarter order
+    """
+    files = []
+    for year_and_quarter in sorted(set(year_and_quarters)):
+        partition = _partition_directory(index, year_and_quarter)
+        files.extend(str(path) for path in sorted(partition.glob('*.parquet')))
+    if not files:
+        from edgar._filings import _empty_filing_index
+        return _empty_filing_index()
+
+    dataset = ds.dataset(files, format='parquet')
+    condition = None
+    if forms:
+        condition = ds.field('form').isin(forms)
+    if ciks:
+        cik_condition = ds.field('cik').isin(pa.array(ciks, type=pa.int32()))
+        condition = cik_condition if condition is None else condition & cik_condition
+    return dataset.to_table(filter=condition)
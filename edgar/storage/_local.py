@@ -20,6 +20,7 @@ from edgar.core import filing_date_to_year_quarters, log, strtobool
 from edgar.settings import get_edgar_data_directory
 from edgar.dates import extract_dates
 from edgar.httprequests import download_bulk_data, download_datafile, download_text
+from edgar.storage._seekable import seekable_index_path, write_seekable_gzip
 from edgar.urls import build_company_tickers_exchange_url, build_company_tickers_url, build_mutual_fund_tickers_url, build_ticker_url
 
 def _run_coroutine(coroutine):
@@ -728,7 +729,8 @@ def is_compressed_file(file_path: Path) -> bool:
     return str(file_path).endswith('.gz')
 
 
-def compress_filing(file_path: Path, compression_level: int = 6, delete_original: bool = True) -> Path:
+def compress_filing(file_path: Path, compression_level: int = 6, delete_original: bool = True,
+                    seekable: bool = False) -> Path:
     """
     Compress a filing file using gzip and optionally delete the original.
 
@@ -736,6 +738,9 @@ def compress_filing(file_path: Path, compression_level: int = 6, delete_original
         file_path: Path to the file to compress
         compression_level: Compression level (1-9, with 9 being highest compression)
         delete_original: Whether to delete the original file after compression
+        seekable: Write the file as independently compressed blocks with an index of
+            its documents beside it (<file>.gz.idx), so a single attachment can be read
+            without decompressing the whole submission. The file is still ordinary gzip.
 
     Returns:
         Path to the compressed file
@@ -756,9 +761,14 @@ def compress_filing(file_path: Path, compression_level: int = 6, delete_original
     compressed_path = Path(f"{file_path}.gz")
 
     # Compress the file
-    with file_path.open('rb') as f_in:
-        with gzip.open(compressed_path, 'wb', compresslevel=compression_level) as f_out:
-            shutil.copyfileobj(f_in, f_out)
+    if seekable:
+        write_seekable_gzip(file_path, compressed_path, compression_level=compression_level)
+    else:
+        with file_path.open('rb') as f_in:
+            with gzip.open(compressed_path, 'wb', compresslevel=compression_level) as f_out:
+                shutil.copyfileobj(f_in, f_out)
+        # An index left by an earlier seekable compression no longer describes the file
+        seekable_index_path(compressed_path).unlink(missing_ok=True)
 
     # Delete the original file if requested
     if delete_original:
@@ -806,11 +816,13 @@ def decompress_filing(file_path: Path, output_path: Optional[Path] = None, delet
     # Delete the original compressed file if requested
     if delete_original:
         file_path.unlink()
+        seekable_index_path(file_path).unlink(missing_ok=True)
 
     return output_path
 
 
-def compress_all_filings(data_directory: Optional[Path] = None, compression_level: int = 6, disable_progress: bool = False) -> int:
+def compress_all_filings(data_directory: Optional[Path] = None, compression_level: int = 6, disable_progress: bool = False,
+                         seekable: bool = False) -> int:
     """
     Compress all uncompressed filing files in the data directory.
 
@@ -818,6 +830,7 @@ def compress_all_filings(data_directory: Optional[Path] = None, compression_leve
         data_directory: Path to the data directory (defaults to the Edgar data directory)
         compression_level: Compression level (1-9, with 9 being highest compression)
         disable_progress: If True, suppress progress bar. Defaults to False.
+        seekable: Compress as seekable gzip with a document index (see compress_filing)
 
     Returns:
         Number of files compressed
@@ -830,7 +843,7 @@ def compress_all_filings(data_directory: Optional[Path] = None, compression_leve
     for file_path in tqdm(list(data_directory.glob('**/*.nc')), desc="Compressing files", disable=disable_progress):
         if not is_compressed_file(file_path) and file_path.is_file():
             try:
-                compress_filing(file_path, compression_level=compression_level)
+                compress_filing(file_path, compression_level=compression_level, seekable=seekable)
                 files_compressed += 1
             except Exception as e:
                 log.warning(f"Failed to compress {file_path}: {e}")
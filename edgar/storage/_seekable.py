@@ -0,0 +1,172 @@
+"""
+Seekable gzip storage for full submissions.
+
+A gzip file can hold any number of members back to back, and readers decompress
+them into one stream. compress_filing(seekable=True) writes a submission as
+independent members of SEEKABLE_BLOCK_SIZE uncompressed bytes each, the layout
+BGZF uses. The file is still an ordinary .gz that gzip, zcat and read_content()
+read in full, but any byte range can be decompressed starting from the block
+that holds it.
+
+Beside the .gz goes a small JSON index, <file>.gz.idx, recording where each
+block starts in the compressed file and where each <DOCUMENT> of the submission
+starts and ends. FilingSGML.from_source() uses it to decompress only the header
+up front. A document's blocks are decompressed when its content is read, so
+pulling the XBRL instance out of a 100MB submission costs a few blocks rather
+than the whole file.
+"""
+
+import gzip
+import json
+import os
+from pathlib import Path
+from typing import List, Optional, Union
+
+from edgar.sgml.sgml_parser import SGMLParser, _decode, _document_tags, _extract_all_documents
+
+__all__ = ['SeekableGzip', 'write_seekable_gzip', 'seekable_index_path', 'SEEKABLE_BLOCK_SIZE']
+
+# Uncompressed bytes per gzip member. Smaller blocks make reads of small documents
+# cheaper and compress slightly worse; 64KB is what BGZF uses.
+SEEKABLE_BLOCK_SIZE = 64 * 1024
+
+# Bump when the index layout changes
+SEEKABLE_INDEX_FORMAT = 1
+
+
+def seekable_index_path(path: Union[str, Path]) -> Path:
+    """The index written beside a seekable .gz file."""
+    return Path(f"{path}.idx")
+
+
+def write_seekable_gzip(source: Path,
+                        target: Path,
+                        compression_level: int = 6,
+                        block_size: int = SEEKABLE_BLOCK_SIZE) -> Path:
+    """
+    Compress a file as a seekable gzip file with its index.
+
+    Args:
+        source: The uncompressed submission
+        target: Path of the .gz file to write
+        compression_level: Compression level (1-9, with 9 being highest compression)
+        block_size: Uncompressed bytes per gzip member
+
+    Returns:
+        Path to the compressed file
+    """
+    data = source.read_bytes()
+    blocks = []
+    temp_path = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    with temp_path.open('wb') as f_out:
+        # An empty file still gets one (empty) member, so it is a valid gzip file
+        for start in range(0, max(len(data), 1), block_size):
+            blocks.append(f_out.tell())
+            f_out.write(gzip.compress(data[start:start + block_size], compresslevel=compression_level, mtime=0))
+        compressed_size = f_out.tell()
+
+    index = {
+        'format': SEEKABLE_INDEX_FORMAT,
+        'block_size': block_size,
+        'size': len(data),
+        'compressed_size': compressed_size,
+        'blocks': blocks,
+    }
+    index.update(_index_documents(data))
+
+    os.replace(temp_path, target)
+    index_path = seekable_index_path(target)
+    temp_index_path = index_path.with_name(f"{index_path.name}.{os.getpid()}.tmp")
+    with temp_index_path.open('w') as f:
+        json.dump(index, f, separators=(',', ':'))
+    os.replace(temp_index_path, index_path)
+    return target
+
+
+def _index_documents(data: bytes) -> dict:
+    """
+    Where the header ends and each document starts and ends, as the SGML parser
+    finds them. Content that does not parse as a submission gets no document index,
+    so reading it goes through the full parser and its errors.
+    """
+    first_doc = data.find(_document_tags(data)[0])
+    try:
+        sgml_format = SGMLParser.detect_format(_decode(data[:first_doc + 10] if first_doc >= 0 else data))
+        documents = _extract_all_documents(data, first_doc) if first_doc >= 0 else []
+    except Exception:
+        return {}
+    return {
+        'sgml_format': sgml_format.value,
+        'header_end': first_doc if first_doc >= 0 else len(data),
+        'documents': [[document['type'], document['sequence'], document['filename'], document['description'],
+                       document['_content_start'], document['_content_end']]
+                      for document in documents],
+    }
+
+
+class SeekableGzip:
+    """
+    Random access to the uncompressed bytes of a seekable gzip file.
+
+    Slicing decompresses only the blocks the slice covers:
+
+        >>> submission = SeekableGzip.open('0000320193-24-000123.nc.gz')
+        >>> header = submission[:submission.header_end]
+
+    Nothing is held open between reads, so a SeekableGzip pickles as its path and index.
+    """
+
+    def __init__(self, path: Union[str, Path], index: dict):
+        self.path = Path(path)
+        self.block_size: int = index['block_size']
+        self.size: int = index['size']
+        self.compressed_size: int = index['compressed_size']
+        self.blocks: List[int] = index['blocks']
+        self.sgml_format: Optional[str] = index.get('sgml_format')
+        self.header_end: Optional[int] = index.get('header_end')
+        self.documents: Optional[List[list]] = index.get('documents')
+
+    @classmethod
+    def open(cls, path: Union[str, Path]) -> Optional['SeekableGzip']:
+        """
+        Open a seekable gzip file by its index.
+
+        Returns:
+            None if the file has no index, or its index does not describe it -
+            a plain .gz written over a seekable one, say
+        """
+        index_path = seekable_index_path(path)
+        try:
+            with index_path.open() as f:
+                index = json.load(f)
+            compressed_size = Path(path).stat().st_size
+        except (OSError, ValueError):
+            return None
+        if index.get('format') != SEEKABLE_INDEX_FORMAT or index.get('compressed_size') != compressed_size:
+            return None
+        return cls(path, index)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, key: slice) -> bytes:
+        if not isinstance(key, slice):
+            raise TypeError("SeekableGzip supports slicing only")
+        start, stop, step = key.indices(self.size)
+        if step != 1:
+            raise ValueError("SeekableGzip does not support slice steps")
+        if start >= stop:
+            return b''
+        first_block = start // self.block_size
+        last_block = (stop - 1) // self.block_size
+        compressed_start = self.blocks[first_block]
+        compressed_end = self.blocks[last_block + 1] if last_block + 1 < len(self.blocks) else self.compressed_size
+        with self.path.open('rb') as f:
+            f.seek(compressed_start)
+            compressed = f.read(compressed_end - compressed_start)
+        data = gzip.decompress(compressed)
+        offset = first_block * self.block_size
+        return data[start - offset:stop - offset]
+
+    def __repr__(self) -> str:
+        return f"SeekableGzip({self.path}, size={self.size:,}, blocks={len(self.blocks)})"
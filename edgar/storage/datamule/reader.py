@@ -22,7 +22,7 @@ import logging
 import tarfile
 from collections import defaultdict
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from edgar.sgml.sgml_common import FilingSGML
 from edgar.storage.datamule.documents import TarSGMLDocument
@@ -30,7 +30,7 @@ from edgar.storage.datamule.metadata import filing_header_from_metadata
 
 log = logging.getLogger(__name__)
 
-__all__ = ['load_filing_from_tar']
+__all__ = ['load_filing_from_tar', 'load_filing_from_members']
 
 
 def load_filing_from_tar(tar_path: Path, accession_no: Optional[str] = None) -> Optional[FilingSGML]:
@@ -58,6 +58,43 @@ def load_filing_from_tar(tar_path: Path, accession_no: Optional[str] = None) ->
         return None
 
 
+def load_filing_from_members(tar_path: Path, entry: Dict[str, Any]) -> Optional[FilingSGML]:
+    """
+    Load a filing by reading its members at the offsets recorded in the datamule index.
+
+    Only the filing's own metadata.json and documents are read, each with one
+    seek, so the cost does not grow with the number of filings in the tar.
+
+    Args:
+        tar_path: Path to the uncompressed tar file.
+        entry: The filing's index entry, with 'metadata': [offset, size] and
+            'members': [[name, offset, size, zstd], ...].
+
+    Returns:
+        FilingSGML or None if the filing could not be loaded.
+    """
+    prefix = entry['prefix']
+    try:
+        with Path(tar_path).open('rb') as f:
+            metadata = json.loads(_read_at(f, *entry['metadata']).decode('utf-8'))
+            contents = []
+            for name, offset, size, zstd in entry['members']:
+                data = _read_at(f, offset, size)
+                contents.append((_strip_prefix(name, prefix), _maybe_decompress_zstd(data) if zstd else data))
+    except (OSError, ValueError) as e:
+        log.warning("Failed to read tar %s: %s", Path(tar_path).name, e)
+        return None
+    return _filing_sgml_from_contents(metadata, contents)
+
+
+def _read_at(f, offset: int, size: int) -> bytes:
+    f.seek(offset)
+    data = f.read(size)
+    if len(data) != size:
+        raise ValueError(f"tar member at offset {offset} is truncated")
+    return data
+
+
 def _load_from_open_tar(tf: tarfile.TarFile, accession_no: Optional[str]) -> Optional[FilingSGML]:
     """Load a filing from an already-opened tar file."""
     members = tf.getmembers()
@@ -114,19 +151,15 @@ def _build_filing_sgml(
     members: List[tarfile.TarInfo],
 ) -> FilingSGML:
     """Construct a FilingSGML from tar contents."""
-    header = filing_header_from_metadata(metadata)
+    return _filing_sgml_from_contents(metadata, _member_contents(tf, prefix, members))
 
-    # Build a filename→doc_info map from the documents array if available
-    doc_info_map: Dict[str, Dict] = {}
-    if isinstance(metadata.get('documents'), list):
-        for doc_info in metadata['documents']:
-            if isinstance(doc_info, dict) and 'filename' in doc_info:
-                doc_info_map[doc_info['filename']] = doc_info
-
-    # Build documents from tar members
-    documents_by_sequence = defaultdict(list)
-    seq = 1
 
+def _member_contents(
+    tf: tarfile.TarFile,
+    prefix: str,
+    members: List[tarfile.TarInfo],
+) -> Iterable[Tuple[str, bytes]]:
+    """The filename and decompressed content of each document member under prefix."""
     for member in members:
         # Skip directories, metadata.json, and files outside our prefix
         if member.isdir():
@@ -140,12 +173,26 @@ def _build_filing_sgml(
         if f is None:
             continue
 
-        filename = _strip_prefix(member.name, prefix)
-        raw_content = f.read()
-
         # Decompress zstd-compressed content (datamule uses zstandard)
-        raw_content = _maybe_decompress_zstd(raw_content)
+        yield _strip_prefix(member.name, prefix), _maybe_decompress_zstd(f.read())
+
+
+def _filing_sgml_from_contents(metadata: Dict, contents: Iterable[Tuple[str, bytes]]) -> FilingSGML:
+    """Construct a FilingSGML from the metadata and (filename, content) of each document."""
+    header = filing_header_from_metadata(metadata)
+
+    # Build a filename→doc_info map from the documents array if available
+    doc_info_map: Dict[str, Dict] = {}
+    if isinstance(metadata.get('documents'), list):
+        for doc_info in metadata['documents']:
+            if isinstance(doc_info, dict) and 'filename' in doc_info:
+                doc_info_map[doc_info['filename']] = doc_info
+
+    # Build documents from tar members
+    documents_by_sequence = defaultdict(list)
+    seq = 1
 
+    for filename, raw_content in contents:
         # Try to decode as text; keep as bytes for binary files
         try:
             content_str = raw_content.decode('utf-8')
@@ -7,12 +7,22 @@ filings with a metadata.json and the raw document files (HTML, XML, etc.).
 Usage:
     edgar.use_datamule_storage("/path/to/tars")   # scans tars, builds index
     edgar.use_datamule_storage(disable=True)       # turn it off
+
+The index is saved beside the tars in .edgar-datamule-index.json. For every
+filing it records the tar it lives in and where each of its members' data
+starts and how long it is, so a filing is read by seeking straight to its
+members instead of walking the tar. A tar is only read again when its size or
+modification time changes; new and changed tars are indexed in a process pool.
 """
 
+import json
 import logging
+import os
 import tarfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import TYPE_CHECKING, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 if TYPE_CHECKING:
     from edgar.sgml.sgml_common import FilingSGML
@@ -24,6 +34,14 @@ __all__ = ['use_datamule_storage', 'is_using_datamule_storage', 'get_datamule_fi
 # Module-level state
 _datamule_path: Optional[Path] = None
 _accession_index: Dict[str, Path] = {}  # accession_no -> tar_path
+_member_index: Dict[str, Dict[str, Any]] = {}  # accession_no -> member offsets, see _index_tar_members
+
+DATAMULE_INDEX_NAME = '.edgar-datamule-index.json'
+
+# Bump when the layout of the saved index changes
+DATAMULE_INDEX_FORMAT = 1
+
+_ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
 
 
 def use_datamule_storage(path=None, *, disable=False):
@@ -31,7 +49,8 @@ def use_datamule_storage(path=None, *, disable=False):
     Configure a datamule tar directory as a filing source.
 
     Scans the directory for .tar files and builds an accession-number index
-    by reading metadata.json from each tar.
+    by reading metadata.json from each tar. The index is saved in the directory
+    and reused the next time, so only tars added or changed since are read.
 
     Args:
         path: Directory containing datamule tar files. If None and not disabling,
@@ -47,6 +66,7 @@ def use_datamule_storage(path=None, *, disable=False):
     if disable:
         _datamule_path = None
         _accession_index.clear()
+        _member_index.clear()
         log.info("Datamule storage disabled")
         return
 
@@ -61,6 +81,7 @@ def use_datamule_storage(path=None, *, disable=False):
 
     _datamule_path = tar_dir
     _accession_index.clear()
+    _member_index.clear()
     _scan_tars(tar_dir)
     log.info("Datamule storage enabled: %s (%d filings indexed)", tar_dir, len(_accession_index))
 
@@ -84,7 +105,10 @@ def get_datamule_filing(accession_no: str) -> Optional['FilingSGML']:
     if tar_path is None:
         return None
 
-    from edgar.storage.datamule.reader import load_filing_from_tar
+    from edgar.storage.datamule.reader import load_filing_from_members, load_filing_from_tar
+    entry = _member_index.get(accession_no)
+    if entry is not None and entry['tar'] == tar_path and _tar_unchanged(tar_path, entry):
+        return load_filing_from_members(tar_path, entry)
     return load_filing_from_tar(tar_path, accession_no=accession_no)
 
 
@@ -93,47 +117,174 @@ def get_datamule_filing(accession_no: str) -> Optional['FilingSGML']:
 # ---------------------------------------------------------------------------
 
 def _scan_tars(tar_dir: Path):
-    """Scan all .tar files in the directory and index accession numbers."""
-    import json
-
+    """
+    Index all .tar files in the directory, reusing the saved index for tars
+    that have not changed since it was written.
+    """
     tar_files = sorted(tar_dir.glob("*.tar"))
     if not tar_files:
         log.warning("No .tar files found in %s", tar_dir)
         return
 
+    saved = _load_saved_index(tar_dir)
+    tars: Dict[str, Dict[str, Any]] = {}
+    stale: List[Path] = []
+    for tar_path in tar_files:
+        stat = tar_path.stat()
+        entry = saved.get(tar_path.name)
+        if entry is not None and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+            tars[tar_path.name] = entry
+        else:
+            stale.append(tar_path)
+
+    for tar_path, entry in _index_tars(stale):
+        if entry is not None:
+            tars[tar_path.name] = entry
+
+    if stale or tars.keys() != saved.keys():
+        _save_index(tar_dir, tars)
+
     for tar_path in tar_files:
+        entry = tars.get(tar_path.name)
+        if entry is None:
+            continue
+        for accession_no, filing in entry['filings'].items():
+            _accession_index[accession_no] = tar_path
+            if filing is not None:
+                _member_index[accession_no] = {'tar': tar_path, 'mtime_ns': entry['mtime_ns'],
+                                               'size': entry['size'], **filing}
+
+
+def _index_tars(tar_paths: List[Path]) -> List[tuple]:
+    """
+    Index tars in a process pool, one tar per task, or in this process when
+    there is only one tar or the pool cannot start.
+
+    Returns (tar_path, entry) pairs, with None for tars that could not be read.
+    """
+    workers = min(os.cpu_count() or 1, len(tar_paths))
+    if workers > 1:
         try:
-            _index_tar(tar_path)
-        except Exception as e:
-            log.warning("Failed to index %s: %s", tar_path.name, e)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                return list(zip(tar_paths, executor.map(_index_tar_safely, tar_paths), strict=True))
+        except (BrokenProcessPool, OSError) as e:
+            log.debug("Datamule index process pool unavailable, indexing in process: %s", e)
+    return [(tar_path, _index_tar_safely(tar_path)) for tar_path in tar_paths]
+
+
+def _index_tar_safely(tar_path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        return _index_tar_members(tar_path)
+    except Exception as e:
+        log.warning("Failed to index %s: %s", tar_path.name, e)
+        return None
 
 
-def _index_tar(tar_path: Path):
+def _index_tar_members(tar_path: Path) -> Dict[str, Any]:
     """
-    Read a single tar and map accession numbers to tar_path.
+    Read a single tar and record, for every filing in it, where its metadata.json
+    and documents are stored.
 
     Handles two layouts:
     - Single-filing tar: metadata.json at the root
     - Batch tar: <accession_no>/metadata.json for each filing
-    """
-    import json
-
-    with tarfile.open(tar_path, 'r') as tf:
-        metadata_members = [m for m in tf.getmembers() if m.name.endswith('metadata.json')]
 
-        for member in metadata_members:
+    Returns:
+        {'mtime_ns', 'size', 'filings': {accession_no: filing}} where a filing is
+        {'prefix', 'metadata': [offset, size], 'members': [[name, offset, size, zstd], ...]}
+        with offsets to the member data in the tar file. A compressed tar cannot be
+        read by offset, so its filings are None and get read with tarfile.
+    """
+    stat = tar_path.stat()
+    filings: Dict[str, Optional[Dict[str, Any]]] = {}
+    try:
+        tf = tarfile.open(tar_path, 'r:')
+        seekable = True
+    except tarfile.ReadError:
+        tf = tarfile.open(tar_path, 'r')
+        seekable = False
+
+    with tf, tar_path.open('rb') as raw:
+        members = [m for m in tf.getmembers() if m.isreg()]
+        # The documents under each directory, so a batch tar is not rescanned per filing
+        documents_under: Dict[str, List[tarfile.TarInfo]] = {'': []}
+        for member in members:
+            if member.name.endswith('metadata.json'):
+                continue
+            documents_under[''].append(member)
+            parts = member.name.split('/')[:-1]
+            for depth in range(1, len(parts) + 1):
+                documents_under.setdefault('/'.join(parts[:depth]) + '/', []).append(member)
+
+        for member in members:
+            if not member.name.endswith('metadata.json'):
+                continue
             try:
                 f = tf.extractfile(member)
                 if f is None:
                     continue
                 metadata = json.loads(f.read().decode('utf-8'))
                 accession_no = metadata.get('accession-number') or metadata.get('accession_number') or metadata.get('accessionNumber')
-                if accession_no:
-                    # Normalize to dashed format (0001193125-24-012345)
-                    accession_no = _normalize_accession(accession_no)
-                    _accession_index[accession_no] = tar_path
+                if not accession_no:
+                    continue
+                # Normalize to dashed format (0001193125-24-012345)
+                accession_no = _normalize_accession(accession_no)
             except Exception as e:
                 log.debug("Skipping %s in %s: %s", member.name, tar_path.name, e)
+                continue
+            if not seekable:
+                filings[accession_no] = None
+                continue
+            prefix = member.name.rsplit('/', 1)[0] + '/' if '/' in member.name else ''
+            filings[accession_no] = {
+                'prefix': prefix,
+                'metadata': [member.offset_data, member.size],
+                'members': [[m.name, m.offset_data, m.size, _is_zstd(raw, m)]
+                            for m in documents_under.get(prefix, [])],
+            }
+    return {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'filings': filings}
+
+
+def _is_zstd(raw, member: tarfile.TarInfo) -> bool:
+    """Whether a member's data is zstd compressed, from its first four bytes."""
+    if member.size < len(_ZSTD_MAGIC):
+        return False
+    raw.seek(member.offset_data)
+    return raw.read(len(_ZSTD_MAGIC)) == _ZSTD_MAGIC
+
+
+def _tar_unchanged(tar_path: Path, entry: Dict[str, Any]) -> bool:
+    """Whether the tar is still the one the member offsets were recorded from."""
+    try:
+        stat = tar_path.stat()
+    except OSError:
+        return False
+    return stat.st_mtime_ns == entry['mtime_ns'] and stat.st_size == entry['size']
+
+
+def _load_saved_index(tar_dir: Path) -> Dict[str, Dict[str, Any]]:
+    """The per-tar entries of the index saved in the directory, or {} if there is none."""
+    try:
+        with (tar_dir / DATAMULE_INDEX_NAME).open() as f:
+            saved = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(saved, dict) or saved.get('format') != DATAMULE_INDEX_FORMAT:
+        return {}
+    return saved.get('tars', {})
+
+
+def _save_index(tar_dir: Path, tars: Dict[str, Dict[str, Any]]):
+    """Write the index beside the tars. A read-only directory just goes without one."""
+    index_path = tar_dir / DATAMULE_INDEX_NAME
+    temp_path = index_path.with_name(f"{index_path.name}.{os.getpid()}.tmp")
+    try:
+        with temp_path.open('w') as f:
+            json.dump({'format': DATAMULE_INDEX_FORMAT, 'tars': tars}, f, separators=(',', ':'))
+        os.replace(temp_path, index_path)
+    except OSError as e:
+        log.debug("Could not save the datamule index in %s: %s", tar_dir, e)
+        temp_path.unlink(missing_ok=True)
 
 
 def _normalize_accession(accession_no: str) -> str:
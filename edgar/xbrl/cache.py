@@ -0,0 +1,281 @@
+"""
+Persistent cache of parsed XBRL, keyed by accession number.
+
+Filing.xbrl() parses the schema, every linkbase and the instance document each
+time it is called, which for a large 10-K takes seconds even when the documents
+come from the HTTP cache. A filing's XBRL never changes once filed, so the fully
+parsed model (contexts, facts, element catalog, presentation trees, reporting
+periods) is stored on disk and reopening the filing becomes a single load.
+
+Entries are zlib-compressed pickles, one file per accession number, each
+prefixed with a version tag built from the edgartools version and
+XBRL_CACHE_FORMAT. An entry written by any other version is discarded on read,
+so a parser upgrade never serves objects it did not produce. The cache is
+bounded in bytes and evicts the least recently used entries first.
+
+The cache is off unless enabled, either with set_xbrl_cache(XBRLCache()) or by
+setting the EDGAR_XBRL_CACHE environment variable:
+
+    export EDGAR_XBRL_CACHE=1
+    export EDGAR_XBRL_CACHE_MAX_MB=2048   # optional, defaults to 1024
+"""
+
+import io
+import logging
+import os
+import pickle
+import re
+import zlib
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Union
+
+from edgar._disk_cache import DiskLRU
+
+if TYPE_CHECKING:
+    from edgar.sgml import FilingSGML
+    from edgar.xbrl.xbrl import XBRL
+
+log = logging.getLogger(__name__)
+
+__all__ = ['XBRLCache', 'get_xbrl_cache', 'set_xbrl_cache', 'XBRL_CACHE_FORMAT']
+
+# Bump when the shape of the parsed XBRL model changes without an edgartools release
+XBRL_CACHE_FORMAT = 1
+
+ENV_XBRL_CACHE = 'EDGAR_XBRL_CACHE'
+ENV_XBRL_CACHE_MAX_MB = 'EDGAR_XBRL_CACHE_MAX_MB'
+DEFAULT_MAX_SIZE_MB = 1024
+
+_SUFFIX = '.xbrl'
+_FILING_SGML = 'filing_sgml'
+
+
+class _XBRLPickler(pickle.Pickler):
+    """
+    Pickles an XBRL object without the full submission it came from.
+
+    The FilingSummary attached to an XBRL keeps a reference to the filing's SGML,
+    which holds every document in the submission. That is swapped for a
+    placeholder and reconnected on load.
+    """
+
+    def persistent_id(self, obj):
+        from edgar.sgml import FilingSGML
+        if isinstance(obj, (FilingSGML, _DeferredFilingSGML)):
+            return _FILING_SGML
+        return None
+
+
+class _DeferredFilingSGML:
+    """
+    The filing's SGML in an XBRL loaded from the cache, read on first use.
+
+    Reading the SGML can mean downloading the full submission, which a cache hit
+    should only pay for when report content is actually needed.
+    """
+
+    def __init__(self, load_sgml: Callable[[], Optional['FilingSGML']]):
+        self._load_sgml = load_sgml
+        self._sgml = None
+
+    def _resolve(self) -> Optional['FilingSGML']:
+        if self._sgml is None:
+            self._sgml = self._load_sgml()
+        return self._sgml
+
+    def __bool__(self):
+        return self._resolve() is not None
+
+    def __getattr__(self, name):
+        # Dunder lookups (pickle, copy) and our own attributes must not load the SGML
+        if name.startswith('__') or name in ('_load_sgml', '_sgml'):
+            raise AttributeError(name)
+        sgml = self._resolve()
+        if sgml is None:
+            raise AttributeError(name)
+        return getattr(sgml, name)
+
+
+class _XBRLUnpickler(pickle.Unpickler):
+
+    def __init__(self, file, filing_sgml: Union['FilingSGML', Callable[[], Optional['FilingSGML']], None] = None):
+        super().__init__(file)
+        self._filing_sgml = filing_sgml
+
+    def persistent_load(self, pid):
+        if pid == _FILING_SGML:
+            if callable(self._filing_sgml):
+                return _DeferredFilingSGML(self._filing_sgml)
+            return self._filing_sgml
+        raise pickle.UnpicklingError(f"Unknown persistent id {pid!r}")
+
+
+def _default_version() -> str:
+    from edgar.__about__ import __version__
+    return f"{__version__}/{XBRL_CACHE_FORMAT}"
+
+
+class XBRLCache:
+    """
+    On-disk cache of parsed XBRL objects with LRU eviction.
+
+    Parameters:
+        cache_dir: Directory for cache entries (default: <edgar data dir>/xbrl_cache)
+        max_size_mb: Total size the cache may grow to before evicting (default: 1024)
+        version: Version tag entries must carry to be read back (default: edgartools
+                 version and XBRL_CACHE_FORMAT)
+    """
+
+    def __init__(self,
+                 cache_dir: Optional[Union[str, Path]] = None,
+                 max_size_mb: float = DEFAULT_MAX_SIZE_MB,
+                 version: Optional[str] = None):
+        if cache_dir is None:
+            from edgar.settings import get_edgar_data_directory
+            cache_dir = get_edgar_data_directory() / 'xbrl_cache'
+        self.cache_dir = Path(cache_dir)
+        self.version = version or _default_version()
+        self._header = f"EDGARXBRL {self.version}\n".encode()
+        self._files = DiskLRU(self.cache_dir, _SUFFIX, int(max_size_mb * 1024 * 1024), name='XBRL cache')
+
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def max_size_bytes(self) -> int:
+        return self._files.max_size_bytes
+
+    @max_size_bytes.setter
+    def max_size_bytes(self, value: int):
+        self._files.max_size_bytes = value
+
+    def path_for(self, accession_no: str) -> Path:
+        """The cache file for an accession number."""
+        return self.cache_dir / f"{re.sub(r'[^0-9A-Za-z-]', '_', accession_no)}{_SUFFIX}"
+
+    def get(self,
+            accession_no: str,
+            filing_sgml: Union['FilingSGML', Callable[[], Optional['FilingSGML']], None] = None) -> Optional['XBRL']:
+        """
+        Load the parsed XBRL for a filing.
+
+        Args:
+            accession_no: The filing's accession number
+            filing_sgml: The filing's SGML, or a function returning it such as
+                         Filing.sgml, to reconnect to the FilingSummary so report
+                         content stays available. A function is only called when
+                         report content is first read.
+
+        Returns:
+            The XBRL object, or None if it is not cached, is from another version,
+            or cannot be read
+        """
+        path = self.path_for(accession_no)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            self._misses += 1
+            return None
+
+        if not data.startswith(self._header):
+            log.debug("Discarding XBRL cache entry for %s written by another version", accession_no)
+            self._files.delete(path)
+            self._misses += 1
+            return None
+
+        try:
+            payload = zlib.decompress(memoryview(data)[len(self._header):])
+            xbrl = _XBRLUnpickler(io.BytesIO(payload), filing_sgml=filing_sgml).load()
+        except Exception as e:
+            log.warning("Could not read the XBRL cache entry for %s: %s", accession_no, e)
+            self._files.delete(path)
+            self._misses += 1
+            return None
+
+        self._files.touch(path)
+        self._hits += 1
+        return xbrl
+
+    def put(self, accession_no: str, xbrl: 'XBRL') -> None:
+        """Store the parsed XBRL for a filing, then evict down to the size limit."""
+        try:
+            buffer = io.BytesIO()
+            _XBRLPickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(xbrl)
+            data = self._header + zlib.compress(buffer.getbuffer(), 1)
+        except Exception as e:
+            log.warning("Could not serialize XBRL for %s: %s", accession_no, e)
+            return
+
+        try:
+            self._files.write(self.path_for(accession_no), lambda f: f.write(data))
+        except OSError as e:
+            log.warning("Could not write the XBRL cache entry for %s: %s", accession_no, e)
+
+    def __contains__(self, accession_no: str) -> bool:
+        return self.path_for(accession_no).exists()
+
+    def evict(self) -> int:
+        """
+        Delete least recently used entries until the cache fits in max_size_mb.
+
+        Returns:
+            The number of entries deleted
+        """
+        return self._files.evict()
+
+    def clear(self) -> None:
+        """Delete every cache entry."""
+        self._files.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with cache statistics
+        """
+        sizes = self._files.sizes()
+        total_requests = self._hits + self._misses
+        return {
+            "entries": len(sizes),
+            "size_mb": sum(sizes) / (1024 * 1024),
+            "max_size_mb": self.max_size_bytes / (1024 * 1024),
+            "cache_hits": self._hits,
+            "cache_misses": self._misses,
+            "hit_rate": self._hits / total_requests if total_requests > 0 else 0.0,
+            "version": self.version,
+        }
+
+
+# Global cache instance, created from the environment on first use
+_global_cache: Optional[XBRLCache] = None
+_global_cache_configured = False
+
+
+def get_xbrl_cache() -> Optional[XBRLCache]:
+    """
+    Get the global XBRL cache.
+
+    Returns:
+        The XBRLCache set with set_xbrl_cache, or one created on first call when
+        EDGAR_XBRL_CACHE is set. None when the cache is disabled.
+    """
+    global _global_cache, _global_cache_configured
+    if not _global_cache_configured:
+        if os.getenv(ENV_XBRL_CACHE, '').lower() in ('1', 'true', 'yes', 'on'):
+            max_size_mb = float(os.getenv(ENV_XBRL_CACHE_MAX_MB, DEFAULT_MAX_SIZE_MB))
+            _global_cache = XBRLCache(max_size_mb=max_size_mb)
+        _global_cache_configured = True
+    return _global_cache
+
+
+def set_xbrl_cache(cache: Optional[XBRLCache]) -> None:
+    """
+    Set the global XBRL cache.
+
+    Args:
+        cache: Cache instance to use globally (None to disable)
+    """
+    global _global_cache, _global_cache_configured
+    _global_cache = cache
+    _global_cache_configured = True
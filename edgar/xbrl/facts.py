@@ -14,6 +14,7 @@ from decimal import Decimal
 from textwrap import dedent
 from typing import Any, Callable, Dict, List, Optional, Set, Union
 
+import numpy as np
 import pandas as pd
 from rich import box
 from rich.console import Group
@@ -24,6 +25,7 @@ from rich.text import Text
 
 from edgar.richtools import repr_rich
 from edgar.xbrl.core import STANDARD_LABEL, parse_date
+from edgar.xbrl.fact_table import FactTable
 from edgar.xbrl.models import select_display_label
 
 
@@ -145,6 +147,38 @@ def _unit_currency(unit_info: Optional[Dict[str, Any]]) -> Optional[str]:
     return None
 
 
+class _ColumnFilter:
+    """
+    A fact filter with both a row predicate and an equivalent columnar mask.
+
+    FactQuery evaluates the mask against the FactsView's FactTable when one is
+    available, and the row predicate everywhere else (custom fact lists, the
+    stitched query, or a fact set Arrow could not type). Instances are callable
+    on a fact dict so code that iterates ``_filters`` keeps working.
+    """
+    __slots__ = ('row', 'mask')
+
+    def __init__(self, row: Callable[[Dict[str, Any]], bool], mask: Callable[[FactTable], np.ndarray]):
+        self.row = row
+        self.mask = mask
+
+    def __call__(self, fact: Dict[str, Any]) -> bool:
+        return self.row(fact)
+
+
+# Label fields searched by by_label() and by_text(), in the order the row predicates check them
+_LABEL_FIELDS = ('label', 'element_label', 'original_label')
+_TEXT_FIELDS = ('concept', 'label', 'element_label', 'element_name', 'original_label')
+
+
+def _any_mask(table: FactTable, names, predicate: Callable[[Any], bool]) -> np.ndarray:
+    """Rows where any of the named columns satisfies ``predicate``."""
+    mask = table.no_rows()
+    for name in names:
+        mask |= table.match(name, predicate)
+    return mask
+
+
 class FactQuery:
     """
     A query builder for XBRL facts that enables filtering by various attributes.
@@ -186,10 +220,12 @@ class FactQuery:
         """
         pattern = pattern.replace('_', ':')  # Normalize underscores to colons for concept names
         if exact:
-            self._filters.append(lambda f: f['concept'] == pattern)
+            self._filters.append(_ColumnFilter(lambda f: f['concept'] == pattern,
+                                               lambda t: t.equals('concept', pattern)))
         else:
             regex = re.compile(pattern, re.IGNORECASE)
-            self._filters.append(lambda f: bool(regex.search(f['concept'])))
+            self._filters.append(_ColumnFilter(lambda f: bool(regex.search(f['concept'])),
+                                               lambda t: t.match('concept', lambda v: bool(regex.search(v)))))
         return self
 
     def by_label(self, pattern: str, exact: bool = False) -> FactQuery:
@@ -209,23 +245,27 @@ class FactQuery:
         """
         if exact:
             # Try multiple label fields with exact matching
-            self._filters.append(lambda f:
-                                 ('label' in f and f['label'] == pattern) or
-                                 ('element_label' in f and f['element_label'] == pattern) or
-                                 # Also check original_label (present when standardization has been applied)
-                                 ('original_label' in f and f['original_label'] == pattern)
-                                 )
+            self._filters.append(_ColumnFilter(
+                lambda f:
+                ('label' in f and f['label'] == pattern) or
+                ('element_label' in f and f['element_label'] == pattern) or
+                # Also check original_label (present when standardization has been applied)
+                ('original_label' in f and f['original_label'] == pattern),
+                lambda t: _any_mask(t, _LABEL_FIELDS, lambda v: v == pattern)
+            ))
         else:
             # Use regex pattern matching across multiple label fields
             regex = re.compile(pattern, re.IGNORECASE)
-            self._filters.append(lambda f:
-                                 ('label' in f and f['label'] is not None and bool(regex.search(str(f['label'])))) or
-                                 ('element_label' in f and f['element_label'] is not None and
-                                  bool(regex.search(str(f['element_label'])))) or
-                                 # Also check original_label with regex
-                                 ('original_label' in f and f['original_label'] is not None and
-                                  bool(regex.search(str(f['original_label']))))
-                                 )
+            self._filters.append(_ColumnFilter(
+                lambda f:
+                ('label' in f and f['label'] is not None and bool(regex.search(str(f['label'])))) or
+                ('element_label' in f and f['element_label'] is not None and
+                 bool(regex.search(str(f['element_label'])))) or
+                # Also check original_label with regex
+                ('original_label' in f and f['original_label'] is not None and
+                 bool(regex.search(str(f['original_label'])))),
+                lambda t: _any_mask(t, _LABEL_FIELDS, lambda v: bool(regex.search(str(v))))
+            ))
         return self
 
     def by_value(self, value_filter: Union[Callable, str, int, float, list, tuple]) -> FactQuery:
@@ -242,28 +282,24 @@ class FactQuery:
             Self for method chaining
         """
         if callable(value_filter):
-            def numeric_value_filter(f):
-                return ('numeric_value' in f and
-                        f['numeric_value'] is not None and
-                        value_filter(f['numeric_value']))
-
-            self._filters.append(numeric_value_filter)
+            predicate = value_filter
         elif isinstance(value_filter, (list, tuple)) and len(value_filter) == 2:
             min_val, max_val = value_filter
 
-            def numeric_range_filter(f):
-                return ('numeric_value' in f and
-                        f['numeric_value'] is not None and
-                        min_val <= f['numeric_value'] <= max_val)
-
-            self._filters.append(numeric_range_filter)
+            def predicate(value):
+                return min_val <= value <= max_val
         else:
-            def numeric_equality_filter(f):
-                return ('numeric_value' in f and
-                        f['numeric_value'] is not None and
-                        f['numeric_value'] == value_filter)
+            def predicate(value):
+                return value == value_filter
 
-            self._filters.append(numeric_equality_filter)
+        def numeric_value_filter(f):
+            return ('numeric_value' in f and
+                    f['numeric_value'] is not None and
+                    predicate(f['numeric_value']))
+
+        # The predicate runs once per distinct value rather than once per fact
+        self._filters.append(_ColumnFilter(numeric_value_filter,
+                                           lambda t: t.match('numeric_value', predicate)))
         return self
 
     def by_period_type(self, period_type: str) -> FactQuery:
@@ -280,7 +316,8 @@ class FactQuery:
         def period_type_filter(f):
             return 'period_type' in f and f['period_type'] == period_type
 
-        self._filters.append(period_type_filter)
+        self._filters.append(_ColumnFilter(period_type_filter,
+                                           lambda t: t.match('period_type', lambda v: v == period_type)))
         return self
 
     def by_period_key(self, period_key: str) -> FactQuery:
@@ -293,7 +330,8 @@ class FactQuery:
         Returns:
             Self for method chaining
         """
-        self._filters.append(lambda f: 'period_key' in f and f['period_key'] == period_key)
+        self._filters.append(_ColumnFilter(lambda f: 'period_key' in f and f['period_key'] == period_key,
+                                           lambda t: t.match('period_key', lambda v: v == period_key)))
         return self
 
     def by_period_keys(self, period_keys: List[str]) -> FactQuery:
@@ -306,7 +344,8 @@ class FactQuery:
         Returns:
             Self for method chaining
         """
-        self._filters.append(lambda f: 'period_key' in f and f['period_key'] in period_keys)
+        self._filters.append(_ColumnFilter(lambda f: 'period_key' in f and f['period_key'] in period_keys,
+                                           lambda t: t.isin('period_key', period_keys)))
         return self
 
     def by_instant_date(self, date_str: str, exact: bool = True) -> FactQuery:
@@ -321,11 +360,14 @@ class FactQuery:
             Self for method chaining
         """
         if exact:
-            self._filters.append(lambda f: 'period_instant' in f and f['period_instant'] == date_str)
+            self._filters.append(_ColumnFilter(lambda f: 'period_instant' in f and f['period_instant'] == date_str,
+                                               lambda t: t.match('period_instant', lambda v: v == date_str)))
         else:
             date_obj = parse_date(date_str)
-            self._filters.append(lambda f: 'period_instant' in f and
-                                           parse_date(f['period_instant']) <= date_obj)
+            self._filters.append(_ColumnFilter(lambda f: 'period_instant' in f and
+                                                         parse_date(f['period_instant']) <= date_obj,
+                                               lambda t: t.match('period_instant',
+                                                                 lambda v: parse_date(v) <= date_obj)))
         return self
 
     def by_date_range(self, start_date: Optional[str] = None,
@@ -342,42 +384,34 @@ class FactQuery:
         Returns:
             Self for method chaining
         """
-        if start_date and end_date:
-            start_obj = parse_date(start_date)
-            end_obj = parse_date(end_date)
-            if exact:
-                self._filters.append(lambda f:
-                                     ('period_start' in f and 'period_end' in f and
-                                      parse_date(f['period_start']) == start_obj and
-                                      parse_date(f['period_end']) == end_obj))
-            else:
-                # Match duration facts that fall within the date range
-                self._filters.append(lambda f:
-                                     ('period_start' in f and 'period_end' in f and
-                                      parse_date(f['period_start']) >= start_obj and
-                                      parse_date(f['period_end']) <= end_obj))
-        elif start_date:
+        # Duration facts that fall within the range: start on or after start_date,
+        # end on or before end_date (or on those exact dates when exact=True)
+        bounds = []
+        if start_date:
             start_obj = parse_date(start_date)
             if exact:
-                self._filters.append(lambda f:
-                                     ('period_start' in f and
-                                      parse_date(f['period_start']) == start_obj))
+                bounds.append(('period_start', lambda v: parse_date(v) == start_obj))
             else:
-                # Match duration facts that start on or after start_date
-                self._filters.append(lambda f:
-                                     ('period_start' in f and
-                                      parse_date(f['period_start']) >= start_obj))
-        elif end_date:
+                bounds.append(('period_start', lambda v: parse_date(v) >= start_obj))
+        if end_date:
             end_obj = parse_date(end_date)
             if exact:
-                self._filters.append(lambda f:
-                                     ('period_end' in f and
-                                      parse_date(f['period_end']) == end_obj))
+                bounds.append(('period_end', lambda v: parse_date(v) == end_obj))
             else:
-                # Match duration facts that end on or before end_date
-                self._filters.append(lambda f:
-                                     ('period_end' in f and
-                                      parse_date(f['period_end']) <= end_obj))
+                bounds.append(('period_end', lambda v: parse_date(v) <= end_obj))
+        if not bounds:
+            return self
+
+        def date_range_filter(f):
+            return all(name in f for name, _ in bounds) and all(check(f[name]) for name, check in bounds)
+
+        def date_range_mask(t):
+            mask = t.all_rows()
+            for name, check in bounds:
+                mask &= t.match(name, check)
+            return mask
+
+        self._filters.append(_ColumnFilter(date_range_filter, date_range_mask))
         return self
 
     def by_dimension(self, dimension: Optional[str], value: Optional[str] = None) -> FactQuery:
@@ -405,7 +439,14 @@ class FactQuery:
         """
         if dimension is None:
             # Filter for facts with no dimensions
-            self._filters.append(lambda f: not any(key.startswith('dim_') for key in f.keys()))
+            def undimensioned_mask(t):
+                mask = t.all_rows()
+                for dim_key in t.dimension_columns:
+                    mask &= t.is_null(dim_key)
+                return mask
+
+            self._filters.append(_ColumnFilter(lambda f: not any(key.startswith('dim_') for key in f.keys()),
+                                               undimensioned_mask))
             return self
 
         # GH-574: When filtering by dimension, automatically include dimension columns in output
@@ -417,6 +458,11 @@ class FactQuery:
 
         # Normalize the input dimension to match stored format
         normalized_dim = self._normalize_dimension_key(dimension)
+        exact_key = f'dim_{normalized_dim}'
+
+        def matching_dimension_columns(t):
+            return [dim_key for dim_key in t.dimension_columns
+                    if dim_key == exact_key or self._dimension_key_matches(dim_key, dimension)]
 
         if value is not None:
             # Normalize the value as well
@@ -439,7 +485,14 @@ class FactQuery:
                             return True
                 return False
 
-            self._filters.append(dimension_filter_with_value)
+            def dimension_mask_with_value(t):
+                mask = t.no_rows()
+                for dim_key in matching_dimension_columns(t):
+                    mask |= t.match(dim_key, lambda v: v == normalized_value or
+                                    self._dimension_value_matches(v, value))
+                return mask
+
+            self._filters.append(_ColumnFilter(dimension_filter_with_value, dimension_mask_with_value))
         else:
             # Filter for facts that have this dimension (any value)
             def dimension_filter_exists(f):
@@ -453,7 +506,13 @@ class FactQuery:
                         return True
                 return False
 
-            self._filters.append(dimension_filter_exists)
+            def dimension_mask_exists(t):
+                mask = t.no_rows()
+                for dim_key in matching_dimension_columns(t):
+                    mask |= t.not_null(dim_key)
+                return mask
+
+            self._filters.append(_ColumnFilter(dimension_filter_exists, dimension_mask_exists))
 
         return self
 
@@ -642,7 +701,8 @@ class FactQuery:
         Returns:
             Self for method chaining
         """
-        self._filters.append(lambda f: 'statement_type' in f and f['statement_type'] == statement_type)
+        self._filters.append(_ColumnFilter(lambda f: 'statement_type' in f and f['statement_type'] == statement_type,
+                                           lambda t: t.match('statement_type', lambda v: v == statement_type)))
         return self
 
     def by_fiscal_period(self, fiscal_period: str) -> FactQuery:
@@ -655,7 +715,8 @@ class FactQuery:
         Returns:
             Self for method chaining
         """
-        self._filters.append(lambda f: 'fiscal_period' in f and f['fiscal_period'] == fiscal_period)
+        self._filters.append(_ColumnFilter(lambda f: 'fiscal_period' in f and f['fiscal_period'] == fiscal_period,
+                                           lambda t: t.match('fiscal_period', lambda v: v == fiscal_period)))
         return self
 
     def by_fiscal_year(self, fiscal_year: Union[int, str]) -> FactQuery:
@@ -668,7 +729,8 @@ class FactQuery:
         Returns:
             Self for method chaining
         """
-        self._filters.append(lambda f: 'fiscal_year' in f and str(f['fiscal_year']) == str(fiscal_year))
+        self._filters.append(_ColumnFilter(lambda f: 'fiscal_year' in f and str(f['fiscal_year']) == str(fiscal_year),
+                                           lambda t: t.match('fiscal_year', lambda v: str(v) == str(fiscal_year))))
         return self
 
     def by_unit(self, unit: str) -> FactQuery:
@@ -681,7 +743,8 @@ class FactQuery:
         Returns:
             Self for method chaining
         """
-        self._filters.append(lambda f: 'unit_ref' in f and f['unit_ref'] == unit)
+        self._filters.append(_ColumnFilter(lambda f: 'unit_ref' in f and f['unit_ref'] == unit,
+                                           lambda t: t.match('unit_ref', lambda v: v == unit)))
         return self
 
     def by_custom(self, filter_func: Callable) -> FactQuery:
@@ -735,7 +798,8 @@ class FactQuery:
 
             return False
 
-        self._filters.append(text_filter)
+        self._filters.append(_ColumnFilter(text_filter,
+                                           lambda t: _any_mask(t, _TEXT_FIELDS, lambda v: bool(regex.search(str(v))))))
         return self
 
     def with_dimensions(self) -> 'FactQuery':
@@ -817,7 +881,8 @@ class FactQuery:
             Self for method chaining
         """
         self._statement_type = statement_type
-        self._filters.append(lambda f: f.get('statement_type') == statement_type)
+        self._filters.append(_ColumnFilter(lambda f: f.get('statement_type') == statement_type,
+                                           lambda t: t.equals('statement_type', statement_type)))
         return self
 
     def transform(self, transform_fn: Callable[[Any], Any]) -> 'FactQuery':
@@ -875,11 +940,15 @@ class FactQuery:
         Returns:
             List of fact dictionaries
         """
-        results = self._facts_view.get_facts()
-
-        # Apply filters
-        for filter_func in self._filters:
-            results = [f for f in results if filter_func(f)]
+        facts = self._facts_view.get_facts()
+        rows = self._matching_rows(facts)
+        if rows is None:
+            results = facts
+            # Apply filters
+            for filter_func in self._filters:
+                results = [f for f in results if filter_func(f)]
+        else:
+            results = [facts[i] for i in rows]
 
         # Apply transformations
         for transform_fn in self._transformations:
@@ -928,6 +997,50 @@ class FactQuery:
 
         return results
 
+    def _fact_table(self) -> Optional[FactTable]:
+        """The columnar store of the facts view, if it has one."""
+        fact_table = getattr(self._facts_view, 'fact_table', None)
+        return fact_table if isinstance(fact_table, FactTable) else None
+
+    def _matching_rows(self, facts: List[Dict[str, Any]]) -> Optional[np.ndarray]:
+        """
+        Row indices into ``facts`` that pass every filter, or None without a fact table.
+
+        Column filters are combined as one vectorized mask over the FactTable;
+        only the remaining plain callables (by_custom and the like) are evaluated
+        per fact, and only on the rows the mask kept.
+        """
+        fact_table = self._fact_table()
+        if fact_table is None or len(fact_table) != len(facts):
+            return None
+
+        mask = fact_table.all_rows()
+        row_filters = []
+        for filter_func in self._filters:
+            if isinstance(filter_func, _ColumnFilter):
+                mask &= filter_func.mask(fact_table)
+            else:
+                row_filters.append(filter_func)
+
+        rows = np.flatnonzero(mask)
+        for filter_func in row_filters:
+            keep = np.fromiter((bool(filter_func(facts[i])) for i in rows), dtype=bool, count=len(rows))
+            rows = rows[keep]
+        return rows
+
+    def _columnar_rows(self) -> Optional[np.ndarray]:
+        """
+        The rows to_dataframe() should emit when it can read them straight from the
+        fact table: no transformations, aggregations or sorting, which all operate
+        on the fact dicts.
+        """
+        if self._transformations or self._aggregations or self._sort_by:
+            return None
+        rows = self._matching_rows(self._facts_view.get_facts())
+        if rows is not None and self._limit is not None:
+            rows = rows[:self._limit]
+        return rows
+
     def _declared_columns(self) -> Dict[str, Any]:
         """The column -> dtype mapping this query's *configuration* declares.
 
@@ -964,9 +1077,10 @@ class FactQuery:
         cache = getattr(self, '_df_cache', {})
         if cache_key in cache:
             return cache[cache_key]
-        results = self.execute()
+        rows = self._columnar_rows()
+        results = self.execute() if rows is None else rows
 
-        if not results:
+        if len(results) == 0:
             # Zero rows, but the declared columns and their dtypes. A bare
             # DataFrame() has no columns at all, so df['decimals'] raised
             # KeyError on an empty result instead of yielding an empty column.
@@ -975,7 +1089,10 @@ class FactQuery:
             return pd.DataFrame({name: _null_column(declared[name], pd.RangeIndex(0))
                                  for name in names})
 
-        df = pd.DataFrame(results)
+        if rows is None:
+            df = pd.DataFrame(results)
+        else:
+            df = self._fact_table().to_pandas(rows)
         df = _deduplicate_facts(df)
 
         # GH-607: When a specific dimension was requested via by_dimension(),
@@ -1098,6 +1215,8 @@ class FactsView:
         self.xbrl = xbrl
         self._facts_cache = None
         self._facts_df_cache = None
+        self._fact_table = None
+        self._fact_table_built = False
 
     def __len__(self):
         return len(self.get_facts())
@@ -1386,6 +1505,20 @@ class FactsView:
         self._facts_cache = enriched_facts
         return self._facts_cache
 
+    @property
+    def fact_table(self) -> Optional[FactTable]:
+        """
+        The facts as a columnar FactTable, built once from get_facts().
+
+        FactQuery filters compile to vectorized masks over this table. None when
+        the facts could not be stored columnar, in which case queries scan the
+        fact dicts instead.
+        """
+        if not self._fact_table_built:
+            self._fact_table = FactTable.from_facts(self.get_facts())
+            self._fact_table_built = True
+        return self._fact_table
+
     def query(self) -> FactQuery:
         """
         Start building a query against facts.
@@ -1405,8 +1538,11 @@ class FactsView:
         if self._facts_df_cache is not None:
             return self._facts_df_cache
 
-        facts = self.get_facts()
-        df = pd.DataFrame(facts)
+        fact_table = self.fact_table
+        if fact_table is not None and len(fact_table):
+            df = fact_table.to_pandas()
+        else:
+            df = pd.DataFrame(self.get_facts())
         df = _deduplicate_facts(df)
         self._facts_df_cache = df
         return df
@@ -1893,6 +2029,8 @@ class FactsView:
         """Clear cached data."""
         self._facts_cache = None
         self._facts_df_cache = None
+        self._fact_table = None
+        self._fact_table_built = False
 
     def __str__(self):
         return f"Facts for {self.xbrl}"
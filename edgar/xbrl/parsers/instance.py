@@ -3,11 +3,20 @@ Instance parser for XBRL documents.
 
 This module handles parsing of XBRL instance documents including facts, contexts,
 units, footnotes, and entity information extraction.
+
+Instance documents are normally parsed into a full lxml tree. Very large ones
+(100MB+ for big insurers and ETF trusts) are instead streamed with iterparse:
+each top-level element is processed as soon as it is complete and then cleared,
+so peak memory is bounded by the largest single element rather than several
+times the file size. Both paths produce the same contexts, units, facts and
+footnotes.
 """
 
+import io
+import os
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Union, Optional
+from typing import Any, BinaryIO, Dict, List, Optional, Set, Tuple, Union
 
 from lxml import etree as ET
 
@@ -17,6 +26,13 @@ from edgar.xbrl.models import Context, Fact, XBRLProcessingError
 
 from .base import BaseParser
 
+# Instance documents at least this large are parsed with iterparse instead of a full tree
+STREAMING_THRESHOLD_BYTES = 50 * 1024 * 1024
+
+_CONTEXT_TAG = '{http://www.xbrl.org/2003/instance}context'
+_UNIT_TAG = '{http://www.xbrl.org/2003/instance}unit'
+_FOOTNOTE_LINK_TAG = '{http://www.xbrl.org/2003/linkbase}footnoteLink'
+
 
 class InstanceParser(BaseParser):
     """Parser for XBRL instance documents."""
@@ -73,16 +89,42 @@ class InstanceParser(BaseParser):
             return f"{normalized_element_id}_{context_ref}_{instance_id}"
         return f"{normalized_element_id}_{context_ref}"
 
-    def parse_instance(self, file_path: Union[str, Path]) -> None:
-        """Parse instance document file and extract contexts, facts, and units."""
+    def parse_instance(self, file_path: Union[str, Path], streaming: Optional[bool] = None) -> None:
+        """
+        Parse instance document file and extract contexts, facts, and units.
+
+        Args:
+            file_path: Path to the instance document
+            streaming: Stream the file with iterparse instead of building a full tree.
+                       By default, files of STREAMING_THRESHOLD_BYTES or more are streamed.
+        """
         try:
-            content = Path(file_path).read_text()
-            self.parse_instance_content(content)
+            if streaming is None:
+                streaming = os.path.getsize(file_path) >= STREAMING_THRESHOLD_BYTES
+            if streaming:
+                self.parse_instance_stream(file_path)
+            else:
+                content = Path(file_path).read_text()
+                self.parse_instance_content(content)
         except Exception as e:
             raise XBRLProcessingError(f"Error parsing instance file {file_path}: {str(e)}") from e
 
-    def parse_instance_content(self, content: str) -> None:
-        """Parse instance document content and extract contexts, facts, and units."""
+    def parse_instance_content(self, content: Union[str, bytes], streaming: Optional[bool] = None) -> None:
+        """
+        Parse instance document content and extract contexts, facts, and units.
+
+        Args:
+            content: The instance document
+            streaming: Parse with iterparse instead of building a full tree.
+                       By default, content of STREAMING_THRESHOLD_BYTES or more is streamed.
+        """
+        if streaming is None:
+            streaming = len(content) >= STREAMING_THRESHOLD_BYTES
+        if streaming:
+            content_bytes = content.encode('utf-8') if isinstance(content, str) else content
+            self.parse_instance_stream(io.BytesIO(content_bytes))
+            return
+
         try:
             # Use lxml's optimized parser with smart string handling and recovery mode
             parser = ET.XMLParser(remove_blank_text=True, recover=True, huge_tree=True)
@@ -110,6 +152,69 @@ class InstanceParser(BaseParser):
         except Exception as e:
             raise XBRLProcessingError(f"Error parsing instance content: {str(e)}") from e
 
+    def parse_instance_stream(self, source: Union[str, Path, BinaryIO]) -> None:
+        """
+        Parse an instance document incrementally with iterparse.
+
+        Each child of the root element is processed once it has been read in full
+        and is then discarded, so the whole tree is never held in memory. The
+        contexts, units, facts and footnotes extracted are the same as
+        parse_instance_content produces.
+
+        Args:
+            source: Path to the instance document, or a binary file object
+        """
+        try:
+            if isinstance(source, Path):
+                source = str(source)
+            events = ET.iterparse(source, events=('start', 'end'),
+                                  remove_blank_text=True, recover=True, huge_tree=True)
+            root = None
+            collector = None
+            footnote_arcs: List[Tuple[str, str]] = []
+            undefined_footnotes: Set[str] = set()
+            depth = 0
+            for event, element in events:
+                if event == 'start':
+                    if root is None:
+                        root = element
+                        collector = _FactCollector(self, self._namespace_prefixes(root))
+                    depth += 1
+                    continue
+
+                depth -= 1
+                if depth != 1:
+                    continue
+
+                # A top-level element is complete: take what it holds, then drop it
+                for context_elem in element.iter(_CONTEXT_TAG):
+                    self._extract_context(context_elem)
+                for unit_elem in element.iter(_UNIT_TAG):
+                    self._extract_unit(unit_elem)
+                collector.add_subtree(element)
+                try:
+                    for footnote_link in element.iter(_FOOTNOTE_LINK_TAG):
+                        footnote_arcs.extend(self._extract_footnote_link(footnote_link, undefined_footnotes))
+                except Exception as e:
+                    log.warning(f"Error extracting footnotes: {str(e)}")
+
+                element.clear()
+                while element.getprevious() is not None:
+                    del root[0]
+
+            if collector is not None:
+                collector.finish()
+            try:
+                self._link_footnotes(footnote_arcs, undefined_footnotes)
+            except Exception as e:
+                log.warning(f"Error extracting footnotes: {str(e)}")
+
+            self._extract_entity_info()
+            self._build_reporting_periods()
+
+        except Exception as e:
+            raise XBRLProcessingError(f"Error parsing instance content: {str(e)}") from e
+
     def count_facts(self, content: str) -> tuple:
         """Count the number of facts in the instance document
         This function counts both unique facts and total fact instances in the XBRL document.
@@ -212,285 +317,171 @@ class InstanceParser(BaseParser):
         try:
             # Find all context elements
             for context_elem in root.findall('.//{http://www.xbrl.org/2003/instance}context'):
-                context_id = context_elem.get('id')
-                if not context_id:
-                    continue
-
-                # Create context object
-                context = Context(context_id=context_id)
-
-                # Extract entity information
-                entity_elem = context_elem.find('.//{http://www.xbrl.org/2003/instance}entity')
-                if entity_elem is not None:
-                    # Get identifier
-                    identifier_elem = entity_elem.find('.//{http://www.xbrl.org/2003/instance}identifier')
-                    if identifier_elem is not None:
-                        scheme = identifier_elem.get('scheme', '')
-                        identifier = identifier_elem.text
-                        context.entity = {
-                            'scheme': scheme,
-                            'identifier': identifier
-                        }
-
-                    # Get segment dimensions if present
-                    segment_elem = entity_elem.find('.//{http://www.xbrl.org/2003/instance}segment')
-                    if segment_elem is not None:
-                        # Extract explicit dimensions
-                        for dim_elem in segment_elem.findall('.//{http://xbrl.org/2006/xbrldi}explicitMember'):
-                            dimension = dim_elem.get('dimension')
-                            value = dim_elem.text
-                            if dimension and value:
-                                context.dimensions[dimension] = value
-
-                        # Extract typed dimensions
-                        for dim_elem in segment_elem.findall('.//{http://xbrl.org/2006/xbrldi}typedMember'):
-                            dimension = dim_elem.get('dimension')
-                            if dimension:
-                                # The typed dimension value is the text content of the first child element
-                                for child in dim_elem:
-                                    # Extract the text content, which contains the actual typed member value
-                                    if child.text and child.text.strip():
-                                        context.dimensions[dimension] = child.text.strip()
-                                    else:
-                                        # Fallback to tag if no text content
-                                        context.dimensions[dimension] = child.tag
-                                    break
-
-                # Extract period information
-                period_elem = context_elem.find('.//{http://www.xbrl.org/2003/instance}period')
-                if period_elem is not None:
-                    # Check for instant period
-                    instant_elem = period_elem.find('.//{http://www.xbrl.org/2003/instance}instant')
-                    if instant_elem is not None and instant_elem.text:
-                        context.period = {
-                            'type': 'instant',
-                            'instant': instant_elem.text
-                        }
-
-                    # Check for duration period
-                    start_elem = period_elem.find('.//{http://www.xbrl.org/2003/instance}startDate')
-                    end_elem = period_elem.find('.//{http://www.xbrl.org/2003/instance}endDate')
-                    if start_elem is not None and end_elem is not None and start_elem.text and end_elem.text:
-                        context.period = {
-                            'type': 'duration',
-                            'startDate': start_elem.text,
-                            'endDate': end_elem.text
-                        }
-
-                    # Check for forever period
-                    forever_elem = period_elem.find('.//{http://www.xbrl.org/2003/instance}forever')
-                    if forever_elem is not None:
-                        context.period = {
-                            'type': 'forever'
-                        }
-
-                # Add context to registry
-                self.contexts[context_id] = context
+                self._extract_context(context_elem)
 
         except Exception as e:
             raise XBRLProcessingError(f"Error extracting contexts: {str(e)}") from e
 
+    def _extract_context(self, context_elem: ET.Element) -> None:
+        """Extract a single context element into the contexts registry."""
+        context_id = context_elem.get('id')
+        if not context_id:
+            return
+
+        # Create context object
+        context = Context(context_id=context_id)
+
+        # Extract entity information
+        entity_elem = context_elem.find('.//{http://www.xbrl.org/2003/instance}entity')
+        if entity_elem is not None:
+            # Get identifier
+            identifier_elem = entity_elem.find('.//{http://www.xbrl.org/2003/instance}identifier')
+            if identifier_elem is not None:
+                scheme = identifier_elem.get('scheme', '')
+                identifier = identifier_elem.text
+                context.entity = {
+                    'scheme': scheme,
+                    'identifier': identifier
+                }
+
+            # Get segment dimensions if present
+            segment_elem = entity_elem.find('.//{http://www.xbrl.org/2003/instance}segment')
+            if segment_elem is not None:
+                # Extract explicit dimensions
+                for dim_elem in segment_elem.findall('.//{http://xbrl.org/2006/xbrldi}explicitMember'):
+                    dimension = dim_elem.get('dimension')
+                    value = dim_elem.text
+                    if dimension and value:
+                        context.dimensions[dimension] = value
+
+                # Extract typed dimensions
+                for dim_elem in segment_elem.findall('.//{http://xbrl.org/2006/xbrldi}typedMember'):
+                    dimension = dim_elem.get('dimension')
+                    if dimension:
+                        # The typed dimension value is the text content of the first child element
+                        for child in dim_elem:
+                            # Extract the text content, which contains the actual typed member value
+                            if child.text and child.text.strip():
+                                context.dimensions[dimension] = child.text.strip()
+                            else:
+                                # Fallback to tag if no text content
+                                context.dimensions[dimension] = child.tag
+                            break
+
+        # Extract period information
+        period_elem = context_elem.find('.//{http://www.xbrl.org/2003/instance}period')
+        if period_elem is not None:
+            # Check for instant period
+            instant_elem = period_elem.find('.//{http://www.xbrl.org/2003/instance}instant')
+            if instant_elem is not None and instant_elem.text:
+                context.period = {
+                    'type': 'instant',
+                    'instant': instant_elem.text
+                }
+
+            # Check for duration period
+            start_elem = period_elem.find('.//{http://www.xbrl.org/2003/instance}startDate')
+            end_elem = period_elem.find('.//{http://www.xbrl.org/2003/instance}endDate')
+            if start_elem is not None and end_elem is not None and start_elem.text and end_elem.text:
+                context.period = {
+                    'type': 'duration',
+                    'startDate': start_elem.text,
+                    'endDate': end_elem.text
+                }
+
+            # Check for forever period
+            forever_elem = period_elem.find('.//{http://www.xbrl.org/2003/instance}forever')
+            if forever_elem is not None:
+                context.period = {
+                    'type': 'forever'
+                }
+
+        # Add context to registry
+        self.contexts[context_id] = context
+
     def _extract_units(self, root: ET.Element) -> None:
         """Extract units from instance document."""
         try:
             # Find all unit elements
             for unit_elem in root.findall('.//{http://www.xbrl.org/2003/instance}unit'):
-                unit_id = unit_elem.get('id')
-                if not unit_id:
-                    continue
-
-                # Check for measure
-                measure_elem = unit_elem.find('.//{http://www.xbrl.org/2003/instance}measure')
-                if measure_elem is not None and measure_elem.text:
-                    self.units[unit_id] = {
-                        'type': 'simple',
-                        'measure': measure_elem.text
-                    }
-                    continue
-
-                # Check for divide
-                divide_elem = unit_elem.find('.//{http://www.xbrl.org/2003/instance}divide')
-                if divide_elem is not None:
-                    # Get numerator
-                    numerator_elem = divide_elem.find('.//{http://www.xbrl.org/2003/instance}unitNumerator')
-                    denominator_elem = divide_elem.find('.//{http://www.xbrl.org/2003/instance}unitDenominator')
-
-                    if numerator_elem is not None and denominator_elem is not None:
-                        # Get measures
-                        numerator_measures = [elem.text for elem in numerator_elem.findall('.//{http://www.xbrl.org/2003/instance}measure') if elem.text]
-                        denominator_measures = [elem.text for elem in denominator_elem.findall('.//{http://www.xbrl.org/2003/instance}measure') if elem.text]
-
-                        self.units[unit_id] = {
-                            'type': 'divide',
-                            'numerator': numerator_measures,
-                            'denominator': denominator_measures
-                        }
+                self._extract_unit(unit_elem)
 
         except Exception as e:
             raise XBRLProcessingError(f"Error extracting units: {str(e)}") from e
 
-    def _extract_facts(self, root: ET.Element) -> None:
-        """Extract facts from instance document."""
-        try:
-            # Get direct access to nsmap if using lxml (much faster than regex extraction)
-            if hasattr(root, 'nsmap'):
-                # Leverage lxml's native nsmap functionality
-                prefix_map = {uri: prefix for prefix, uri in root.nsmap.items() if prefix is not None}
-            else:
-                # Fallback for ElementTree - precompile regex patterns for namespace extraction
-                xmlns_pattern = '{http://www.w3.org/2000/xmlns/}'
-                prefix_map = {}
-
-                # Extract namespace declarations from root
-                for attr_name, attr_value in root.attrib.items():
-                    if attr_name.startswith(xmlns_pattern) or attr_name.startswith('xmlns:'):
-                        # Extract the prefix more efficiently
-                        if attr_name.startswith(xmlns_pattern):
-                            prefix = attr_name[len(xmlns_pattern):]
-                        else:
-                            prefix = attr_name.split(':', 1)[1]
-                        prefix_map[attr_value] = prefix
-
-            # Initialize counters and tracking
-            fact_count = 0
-            facts_dict = {}
-            base_keys = {}
-
-            # Fast path to identify non-fact elements to skip - compile as set for O(1) lookup
-            skip_tag_endings = {
-                'schemaRef',
-                'roleRef',
-                'arcroleRef',
-                'linkbaseRef',
-                'context',
-                'unit'
+    def _extract_unit(self, unit_elem: ET.Element) -> None:
+        """Extract a single unit element into the units registry."""
+        unit_id = unit_elem.get('id')
+        if not unit_id:
+            return
+
+        # Check for measure
+        measure_elem = unit_elem.find('.//{http://www.xbrl.org/2003/instance}measure')
+        if measure_elem is not None and measure_elem.text:
+            self.units[unit_id] = {
+                'type': 'simple',
+                'measure': measure_elem.text
             }
-
-            def process_element(element):
-                """Process a single element as a potential fact."""
-                nonlocal fact_count
-
-                # Skip annotation nodes and other non element nodes
-                if not ET.iselement(element):
-                    return
-                # Skip known non-fact elements - faster check with set membership
-                # If the tag is not a string, try calling () to get the string value (in rare cases)
-                if callable(element.tag):
-                    if isinstance(element, ET._Comment):
-                        return
-                    if not element.values():
-                        return
-                tag = element.tag
-                for ending in skip_tag_endings:
-                    if tag.endswith(ending):
-                        return
-
-                # Get context reference - key check to identify facts
-                context_ref = element.get('contextRef')
-                if not context_ref:
-                    return
-
-                # Get fact ID if present (for footnote linkage)
-                fact_id = element.get('id')
-
-                # Extract element namespace and name - optimized split
-                if '}' in tag:
-                    namespace, element_name = tag.split('}', 1)
-                    namespace = namespace[1:]  # Faster than strip('{')
-
-                    # Try to extract prefix from the namespace
-                    prefix = prefix_map.get(namespace)
-                    if not prefix:
-                        parts = namespace.split('/')
-                        prefix = parts[-1] if parts else ''
+            return
+
+        # Check for divide
+        divide_elem = unit_elem.find('.//{http://www.xbrl.org/2003/instance}divide')
+        if divide_elem is not None:
+            # Get numerator
+            numerator_elem = divide_elem.find('.//{http://www.xbrl.org/2003/instance}unitNumerator')
+            denominator_elem = divide_elem.find('.//{http://www.xbrl.org/2003/instance}unitDenominator')
+
+            if numerator_elem is not None and denominator_elem is not None:
+                # Get measures
+                numerator_measures = [elem.text for elem in numerator_elem.findall('.//{http://www.xbrl.org/2003/instance}measure') if elem.text]
+                denominator_measures = [elem.text for elem in denominator_elem.findall('.//{http://www.xbrl.org/2003/instance}measure') if elem.text]
+
+                self.units[unit_id] = {
+                    'type': 'divide',
+                    'numerator': numerator_measures,
+                    'denominator': denominator_measures
+                }
+
+    @staticmethod
+    def _namespace_prefixes(root: ET.Element) -> Dict[str, str]:
+        """Map the namespace URIs declared on the root element to their prefixes."""
+        # Get direct access to nsmap if using lxml (much faster than regex extraction)
+        if hasattr(root, 'nsmap'):
+            # Leverage lxml's native nsmap functionality
+            return {uri: prefix for prefix, uri in root.nsmap.items() if prefix is not None}
+
+        # Fallback for ElementTree - precompile regex patterns for namespace extraction
+        xmlns_pattern = '{http://www.w3.org/2000/xmlns/}'
+        prefix_map = {}
+
+        # Extract namespace declarations from root
+        for attr_name, attr_value in root.attrib.items():
+            if attr_name.startswith(xmlns_pattern) or attr_name.startswith('xmlns:'):
+                # Extract the prefix more efficiently
+                if attr_name.startswith(xmlns_pattern):
+                    prefix = attr_name[len(xmlns_pattern):]
                 else:
-                    element_name = tag
-                    prefix = ''
+                    prefix = attr_name.split(':', 1)[1]
+                prefix_map[attr_value] = prefix
+        return prefix_map
 
-                # Construct element ID with optimized string concatenation
-                element_id = f"{prefix}:{element_name}" if prefix else element_name
-
-                # Get unit reference
-                unit_ref = element.get('unitRef')
-
-                # Get value - optimize string handling
-                value = element.text
-                if not value or not value.strip():
-                    # Collect all nested text (handles HTML content in TextBlock elements)
-                    all_text = "".join(element.itertext()).strip()
-                    if all_text:
-                        value = all_text
-
-                # Optimize string handling - inline conditional
-                value = value.strip() if value else ""
-
-                # Get decimals attribute - direct access
-                decimals = element.get('decimals')
-
-                # Optimize numeric conversion with faster try/except
-                numeric_value = None
-                if value:
-                    try:
-                        numeric_value = float(value)
-                    except (ValueError, TypeError):
-                        pass
-
-                # Create base key for duplicate detection
-                base_key = self._create_normalized_fact_key(element_id, context_ref)
-
-                # Handle duplicates
-                instance_id = None
-                if base_key in base_keys:
-                    # This is a duplicate - convert existing fact to use instance_id if needed
-                    if base_key in facts_dict:
-                        existing_fact = facts_dict[base_key]
-                        # Move existing fact to new key with instance_id=0
-                        del facts_dict[base_key]
-                        existing_fact.instance_id = 0
-                        facts_dict[self._create_normalized_fact_key(element_id, context_ref, 0)] = existing_fact
-                    # Add new fact with next instance_id
-                    instance_id = len(base_keys[base_key])
-                    base_keys[base_key].append(True)
-                else:
-                    # First instance of this fact
-                    base_keys[base_key] = [True]
-
-                # Create fact object
-                fact = Fact(
-                    element_id=element_id,
-                    context_ref=context_ref,
-                    value=value,
-                    unit_ref=unit_ref,
-                    decimals=decimals,
-                    numeric_value=numeric_value,
-                    instance_id=instance_id,
-                    fact_id=fact_id
-                )
-
-                # Store fact with appropriate key
-                key = self._create_normalized_fact_key(element_id, context_ref, instance_id)
-                facts_dict[key] = fact
-                fact_count += 1
+    def _extract_facts(self, root: ET.Element) -> None:
+        """Extract facts from instance document."""
+        try:
+            collector = _FactCollector(self, self._namespace_prefixes(root))
 
             # Use lxml's optimized traversal methods
             if hasattr(root, 'iterchildren'):
-                # Use lxml's optimized traversal methods
                 for child in root.iterchildren():
-                    process_element(child)
-                    # Process nested elements with optimized iteration
-                    for descendant in child.iterdescendants():
-                        process_element(descendant)
+                    collector.add_subtree(child)
             else:
                 # Fallback for ElementTree
                 for child in root:
-                    process_element(child)
+                    collector.add(child)
                     for descendant in child.findall('.//*'):
-                        process_element(descendant)
+                        collector.add(descendant)
 
-            # Update instance facts
-            self.facts.update(facts_dict)
-
-            log.debug(f"Extracted {fact_count} facts ({len(base_keys)} unique fact identifiers)")
+            collector.finish()
 
         except Exception as e:
             raise XBRLProcessingError(f"Error extracting facts: {str(e)}") from e
@@ -503,82 +494,101 @@ class InstanceParser(BaseParser):
         2. footnoteArc elements that connect fact IDs to footnote IDs
         """
         try:
-            from edgar.xbrl.models import Footnote
-
             # Track undefined footnotes for deduplication
             undefined_footnotes = set()
+            footnote_arcs = []
 
             # Find all footnoteLink elements
             for footnote_link in root.findall('.//{http://www.xbrl.org/2003/linkbase}footnoteLink'):
-                # First, extract all footnote definitions
-                for footnote_elem in footnote_link.findall('{http://www.xbrl.org/2003/linkbase}footnote'):
-                    # Prioritize xlink:label over id attribute for footnote identification.
-                    # FootnoteArcs reference footnotes using xlink:to, which corresponds to xlink:label.
-                    # In pre-2016 filings, these attributes often differ (e.g., xlink:label="lbl_footnote_0"
-                    # vs id="FN_0"), so we must use xlink:label to match arc references correctly.
-                    footnote_id = footnote_elem.get('{http://www.w3.org/1999/xlink}label') or footnote_elem.get('id')
-                    if not footnote_id:
-                        continue
-
-                    # Get footnote attributes
-                    lang = footnote_elem.get('{http://www.w3.org/XML/1998/namespace}lang', 'en-US')
-                    role = footnote_elem.get('{http://www.w3.org/1999/xlink}role')
-
-                    # Extract text content, handling XHTML formatting
-                    footnote_text = ""
-                    # Check for XHTML content
-                    xhtml_divs = footnote_elem.findall('.//{http://www.w3.org/1999/xhtml}div')
-                    if xhtml_divs:
-                        # Concatenate all text within XHTML elements
-                        for div in xhtml_divs:
-                            footnote_text += "".join(div.itertext()).strip()
-                    else:
-                        # Fall back to direct text content
-                        footnote_text = "".join(footnote_elem.itertext()).strip()
-
-                    # Create Footnote object
-                    footnote = Footnote(
-                        footnote_id=footnote_id,
-                        text=footnote_text,
-                        lang=lang,
-                        role=role,
-                        related_fact_ids=[]
-                    )
-                    self.footnotes[footnote_id] = footnote
-
-                # Second, process footnoteArc elements to link facts to footnotes
-                for arc_elem in footnote_link.findall('{http://www.xbrl.org/2003/linkbase}footnoteArc'):
-                    fact_id = arc_elem.get('{http://www.w3.org/1999/xlink}from')
-                    footnote_id = arc_elem.get('{http://www.w3.org/1999/xlink}to')
-
-                    if fact_id and footnote_id:
-                        # Add fact ID to footnote's related facts
-                        if footnote_id in self.footnotes:
-                            self.footnotes[footnote_id].related_fact_ids.append(fact_id)
-                        else:
-                            # Track undefined footnote (common in older filings due to naming inconsistencies)
-                            if footnote_id not in undefined_footnotes:
-                                undefined_footnotes.add(footnote_id)
-                                log.debug(f"Footnote arc references undefined footnote: {footnote_id}")
-
-                        # Also update the fact's footnotes list if we can find it
-                        # This requires finding the fact by its fact_id
-                        for fact in self.facts.values():
-                            if fact.fact_id == fact_id:
-                                if footnote_id not in fact.footnotes:
-                                    fact.footnotes.append(footnote_id)
-                                break
-
-            # Summary message for undefined footnotes (non-critical)
-            if undefined_footnotes:
-                log.debug(f"{len(undefined_footnotes)} footnote arc references could not be resolved (non-critical)")
-
-            log.debug(f"Extracted {len(self.footnotes)} footnotes")
+                footnote_arcs.extend(self._extract_footnote_link(footnote_link, undefined_footnotes))
+
+            self._link_footnotes(footnote_arcs, undefined_footnotes)
 
         except Exception as e:
             # Log the error but don't fail - footnotes are optional
             log.warning(f"Error extracting footnotes: {str(e)}")
 
+    def _extract_footnote_link(self, footnote_link: ET.Element, undefined_footnotes: Set[str]) -> List[Tuple[str, str]]:
+        """
+        Register the footnotes of one footnoteLink and return its (fact_id, footnote_id) arcs.
+
+        Arcs are resolved against facts later, once every fact has been extracted.
+        """
+        from edgar.xbrl.models import Footnote
+
+        # First, extract all footnote definitions
+        for footnote_elem in footnote_link.findall('{http://www.xbrl.org/2003/linkbase}footnote'):
+            # Prioritize xlink:label over id attribute for footnote identification.
+            # FootnoteArcs reference footnotes using xlink:to, which corresponds to xlink:label.
+            # In pre-2016 filings, these attributes often differ (e.g., xlink:label="lbl_footnote_0"
+            # vs id="FN_0"), so we must use xlink:label to match arc references correctly.
+            footnote_id = footnote_elem.get('{http://www.w3.org/1999/xlink}label') or footnote_elem.get('id')
+            if not footnote_id:
+                continue
+
+            # Get footnote attributes
+            lang = footnote_elem.get('{http://www.w3.org/XML/1998/namespace}lang', 'en-US')
+            role = footnote_elem.get('{http://www.w3.org/1999/xlink}role')
+
+            # Extract text content, handling XHTML formatting
+            footnote_text = ""
+            # Check for XHTML content
+            xhtml_divs = footnote_elem.findall('.//{http://www.w3.org/1999/xhtml}div')
+            if xhtml_divs:
+                # Concatenate all text within XHTML elements
+                for div in xhtml_divs:
+                    footnote_text += "".join(div.itertext()).strip()
+            else:
+                # Fall back to direct text content
+                footnote_text = "".join(footnote_elem.itertext()).strip()
+
+            # Create Footnote object
+            footnote = Footnote(
+                footnote_id=footnote_id,
+                text=footnote_text,
+                lang=lang,
+                role=role,
+                related_fact_ids=[]
+            )
+            self.footnotes[footnote_id] = footnote
+
+        # Second, process footnoteArc elements to link facts to footnotes
+        arcs = []
+        for arc_elem in footnote_link.findall('{http://www.xbrl.org/2003/linkbase}footnoteArc'):
+            fact_id = arc_elem.get('{http://www.w3.org/1999/xlink}from')
+            footnote_id = arc_elem.get('{http://www.w3.org/1999/xlink}to')
+
+            if fact_id and footnote_id:
+                # Add fact ID to footnote's related facts
+                if footnote_id in self.footnotes:
+                    self.footnotes[footnote_id].related_fact_ids.append(fact_id)
+                else:
+                    # Track undefined footnote (common in older filings due to naming inconsistencies)
+                    if footnote_id not in undefined_footnotes:
+                        undefined_footnotes.add(footnote_id)
+                        log.debug(f"Footnote arc references undefined footnote: {footnote_id}")
+                arcs.append((fact_id, footnote_id))
+        return arcs
+
+    def _link_footnotes(self, footnote_arcs: List[Tuple[str, str]], undefined_footnotes: Set[str]) -> None:
+        """Add each arc's footnote to the footnotes list of the first fact with the arc's fact ID."""
+        if footnote_arcs:
+            facts_by_id = {}
+            for fact in self.facts.values():
+                if fact.fact_id:
+                    facts_by_id.setdefault(fact.fact_id, fact)
+
+            for fact_id, footnote_id in footnote_arcs:
+                fact = facts_by_id.get(fact_id)
+                if fact is not None and footnote_id not in fact.footnotes:
+                    fact.footnotes.append(footnote_id)
+
+        # Summary message for undefined footnotes (non-critical)
+        if undefined_footnotes:
+            log.debug(f"{len(undefined_footnotes)} footnote arc references could not be resolved (non-critical)")
+
+        log.debug(f"Extracted {len(self.footnotes)} footnotes")
+
     def _extract_entity_info(self) -> None:
         """Extract entity information from contexts and DEI facts."""
         try:
@@ -817,6 +827,150 @@ class InstanceParser(BaseParser):
                 period['fiscal_year'] = _fiscal_year_for_date(date_obj, fy_end_month, fy_end_day)
 
 
+class _FactCollector:
+    """
+    Turns fact elements into Fact objects, numbering duplicate facts as it goes.
+
+    Elements are fed in document order, from a full tree or from iterparse, and
+    the facts are added to the parser's registry by finish().
+    """
+
+    # Fast path to identify non-fact elements to skip
+    _SKIP_TAG_ENDINGS = (
+        'schemaRef',
+        'roleRef',
+        'arcroleRef',
+        'linkbaseRef',
+        'context',
+        'unit'
+    )
+
+    def __init__(self, parser: InstanceParser, prefix_map: Dict[str, str]):
+        self._parser = parser
+        self._prefix_map = prefix_map
+        self.fact_count = 0
+        self.facts_dict: Dict[str, Fact] = {}
+        self.base_keys: Dict[str, List[bool]] = {}
+
+    def add_subtree(self, element) -> None:
+        """Process an element and every element nested in it."""
+        self.add(element)
+        # Process nested elements with optimized iteration
+        for descendant in element.iterdescendants():
+            self.add(descendant)
+
+    def add(self, element) -> None:
+        """Process a single element as a potential fact."""
+        # Skip annotation nodes and other non element nodes
+        if not ET.iselement(element):
+            return
+        # Skip known non-fact elements
+        # If the tag is not a string, try calling () to get the string value (in rare cases)
+        if callable(element.tag):
+            if isinstance(element, ET._Comment):
+                return
+            if not element.values():
+                return
+        tag = element.tag
+        if tag.endswith(self._SKIP_TAG_ENDINGS):
+            return
+
+        # Get context reference - key check to identify facts
+        context_ref = element.get('contextRef')
+        if not context_ref:
+            return
+
+        # Get fact ID if present (for footnote linkage)
+        fact_id = element.get('id')
+
+        # Extract element namespace and name - optimized split
+        if '}' in tag:
+            namespace, element_name = tag.split('}', 1)
+            namespace = namespace[1:]  # Faster than strip('{')
+
+            # Try to extract prefix from the namespace
+            prefix = self._prefix_map.get(namespace)
+            if not prefix:
+                parts = namespace.split('/')
+                prefix = parts[-1] if parts else ''
+        else:
+            element_name = tag
+            prefix = ''
+
+        # Construct element ID with optimized string concatenation
+        element_id = f"{prefix}:{element_name}" if prefix else element_name
+
+        # Get unit reference
+        unit_ref = element.get('unitRef')
+
+        # Get value - optimize string handling
+        value = element.text
+        if not value or not value.strip():
+            # Collect all nested text (handles HTML content in TextBlock elements)
+            all_text = "".join(element.itertext()).strip()
+            if all_text:
+                value = all_text
+
+        # Optimize string handling - inline conditional
+        value = value.strip() if value else ""
+
+        # Get decimals attribute - direct access
+        decimals = element.get('decimals')
+
+        # Optimize numeric conversion with faster try/except
+        numeric_value = None
+        if value:
+            try:
+                numeric_value = float(value)
+            except (ValueError, TypeError):
+                pass
+
+        # Create base key for duplicate detection
+        create_key = self._parser._create_normalized_fact_key
+        base_key = create_key(element_id, context_ref)
+        facts_dict = self.facts_dict
+        base_keys = self.base_keys
+
+        # Handle duplicates
+        instance_id = None
+        if base_key in base_keys:
+            # This is a duplicate - convert existing fact to use instance_id if needed
+            if base_key in facts_dict:
+                existing_fact = facts_dict[base_key]
+                # Move existing fact to new key with instance_id=0
+                del facts_dict[base_key]
+                existing_fact.instance_id = 0
+                facts_dict[create_key(element_id, context_ref, 0)] = existing_fact
+            # Add new fact with next instance_id
+            instance_id = len(base_keys[base_key])
+            base_keys[base_key].append(True)
+        else:
+            # First instance of this fact
+            base_keys[base_key] = [True]
+
+        # Create fact object
+        fact = Fact(
+            element_id=element_id,
+            context_ref=context_ref,
+            value=value,
+            unit_ref=unit_ref,
+            decimals=decimals,
+            numeric_value=numeric_value,
+            instance_id=instance_id,
+            fact_id=fact_id
+        )
+
+        # Store fact with appropriate key
+        key = create_key(element_id, context_ref, instance_id)
+        facts_dict[key] = fact
+        self.fact_count += 1
+
+    def finish(self) -> None:
+        """Add the collected facts to the parser's facts registry."""
+        self._parser.facts.update(self.facts_dict)
+        log.debug(f"Extracted {self.fact_count} facts ({len(self.base_keys)} unique fact identifiers)")
+
+
 def _fiscal_year_for_date(d, fy_end_month: int, fy_end_day: int) -> int:
     """Determine the fiscal year a date belongs to.
 
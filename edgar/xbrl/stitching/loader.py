@@ -0,0 +1,191 @@
+"""
+XBRL Statement Stitching - Concurrent Loader
+
+Loading the XBRL for every filing to be stitched used to be one serial
+download-then-parse cycle per filing. This module splits the two:
+
+1. Full submissions are fetched concurrently with the async HTTP client, which
+   shares the global rate limiter and HTTP cache with every other request.
+2. The XBRL documents are parsed in a process pool, since parsing is CPU bound.
+
+Filings that fail to load are skipped, as XBRLS.from_filings always did, and
+reported back alongside the XBRL objects that did load.
+"""
+
+import asyncio
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+
+from edgar.httprequests import MAX_CONCURRENT_DOWNLOADS
+
+if TYPE_CHECKING:
+    from edgar._filings import Filing
+    from edgar.xbrl.xbrl import XBRL
+
+log = logging.getLogger(__name__)
+
+__all__ = ['load_xbrls']
+
+
+def _needs_download(filing: 'Filing') -> bool:
+    """True if reading this filing's SGML would go to the SEC."""
+    from edgar.storage import is_using_local_storage
+    from edgar.storage.datamule import is_using_datamule_storage
+
+    if getattr(filing, '_sgml', None) is not None:
+        return False
+    return not (is_using_local_storage() or is_using_datamule_storage())
+
+
+async def _download_submissions(filings: Sequence['Filing']) -> List[object]:
+    from edgar.httpclient import async_http_client
+    from edgar.httprequests import download_file_async
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
+
+    async def download(client, filing):
+        async with semaphore:
+            return await download_file_async(client, filing.text_url, as_text=True)
+
+    async with async_http_client() as client:
+        return await asyncio.gather(*[download(client, filing) for filing in filings], return_exceptions=True)
+
+
+def prefetch_submissions(filings: Sequence['Filing']) -> None:
+    """
+    Download the full submissions of the filings concurrently and attach them as parsed SGML.
+
+    A filing whose download fails is left as it was: Filing.sgml() fetches it again
+    later with its usual retries and homepage fallback.
+    """
+    from edgar.core import run_async_or_sync
+    from edgar.sgml import FilingSGML
+
+    pending = [filing for filing in filings if _needs_download(filing)]
+    if len(pending) < 2:
+        return
+
+    results = run_async_or_sync(_download_submissions(pending))
+    for filing, result in zip(pending, results, strict=True):
+        if isinstance(result, BaseException):
+            log.debug("Concurrent download of %s failed, will retry serially: %s", filing.accession_no, result)
+            continue
+        # An empty or truncated body is left to the serial path, which knows how to recover
+        if not result or len(result.strip()) < 50:
+            continue
+        try:
+            filing_sgml = FilingSGML.from_text(result)
+            filing_sgml._apply_filing_defaults(filing)
+            filing._sgml = filing_sgml
+        except Exception as e:
+            log.debug("Could not parse the submission of %s, will retry serially: %s", filing.accession_no, e)
+
+
+def _parse_xbrl_contents(contents: Dict[str, str]) -> 'XBRL':
+    """Process pool entry point: parse one filing's XBRL documents."""
+    from edgar.xbrl.xbrl import XBRL
+    return XBRL.from_contents(contents)
+
+
+def _default_workers(job_count: int) -> int:
+    return max(1, min(job_count, os.cpu_count() or 1))
+
+
+def load_xbrls(filings: Sequence['Filing'],
+               max_workers: Optional[int] = None) -> Tuple[List['XBRL'], Dict[str, Exception]]:
+    """
+    Load the XBRL of each filing, downloading and parsing concurrently.
+
+    Args:
+        filings: The filings to load, in the order the XBRL objects should be returned
+        max_workers: Processes used to parse XBRL documents. Defaults to one per CPU,
+                     capped at the number of filings. 1 parses in this process.
+
+    Returns:
+        The XBRL objects that loaded, in the order of ``filings``, and a dict of
+        accession number to the exception for each filing that did not
+    """
+    from edgar.xbrl.cache import get_xbrl_cache
+    from edgar.xbrl.xbrl import XBRL, XBRLAttachments, XBRLFilingWithNoXbrlData
+
+    filings = list(filings)
+    failed: Dict[str, Exception] = {}
+    loaded: Dict[int, 'XBRL'] = {}
+
+    # Filings already in the XBRL cache need neither a download nor a parse
+    xbrl_cache = get_xbrl_cache()
+    if xbrl_cache is not None:
+        for index, filing in enumerate(filings):
+            xbrl = xbrl_cache.get(filing.accession_no, filing_sgml=filing.sgml)
+            if xbrl is not None:
+                loaded[index] = xbrl
+
+    prefetch_submissions([filing for index, filing in enumerate(filings) if index not in loaded])
+
+    # Collect the XBRL document text for each filing. Anything that cannot be parsed
+    # from text alone (a missing instance) goes through XBRL.from_filing as before.
+    jobs: Dict[int, Dict[str, str]] = {}
+    for index, filing in enumerate(filings):
+        if index in loaded:
+            continue
+        try:
+            xbrl_attachments = XBRLAttachments(filing.attachments)
+            if xbrl_attachments.empty:
+                raise XBRLFilingWithNoXbrlData(f"No XBRL attachments found in filing {filing.accession_no}")
+            if xbrl_attachments.has_instance_document:
+                jobs[index] = xbrl_attachments.contents()
+            else:
+                loaded[index] = XBRL.from_filing(filing)
+        except Exception as e:
+            failed[filing.accession_no] = e
+
+    workers = max_workers or _default_workers(len(jobs))
+    parsed = _parse_in_pool(jobs, workers) if workers > 1 and len(jobs) > 1 else {}
+
+    for index, contents in jobs.items():
+        filing = filings[index]
+        try:
+            xbrl = parsed.get(index)
+            if isinstance(xbrl, Exception):
+                raise xbrl
+            if xbrl is None:
+                xbrl = XBRL.from_contents(contents)
+            xbrl._apply_filing_context(filing)
+            if xbrl_cache is not None:
+                xbrl_cache.put(filing.accession_no, xbrl)
+            loaded[index] = xbrl
+        except Exception as e:
+            failed[filing.accession_no] = e
+
+    if failed:
+        log.warning("Could not load XBRL for %d of %d filings: %s",
+                    len(failed), len(filings), ", ".join(failed))
+
+    return [loaded[index] for index in sorted(loaded)], failed
+
+
+def _parse_in_pool(jobs: Dict[int, Dict[str, str]], workers: int) -> Dict[int, object]:
+    """
+    Parse the XBRL documents of each job in a process pool.
+
+    Returns the XBRL, or the exception it raised, per job index. Jobs that never
+    came back (the pool could not start, or broke) are missing from the result
+    and get parsed in this process by the caller.
+    """
+    results: Dict[int, object] = {}
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {index: executor.submit(_parse_xbrl_contents, contents) for index, contents in jobs.items()}
+            for index, future in futures.items():
+                try:
+                    results[index] = future.result()
+                except BrokenProcessPool:
+                    raise
+                except Exception as e:
+                    results[index] = e
+    except (BrokenProcessPool, OSError) as e:
+        log.debug("XBRL process pool unavailable, parsing in process: %s", e)
+    return results
@@ -45,22 +45,32 @@ class XBRLS:
         # Cache for stitched facts view
         self._stitched_facts_view = None
 
+        # Accession number -> exception for filings from_filings could not load
+        self.failed_filings: Dict[str, Exception] = {}
+
     @classmethod
-    def from_filings(cls, filings: Union['Filings', List[Any]], filter_amendments:bool=True) -> 'XBRLS':
+    def from_filings(cls, filings: Union['Filings', List[Any]], filter_amendments:bool=True,
+                     max_workers: Optional[int] = None) -> 'XBRLS':
         """
         Create an XBRLS object from a list of Filing objects or a Filings object containing multiple filings.
         Each filing should be the same form (e.g., 10-K, 10-Q) and from the same company.
 
+        Submissions are downloaded concurrently under the shared rate limiter and their
+        XBRL documents parsed in a process pool. Filings that fail to load are skipped
+        and listed in ``failed_filings`` on the result.
+
         Args:
             filings: A ``Filings`` collection or a plain list of ``Filing`` objects,
                 all from the same company.
             filter_amendments: If True (default), drop amendments (forms ending in
                 ``/A``) before stitching. Works for both ``Filings`` and plain lists.
+            max_workers: Processes used to parse XBRL. Defaults to one per CPU;
+                1 parses everything in this process.
 
         Returns:
             XBRLS object with stitched data
         """
-        from edgar.xbrl.xbrl import XBRL
+        from edgar.xbrl.stitching.loader import load_xbrls
 
         if filter_amendments:
             if hasattr(filings, 'filter'):
@@ -75,15 +85,11 @@ class XBRLS:
         sorted_filings = sorted(filtered_filings, key=lambda f: f.filing_date, reverse=True)
 
         # Create XBRL objects from filings
-        xbrl_list = []
-        for filing in sorted_filings:
-            try:
-                xbrl = XBRL.from_filing(filing)
-                xbrl_list.append(xbrl)
-            except Exception:
-                pass
+        xbrl_list, failed_filings = load_xbrls(sorted_filings, max_workers=max_workers)
 
-        return cls(xbrl_list)
+        xbrls = cls(xbrl_list)
+        xbrls.failed_filings = failed_filings
+        return xbrls
 
     @classmethod
     def from_xbrl_objects(cls, xbrl_list: List[Any]) -> 'XBRLS':
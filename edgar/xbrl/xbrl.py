@@ -49,6 +49,10 @@ class XBRLFilingWithNoXbrlData(NotFoundError):
         super().__init__(message)
 
 
+# The instance is parsed last because facts resolve against the schema and linkbases
+XBRL_DOCUMENT_PARSE_ORDER = ('schema', 'label', 'presentation', 'calculation', 'definition', 'instance')
+
+
 class XBRLAttachments:
     """
     An adapter for the Attachments class that provides easy access to the XBRL documents.
@@ -89,6 +93,16 @@ class XBRLAttachments:
     def get(self, doc_type: str):
         return self._documents.get(doc_type)
 
+    def contents(self) -> Dict[str, str]:
+        """
+        The text of each XBRL document, keyed by document type, in the order they must be parsed.
+
+        Plain strings, so the result can be handed to another process for parsing.
+        """
+        return {doc_type: self._documents[doc_type].content
+                for doc_type in XBRL_DOCUMENT_PARSE_ORDER
+                if doc_type in self._documents}
+
     def __rich__(self):
         table = Table(Column("Type"),
                       Column("Document"),
@@ -590,6 +604,9 @@ class XBRL:
         """
         Create an XBRL object from a Filing object.
 
+        When the XBRL cache is enabled (see edgar.xbrl.cache), a filing parsed
+        before is loaded from disk instead of being parsed again.
+
         Args:
             filing: Filing object with attachments containing XBRL files
 
@@ -603,7 +620,12 @@ class XBRL:
             Consider using the original filing instead if available with `get_filings(form="10-K", amendments=False)`
             """))
 
-        xbrl = cls()
+        from edgar.xbrl.cache import get_xbrl_cache
+        xbrl_cache = get_xbrl_cache()
+        if xbrl_cache is not None:
+            xbrl = xbrl_cache.get(filing.accession_no, filing_sgml=filing.sgml)
+            if xbrl is not None:
+                return xbrl
 
         xbrl_attachments = XBRLAttachments(filing.attachments)
 
@@ -611,57 +633,85 @@ class XBRL:
             log.debug(f"No XBRL attachments found in filing {filing}")
             return None
 
-        if xbrl_attachments.get('schema'):
-            xbrl.parser.parse_schema_content(xbrl_attachments.get('schema').content)
-
-        if xbrl_attachments.get('label'):
-            xbrl.parser.parse_labels_content(xbrl_attachments.get('label').content)
-
-        if xbrl_attachments.get('presentation'):
-            xbrl.parser.parse_presentation_content(xbrl_attachments.get('presentation').content)
-
-        if xbrl_attachments.get('calculation'):
-            xbrl.parser.parse_calculation_content(xbrl_attachments.get('calculation').content)
-
-        if xbrl_attachments.get('definition'):
-            xbrl.parser.parse_definition_content(xbrl_attachments.get('definition').content)
-
-        if xbrl_attachments.get('instance'):
-            xbrl.parser.parse_instance_content(xbrl_attachments.get('instance').content)
-        elif not xbrl_attachments.empty:
-            # Filing bundle is in local storage AND has linkbases, but the XBRL
-            # instance document itself is missing. This is typical for iXBRL filings
-            # filed before SEC's Oct-2020 feed format change, when the inline-XBRL
-            # data was embedded in the .htm file but not extracted to a separate
-            # _htm.xml in the feed bundle. Fall back to fetching just the instance
-            # from the filing homepage if network fallback is allowed.
-            from edgar.storage import is_using_local_storage, is_network_fallback_allowed
-            if is_using_local_storage() and is_network_fallback_allowed():
-                homepage_xbrl = XBRLAttachments(filing.homepage.attachments)
-                if homepage_xbrl.get('instance'):
-                    log.info(
-                        f"XBRL instance missing from local SGML for {filing.accession_no} "
-                        f"(common for iXBRL filings before SEC's Oct-2020 feed format change). "
-                        f"Fetching just the instance from the SEC homepage (network fallback)."
-                    )
-                    xbrl.parser.parse_instance_content(homepage_xbrl.get('instance').content)
-                else:
-                    log.warning(
-                        f"XBRL instance document not found for {filing.accession_no} — "
-                        f"missing from both local SGML and the SEC filing homepage. "
-                        f"Entity info and facts will be empty."
-                    )
+        xbrl = cls.from_contents(xbrl_attachments.contents())
+
+        if not xbrl_attachments.has_instance_document:
+            xbrl._parse_missing_instance(filing)
+
+        xbrl._apply_filing_context(filing)
+
+        if xbrl_cache is not None:
+            xbrl_cache.put(filing.accession_no, xbrl)
+        return xbrl
+
+    @classmethod
+    def from_contents(cls, contents: Dict[str, str]) -> 'XBRL':
+        """
+        Create an XBRL object from the text of its documents.
+
+        Args:
+            contents: Document text keyed by document type ('schema', 'label', 'presentation',
+                      'calculation', 'definition', 'instance'), as returned by XBRLAttachments.contents()
+
+        Returns:
+            XBRL object with parsed data
+        """
+        xbrl = cls()
+        parse_methods = {
+            'schema': xbrl.parser.parse_schema_content,
+            'label': xbrl.parser.parse_labels_content,
+            'presentation': xbrl.parser.parse_presentation_content,
+            'calculation': xbrl.parser.parse_calculation_content,
+            'definition': xbrl.parser.parse_definition_content,
+            'instance': xbrl.parser.parse_instance_content,
+        }
+        for doc_type in XBRL_DOCUMENT_PARSE_ORDER:
+            if doc_type in contents:
+                parse_methods[doc_type](contents[doc_type])
+        return xbrl
+
+    def _parse_missing_instance(self, filing):
+        """
+        Parse the instance document when the filing bundle has linkbases but no instance.
+        """
+        # Filing bundle is in local storage AND has linkbases, but the XBRL
+        # instance document itself is missing. This is typical for iXBRL filings
+        # filed before SEC's Oct-2020 feed format change, when the inline-XBRL
+        # data was embedded in the .htm file but not extracted to a separate
+        # _htm.xml in the feed bundle. Fall back to fetching just the instance
+        # from the filing homepage if network fallback is allowed.
+        from edgar.storage import is_using_local_storage, is_network_fallback_allowed
+        if is_using_local_storage() and is_network_fallback_allowed():
+            homepage_xbrl = XBRLAttachments(filing.homepage.attachments)
+            if homepage_xbrl.get('instance'):
+                log.info(
+                    f"XBRL instance missing from local SGML for {filing.accession_no} "
+                    f"(common for iXBRL filings before SEC's Oct-2020 feed format change). "
+                    f"Fetching just the instance from the SEC homepage (network fallback)."
+                )
+                self.parser.parse_instance_content(homepage_xbrl.get('instance').content)
             else:
                 log.warning(
-                    f"XBRL instance missing from local SGML for {filing.accession_no} "
-                    f"and network fallback is disabled. Either re-enable fallback "
-                    f"(use_local_storage(..., allow_network_fallback=True)) or re-download "
-                    f"the filing — entity info and facts will be empty."
+                    f"XBRL instance document not found for {filing.accession_no} — "
+                    f"missing from both local SGML and the SEC filing homepage. "
+                    f"Entity info and facts will be empty."
                 )
+        else:
+            log.warning(
+                f"XBRL instance missing from local SGML for {filing.accession_no} "
+                f"and network fallback is disabled. Either re-enable fallback "
+                f"(use_local_storage(..., allow_network_fallback=True)) or re-download "
+                f"the filing — entity info and facts will be empty."
+            )
 
+    def _apply_filing_context(self, filing):
+        """
+        Attach what the filing knows beyond its XBRL documents: the SGML period of report,
+        the SIC code used for industry standardization, and FilingSummary categories.
+        """
         # Capture SGML period_of_report for date discrepancy detection
         try:
-            xbrl._sgml_period_of_report = filing.period_of_report
+            self._sgml_period_of_report = filing.period_of_report
         except Exception:
             pass
 
@@ -673,7 +723,7 @@ class XBRL:
                 if header and header.filers:
                     sic = header.filers[0].company_data.assigned_sic
                     if sic:
-                        xbrl.standardization.set_industry_from_sic(sic)
+                        self.standardization.set_industry_from_sic(sic)
         except Exception:
             pass
 
@@ -695,14 +745,12 @@ class XBRL:
                         if report.role and report.menu_category:
                             classification = _MENU_CATEGORY_TO_CLASSIFICATION.get(report.menu_category)
                             if classification:
-                                xbrl._filing_summary_categories[report.role] = classification
-                            xbrl._filing_summary_menu_categories[report.role] = report.menu_category
-                    xbrl._filing_summary = filing_summary
+                                self._filing_summary_categories[report.role] = classification
+                            self._filing_summary_menu_categories[report.role] = report.menu_category
+                    self._filing_summary = filing_summary
         except Exception:
             pass
 
-        return xbrl
-
     @property
     def statements(self):
         from edgar.xbrl.statements import Statements
@@ -1,5 +1,6 @@
 import pytest
 from pathlib import Path
+from types import SimpleNamespace
 
 from edgar import httpclient
 from edgar import Company
@@ -119,6 +120,51 @@ def pytest_runtest_setup(item):
 FIXTURE_DIR = Path("tests/fixtures/xbrl")
 DATA_DIR = Path("data/xbrl/datafiles")
 
+_XBRL_DOCUMENT_TYPES = {
+    '.xsd': 'EX-101.SCH',
+    '_cal.xml': 'EX-101.CAL',
+    '_def.xml': 'EX-101.DEF',
+    '_lab.xml': 'EX-101.LAB',
+    '_pre.xml': 'EX-101.PRE',
+    '_htm.xml': 'XML',
+}
+
+
+class XBRLFixtureFiling:
+    """
+    Just enough of a Filing for XBRL loading, backed by a directory of XBRL fixture
+    documents. Its SGML counts as loaded so nothing goes to the network, and it
+    counts how often its attachments are read.
+    """
+
+    def __init__(self, directory, accession_no, filing_date, form='10-K', period_of_report=None):
+        self.directory = Path(directory) if directory else None
+        self.accession_no = accession_no
+        self.filing_date = filing_date
+        self.form = form
+        self.period_of_report = period_of_report
+        self._sgml = SimpleNamespace(header=None)
+        self.attachment_reads = 0
+
+    @property
+    def attachments(self):
+        self.attachment_reads += 1
+        files = sorted(self.directory.glob('*')) if self.directory else []
+        return SimpleNamespace(data_files=[
+            SimpleNamespace(document_type=next(t for suffix, t in _XBRL_DOCUMENT_TYPES.items() if f.name.endswith(suffix)),
+                            extension=f.suffix, content=f.read_text(), description=f.name)
+            for f in files if f.suffix in ('.xsd', '.xml')
+        ])
+
+    def sgml(self):
+        return None
+
+
+@pytest.fixture
+def xbrl_fixture_filing():
+    """The XBRLFixtureFiling class, for tests that load XBRL from fixture directories."""
+    return XBRLFixtureFiling
+
 
 def pytest_addoption(parser):
     parser.addoption("--enable-cache", action="store_true", help="Enable HTTP cache")
@@ -328,6 +374,10 @@ def pytest_collection_modifyitems(config, items):
         # MA-I municipal advisor parse; tests/test_muni_advisors.py matches the
         # 'test_muni' network pattern. Verified with outbound sockets blocked.
         'test_ma_i_form_contract',
+        # The filing index warehouse, fed from the committed daily index in
+        # data/index_files with the quarterly fetch patched out. Verified with
+        # outbound sockets blocked.
+        'test_index_warehouse',
     ]
 
     # Files that need network (fetch from SEC)
@@ -53,7 +53,7 @@ class TestEmptySGMLCacheBypass:
 
     def test_from_source_retries_on_empty_cached_response(self):
         """If cached fetch returns empty content, retry with direct fetch."""
-        with patch("edgar.sgml.sgml_common.read_content_as_string", return_value="") as mock_read, \
+        with patch("edgar.sgml.sgml_common.read_content_as_bytes", return_value=b"") as mock_read, \
              patch("edgar.sgml.sgml_common._fetch_url_directly", return_value=VALID_SGML) as mock_direct:
             result = FilingSGML.from_source(SEC_URL)
 
@@ -63,7 +63,7 @@ class TestEmptySGMLCacheBypass:
 
     def test_from_source_retries_on_truncated_cached_response(self):
         """Short content (< 50 bytes stripped) also triggers retry."""
-        with patch("edgar.sgml.sgml_common.read_content_as_string", return_value="short") as mock_read, \
+        with patch("edgar.sgml.sgml_common.read_content_as_bytes", return_value=b"short") as mock_read, \
              patch("edgar.sgml.sgml_common._fetch_url_directly", return_value=VALID_SGML) as mock_direct:
             result = FilingSGML.from_source(SEC_URL)
 
@@ -72,7 +72,7 @@ class TestEmptySGMLCacheBypass:
 
     def test_from_source_does_not_retry_for_valid_content(self):
         """Valid SGML content should not trigger a retry."""
-        with patch("edgar.sgml.sgml_common.read_content_as_string", return_value=VALID_SGML), \
+        with patch("edgar.sgml.sgml_common.read_content_as_bytes", return_value=VALID_SGML.encode()), \
              patch("edgar.sgml.sgml_common._fetch_url_directly") as mock_direct:
             result = FilingSGML.from_source(SEC_URL)
 
@@ -81,7 +81,7 @@ class TestEmptySGMLCacheBypass:
 
     def test_from_source_does_not_retry_for_local_files(self):
         """Cache bypass retry should only apply to URL sources, not local files."""
-        with patch("edgar.sgml.sgml_common.read_content_as_string", return_value=""), \
+        with patch("edgar.sgml.sgml_common.read_content_as_bytes", return_value=b""), \
              patch("edgar.sgml.sgml_common._fetch_url_directly") as mock_direct:
             with pytest.raises(ValueError, match="empty or truncated"):
                 FilingSGML.from_source("/tmp/some_file.txt")
@@ -91,7 +91,7 @@ class TestEmptySGMLCacheBypass:
     def test_direct_fetch_called_with_correct_url(self):
         """Verify _fetch_url_directly receives the original source URL."""
         test_url = "https://www.sec.gov/Archives/edgar/data/1045810/test.txt"
-        with patch("edgar.sgml.sgml_common.read_content_as_string", return_value=""), \
+        with patch("edgar.sgml.sgml_common.read_content_as_bytes", return_value=b""), \
              patch("edgar.sgml.sgml_common._fetch_url_directly", return_value=VALID_SGML) as mock_direct:
             FilingSGML.from_source(test_url)
 
@@ -3,7 +3,7 @@ Comprehensive benchmark suite for HTML parser performance.
 
 Benchmarks:
 - Parse time across document sizes
-- Memory usage
+- Memory usage (RSS growth and peak Python allocation during a parse)
 - Throughput (MB/s)
 - Comparison with old parser
 - Batch processing performance
@@ -11,6 +11,7 @@ Benchmarks:
 
 import time
 import statistics
+import tracemalloc
 from pathlib import Path
 from typing import Dict, List, Optional
 import psutil
@@ -23,14 +24,16 @@ from edgar.documents.config import ParserConfig
 class ParserBenchmark:
     """Comprehensive HTML parser performance benchmarks."""
 
-    def __init__(self, corpus_dir: Path = None):
+    def __init__(self, corpus_dir: Path = None, as_bytes: bool = False):
         """
         Initialize benchmark suite.
 
         Args:
             corpus_dir: Directory containing HTML test files
+            as_bytes: Pass documents to the parser as raw bytes instead of str
         """
         self.corpus_dir = corpus_dir or Path('data/html')
+        self.as_bytes = as_bytes
         self.results = []
         self.process = psutil.Process()
 
@@ -51,7 +54,7 @@ class ParserBenchmark:
         Returns:
             Dict with benchmark results
         """
-        html = html_path.read_text()
+        html = html_path.read_bytes() if self.as_bytes else html_path.read_text()
         file_size_mb = len(html) / (1024 * 1024)
 
         if config is None:
@@ -84,6 +87,16 @@ class ParserBenchmark:
             del doc
             gc.collect()
 
+        # Peak Python allocation during one more parse, measured on its own because
+        # tracemalloc slows parsing down. lxml's C allocations are not included.
+        tracemalloc.start()
+        doc = parse_html(html, config=config)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del doc
+        gc.collect()
+        peak_memory_mb = peak / (1024 * 1024)
+
         return {
             'file': html_path.name,
             'size_mb': round(file_size_mb, 2),
@@ -94,6 +107,8 @@ class ParserBenchmark:
             'std_dev_s': round(statistics.stdev(times) if len(times) > 1 else 0, 3),
             'avg_memory_mb': round(statistics.mean(memory_usage), 1),
             'max_memory_mb': round(max(memory_usage), 1),
+            'peak_memory_mb': round(peak_memory_mb, 1),
+            'peak_ratio': round(peak_memory_mb / file_size_mb, 1) if file_size_mb else 0.0,
             'throughput_mbs': round(file_size_mb / statistics.mean(times), 2),
             'tables': table_counts[0],
             'sections': section_counts[0],
@@ -121,8 +136,8 @@ class ParserBenchmark:
             files = files[:max_files]
 
         print(f"Benchmarking {len(files)} files from {self.corpus_dir}\n")
-        print(f"{'File':<35} {'Size':>8} {'Time':>8} {'Memory':>9} {'Speed':>10} {'Tables':>7}")
-        print(f"{'-'*35} {'-'*8} {'-'*8} {'-'*9} {'-'*10} {'-'*7}")
+        print(f"{'File':<35} {'Size':>8} {'Time':>8} {'Memory':>9} {'Peak':>9} {'Speed':>10} {'Tables':>7}")
+        print(f"{'-'*35} {'-'*8} {'-'*8} {'-'*9} {'-'*9} {'-'*10} {'-'*7}")
 
         self.results = []
 
@@ -135,6 +150,7 @@ class ParserBenchmark:
                       f"{result['size_mb']:>6.1f}MB "
                       f"{result['avg_time_s']:>7.3f}s "
                       f"{result['avg_memory_mb']:>8.1f}MB "
+                      f"{result['peak_memory_mb']:>8.1f}MB "
                       f"{result['throughput_mbs']:>9.1f}MB/s "
                       f"{result['tables']:>7}")
 
@@ -158,12 +174,14 @@ class ParserBenchmark:
         total_time = sum(r['avg_time_s'] for r in self.results)
         avg_throughput = statistics.mean(r['throughput_mbs'] for r in self.results)
         avg_memory = statistics.mean(r['avg_memory_mb'] for r in self.results)
+        avg_peak_ratio = statistics.mean(r['peak_ratio'] for r in self.results)
 
         print(f"Total documents: {len(self.results)}")
         print(f"Total size: {total_size:.1f}MB")
         print(f"Total time: {total_time:.2f}s")
         print(f"Average throughput: {avg_throughput:.1f}MB/s")
         print(f"Average memory usage: {avg_memory:.1f}MB")
+        print(f"Average peak allocation: {avg_peak_ratio:.1f}x document size")
 
         # By size category
         print(f"\nPerformance by document size:")
@@ -275,10 +293,12 @@ def main():
                        help='Output file for results')
     parser.add_argument('--baseline', type=Path, default=None,
                        help='Baseline results file for comparison')
+    parser.add_argument('--bytes', action='store_true',
+                       help='Parse the raw file bytes instead of decoded text')
 
     args = parser.parse_args()
 
-    benchmark = ParserBenchmark(corpus_dir=args.corpus)
+    benchmark = ParserBenchmark(corpus_dir=args.corpus, as_bytes=args.bytes)
     benchmark.benchmark_corpus(pattern=args.pattern, max_files=args.max_files, runs=args.runs)
     benchmark.save_results(args.output)
 
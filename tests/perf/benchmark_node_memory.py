@@ -0,0 +1,132 @@
+"""
+Memory footprint of the edgar.documents node tree.
+
+Reports, per document:
+- Node and table cell counts
+- Bytes per node: the node objects themselves, their attribute storage, children
+  lists, metadata dicts, ids and the Style objects they reference (each distinct
+  Style counted once). Text content is not included.
+- Bytes per cell: table rows and cells, which are counted separately
+- Retained bytes: what tracemalloc still holds for the parsed Document after
+  garbage collection, text included, divided by the number of nodes and cells
+
+Usage:
+    python tests/perf/benchmark_node_memory.py
+    python tests/perf/benchmark_node_memory.py --pattern '*10-K*.html' --output node_memory.json
+"""
+
+import gc
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from edgar.documents import parse_html
+from edgar.documents.config import ParserConfig
+from edgar.documents.table_nodes import TableNode
+
+
+def _attribute_bytes(obj) -> int:
+    """The object plus its __dict__, if it has one"""
+    size = sys.getsizeof(obj)
+    attributes = getattr(obj, '__dict__', None)
+    if attributes is not None:
+        size += sys.getsizeof(attributes)
+    return size
+
+
+def tree_footprint(root) -> Dict[str, int]:
+    """Count the nodes under root and the bytes their structure takes"""
+    nodes = cells = 0
+    node_bytes = style_bytes = cell_bytes = 0
+    seen_styles = set()
+    for node in root.walk():
+        nodes += 1
+        node_bytes += _attribute_bytes(node)
+        node_bytes += sys.getsizeof(node.children) + sys.getsizeof(node.metadata) + sys.getsizeof(node.id)
+        style = node.style
+        if style is not None and id(style) not in seen_styles:
+            seen_styles.add(id(style))
+            style_bytes += _attribute_bytes(style)
+        if isinstance(node, TableNode):
+            for row in node.rows + node.footer:
+                cell_bytes += _attribute_bytes(row) + sys.getsizeof(row.cells)
+                for cell in row.cells:
+                    cells += 1
+                    cell_bytes += _attribute_bytes(cell)
+            for header_row in node.headers:
+                for cell in header_row:
+                    cells += 1
+                    cell_bytes += _attribute_bytes(cell)
+    return {
+        'nodes': nodes,
+        'cells': cells,
+        'distinct_styles': len(seen_styles),
+        'node_bytes': node_bytes,
+        'style_bytes': style_bytes,
+        'cell_bytes': cell_bytes,
+    }
+
+
+def benchmark_document(html_path: Path, config: Optional[ParserConfig] = None) -> Dict:
+    """Measure the node tree of one parsed document"""
+    html = html_path.read_text()
+    config = config or ParserConfig(max_document_size=100 * 1024 * 1024)
+
+    # Parse once so module imports and caches aren't counted as the document's
+    parse_html(html, config=config)
+    gc.collect()
+
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    document = parse_html(html, config=config)
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    footprint = tree_footprint(document.root)
+    nodes, cells = footprint['nodes'], footprint['cells']
+    objects = nodes + cells
+    return {
+        'file': html_path.name,
+        'size_mb': len(html) / (1024 * 1024),
+        **footprint,
+        'bytes_per_node': (footprint['node_bytes'] + footprint['style_bytes']) / nodes if nodes else 0.0,
+        'bytes_per_cell': footprint['cell_bytes'] / cells if cells else 0.0,
+        'retained_mb': (retained - baseline) / (1024 * 1024),
+        'retained_bytes_per_node': (retained - baseline) / objects if objects else 0.0,
+        'peak_mb': (peak - baseline) / (1024 * 1024),
+    }
+
+
+def print_results(results: List[Dict]):
+    print(f"{'Document':<36} {'Nodes':>7} {'Cells':>7} {'Styles':>7} {'B/node':>7} {'B/cell':>7} "
+          f"{'Retained MB':>12} {'B/object (ret)':>15} {'Peak MB':>8}")
+    print('-' * 114)
+    for r in results:
+        print(f"{r['file'][:36]:<36} {r['nodes']:>7,} {r['cells']:>7,} {r['distinct_styles']:>7,} "
+              f"{r['bytes_per_node']:>7.0f} {r['bytes_per_cell']:>7.0f} {r['retained_mb']:>12.1f} "
+              f"{r['retained_bytes_per_node']:>15.0f} {r['peak_mb']:>8.1f}")
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Measure the memory footprint of parsed document trees')
+    parser.add_argument('--corpus', type=Path, default=Path('data/html'),
+                        help='Path to corpus directory')
+    parser.add_argument('--pattern', default='*.10-*.html',
+                        help='Glob pattern for HTML files')
+    parser.add_argument('--output', type=Path, default=None,
+                        help='Write the results as JSON')
+    args = parser.parse_args()
+
+    results = [benchmark_document(path) for path in sorted(args.corpus.glob(args.pattern))]
+    print_results(results)
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
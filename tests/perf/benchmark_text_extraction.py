@@ -0,0 +1,182 @@
+"""
+Benchmark text extraction from parsed documents.
+
+Measures what Document.text(), Section.text() and Filing.text() spend turning
+an already parsed document into text, most of which goes to rendering tables.
+Parsing is not timed: each run parses the document afresh, untimed, so that no
+text cached on the nodes by an earlier run is reused.
+
+Throughput is reported against the size of the source HTML, the same measure
+benchmark_html_parser.py uses for parsing.
+
+Usage:
+    python tests/perf/benchmark_text_extraction.py                  # 50 largest fixtures
+    python tests/perf/benchmark_text_extraction.py --rich           # tables rendered with Rich
+    python tests/perf/benchmark_text_extraction.py --table-width 500  # as Filing.text() extracts
+    python tests/perf/benchmark_text_extraction.py --sections --max-files 10
+"""
+
+import gc
+import json
+import statistics
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from edgar.documents import parse_html
+from edgar.documents.config import ParserConfig
+
+DEFAULT_CORPUS = (Path('data/html'), Path('tests/fixtures'))
+
+
+class TextExtractionBenchmark:
+    """Text extraction throughput over a corpus of filings."""
+
+    def __init__(self, corpus_dirs=DEFAULT_CORPUS, rich: bool = False, sections: bool = False,
+                 table_width: Optional[int] = None):
+        """
+        Initialize benchmark suite.
+
+        Args:
+            corpus_dirs: Directories searched recursively for HTML filings
+            rich: Render tables with Rich instead of the fast renderer
+            sections: Also extract the text of every detected section
+            table_width: table_max_col_width passed to Document.text()
+        """
+        self.corpus_dirs = [Path(d) for d in corpus_dirs]
+        self.rich = rich
+        self.sections = sections
+        self.table_width = table_width
+        self.results: List[Dict] = []
+
+    def corpus(self, max_files: int) -> List[Path]:
+        """The largest HTML files in the corpus directories."""
+        files = [path for directory in self.corpus_dirs
+                 for pattern in ('*.htm', '*.html') for path in directory.rglob(pattern)]
+        return sorted(files, key=lambda path: path.stat().st_size, reverse=True)[:max_files]
+
+    def benchmark_document(self, html_path: Path, runs: int = 3) -> Dict:
+        """
+        Benchmark extracting text from a single document.
+
+        Args:
+            html_path: Path to HTML file
+            runs: Number of runs to average
+
+        Returns:
+            Dict with benchmark results
+        """
+        html = html_path.read_text(errors='ignore')
+        size_mb = len(html.encode('utf-8')) / (1024 * 1024)
+        config = ParserConfig(max_document_size=100 * 1024 * 1024,
+                              fast_table_rendering=not self.rich)
+
+        times = []
+        text_chars = 0
+        for _ in range(runs):
+            document = parse_html(html, config=config)
+            gc.collect()
+
+            start = time.perf_counter()
+            text = document.text(table_max_col_width=self.table_width)
+            if self.sections:
+                for section in document.sections.values():
+                    section.text()
+            times.append(time.perf_counter() - start)
+            text_chars = len(text)
+
+        avg_time = statistics.mean(times)
+        return {
+            'file': html_path.name,
+            'size_mb': size_mb,
+            'tables': len(document.tables),
+            'text_chars': text_chars,
+            'avg_time_s': avg_time,
+            'min_time_s': min(times),
+            'throughput_mbs': size_mb / avg_time if avg_time > 0 else 0.0,
+        }
+
+    def benchmark_corpus(self, max_files: int = 50, runs: int = 3) -> List[Dict]:
+        """Benchmark every document in the corpus and print a summary."""
+        files = self.corpus(max_files)
+        renderer = 'Rich' if self.rich else 'fast'
+        print(f"Extracting text from {len(files)} documents ({renderer} table renderer), {runs} runs each\n")
+        print(f"{'File':<45} {'Size':>8} {'Tables':>7} {'Time':>9} {'MB/s':>8}")
+        print(f"{'-'*45} {'-'*8} {'-'*7} {'-'*9} {'-'*8}")
+
+        for html_path in files:
+            try:
+                result = self.benchmark_document(html_path, runs=runs)
+            except Exception as e:
+                print(f"{html_path.name:<45} failed: {e}")
+                continue
+            self.results.append(result)
+            print(f"{result['file'][:45]:<45} {result['size_mb']:>6.2f}MB {result['tables']:>7} "
+                  f"{result['avg_time_s']*1000:>7.1f}ms {result['throughput_mbs']:>8.1f}")
+
+        self.print_summary()
+        return self.results
+
+    def print_summary(self):
+        """Print aggregate throughput."""
+        if not self.results:
+            return
+        total_size = sum(r['size_mb'] for r in self.results)
+        total_time = sum(r['avg_time_s'] for r in self.results)
+        total_tables = sum(r['tables'] for r in self.results)
+
+        print(f"\n{'='*80}")
+        print("SUMMARY")
+        print(f"{'='*80}")
+        print(f"Documents: {len(self.results)}")
+        print(f"Tables: {total_tables}")
+        print(f"Total size: {total_size:.1f}MB")
+        print(f"Total time: {total_time:.2f}s")
+        print(f"Throughput: {total_size / total_time:.1f}MB/s")
+        print(f"Median document throughput: {statistics.median(r['throughput_mbs'] for r in self.results):.1f}MB/s")
+
+    def save_results(self, output_path: Path):
+        """Save benchmark results to JSON file."""
+        with open(output_path, 'w') as f:
+            json.dump({
+                'benchmark_date': time.strftime('%Y-%m-%d %H:%M:%S'),
+                'renderer': 'rich' if self.rich else 'fast',
+                'sections': self.sections,
+                'total_documents': len(self.results),
+                'results': self.results
+            }, f, indent=2)
+
+        print(f"\n📊 Results saved to {output_path}")
+
+
+def main():
+    """Run benchmark suite."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark text extraction throughput')
+    parser.add_argument('--corpus', type=Path, nargs='+', default=list(DEFAULT_CORPUS),
+                        help='Directories to search for HTML files')
+    parser.add_argument('--max-files', type=int, default=50,
+                        help='Number of documents, largest first')
+    parser.add_argument('--runs', type=int, default=3,
+                        help='Number of runs per file')
+    parser.add_argument('--rich', action='store_true',
+                        help='Render tables with Rich instead of the fast renderer')
+    parser.add_argument('--sections', action='store_true',
+                        help='Also extract the text of every detected section')
+    parser.add_argument('--table-width', type=int, default=None,
+                        help='Table column width passed to Document.text(); Filing.text() uses 500')
+    parser.add_argument('--output', type=Path, default=None,
+                        help='Output file for results')
+
+    args = parser.parse_args()
+
+    benchmark = TextExtractionBenchmark(corpus_dirs=args.corpus, rich=args.rich, sections=args.sections,
+                                        table_width=args.table_width)
+    benchmark.benchmark_corpus(max_files=args.max_files, runs=args.runs)
+    if args.output:
+        benchmark.save_results(args.output)
+
+
+if __name__ == '__main__':
+    main()
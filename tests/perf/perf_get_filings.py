@@ -1,12 +1,105 @@
-from edgar import *
-import os
+"""
+Benchmark parsing of the fixed width filing indexes behind get_filings.
 
+Compares the line-by-line parser get_filings used to run, which split every
+line with a regex in Python, with the vectorized parser in edgar._filings.
+A full quarterly form index is around 300k lines, so by default the committed
+daily index is repeated up to that size; pass a downloaded form.idx or
+company.idx to benchmark that instead.
 
-def get_filing_for_year_and_quarter():
-    filings = get_filings(year=2022, quarter=1)
-    print(filings)
+    python tests/perf/perf_get_filings.py
+    python tests/perf/perf_get_filings.py --lines 1000000
+    python tests/perf/perf_get_filings.py path/to/form.idx
+"""
+
+import argparse
+import re
+import time
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from edgar._filings import (
+    COMPANY_INDEX_FORM_COLUMN,
+    FORM_INDEX_FORM_COLUMN,
+    INDEX_COLUMN_NAMES,
+    read_index_file,
+)
+
+DEFAULT_INDEX = Path('data/index_files/form.20200318.idx')
+
+
+def read_index_file_by_line(index_text: str, form_column: int, filing_date_format: str) -> pa.Table:
+    """The previous parser: a regex split of every line in Python."""
+    lines = index_text.rstrip('\n').split('\n')
+    data_start = 0
+    for index, line in enumerate(lines):
+        if line.startswith("-----"):
+            data_start = index + 1
+            break
+    rows = [re.split(r" {2,}", line.strip()) for line in lines[data_start:] if line.strip()]
+    forms = pa.array([row[form_column] for row in rows])
+    ciks = pa.array([int(row[-3]) for row in rows], type=pa.int32())
+    dates = pc.cast(pc.strptime(pa.array([row[-2] for row in rows]), filing_date_format, 'us'), pa.date32())
+    accession_numbers = pa.array([row[-1][-24:-4] for row in rows])
+    if form_column == 0:
+        companies = pa.array([" ".join(row[1:-3]) for row in rows])
+    else:
+        companies = pa.array([" ".join(row[0:form_column]) for row in rows])
+    return pa.Table.from_arrays([forms, companies, ciks, dates, accession_numbers], names=INDEX_COLUMN_NAMES)
+
+
+def inflate_index(index_text: str, lines: int) -> str:
+    """Repeat the data lines of an index until it has at least ``lines`` of them."""
+    header, _, data = index_text.partition('\n-----')
+    dashes, _, data = data.partition('\n')
+    data_lines = data.rstrip('\n').split('\n')
+    repeats = -(-lines // len(data_lines))
+    return header + '\n-----' + dashes + '\n' + '\n'.join(data_lines * repeats) + '\n'
+
+
+def best_time(parse, runs: int) -> float:
+    best = float('inf')
+    for _ in range(runs):
+        start = time.perf_counter()
+        parse()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('index', nargs='?', type=Path, help='A form.idx or company.idx file to parse')
+    arg_parser.add_argument('--lines', type=int, default=300_000, help='Lines to inflate the default index to')
+    arg_parser.add_argument('--runs', type=int, default=5, help='Runs per parser')
+    args = arg_parser.parse_args()
+
+    path = args.index or DEFAULT_INDEX
+    index_text = path.read_text()
+    if args.index is None:
+        index_text = inflate_index(index_text, args.lines)
+    form_column = COMPANY_INDEX_FORM_COLUMN if path.name.startswith('company') else FORM_INDEX_FORM_COLUMN
+    # Daily indexes date filings as 20200318, quarterly indexes as 2020-03-18
+    date_format = '%Y%m%d' if re.search(r'\.\d{8}\.idx$', path.name) else '%Y-%m-%d'
+    index_bytes = index_text.encode()
+
+    expected = read_index_file_by_line(index_text, form_column, date_format)
+    assert read_index_file(index_text, form_column, date_format).equals(expected)
+    print(f"Index: {path.name} ({expected.num_rows:,} lines, {len(index_bytes) / (1024 * 1024):.1f} MB)\n")
+    print(f"{'Parser':<22} {'Best (s)':>9} {'Lines/sec':>12} {'Speedup':>8}")
+
+    parsers = [
+        ('line by line', lambda: read_index_file_by_line(index_text, form_column, date_format)),
+        ('vectorized (str)', lambda: read_index_file(index_text, form_column, date_format)),
+        ('vectorized (bytes)', lambda: read_index_file(index_bytes, form_column, date_format)),
+    ]
+    baseline = None
+    for name, parse in parsers:
+        seconds = best_time(parse, args.runs)
+        baseline = baseline or seconds
+        print(f"{name:<22} {seconds:>9.3f} {expected.num_rows / seconds:>12,.0f} {baseline / seconds:>7.1f}x")
 
 
 if __name__ == '__main__':
-    # print(os.environ.get('EDGAR_IDENTITY'))
-    get_filing_for_year_and_quarter()
+    main()
@@ -1,42 +1,90 @@
-import timeit
+"""
+Benchmark the tree-based and streaming (iterparse) instance document parsers.
+
+Each parse runs in a fresh process so its peak RSS is not polluted by the other.
+Fixture instance documents are only a few MB, so by default one is inflated to
+a large instance by repeating its facts; pass a real instance document to
+benchmark that instead.
+
+    python tests/perf/perf_instance_parsing.py
+    python tests/perf/perf_instance_parsing.py --scale 60
+    python tests/perf/perf_instance_parsing.py path/to/huge_instance.xml
+"""
+
+import argparse
+import multiprocessing
+import resource
+import sys
+import tempfile
+import time
 from pathlib import Path
-from legacy.xbrl import XBRLInstance
-
-instance_xml = None
-
-def setup_code():
-    global instance_xml
-    instance_xml = Path('data/xbrl/datafiles/aapl/aapl-20230930_htm.xml').read_text()
-
-def parse_function():
-    global instance_xml
-    XBRLInstance.parse(instance_xml)
-
-if __name__ == "__main__":
-    # Warm-up run
-    setup_code()
-    parse_function()
-
-    # Number of repetitions for each test
-    number = 10
-    # Number of times to repeat the test
-    repeat = 5
-
-    # Run the benchmark
-    results = timeit.repeat(
-        stmt="parse_function()",
-        setup="from __main__ import setup_code, parse_function; setup_code()",
-        number=number,
-        repeat=repeat,
-        globals=globals()
-    )
-
-    # Process and print results
-    avg_time = sum(results) / len(results)
-    best_time = min(results)
-    worst_time = max(results)
-
-    print(f"Average time: {avg_time:.6f} seconds")
-    print(f"Best time: {best_time:.6f} seconds")
-    print(f"Worst time: {worst_time:.6f} seconds")
-    print(f"Standard deviation: {(sum((x - avg_time) ** 2 for x in results) / len(results)) ** 0.5:.6f} seconds")
\ No newline at end of file
+
+from lxml import etree as ET
+
+DEFAULT_INSTANCE = Path('tests/fixtures/xbrl/aapl/aapl-20230930_htm.xml')
+
+
+def inflate_instance(source: Path, scale: int, destination: Path) -> Path:
+    """Write an instance document with the facts of ``source`` repeated ``scale`` times."""
+    root = ET.parse(str(source)).getroot()
+    facts = [child for child in root if isinstance(child.tag, str) and child.get('contextRef')]
+    for _ in range(scale - 1):
+        for fact in facts:
+            root.append(ET.fromstring(ET.tostring(fact)))
+    ET.ElementTree(root).write(str(destination), xml_declaration=True, encoding='utf-8')
+    return destination
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def _parse(path: str, streaming: bool, results) -> None:
+    from edgar.xbrl.parsers.instance import InstanceParser
+
+    baseline = _peak_rss_mb()
+    parser = InstanceParser({}, {}, {}, {}, {}, {}, [], {})
+    start = time.perf_counter()
+    parser.parse_instance(path, streaming=streaming)
+    elapsed = time.perf_counter() - start
+    results.put({'seconds': elapsed, 'peak_rss_mb': _peak_rss_mb(), 'baseline_rss_mb': baseline,
+                 'facts': len(parser.facts)})
+
+
+def run_in_fresh_process(path: Path, streaming: bool) -> dict:
+    context = multiprocessing.get_context('spawn')
+    results = context.Queue()
+    process = context.Process(target=_parse, args=(str(path), streaming, results))
+    process.start()
+    result = results.get()
+    process.join()
+    return result
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('instance', nargs='?', type=Path, help='Instance document to parse')
+    arg_parser.add_argument('--scale', type=int, default=40, help='Times to repeat the default fixture facts')
+    arg_parser.add_argument('--runs', type=int, default=3, help='Runs per mode')
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = args.instance
+        if path is None:
+            path = inflate_instance(DEFAULT_INSTANCE, args.scale, Path(temp_dir) / 'inflated_htm.xml')
+        size_mb = path.stat().st_size / (1024 * 1024)
+        print(f"Instance: {path.name} ({size_mb:.1f} MB)\n")
+        print(f"{'Mode':<10} {'Facts':>9} {'Best (s)':>9} {'MB/s':>8} {'Peak RSS (MB)':>14} {'Parse RSS (MB)':>15}")
+
+        for mode, streaming in (('tree', False), ('streaming', True)):
+            runs = [run_in_fresh_process(path, streaming) for _ in range(args.runs)]
+            best = min(run['seconds'] for run in runs)
+            peak = max(run['peak_rss_mb'] for run in runs)
+            growth = max(run['peak_rss_mb'] - run['baseline_rss_mb'] for run in runs)
+            print(f"{mode:<10} {runs[0]['facts']:>9,} {best:>9.2f} {size_mb / best:>8.1f} {peak:>14.0f} {growth:>15.0f}")
+
+
+if __name__ == '__main__':
+    main()
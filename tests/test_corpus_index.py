@@ -0,0 +1,105 @@
+"""Corpus-level inverted index, built from the committed HTML fixtures."""
+from pathlib import Path
+
+import pytest
+
+from edgar.documents import HTMLParser, ParserConfig
+from edgar.documents.ranking import CorpusIndex
+from edgar.documents.ranking.corpus import document_passages
+from edgar.documents.ranking.ranking import BM25Engine, HybridEngine
+
+pytestmark = pytest.mark.fast
+
+
+def parse(name: str, form: str):
+    return HTMLParser(ParserConfig(form=form)).parse(Path('data/html', name).read_text())
+
+
+@pytest.fixture(scope='module')
+def apple_10k():
+    return parse('Apple.10-K.html', '10-K')
+
+
+@pytest.fixture(scope='module')
+def apple_10q():
+    return parse('Apple.10-Q.html', '10-Q')
+
+
+@pytest.mark.parametrize('query', ['revenue growth iphone', 'risk factors supply chain', 'item 1a'])
+def test_single_document_scores_match_ranked_search(tmp_path, apple_10k, query):
+    index = CorpusIndex(tmp_path)
+    index.add('apple-10k', apple_10k)
+    passages = document_passages(apple_10k)
+
+    for engine, algorithm in ((BM25Engine(), 'bm25'), (HybridEngine(), 'hybrid')):
+        expected = engine.rank(query, passages)[:10]
+        results = index.search(query, top_k=10, algorithm=algorithm)
+        assert [r.passage for r in results] == [passages.index(r.node) for r in expected]
+        assert [r.score for r in results] == pytest.approx([r.score for r in expected])
+        assert results[0].text == expected[0].node.text()
+
+
+def test_documents_added_separately_score_as_one_corpus(tmp_path, apple_10k, apple_10q):
+    together = CorpusIndex(tmp_path / 'together')
+    together.add_many([('10-K', apple_10k, {}), ('10-Q', apple_10q, {})])
+    separate = CorpusIndex(tmp_path / 'separate')
+    separate.add('10-K', apple_10k)
+    separate.add('10-Q', apple_10q)
+
+    for query in ['net sales by category', 'iphone mac ipad']:
+        expected = [(r.key, r.passage, r.score) for r in together.search(query, top_k=20)]
+        results = [(r.key, r.passage, r.score) for r in separate.search(query, top_k=20)]
+        assert [r[:2] for r in results] == [r[:2] for r in expected]
+        assert [r[2] for r in results] == pytest.approx([r[2] for r in expected])
+    assert {r.key for r in separate.search('net sales', top_k=50)} == {'10-K', '10-Q'}
+
+
+def test_terms_in_most_passages_take_the_average_idf_floor(tmp_path):
+    # "revenue" is in three of the four passages, so BM25Okapi floors its negative idf
+    paragraphs = [['Revenue grew in Europe.', 'Revenue fell in Asia.'],
+                  ['Revenue was flat.', 'Margins improved in Europe.']]
+    documents = [HTMLParser(ParserConfig()).parse('<html><body>' + ''.join(f'<p>{p}</p>' for p in ps) +
+                                                  '</body></html>') for ps in paragraphs]
+    index = CorpusIndex(tmp_path)
+    index.add('first', documents[0])
+    index.add('second', documents[1])
+
+    passages = [node for document in documents for node in document_passages(document)]
+    expected = BM25Engine().rank('revenue europe', passages)
+    results = index.search('revenue europe')
+    assert [r.text for r in results] == [r.node.text() for r in expected]
+    assert [r.score for r in results] == pytest.approx([r.score for r in expected])
+
+
+def test_index_is_reopened_from_disk(tmp_path, apple_10k, apple_10q):
+    index = CorpusIndex(tmp_path)
+    index.add('10-K', apple_10k, form='10-K')
+    index.add('10-Q', apple_10q, form='10-Q')
+    expected = index.search('iphone', top_k=5)
+
+    reopened = CorpusIndex(tmp_path)
+
+    assert len(reopened) == 2 and '10-Q' in reopened
+    assert reopened.search('iphone', top_k=5) == expected
+    assert not reopened.add('10-K', apple_10k)
+    assert len(list(tmp_path.glob('segment-*'))) == 2
+
+
+def test_search_filters_by_key_and_metadata(tmp_path, apple_10k, apple_10q):
+    index = CorpusIndex(tmp_path)
+    index.add('10-K', apple_10k, form='10-K')
+    index.add('10-Q', apple_10q, form='10-Q')
+
+    assert {r.key for r in index.search('net sales', top_k=50, form='10-Q')} == {'10-Q'}
+    assert {r.key for r in index.search('net sales', top_k=50, keys=['10-K'])} == {'10-K'}
+    assert index.search('net sales', form='8-K') == []
+    assert index.search('zzzunknownterm') == []
+
+
+def test_documents_without_text_are_not_indexed(tmp_path):
+    empty = HTMLParser(ParserConfig()).parse('<html><body><div></div></body></html>')
+    index = CorpusIndex(tmp_path)
+    assert not index.add('empty', empty)
+    assert len(index) == 0
+    assert not list(tmp_path.glob('segment-*'))
+    assert index.search('revenue') == []
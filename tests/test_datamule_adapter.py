@@ -6,6 +6,7 @@ Tests use both synthetic tar fixtures (backward compat) and the real
 """
 
 import json
+import shutil
 import tarfile
 from io import BytesIO
 from pathlib import Path
@@ -19,6 +20,7 @@ from edgar.storage.datamule.storage import (
     is_using_datamule_storage,
     get_datamule_filing,
     _normalize_accession,
+    DATAMULE_INDEX_NAME,
 )
 from edgar.storage.datamule.metadata import (
     filing_header_from_metadata,
@@ -167,14 +169,23 @@ def batch_tar(tmp_path):
     return tar_path
 
 
+@pytest.fixture
+def real_tar_dir(tmp_path):
+    """A copy of the real tar fixture, so the index saved beside it stays out of the repo."""
+    shutil.copy(REAL_TAR_PATH, tmp_path / REAL_TAR_PATH.name)
+    return tmp_path
+
+
 @pytest.fixture(autouse=True)
 def _reset_datamule_state():
     """Reset datamule state before and after each test."""
     _storage_mod._datamule_path = None
     _storage_mod._accession_index.clear()
+    _storage_mod._member_index.clear()
     yield
     _storage_mod._datamule_path = None
     _storage_mod._accession_index.clear()
+    _storage_mod._member_index.clear()
 
 
 # ---------------------------------------------------------------------------
@@ -455,6 +466,67 @@ class TestReader:
         assert result is None
 
 
+# ---------------------------------------------------------------------------
+# TestPersistedIndex — saved member offsets and seek-based reads
+# ---------------------------------------------------------------------------
+
+def _documents(filing):
+    return [(doc.sequence, doc.type, doc.filename, doc.content)
+            for docs in filing._documents_by_sequence.values() for doc in docs]
+
+
+class TestPersistedIndex:
+
+    def test_index_saved_beside_tars(self, batch_tar):
+        use_datamule_storage(batch_tar.parent)
+        saved = json.loads((batch_tar.parent / DATAMULE_INDEX_NAME).read_text())
+        filings = saved['tars']['batch.tar']['filings']
+        assert set(filings) == {'0001193125-24-012345', '0001193125-24-067890'}
+        assert filings['0001193125-24-067890']['prefix'] == '0001193125-24-067890/'
+        assert [member[0] for member in filings['0001193125-24-067890']['members']] == \
+            ['0001193125-24-067890/primary-document.htm']
+
+    def test_saved_index_reused_for_unchanged_tars(self, batch_tar):
+        use_datamule_storage(batch_tar.parent)
+        with patch.object(_storage_mod, '_index_tar_members') as index_tar:
+            use_datamule_storage(batch_tar.parent)
+        index_tar.assert_not_called()
+        assert _storage_mod._accession_index['0001193125-24-067890'] == batch_tar
+
+    def test_changed_tar_reindexed(self, single_tar):
+        use_datamule_storage(single_tar.parent)
+        other = {**SAMPLE_METADATA, 'accession_number': '0000320193-24-000001'}
+        single_tar.write_bytes(_make_tar_bytes(other, {'primary-document.htm': SAMPLE_HTML}))
+        use_datamule_storage(single_tar.parent)
+        assert list(_storage_mod._accession_index) == ['0000320193-24-000001']
+        assert get_datamule_filing('0000320193-24-000001').accession_number == '0000320193-24-000001'
+
+    def test_read_by_offset_matches_tarfile(self, single_tar, batch_tar):
+        use_datamule_storage(single_tar.parent)
+        for accession_no in ['0001193125-24-012345', '0001193125-24-067890']:
+            tar_path = _storage_mod._accession_index[accession_no]
+            with patch('edgar.storage.datamule.reader.tarfile.open') as open_tar:
+                filing = get_datamule_filing(accession_no)
+            open_tar.assert_not_called()
+            expected = load_filing_from_tar(tar_path, accession_no=accession_no)
+            assert filing.accession_number == accession_no
+            assert _documents(filing) == _documents(expected)
+
+    def test_compressed_tar_read_with_tarfile(self, tmp_path):
+        tar_path = tmp_path / 'filing.tar'
+        with tarfile.open(tar_path, 'w:gz') as tf:
+            for name, content in [('metadata.json', json.dumps(SAMPLE_METADATA)), ('primary-document.htm', SAMPLE_HTML)]:
+                data = content.encode('utf-8')
+                info = tarfile.TarInfo(name=name)
+                info.size = len(data)
+                tf.addfile(info, BytesIO(data))
+        use_datamule_storage(tmp_path)
+        assert '0001193125-24-012345' not in _storage_mod._member_index
+        filing = get_datamule_filing('0001193125-24-012345')
+        assert filing.form == '10-K'
+        assert _documents(filing)[0][3] == SAMPLE_HTML
+
+
 # ---------------------------------------------------------------------------
 # TestRealTarFixture — loads the real 000143774924000106.tar
 # ---------------------------------------------------------------------------
@@ -547,14 +619,14 @@ class TestRealTarFixture:
         assert filing is not None
         assert filing.accession_number == '0001437749-24-000106'
 
-    def test_index_real_tar(self):
+    def test_index_real_tar(self, real_tar_dir):
         """use_datamule_storage should index the real tar correctly."""
-        use_datamule_storage(REAL_TAR_PATH.parent)
+        use_datamule_storage(real_tar_dir)
         assert '0001437749-24-000106' in _storage_mod._accession_index
 
-    def test_get_datamule_filing_real(self):
+    def test_get_datamule_filing_real(self, real_tar_dir):
         """get_datamule_filing should load the real tar correctly."""
-        use_datamule_storage(REAL_TAR_PATH.parent)
+        use_datamule_storage(real_tar_dir)
         filing = get_datamule_filing('0001437749-24-000106')
         assert filing is not None
         assert filing.accession_number == '0001437749-24-000106'
@@ -568,11 +640,11 @@ class TestRealTarFixture:
 @pytest.mark.skipif(not REAL_TAR_PATH.exists(), reason="Real tar fixture not available")
 class TestFilingSgmlIntegration:
 
-    def test_filing_object_resolves_from_datamule(self):
+    def test_filing_object_resolves_from_datamule(self, real_tar_dir):
         """A Filing object should be able to load from datamule without network."""
         from edgar._filings import Filing
 
-        use_datamule_storage(REAL_TAR_PATH.parent)
+        use_datamule_storage(real_tar_dir)
 
         # Create a Filing that matches the real tar
         filing = Filing(
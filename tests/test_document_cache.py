@@ -0,0 +1,115 @@
+"""Persistent cache of parsed Documents, run offline against the committed HTML fixtures."""
+from pathlib import Path
+
+import pytest
+
+from edgar._filings import Filing
+from edgar.documents import HTMLParser, ParserConfig
+from edgar.documents.cache import PRIMARY_DOCUMENT, DocumentCache, get_document_cache, set_document_cache
+from edgar.documents.table_nodes import TableNode
+
+pytestmark = pytest.mark.fast
+
+ACCESSION = '0000320193-23-000106'
+APPLE_10K = Path('data/html/Apple.10-K.html')
+
+
+@pytest.fixture(scope='module')
+def apple_10k():
+    return HTMLParser(ParserConfig(form='10-K')).parse(APPLE_10K.read_text())
+
+
+@pytest.fixture
+def document_cache(tmp_path):
+    cache = DocumentCache(cache_dir=tmp_path / 'document_cache')
+    set_document_cache(cache)
+    yield cache
+    set_document_cache(None)
+
+
+def test_cached_document_matches_the_parsed_one(tmp_path, apple_10k):
+    config = ParserConfig(form='10-K')
+    cache = DocumentCache(cache_dir=tmp_path)
+    cache.put(ACCESSION, PRIMARY_DOCUMENT, config, apple_10k)
+
+    cached = cache.get(ACCESSION, PRIMARY_DOCUMENT, config)
+
+    assert cached.text() == apple_10k.text()
+    assert cached.to_markdown() == apple_10k.to_markdown()
+    assert len(cached.tables) == len(apple_10k.tables)
+    table, cached_table = apple_10k.tables[10], cached.tables[10]
+    assert isinstance(cached_table, TableNode)
+    assert cached_table.table_type == table.table_type
+    assert cached_table.to_dataframe().equals(table.to_dataframe())
+    assert cached.metadata.form == '10-K'
+    assert cached.metadata.statistics == apple_10k.metadata.statistics
+    # Sections are detected again from the original HTML kept alongside the tree
+    assert cached.sections.get_item('1A').text() == apple_10k.sections.get_item('1A').text()
+
+
+def test_original_html_is_read_on_first_access(tmp_path, apple_10k):
+    config = ParserConfig(form='10-K')
+    cache = DocumentCache(cache_dir=tmp_path)
+    cache.put(ACCESSION, PRIMARY_DOCUMENT, config, apple_10k)
+
+    cached = cache.get(ACCESSION, PRIMARY_DOCUMENT, config)
+    assert 'original_html' not in cached.metadata.__dict__
+    assert cached.metadata.original_html == apple_10k.metadata.original_html
+
+
+def test_entries_are_keyed_by_parser_config(tmp_path, apple_10k):
+    cache = DocumentCache(cache_dir=tmp_path)
+    cache.put(ACCESSION, PRIMARY_DOCUMENT, ParserConfig(form='10-K'), apple_10k)
+
+    assert (ACCESSION, PRIMARY_DOCUMENT, ParserConfig(form='10-K')) in cache
+    assert cache.get(ACCESSION, PRIMARY_DOCUMENT, ParserConfig(form='10-K', detect_sections=False)) is None
+    assert cache.get(ACCESSION, 'ex99-1.htm', ParserConfig(form='10-K')) is None
+
+
+def test_entries_from_another_version_are_discarded(tmp_path, apple_10k):
+    config = ParserConfig(form='10-K')
+    DocumentCache(cache_dir=tmp_path, version='old').put(ACCESSION, PRIMARY_DOCUMENT, config, apple_10k)
+
+    cache = DocumentCache(cache_dir=tmp_path)
+    assert cache.get(ACCESSION, PRIMARY_DOCUMENT, config) is None
+    assert cache.get_stats()['entries'] == 0
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    html = '<html><body><p>' + 'Revenue grew. ' * 20000 + '</p></body></html>'
+    config = ParserConfig()
+    document = HTMLParser(config).parse(html)
+    cache = DocumentCache(cache_dir=tmp_path, max_size_mb=0.5)
+
+    cache.put('first', PRIMARY_DOCUMENT, config, document)
+    cache.put('second', PRIMARY_DOCUMENT, config, document)
+
+    assert cache.get('first', PRIMARY_DOCUMENT, config) is None
+    assert cache.get('second', PRIMARY_DOCUMENT, config).text() == document.text()
+
+
+class FixtureFiling(Filing):
+    """A Filing whose primary document is the Apple 10-K fixture, counting fetches."""
+    fetches = 0
+
+    def html(self):
+        FixtureFiling.fetches += 1
+        return APPLE_10K.read_text()
+
+
+def test_filing_parse_loads_a_seen_filing_from_the_cache(document_cache):
+    FixtureFiling.fetches = 0
+    filing = FixtureFiling(cik=320193, company='Apple Inc.', form='10-K', filing_date='2023-11-03',
+                           accession_no=ACCESSION)
+    parsed = filing.parse()
+    # Clearing Filing.parse's in-memory memo stands in for a new session
+    Filing.parse.cache_clear()
+    cached = filing.parse()
+
+    assert FixtureFiling.fetches == 1
+    assert document_cache.get_stats()['cache_hits'] == 1
+    assert cached.text() == parsed.text()
+
+
+def test_cache_is_off_unless_enabled():
+    assert get_document_cache() is None
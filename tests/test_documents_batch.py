@@ -0,0 +1,85 @@
+"""Batch parsing of documents in a process pool with parse_many.
+
+Inputs are small HTML strings and stand-in filings whose HTML is already in
+hand, so nothing touches the network.
+"""
+import pickle
+from pathlib import Path
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from edgar.documents import HTMLParser, ParserConfig, ParseResult, parse_many
+
+pytestmark = pytest.mark.fast
+
+HTML = [
+    "<html><body><p>First document</p><table><tr><td>Revenue</td><td>10</td></tr></table></body></html>",
+    "<html><body><p>Second document</p></body></html>",
+    b"<html><body><p>Third document</p></body></html>",
+]
+
+
+def _filing(accession_no, html=None, error=None):
+    def fetch_html():
+        if error:
+            raise error
+        return html
+    return SimpleNamespace(accession_no=accession_no, form='10-K', html=fetch_html)
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_results_cover_every_input(workers):
+    results = sorted(parse_many(HTML, workers=workers, artifacts=['text', 'tables']), key=lambda r: r.index)
+
+    assert [r.index for r in results] == [0, 1, 2]
+    assert all(r.ok for r in results)
+    assert 'First document' in results[0].text
+    assert 'Third document' in results[2].text
+    assert isinstance(results[0].tables[0], pd.DataFrame)
+    assert results[1].tables == []
+    # Only what was asked for comes back
+    assert all(r.document is None and r.markdown is None for r in results)
+    assert all(r.total_time >= r.parse_time > 0 for r in results)
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_failures_are_reported_per_document(workers):
+    items = [
+        _filing('0000000001-24-000001', html=HTML[0]),
+        _filing('0000000001-24-000002', error=ConnectionError("unreachable")),
+        _filing('0000000001-24-000003', html="Just some text"),
+        "<p>" + "x" * 2000 + "</p>",
+    ]
+    results = {r.index: r for r in parse_many(items, workers=workers, artifacts=['markdown'],
+                                               config=ParserConfig(max_document_size=1000))}
+
+    assert results[0].ok and results[0].accession_no == '0000000001-24-000001'
+    assert 'First document' in results[0].markdown
+    assert results[1].error == "ConnectionError: unreachable"
+    assert results[2].error == "ValueError: Filing has no HTML document"
+    assert results[3].error.startswith("DocumentTooLargeError")
+    assert results[3].accession_no is None
+
+
+def test_documents_come_back_from_the_pool():
+    results = sorted(parse_many(HTML[:2], workers=2), key=lambda r: r.index)
+
+    assert 'Second document' in results[1].document.text()
+    assert all(isinstance(r, ParseResult) and r.text is None for r in results)
+
+
+def test_unknown_artifacts_are_rejected_before_parsing():
+    with pytest.raises(ValueError, match='pdf'):
+        parse_many(HTML, artifacts=['pdf'])
+
+
+def test_document_with_detected_sections_pickles():
+    html = Path('data/html/Apple.10-K.html').read_text()
+    document = HTMLParser(ParserConfig(form='10-K')).parse(html)
+    risk_factors = document.sections.get_item('1A').text()
+
+    restored = pickle.loads(pickle.dumps(document))  # nosec B301 - trusted local payload
+
+    assert restored.sections.get_item('1A').text() == risk_factors
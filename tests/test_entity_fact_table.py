@@ -0,0 +1,123 @@
+"""
+Tests for the columnar fact storage behind EntityFacts.
+
+Parsed company facts are held as a FactTable and only turned into
+FinancialFact objects when used. Each test checks the columnar path against
+an EntityFacts built from the same facts as a list.
+"""
+
+import json
+from datetime import date
+from pathlib import Path
+
+import pytest
+from pandas.testing import assert_frame_equal
+
+from edgar.entity.entity_facts import EntityFacts
+from edgar.entity.fact_table import FactTable
+from edgar.entity.models import FinancialFact
+from edgar.entity.parser import EntityFactsParser
+from edgar.entity.query import FactQuery
+
+pytestmark = pytest.mark.fast
+
+REVENUE = 'us-gaap:RevenueFromContractWithCustomerExcludingAssessedTax'
+
+
+@pytest.fixture(scope='module')
+def snow_json():
+    return json.loads(Path("tests/fixtures/entity/snow_facts.json").read_text('utf-8'))
+
+
+@pytest.fixture()
+def parsed(snow_json):
+    return EntityFactsParser.parse_company_facts(snow_json)
+
+
+@pytest.fixture()
+def from_list(snow_json):
+    facts = list(EntityFactsParser.parse_company_facts(snow_json))
+    return EntityFacts(cik=1640147, name="SNOWFLAKE INC.", facts=facts)
+
+
+def test_facts_are_built_when_used(parsed):
+    assert len(parsed) > 0
+    assert parsed._fact_list is None
+
+    fact = parsed.get_fact(REVENUE)
+    assert isinstance(fact, FinancialFact)
+    assert parsed.get_fact(REVENUE) is fact
+    parsed.time_series(REVENUE)
+    assert parsed._fact_list is None
+
+    facts = list(parsed)
+    assert len(facts) == len(parsed)
+    assert any(f is fact for f in facts)
+
+
+def test_to_dataframe_matches_fact_list(parsed, from_list):
+    assert_frame_equal(parsed.to_dataframe(), from_list.to_dataframe())
+    assert_frame_equal(parsed.to_dataframe(include_metadata=True, pit_mode=True),
+                       from_list.to_dataframe(include_metadata=True, pit_mode=True))
+    assert_frame_equal(parsed.to_dataframe(columns=['concept', 'fiscal_year', 'numeric_value']),
+                       from_list.to_dataframe(columns=['concept', 'fiscal_year', 'numeric_value']))
+
+
+@pytest.mark.parametrize('concept', [REVENUE, 'Revenue', 'us-gaap:Assets', 'cash', 'NoSuchConcept'])
+def test_time_series_matches_query(parsed, from_list, concept):
+    expected = FactQuery(list(from_list), from_list._fact_index) \
+        .by_concept(concept, exact=":" in concept) \
+        .sort_by('filing_date', ascending=False) \
+        .to_dataframe('period_start', 'period_end', 'numeric_value', 'fiscal_period', 'fiscal_year') \
+        .head(8)
+    result = parsed.time_series(concept, periods=8)
+    if expected.empty:
+        assert result.empty
+    else:
+        assert_frame_equal(result.drop(columns='duration_days'), expected[result.columns.drop('duration_days')])
+
+
+@pytest.mark.parametrize('period_type', ['annual', 'quarterly', 'monthly'])
+def test_filter_by_period_type_matches_query(parsed, period_type):
+    expected = parsed.query().by_period_type(period_type).execute()
+    filtered = parsed.filter_by_period_type(period_type)
+    assert list(filtered) == expected
+    # The filtered facts are the same objects, and keep their columns
+    assert all(a is b for a, b in zip(filtered, expected, strict=True))
+    assert_frame_equal(filtered.to_dataframe(include_metadata=True),
+                       EntityFacts(1640147, "SNOWFLAKE INC.", facts=expected).to_dataframe(include_metadata=True))
+
+    with pytest.raises(NotImplementedError):
+        parsed.filter_by_period_type('ttm')
+
+
+def test_available_periods_match_fact_list(parsed, from_list):
+    assert_frame_equal(parsed.available_periods().to_dataframe(), from_list.available_periods().to_dataframe())
+    assert_frame_equal(parsed.available_periods(REVENUE).to_dataframe(),
+                       from_list.available_periods(REVENUE).to_dataframe())
+
+
+def test_indexes_match_fact_list(parsed, from_list):
+    for name in ('by_concept', 'by_period', 'by_statement', 'by_form', 'by_fiscal_year', 'by_fiscal_period'):
+        index, expected = parsed._fact_index[name], from_list._fact_index[name]
+        assert sorted(index, key=str) == sorted(expected, key=str)
+        for key in list(expected)[:25]:
+            assert index[key] == expected[key]
+    assert parsed._fact_index['by_concept'].get('NoSuchConcept', []) == []
+
+
+def test_fact_list_changes_rebuild_table():
+    fact = FinancialFact(concept="us-gaap:Revenue", taxonomy="us-gaap", label="Revenue", value=100,
+                         numeric_value=100.0, unit="USD", period_start=date(2023, 1, 1),
+                         period_end=date(2023, 12, 31), period_type="duration", fiscal_year=2023,
+                         fiscal_period="FY", filing_date=date(2024, 2, 1))
+    facts = EntityFacts(cik=1, name="Test", facts=[])
+    assert facts.to_dataframe().empty
+    assert facts.time_series('Revenue').empty
+
+    facts._facts.append(fact)
+    facts._fact_index = facts._build_indices()
+    assert facts.get_fact('us-gaap:Revenue') is fact
+    assert facts.time_series('us-gaap:Revenue')['numeric_value'].tolist() == [100.0]
+    assert isinstance(facts._table, FactTable)
+    assert len(facts.filter_by_period_type('annual')) == 1
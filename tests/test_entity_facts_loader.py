@@ -0,0 +1,122 @@
+"""
+Tests for loading the facts of many companies at once.
+
+The companies are read from local storage, set up from the committed entity
+fixtures, so nothing touches the network.
+"""
+
+import json
+import shutil
+import threading
+import time
+from pathlib import Path
+
+import pyarrow as pa
+import pytest
+
+from edgar.entity import facts_loader, get_company_facts_many
+from edgar.entity.entity_facts import (
+    _company_facts_cache,
+    clear_company_facts_cache,
+    get_company_facts,
+    set_company_facts_cache_size,
+)
+from edgar.entity.facts_loader import COMPANY_FACTS_SCHEMA, load_company_facts
+from edgar.entity.parser import EntityFactsParser
+from edgar.exceptions import CompanyFactsNotFoundError
+
+pytestmark = pytest.mark.fast
+
+FIXTURES = Path("tests/fixtures/entity")
+SNOW, LPA, MISSING = 1640147, 1997711, 1
+
+
+@pytest.fixture()
+def local_facts(tmp_path, monkeypatch):
+    companyfacts = tmp_path / "companyfacts"
+    companyfacts.mkdir()
+    shutil.copy(FIXTURES / "snow_facts.json", companyfacts / f"CIK{SNOW:010}.json")
+    shutil.copy(FIXTURES / "lpa_facts.json", companyfacts / f"CIK{LPA:010}.json")
+    monkeypatch.setenv("EDGAR_USE_LOCAL_DATA", "1")
+    monkeypatch.setenv("EDGAR_LOCAL_DATA_DIR", str(tmp_path))
+    clear_company_facts_cache()
+    yield companyfacts
+    clear_company_facts_cache()
+
+
+def _expected_rows(name):
+    return len(EntityFactsParser.parse_company_facts(json.loads((FIXTURES / name).read_text('utf-8'))))
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_load_company_facts_keeps_order_and_reports_failures(local_facts, workers):
+    loaded, failed = load_company_facts([LPA, MISSING, str(SNOW), LPA], workers=workers)
+    assert list(loaded) == [LPA, SNOW]
+    assert loaded[SNOW].name == "SNOWFLAKE INC."
+    assert len(loaded[LPA]) == _expected_rows("lpa_facts.json")
+    assert list(failed) == [MISSING]
+    assert isinstance(failed[MISSING], CompanyFactsNotFoundError)
+
+
+def test_loaded_companies_are_cached_under_the_cache_bound(local_facts):
+    loaded, _ = load_company_facts([SNOW, LPA], workers=1)
+    # The cache keeps one company by default, as get_company_facts() alone would
+    assert list(_company_facts_cache) == [LPA]
+
+    set_company_facts_cache_size(2)
+    try:
+        loaded, _ = load_company_facts([SNOW, LPA], workers=1)
+        assert list(_company_facts_cache) == [SNOW, LPA]
+        assert get_company_facts(SNOW) is loaded[SNOW]
+
+        # Cached companies are not read again
+        shutil.rmtree(local_facts)
+        again, failed = load_company_facts([LPA, SNOW], workers=1)
+        assert not failed
+        assert again[LPA] is loaded[LPA]
+    finally:
+        set_company_facts_cache_size(1)
+    assert list(_company_facts_cache) == [SNOW]
+
+
+def test_jobs_in_flight_are_bounded(local_facts, monkeypatch):
+    parse = facts_loader._parse_company_facts
+    lock = threading.Lock()
+    running, most = [0], [0]
+
+    def counting_parse(cik, content):
+        with lock:
+            running[0] += 1
+            most[0] = max(most[0], running[0])
+        try:
+            time.sleep(0.05)
+            return parse(cik, content)
+        finally:
+            with lock:
+                running[0] -= 1
+
+    monkeypatch.setattr(facts_loader, '_parse_company_facts', counting_parse)
+    monkeypatch.setattr(facts_loader, 'JOBS_IN_FLIGHT_PER_WORKER', 1)
+    loaded, failed = load_company_facts([SNOW, LPA, MISSING, 2, 3], workers=1)
+    assert list(loaded) == [SNOW, LPA]
+    assert len(failed) == 3
+    assert most[0] == 1
+
+
+def test_get_company_facts_many_is_one_table(local_facts):
+    table = get_company_facts_many([SNOW, MISSING, LPA], workers=2)
+    assert table.schema == COMPANY_FACTS_SCHEMA
+    snow_rows, lpa_rows = _expected_rows("snow_facts.json"), _expected_rows("lpa_facts.json")
+    assert table.num_rows == snow_rows + lpa_rows
+    assert table['cik'].to_pylist() == [SNOW] * snow_rows + [LPA] * lpa_rows
+
+    snow = table.slice(0, snow_rows).drop_columns(['cik'])
+    assert snow.equals(get_company_facts(SNOW)._table.to_arrow())
+
+
+def test_get_company_facts_many_with_no_companies(local_facts):
+    table = get_company_facts_many([MISSING])
+    assert isinstance(table, pa.Table)
+    assert table.num_rows == 0
+    assert table.schema == COMPANY_FACTS_SCHEMA
+    assert get_company_facts_many([]).num_rows == 0
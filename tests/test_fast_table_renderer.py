@@ -646,3 +646,32 @@ def test_simple_style_preserves_all_columns():
 
     print("✓ All columns preserved after colspan handling")
     print(f"  Table contains: 2024, 2023, 2022, Change, iPhone, Mac, and all values")
+
+
+def test_table_without_config_renders_with_fast_renderer():
+    """A TableNode built by hand, with no parser config, renders without Rich."""
+    table = FastTableRendererTestSuite().create_test_table(5, 4)
+
+    assert table.text() == FastTableRenderer(TableStyle.simple()).render_table_node(table)
+
+    table._config = ParserConfig(fast_table_rendering=False)
+    table.clear_text_cache()
+    assert table.text() == rich_to_text(table.render(width=195))
+
+
+def test_document_text_renders_each_table_once():
+    """Filing.text()'s column width is the fast renderer's own, so tables render once and are cached."""
+    from unittest.mock import patch
+
+    from edgar.documents import parse_html
+
+    html = Path('data/html/Apple.10-K.html').read_text()
+    document = parse_html(html)
+    render = FastTableRenderer.render_table_node
+    with patch.object(FastTableRenderer, 'render_table_node', autospec=True, side_effect=render) as rendered:
+        text = document.text(table_max_col_width=500)
+    assert rendered.call_count == len(document.tables)
+    assert text == parse_html(html).text()
+
+    # Any other width still gets a rendering of its own
+    assert document.text(table_max_col_width=40) != text
@@ -0,0 +1,105 @@
+import gzip
+import json
+from contextlib import asynccontextmanager
+from datetime import date
+
+import pyarrow as pa
+import pytest
+
+from edgar._filings import Filings
+from edgar.storage import FetchManifest, fetch_filings
+
+ACCESSION_NUMBERS = ['0000320193-24-000001', '0000320193-24-000002', '0000789019-24-000003']
+
+
+def _filings() -> Filings:
+    return Filings(pa.table({
+        'form': ['8-K', '8-K', '8-K', '8-K'],
+        'company': ['Apple', 'Apple', 'Microsoft', 'Microsoft Subsidiary'],
+        'cik': pa.array([320193, 320193, 789019, 789020], type=pa.int32()),
+        'filing_date': pa.array([date(2024, 1, 2), date(2024, 1, 3), date(2024, 1, 3), date(2024, 1, 3)],
+                                type=pa.date32()),
+        # The last two rows are one submission with two filers
+        'accession_number': ACCESSION_NUMBERS + [ACCESSION_NUMBERS[2]],
+    }))
+
+
+@pytest.fixture
+def fake_sec(monkeypatch):
+    """Serve a submission for every accession number except the ones in `failing`"""
+    requested = []
+    failing = set()
+
+    @asynccontextmanager
+    async def fake_client():
+        yield None
+
+    async def fake_download(client, url, as_text=None, path=None):
+        requested.append(url)
+        accession_number = url.rsplit('/', 1)[-1][:-len('.txt')]
+        if accession_number in failing:
+            raise ConnectionError(f"Could not fetch {url}")
+        return f"<SEC-DOCUMENT>{accession_number}</SEC-DOCUMENT>".encode()
+
+    monkeypatch.setattr('edgar.httpclient.async_http_client', fake_client)
+    monkeypatch.setattr('edgar.httprequests.download_file_async', fake_download)
+    return requested, failing
+
+
+@pytest.mark.fast
+def test_fetch_filings_writes_the_local_storage_layout(tmp_path, fake_sec):
+    requested, _ = fake_sec
+    result = fetch_filings(_filings(), data_directory=tmp_path, disable_progress=True)
+
+    assert result.requested == 3
+    assert result.downloaded == 3
+    assert not result.failed
+    assert len(requested) == 3
+    assert any(url.endswith('/data/789019/000078901924000003/0000789019-24-000003.txt') for url in requested)
+
+    path = tmp_path / '20240102' / '0000320193-24-000001.nc.gz'
+    assert gzip.decompress(path.read_bytes()) == b"<SEC-DOCUMENT>0000320193-24-000001</SEC-DOCUMENT>"
+    assert (tmp_path / '20240103' / '0000789019-24-000003.nc.gz').exists()
+    assert not list(tmp_path.glob('**/*.part'))
+
+
+@pytest.mark.fast
+def test_fetch_filings_uncompressed(tmp_path, fake_sec):
+    fetch_filings(_filings(), data_directory=tmp_path, compress=False, disable_progress=True)
+    path = tmp_path / '20240103' / '0000320193-24-000002.nc'
+    assert path.read_bytes() == b"<SEC-DOCUMENT>0000320193-24-000002</SEC-DOCUMENT>"
+
+
+@pytest.mark.fast
+def test_fetch_filings_resumes_and_retries_failures(tmp_path, fake_sec):
+    requested, failing = fake_sec
+    failing.add(ACCESSION_NUMBERS[1])
+
+    result = fetch_filings(_filings(), data_directory=tmp_path, disable_progress=True)
+    assert result.downloaded == 2
+    assert list(result.failed) == [ACCESSION_NUMBERS[1]]
+
+    manifest = FetchManifest(result.manifest)
+    assert manifest.status[ACCESSION_NUMBERS[1]] == 'failed'
+    assert manifest.stored == {ACCESSION_NUMBERS[0], ACCESSION_NUMBERS[2]}
+
+    # Running the job again only fetches what is missing
+    failing.clear()
+    requested.clear()
+    result = fetch_filings(_filings(), data_directory=tmp_path, disable_progress=True)
+    assert result.downloaded == 1
+    assert result.skipped == 2
+    assert [url.rsplit('/', 1)[-1] for url in requested] == [f"{ACCESSION_NUMBERS[1]}.txt"]
+    assert FetchManifest(result.manifest).stored == set(ACCESSION_NUMBERS)
+
+
+@pytest.mark.fast
+def test_fetch_manifest_ignores_a_truncated_line(tmp_path):
+    manifest_path = tmp_path / 'fetch-manifest.jsonl'
+    manifest_path.write_text(json.dumps({'accession_number': ACCESSION_NUMBERS[0], 'status': 'stored'})
+                             + '\n{"accession_number": "00003')
+    manifest = FetchManifest(manifest_path)
+    assert manifest.stored == {ACCESSION_NUMBERS[0]}
+
+    manifest.record(ACCESSION_NUMBERS[1], 'stored')
+    assert FetchManifest(manifest_path).stored == {ACCESSION_NUMBERS[0], ACCESSION_NUMBERS[1]}
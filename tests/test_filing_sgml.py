@@ -484,7 +484,7 @@ def test_handle_sec_error_message_in_sgml_with_invalid_identity(monkeypatch):
     filing = Filing(company='Walmart Inc.', cik=104169, form='4', filing_date='2025-09-24', accession_no='0000104169-25-000155')
 
     # Mock the HTTP fetch to return the SEC identity error page
-    with patch('edgar.sgml.sgml_common.read_content_as_string', return_value=sec_identity_error_html):
+    with patch('edgar.sgml.sgml_common.read_content_as_bytes', return_value=sec_identity_error_html.encode()):
         with pytest.raises(SECIdentityError):
             filing.sgml()
 
@@ -502,6 +502,49 @@ def test_handle_sec_error_message_with_nonexistent_filing():
     filing = Filing(company='Walmart Inc.', cik=104169, form='4', filing_date='2025-09-24', accession_no='0000104169-25-999999')
 
     # Mock the HTTP fetch to return the SEC not-found error
-    with patch('edgar.sgml.sgml_common.read_content_as_string', return_value=sec_not_found_xml):
+    with patch('edgar.sgml.sgml_common.read_content_as_bytes', return_value=sec_not_found_xml.encode()):
         with pytest.raises(SECFilingNotFoundError):
-            filing.sgml()
\ No newline at end of file
+            filing.sgml()
+
+def test_sgml_from_file_is_parsed_from_bytes_like_from_text():
+    source = Path('data/sgml/0001193125-24-100942.txt')
+    from_file = FilingSGML.from_source(source)
+    from_text = FilingSGML.from_text(source.read_text())
+
+    assert from_file.header.text == from_text.header.text
+    documents = [doc for docs in from_file._documents_by_sequence.values() for doc in docs]
+    assert len(documents) == len(from_text._documents_by_name)
+    for document in documents:
+        assert not isinstance(document._content_ref, str)
+        text_document = from_text.get_document_by_name(document.filename)
+        assert document.raw_content == text_document.raw_content
+        assert document.content == text_document.content
+
+
+def test_sgml_bytes_with_crlf_and_uuencoded_documents(tmp_path):
+    image = Path('data/sgml/aapl-20240928_g1.jpg').read_bytes()
+    encoded = BytesIO()
+    uu.encode(BytesIO(image), encoded, name='image.jpg', mode=0o644)
+    submission = (b'<SUBMISSION>\n<ACCESSION-NUMBER>0000320193-24-000123\n<TYPE>10-K\n'
+                  b'<DOCUMENT>\n<TYPE>10-K\n<SEQUENCE>1\n<FILENAME>aapl.htm\n<TEXT>\n'
+                  b'<html><body>Net sales\nincreased</body></html>\n</TEXT>\n</DOCUMENT>\n'
+                  b'<DOCUMENT>\n<TYPE>GRAPHIC\n<SEQUENCE>2\n<FILENAME>image.jpg\n<TEXT>\n' +
+                  encoded.getvalue() + b'</TEXT>\n</DOCUMENT>\n</SUBMISSION>\n')
+    path = tmp_path / 'submission.txt'
+    path.write_bytes(submission.replace(b'\n', b'\r\n'))
+
+    sgml = FilingSGML.from_source(path)
+
+    assert sgml.accession_number == '0000320193-24-000123'
+    assert sgml.html() == '<html><body>Net sales\nincreased</body></html>'
+    assert sgml.get_document_by_name('image.jpg').content == image
+
+
+def test_sgml_document_from_a_mapped_file_can_be_pickled():
+    import pickle
+    sgml = FilingSGML.from_source('data/sgml/0001104659-25-002604.txt')
+    document = sgml.get_document_by_sequence('1')
+
+    unpickled = pickle.loads(pickle.dumps(document))
+
+    assert unpickled.content == document.content
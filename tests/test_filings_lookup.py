@@ -0,0 +1,132 @@
+import datetime
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pytest
+
+from edgar._filings import Filings
+from edgar._filings_lookup import ColumnIndex, FilingsLookup
+from edgar.filtering import filter_by_accession_number, filter_by_cik, filter_by_form
+
+
+def _filing_index(num_rows: int = 500, seed: int = 7) -> pa.Table:
+    rng = np.random.default_rng(seed)
+    forms = np.array(['10-K', '10-Q', '8-K', '4', '10-K/A', 'S-1'])
+    ciks = rng.integers(1000, 1100, num_rows)
+    start = datetime.date(2020, 1, 1)
+    dates = [start + datetime.timedelta(days=int(d)) for d in rng.integers(0, 900, num_rows)]
+    # Every accession number is shared by two rows, like a filing with two filers
+    accessions = [f"{1000 + i // 2:010d}-20-{i // 2:06d}" for i in range(num_rows)]
+    return pa.table({
+        'form': pa.array(forms[rng.integers(0, len(forms), num_rows)].tolist(), type=pa.string()),
+        'company': pa.array([f"Company {c}" for c in ciks], type=pa.string()),
+        'cik': pa.array(ciks, type=pa.int32()),
+        'filing_date': pa.array(dates, type=pa.date32()),
+        'accession_number': pa.array(accessions, type=pa.string()),
+    })
+
+
+def _indexed_filings(table: pa.Table) -> Filings:
+    """Filings whose accession number, cik and form indexes are already built"""
+    filings = Filings(table)
+    for column in ('accession_number', 'cik', 'form'):
+        while not filings._lookup.is_indexed(column):
+            filings._lookup.index_for(column)
+    return filings
+
+
+@pytest.mark.fast
+def test_column_index_lookup_matches_is_in():
+    table = _filing_index()
+    index = ColumnIndex.build(table['cik'])
+    ciks = [1003, 1050, 1099, 5]
+    expected = np.flatnonzero(pc.is_in(table['cik'], pa.array(ciks, type=pa.int32())).to_numpy(zero_copy_only=False))
+    assert index.lookup(ciks).tolist() == expected.tolist()
+    assert index.lookup([5]).tolist() == []
+    assert index.first(1050) == int(expected[np.isin(expected, np.flatnonzero(table['cik'].to_numpy() == 1050))][0])
+
+
+@pytest.mark.fast
+def test_column_index_skips_nulls():
+    column = pa.chunked_array([pa.array(['b', None, 'a', 'b'])])
+    index = ColumnIndex.build(column)
+    assert len(index) == 3
+    assert index.lookup(['b']).tolist() == [0, 3]
+    assert index.lookup(['a', 'b']).tolist() == [0, 2, 3]
+
+
+@pytest.mark.fast
+def test_indexes_are_built_on_repeated_lookups():
+    lookup = FilingsLookup(_filing_index())
+    assert lookup.rows_for('cik', [1003]) is None
+    assert not lookup.is_indexed('cik')
+    assert lookup.rows_for('cik', [1003]) is not None
+    assert lookup.is_indexed('cik')
+    # Columns that are not indexed are always scanned
+    assert lookup.rows_for('company', ['Company 1003']) is None
+
+
+@pytest.mark.fast
+def test_indexed_filter_matches_scan():
+    table = _filing_index()
+    filings = _indexed_filings(table)
+
+    filtered = filings.filter(cik=[1003, 1004])
+    assert filtered.data.equals(filter_by_cik(table, [1003, 1004]))
+
+    filtered = filings.filter(form="10-K", amendments=True)
+    assert filtered.data.equals(filter_by_form(table, "10-K", amendments=True))
+
+    accessions = table['accession_number'].to_pylist()[10:40:3]
+    filtered = filings.filter(accession_number=accessions)
+    assert filtered.data.equals(filter_by_accession_number(table, accessions))
+
+    filtered = filings.filter(form=["10-K", "10-Q"], cik=[1003, 1004, 1005], filing_date="2020-06-01:")
+    expected = filter_by_form(table, ["10-K", "10-Q"], amendments=False)
+    expected = filter_by_cik(expected, [1003, 1004, 1005])
+    expected = expected.filter(pc.field('filing_date') >= pc.scalar(datetime.date(2020, 6, 1)))
+    assert filtered.data.equals(expected)
+
+
+@pytest.mark.fast
+def test_get_by_accession_number_uses_index():
+    table = _filing_index()
+    filings = _indexed_filings(table)
+    accession_number = table['accession_number'][101].as_py()
+    filing = filings.get(accession_number)
+    assert filing.accession_no == accession_number
+    # The first of the two rows sharing the accession number is returned
+    assert filing.cik == table['cik'][100].as_py()
+    assert filings._get_by_accession_number("0000000000-00-000000") is None
+
+
+@pytest.mark.fast
+def test_indexes_carry_over_to_derived_filings():
+    table = _filing_index()
+    filings = _indexed_filings(table)
+
+    def check(derived: Filings):
+        assert derived._lookup.is_indexed('cik')
+        for cik in (1003, 1042):
+            rows = derived._lookup.rows_for('cik', [cik])
+            expected = np.flatnonzero(derived.data['cik'].to_numpy() == cik)
+            assert rows.tolist() == expected.tolist()
+        accession_number = derived.data['accession_number'][0].as_py()
+        assert derived.get(accession_number).accession_no == accession_number
+
+    check(filings.filter(form="10-Q"))
+    check(filings.head(200))
+    check(filings.tail(200))
+    check(filings[100:300])
+    check(filings.latest(300))
+    check(filings.next())
+
+
+@pytest.mark.fast
+def test_indexes_are_rebuilt_after_a_scan_filter():
+    table = _filing_index()
+    filings = _indexed_filings(table)
+    filtered = filings.filter(filing_date="2020-06-01:")
+    assert not filtered._lookup.is_indexed('cik')
+    assert filtered.filter(cik=1003).data.equals(filter_by_cik(filtered.data, 1003))
@@ -328,6 +328,22 @@ class TestPreprocessing:
 
         assert result == "Alpha. One Beta? Two U.S.Code"
 
+    def test_whitespace_runs_collapse_and_lone_spaces_are_kept(self):
+        preprocessor = HTMLPreprocessor(ParserConfig())
+
+        result = preprocessor._normalize_whitespace(
+            "<span>one two</span>  <b>\tthree</b>four  \n<i>five</i> <u>six</u>"
+        )
+
+        assert result == "<span>one two</span> <b> three</b>four <i>five</i> <u>six</u>"
+
+    def test_normalized_html_is_returned_as_is(self):
+        preprocessor = HTMLPreprocessor(ParserConfig())
+        html = "<span>one two</span> <b>three</b> four"
+
+        assert preprocessor._normalize_whitespace(html) is html
+        assert preprocessor._remove_empty_tags(html) is html
+
 
 class TestTextExtraction:
     """Test text extraction functionality."""
@@ -505,6 +521,16 @@ class TestPerformance:
         
         with pytest.raises(DocumentTooLargeError):
             parse_html(large_html, config)
+
+        # Bytes are sized as given, before they are decoded
+        with pytest.raises(DocumentTooLargeError):
+            parse_html(large_html.encode('utf-8'), config)
+
+    def test_document_size_is_measured_in_utf8_bytes(self):
+        html = "<p>Caf\u00e9 \u2014 10-K</p>"
+
+        assert parse_html(html).metadata.size == len(html.encode('utf-8'))
+        assert parse_html(html.encode('utf-8')).metadata.size == len(html.encode('utf-8'))
     
     def test_document_over_old_streaming_threshold_extracts_content(self):
         """Documents over the former streaming_threshold parse via the one pipeline.
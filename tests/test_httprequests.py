@@ -1012,3 +1012,173 @@ def test_sequential_system_certs_then_verify_ssl():
         assert HTTP_MGR.httpx_params["verify"] is False
     finally:
         HTTP_MGR.httpx_params["verify"] = original_verify
+
+
+def test_rate_limiter_records_wait_times():
+    from edgar.httpclient import MeteredLimiter, _create_rate_limiter
+
+    limiter = _create_rate_limiter(5, backend="memory")
+    assert isinstance(limiter, MeteredLimiter)
+    for _ in range(7):
+        limiter.try_acquire("test")
+
+    stats = limiter.stats.to_dict()
+    assert stats["requests"] == 7
+    # Two requests over the 5/sec rate had to wait for the next second
+    assert stats["max_wait_seconds"] > 0.5
+    assert stats["p50_wait_seconds"] < 0.1
+    assert stats["total_wait_seconds"] >= stats["max_wait_seconds"]
+
+    limiter.stats.reset()
+    assert limiter.stats.to_dict()["requests"] == 0
+
+
+def test_sqlite_rate_limiter_is_shared_through_its_database(tmp_path):
+    from edgar.httpclient import _create_rate_limiter
+
+    path = tmp_path / "ratelimiter.sqlite"
+    first = _create_rate_limiter(4, backend="sqlite", path=path)
+    second = _create_rate_limiter(4, backend="sqlite", path=path)
+    assert first.backend == "sqlite" and first.path == path
+
+    for _ in range(4):
+        first.try_acquire("edgar")
+    # The second limiter, like another process, sees the requests made through the first
+    second.try_acquire("edgar")
+    assert second.stats.max_wait > 0.5
+
+
+def test_configure_http_rate_limit_backend(tmp_path, monkeypatch):
+    import edgar.httpclient as httpclient
+    from edgar.httpclient import configure_http, get_http_config, get_rate_limit_stats
+
+    monkeypatch.setattr(httpclient.HTTP_MGR, "rate_limiter", httpclient.HTTP_MGR.rate_limiter)
+    monkeypatch.setattr(httpclient.HTTP_MGR, "_client", None)
+
+    configure_http(rate_limit_backend="sqlite", rate_limit_path=tmp_path / "limiter.sqlite")
+    config = get_http_config()
+    assert config["rate_limit_backend"] == "sqlite"
+    assert config["rate_limit_path"] == tmp_path / "limiter.sqlite"
+    assert get_rate_limit_stats()["backend"] == "sqlite"
+    assert get_rate_limit_stats()["requests"] == 0
+
+    with pytest.raises(ValueError):
+        configure_http(rate_limit_backend="redis")
+
+
+def test_concurrent_identical_gets_share_one_request():
+    import threading
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+    from edgar.httprequests import get_coalescing_stats
+
+    calls = []
+    lock = threading.Lock()
+
+    def slow_get(self, url, **kwargs):
+        with lock:
+            calls.append(url)
+        time.sleep(0.3)
+        return httpx.Response(status_code=200, content=url.encode())
+
+    before = get_coalescing_stats()
+    with patch("httpx.Client.get", slow_get):
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            urls = ["https://www.sec.gov/files/company_tickers.json"] * 5 + ["https://www.sec.gov/other.json"]
+            responses = list(pool.map(get_with_retry, urls))
+
+    assert sorted(calls) == ["https://www.sec.gov/files/company_tickers.json", "https://www.sec.gov/other.json"]
+    assert responses[0] is responses[4]
+    assert responses[5].content == b"https://www.sec.gov/other.json"
+    after = get_coalescing_stats()
+    assert after["coalesced"] - before["coalesced"] == 4
+    assert after["requests"] - before["requests"] == 6
+
+    # Nothing is cached, so a later request goes out again
+    with patch("httpx.Client.get", slow_get):
+        get_with_retry("https://www.sec.gov/other.json")
+    assert len(calls) == 3
+
+
+def test_coalesced_gets_share_the_error():
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    calls = []
+
+    def missing_get(self, url, **kwargs):
+        calls.append(url)
+        time.sleep(0.3)
+        return httpx.Response(status_code=404)
+
+    with patch("httpx.Client.get", missing_get):
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            responses = list(pool.map(get_with_retry, ["https://www.sec.gov/missing"] * 3))
+    assert len(calls) == 1
+    assert all(response.status_code == 404 for response in responses)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_async_gets_share_one_request():
+    from edgar.httprequests import get_coalescing_stats
+
+    class SlowClient:
+        def __init__(self):
+            self.calls = 0
+
+        async def get(self, url, **kwargs):
+            self.calls += 1
+            await asyncio.sleep(0.2)
+            return httpx.Response(status_code=200, content=b"{}")
+
+    client = SlowClient()
+    before = get_coalescing_stats()
+    responses = await asyncio.gather(*[get_with_retry_async(client, "https://data.sec.gov/submissions/CIK0000320193.json")
+                                       for _ in range(4)])
+    assert client.calls == 1
+    assert all(response is responses[0] for response in responses)
+    assert get_coalescing_stats()["coalesced"] - before["coalesced"] == 3
+
+
+@pytest.mark.asyncio
+async def test_async_waiters_make_the_call_when_the_leader_is_cancelled():
+    class SlowClient:
+        def __init__(self):
+            self.calls = 0
+
+        async def get(self, url, **kwargs):
+            self.calls += 1
+            await asyncio.sleep(0.2)
+            return httpx.Response(status_code=200, content=b"{}")
+
+    client = SlowClient()
+    url = "https://data.sec.gov/submissions/CIK0000789019.json"
+    leader = asyncio.create_task(get_with_retry_async(client, url))
+    await asyncio.sleep(0.05)
+    waiters = [asyncio.create_task(get_with_retry_async(client, url)) for _ in range(2)]
+    await asyncio.sleep(0.05)
+    leader.cancel()
+
+    responses = await asyncio.gather(*waiters)
+    assert leader.cancelled()
+    assert all(response.status_code == 200 for response in responses)
+    # One waiter took over the call and the other shared it
+    assert client.calls == 2
+    assert responses[0] is responses[1]
+
+
+@pytest.mark.asyncio
+async def test_async_gets_with_different_clients_are_not_shared():
+    class SlowClient:
+        def __init__(self, content):
+            self.content = content
+
+        async def get(self, url, **kwargs):
+            await asyncio.sleep(0.1)
+            return httpx.Response(status_code=200, content=self.content)
+
+    url = "https://data.sec.gov/submissions/CIK0001018724.json"
+    first, second = await asyncio.gather(get_with_retry_async(SlowClient(b"first"), url),
+                                         get_with_retry_async(SlowClient(b"second"), url))
+    assert first.content == b"first"
+    assert second.content == b"second"
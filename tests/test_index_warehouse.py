@@ -0,0 +1,102 @@
+"""The local filing index warehouse behind get_filings.
+
+Every quarterly index is served from the committed daily index in
+data/index_files, so nothing here touches the network.
+"""
+from datetime import date
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pytest
+
+import edgar._filings as filings_module
+from edgar import get_filings
+from edgar._filings import read_index_file
+from edgar.storage import download_filing_index, filing_index_directory, filing_index_quarters, read_filing_index
+from edgar.storage import _filing_index
+
+QUARTER_INDEX = read_index_file(Path("data/index_files/form.20200318.idx").read_text(), filing_date_format='%Y%m%d')
+
+
+@pytest.fixture
+def downloads(monkeypatch, tmp_path):
+    """Point the data directory at a temp dir and serve every quarter from the same index."""
+    monkeypatch.setenv('EDGAR_LOCAL_DATA_DIR', str(tmp_path))
+    fetched = []
+
+    def fetch_filing_index(year_and_quarter, index):
+        fetched.append(year_and_quarter)
+        return year_and_quarter, QUARTER_INDEX
+
+    monkeypatch.setattr(filings_module, 'fetch_filing_index', fetch_filing_index)
+    return fetched
+
+
+def test_download_writes_a_partition_per_quarter(downloads):
+    download_filing_index(2020, disable_progress=True)
+
+    assert downloads == [(2020, 1), (2020, 2), (2020, 3), (2020, 4)]
+    assert filing_index_quarters() == downloads
+    assert (filing_index_directory('form') / 'year=2020' / 'quarter=3' / 'part-0.parquet').exists()
+
+    # Quarters that have ended are never downloaded again
+    download_filing_index(2020, disable_progress=True)
+    assert len(downloads) == 4
+
+
+def test_get_filings_reads_the_warehouse(downloads):
+    from_network = get_filings(2020, 1, form='10-K', cik=[1785173, 1069308])
+    download_filing_index(2020, disable_progress=True)
+    downloads.clear()
+
+    from_warehouse = get_filings(2020, 1, form='10-K', cik=[1785173, 1069308])
+
+    assert downloads == []
+    assert from_warehouse.data.equals(from_network.data)
+    assert set(from_warehouse.data['form'].to_pylist()) <= {'10-K', '10-K/A'}
+
+
+def test_filters_are_pushed_into_the_scan(downloads):
+    download_filing_index(2020, disable_progress=True)
+
+    table = read_filing_index([(2020, 1), (2020, 2)], forms=['10-K'])
+    assert set(table['form'].to_pylist()) == {'10-K'}
+    assert len(table) == 2 * pc.sum(pc.equal(QUARTER_INDEX['form'], '10-K')).as_py()
+
+    table = read_filing_index([(2020, 1)], ciks=[1785173])
+    assert set(table['cik'].to_pylist()) == {1785173}
+    assert table.schema == QUARTER_INDEX.schema
+
+
+def test_quarter_in_progress_appends_daily_indexes(downloads, monkeypatch):
+    index_through_march_17 = QUARTER_INDEX.set_column(
+        3, 'filing_date', pa.array([date(2020, 3, 17)] * len(QUARTER_INDEX), type=pa.date32()))
+    _filing_index.store_quarter('form', (2020, 1), index_through_march_17, today=date(2020, 3, 18))
+    assert not _filing_index._load_manifest('form')['2020Q1']['complete']
+
+    requested_days = []
+
+    def fetch_daily_filing_index(day, index):
+        requested_days.append(day)
+        return QUARTER_INDEX if day == '2020-03-18' else None
+
+    monkeypatch.setattr(filings_module, 'fetch_daily_filing_index', fetch_daily_filing_index)
+    appended = _filing_index._append_daily_indexes('form', (2020, 1), today=date(2020, 3, 20))
+
+    assert requested_days == ['2020-03-18', '2020-03-19', '2020-03-20']
+    assert appended == len(QUARTER_INDEX)
+    entry = _filing_index._load_manifest('form')['2020Q1']
+    assert entry['through'] == '2020-03-18'
+    assert len(read_filing_index([(2020, 1)])) == 2 * len(QUARTER_INDEX)
+
+
+def test_stale_quarter_in_progress_is_fetched_again(downloads):
+    _filing_index.store_quarter('form', (2020, 1), QUARTER_INDEX, today=date(2020, 3, 18))
+    downloads.clear()
+
+    get_filings(2020, 1, form='10-K')
+
+    assert downloads == [(2020, 1)]
+    # ...and the fresh copy replaces the stale one
+    assert _filing_index._load_manifest('form')['2020Q1']['complete']
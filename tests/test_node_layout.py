@@ -0,0 +1,77 @@
+"""Slotted document nodes and interned styles.
+
+Nodes and Styles are slotted dataclasses so a large filing's tree doesn't pay for
+a __dict__ per object, and DocumentBuilder shares one Style between elements
+styled alike. These tests pin the parts of that layout callers could notice.
+"""
+import copy
+import pickle
+
+import pytest
+
+from edgar.documents import parse_html
+from edgar.documents.nodes import ContainerNode, DocumentNode, ParagraphNode, SectionNode, TextNode
+from edgar.documents.types import Style
+
+pytestmark = pytest.mark.fast
+
+
+def test_nodes_have_no_instance_dict():
+    for node in (TextNode(content='x'), ParagraphNode(), ContainerNode(), SectionNode(section_name='item_1'),
+                 DocumentNode()):
+        assert not hasattr(node, '__dict__'), type(node).__name__
+    assert not hasattr(Style(), '__dict__')
+
+
+def test_text_cache_lives_in_a_slot():
+    paragraph = ParagraphNode()
+    paragraph.add_child(TextNode(content='Hello'))
+    assert paragraph.text() == 'Hello'
+
+    paragraph.add_child(TextNode(content=' world'))
+    assert paragraph.text() == 'Hello'  # cached
+    paragraph.clear_text_cache()
+    assert paragraph.text() == 'Hello world'
+
+
+def test_slotted_nodes_copy_and_pickle():
+    section = SectionNode(section_name='item_1')
+    paragraph = ParagraphNode(style=Style(font_weight='bold'))
+    paragraph.add_child(TextNode(content='Business'))
+    section.add_child(paragraph)
+    section.set_metadata('level', 1)
+
+    for clone in (copy.deepcopy(section), pickle.loads(pickle.dumps(section))):
+        assert clone.section_name == 'item_1'
+        assert clone.get_metadata('level') == 1
+        assert clone.text() == 'Business'
+        assert clone.children[0].style.is_bold
+        assert clone.children[0].parent is clone
+
+
+def test_styles_are_shared_between_elements_styled_alike():
+    document = parse_html(
+        '<html><body>'
+        '<p style="margin-top:6pt">First</p>'
+        '<p style="margin-top:6pt">Second</p>'
+        '<p style="margin-top:6pt" align="center">Third</p>'
+        '</body></html>')
+    paragraphs = document.root.find(lambda n: isinstance(n, ParagraphNode))
+    assert len(paragraphs) == 3
+    assert paragraphs[0].style is paragraphs[1].style
+    assert paragraphs[2].style is not paragraphs[0].style
+    assert paragraphs[2].style.text_align == 'center'
+    assert paragraphs[0].style.text_align is None
+
+
+def test_tag_styles_do_not_leak_into_elements_sharing_the_style_attribute():
+    document = parse_html(
+        '<html><body>'
+        '<p><b style="font-size:10pt">Bold</b> text</p>'
+        '<p><span style="font-size:10pt">Plain</span> text</p>'
+        '</body></html>')
+    bold = document.root.find_first(lambda n: n.text() == 'Bold' and not n.children)
+    plain = document.root.find_first(lambda n: n.text() == 'Plain' and not n.children)
+    assert bold.style.is_bold
+    assert not plain.style.is_bold
+    assert plain.style.font_size == bold.style.font_size
@@ -1,5 +1,5 @@
 from edgar.httprequests import download_file
-from edgar._filings import  read_index_file, read_form_index_file, read_company_index_file
+from edgar._filings import  read_index_file, read_form_index_file, read_company_index_file, COMPANY_INDEX_FORM_COLUMN
 import pandas as pd
 from pathlib import Path
 
@@ -52,3 +52,28 @@ def test_forms_with_spaces_are_read_correctly():
     form_1A_POS = df[df.form == "1-A POS"]
     assert len(form_1A_POS) > 0
 
+
+
+def test_read_index_file_from_bytes():
+    text = Path("data/index_files/form.20200318.idx").read_text()
+    table = read_index_file(text, filing_date_format='%Y%m%d')
+    assert len(table) == 4084
+    assert table.equals(read_index_file(text.encode(), filing_date_format='%Y%m%d'))
+
+
+def test_company_names_with_runs_of_spaces_are_joined():
+    text = ("Form Type   Company Name      CIK   Date Filed  File Name\n"
+            "-----------------------------------------------------------\n"
+            "1-A POS     Foo  Bar   Baz            123     2020-01-02  edgar/data/123/0001234567-20-000001.txt  \n"
+            "\n"
+            "10-K        1     2020-01-03  edgar/data/1/0001234567-20-000002.txt\r\n")
+    table = read_index_file(text)
+    assert table['form'].to_pylist() == ['1-A POS', '10-K']
+    assert table['company'].to_pylist() == ['Foo Bar Baz', '']
+    assert table['accession_number'].to_pylist() == ['0001234567-20-000001', '0001234567-20-000002']
+
+    company_index = read_index_file(Path("data/index_files/company.20221003.idx").read_text(),
+                                    form_column=COMPANY_INDEX_FORM_COLUMN, filing_date_format='%Y%m%d')
+    assert company_index.column_names == table.column_names
+    assert company_index.slice(0, 1).to_pylist()[0]['company'] == '1st stREIT Office Inc.'
+    assert company_index.slice(0, 1).to_pylist()[0]['form'] == '1-A POS'
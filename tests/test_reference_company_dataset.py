@@ -249,6 +249,41 @@ class TestBuildDatasetSmallSample:
                 submissions_dir, output, show_progress=False
             )
 
+    def test_build_parquet_skips_submission_pages(self, sample_submissions_dir, tmp_path):
+        """Pages of older filings are not entities"""
+        (sample_submissions_dir / 'CIK0001318605-submissions-001.json').write_text(
+            '{"accessionNumber": [], "form": []}'
+        )
+        table = build_company_dataset_parquet(
+            sample_submissions_dir,
+            tmp_path / 'companies.pq',
+            filter_individuals=False,
+            show_progress=False
+        )
+        assert sorted(table['cik'].to_pylist()) == ['0001078519', '0001318605']
+
+    def test_build_parquet_from_zip_in_worker_processes(self, sample_submissions_dir, tmp_path, monkeypatch):
+        """Reading from submissions.zip in worker processes builds the same dataset"""
+        import zipfile
+        from edgar.reference import company_dataset
+
+        expected = build_company_dataset_parquet(
+            sample_submissions_dir, tmp_path / 'expected.pq', filter_individuals=False, show_progress=False
+        )
+        archive = tmp_path / 'submissions.zip'
+        with zipfile.ZipFile(archive, 'w') as z:
+            for path in sample_submissions_dir.iterdir():
+                z.write(path, path.name)
+
+        # One file per shard, so each worker parses a shard
+        monkeypatch.setattr(company_dataset, 'SHARD_SIZE', 1)
+        output = tmp_path / 'companies.pq'
+        table = build_company_dataset_parquet(
+            archive, output, filter_individuals=False, show_progress=False, workers=2
+        )
+        assert table.equals(expected)
+        assert load_company_dataset_parquet(output).equals(expected)
+
     def test_load_parquet(self, sample_submissions_dir, tmp_path):
         """Load Parquet file"""
         output = tmp_path / 'companies.pq'
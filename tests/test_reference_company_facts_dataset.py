@@ -0,0 +1,140 @@
+"""
+Tests for the company facts dataset built from companyfacts JSON.
+
+The Snowflake and LPA company facts fixtures stand in for the bulk download.
+"""
+
+import gzip
+import zipfile
+from pathlib import Path
+
+import orjson
+import pytest
+
+from edgar.entity.parser import EntityFactsParser
+from edgar.exceptions import CompanyFactsNotFoundError
+from edgar.reference.company_facts_dataset import (
+    build_company_facts_dataset,
+    facts_frame,
+    get_company_facts_from_dataset,
+    load_company_facts_from_dataset,
+)
+
+pytestmark = pytest.mark.fast
+
+FIXTURES = Path(__file__).parent / 'fixtures' / 'entity'
+
+
+def _company_facts(name):
+    return orjson.loads((FIXTURES / f'{name}_facts.json').read_bytes())
+
+
+@pytest.fixture(scope='module')
+def company_facts():
+    return {int(data['cik']): data for data in (_company_facts('snow'), _company_facts('lpa'))}
+
+
+@pytest.fixture(scope='module')
+def facts_dir(tmp_path_factory, company_facts):
+    source = tmp_path_factory.mktemp('companyfacts')
+    for cik, data in company_facts.items():
+        (source / f'CIK{cik:010d}.json').write_bytes(orjson.dumps(data))
+    return source
+
+
+@pytest.fixture(scope='module')
+def dataset_dir(tmp_path_factory, facts_dir):
+    return build_company_facts_dataset(facts_dir, tmp_path_factory.mktemp('dataset') / 'facts', show_progress=False)
+
+
+def test_entity_facts_from_dataset_match_json(dataset_dir, company_facts):
+    for cik, data in company_facts.items():
+        expected = EntityFactsParser.parse_company_facts(data)
+        entity_facts = get_company_facts_from_dataset(cik, dataset_dir)
+        assert entity_facts.cik == cik
+        assert entity_facts.name == expected.name
+        assert entity_facts._facts == expected._facts
+
+
+def test_load_company_facts_keeps_labels_and_units(dataset_dir, company_facts):
+    data = load_company_facts_from_dataset(1640147, dataset_dir)
+    expected = company_facts[1640147]['facts']['us-gaap']['Assets']
+    assets = data['facts']['us-gaap']['Assets']
+    assert assets['label'] == expected['label']
+    assert assets['description'] == expected['description']
+    assert len(assets['units']['USD']) == len(expected['units']['USD'])
+    assert all(isinstance(fact['val'], int) for fact in assets['units']['USD'])
+
+
+def test_unknown_cik_not_found(dataset_dir):
+    with pytest.raises(CompanyFactsNotFoundError):
+        load_company_facts_from_dataset(320193, dataset_dir)
+
+
+def test_missing_dataset(tmp_path):
+    with pytest.raises(FileNotFoundError, match='build_company_facts_dataset'):
+        load_company_facts_from_dataset(1640147, tmp_path / 'nowhere')
+
+
+def test_facts_frame(dataset_dir, company_facts):
+    frame = facts_frame('Assets', 'CY2023Q4I', dataset_dir=dataset_dir)
+    expected = [fact for fact in company_facts[1640147]['facts']['us-gaap']['Assets']['units']['USD']
+                if fact.get('frame') == 'CY2023Q4I']
+    assert len(expected) == 1
+    assert frame['cik'].tolist() == [1640147]
+    assert frame['entity_name'].tolist() == ['SNOWFLAKE INC.']
+    assert frame['value'].tolist() == [expected[0]['val']]
+    assert frame['accn'].tolist() == [expected[0]['accn']]
+    assert str(frame['period_end'][0]) == expected[0]['end']
+
+    assert facts_frame('Assets', 'CY1990Q4I', dataset_dir=dataset_dir).empty
+    assert facts_frame('NoSuchConcept', 'CY2023', dataset_dir=dataset_dir).empty
+
+
+def test_build_from_zip_and_gzip_match(tmp_path, facts_dir, dataset_dir):
+    archive = tmp_path / 'companyfacts.zip'
+    gzipped = tmp_path / 'gzipped'
+    gzipped.mkdir()
+    with zipfile.ZipFile(archive, 'w') as z:
+        for path in facts_dir.glob('CIK*.json'):
+            z.write(path, path.name)
+            (gzipped / f'{path.name}.gz').write_bytes(gzip.compress(path.read_bytes()))
+
+    for source in (archive, gzipped):
+        rebuilt = build_company_facts_dataset(source, tmp_path / f'{source.name}-dataset', show_progress=False)
+        assert load_company_facts_from_dataset(1640147, rebuilt) == load_company_facts_from_dataset(1640147, dataset_dir)
+
+
+def test_rebuild_replaces_dataset(tmp_path, facts_dir):
+    output = tmp_path / 'dataset'
+    build_company_facts_dataset(facts_dir, output, show_progress=False)
+    only_lpa = tmp_path / 'only_lpa'
+    only_lpa.mkdir()
+    lpa = next(path for path in facts_dir.glob('CIK*.json') if not path.name.endswith('1640147.json'))
+    (only_lpa / lpa.name).write_bytes(lpa.read_bytes())
+
+    build_company_facts_dataset(only_lpa, output, show_progress=False)
+    with pytest.raises(CompanyFactsNotFoundError):
+        load_company_facts_from_dataset(1640147, output)
+    assert [path.name for path in tmp_path.iterdir() if path.name.startswith('dataset')] == ['dataset']
+
+
+def test_company_with_unexpected_values_is_skipped(tmp_path, company_facts):
+    source = tmp_path / 'companyfacts'
+    source.mkdir()
+    snow, lpa = company_facts[1640147], company_facts[1997711]
+    bad = orjson.loads(orjson.dumps(lpa))
+    bad['facts']['dei']['EntityCommonStockSharesOutstanding']['units']['shares'][0]['fy'] = '2023'
+    (source / 'CIK0001640147.json').write_bytes(orjson.dumps(snow))
+    (source / 'CIK0001997711.json').write_bytes(orjson.dumps(bad))
+
+    output = build_company_facts_dataset(source, tmp_path / 'dataset', show_progress=False)
+    assert orjson.loads((output / 'dataset.json').read_bytes())['companies'] == 1
+    assert load_company_facts_from_dataset(1640147, output)['entityName'] == snow['entityName']
+    with pytest.raises(CompanyFactsNotFoundError):
+        load_company_facts_from_dataset(1997711, output)
+
+
+def test_build_missing_source(tmp_path):
+    with pytest.raises(FileNotFoundError, match='download_facts'):
+        build_company_facts_dataset(tmp_path / 'missing', tmp_path / 'dataset', show_progress=False)
@@ -0,0 +1,212 @@
+"""
+Tests for the submissions dataset built from submissions JSON.
+
+Tesla's submissions in data/company_submission.json stand in for the bulk
+download, with its oldest filings moved into a page file.
+"""
+
+import copy
+import datetime
+import json
+import os
+import zipfile
+from pathlib import Path
+
+import pyarrow.compute as pc
+import pytest
+
+from edgar.entity.data import extract_company_filings_table
+from edgar.reference.submissions_dataset import (
+    build_submissions_dataset,
+    load_entity_data_from_dataset,
+    read_submissions_entities,
+    read_submissions_filings,
+    update_submissions_dataset,
+)
+
+pytestmark = pytest.mark.fast
+
+TESLA = 1318605
+PAGE_NAME = 'CIK0001318605-submissions-001.json'
+PAGE_SIZE = 300
+
+
+@pytest.fixture(scope='module')
+def tesla():
+    return json.loads(Path('data/company_submission.json').read_text())
+
+
+def _other_entity(tesla, cik, name, forms):
+    entity = copy.deepcopy(tesla)
+    entity['cik'] = str(cik)
+    entity['name'] = name
+    entity['tickers'] = []
+    entity['exchanges'] = []
+    recent = {key: values[:len(forms)] for key, values in tesla['filings']['recent'].items()}
+    recent['form'] = list(forms)
+    recent['accessionNumber'] = [f'0000{cik}-23-{number:06d}' for number in range(len(forms))]
+    entity['filings'] = {'recent': recent, 'files': []}
+    return entity
+
+
+@pytest.fixture(scope='module')
+def submissions_dir(tmp_path_factory, tesla):
+    source = tmp_path_factory.mktemp('submissions')
+    main = copy.deepcopy(tesla)
+    recent = main['filings']['recent']
+    page = {key: values[-PAGE_SIZE:] for key, values in recent.items()}
+    main['filings']['recent'] = {key: values[:-PAGE_SIZE] for key, values in recent.items()}
+    main['filings']['files'] = [{'name': PAGE_NAME, 'filingCount': PAGE_SIZE}]
+    (source / f'CIK{TESLA:010d}.json').write_text(json.dumps(main))
+    (source / PAGE_NAME).write_text(json.dumps(page))
+    for cik, name, forms in ((1000001, 'First Fund', ['N-CSR', '497K']), (1000018, 'Second Co', ['10-K'])):
+        (source / f'CIK{cik:010d}.json').write_text(json.dumps(_other_entity(tesla, cik, name, forms)))
+    return source
+
+
+@pytest.fixture(scope='module')
+def dataset_dir(tmp_path_factory, submissions_dir):
+    return build_submissions_dataset(submissions_dir, tmp_path_factory.mktemp('dataset') / 'submissions',
+                                     buckets=4, show_progress=False)
+
+
+def test_filings_merge_pages(dataset_dir, tesla):
+    expected = extract_company_filings_table(tesla['filings']['recent'])
+    filings = read_submissions_filings(ciks=[TESLA], dataset_dir=dataset_dir)
+    assert filings.num_rows == expected.num_rows
+    assert filings.drop_columns(['cik']).cast(expected.schema).equals(expected)
+
+
+def test_entity_data_from_dataset(dataset_dir, tesla):
+    data = load_entity_data_from_dataset(TESLA, dataset_dir)
+    assert data.name == 'Tesla, Inc.'
+    assert data.sic == '3711'
+    assert data.tickers == tesla['tickers']
+    assert len(data.filings) == len(tesla['filings']['recent']['accessionNumber'])
+    assert data.filings.latest().accession_no == tesla['filings']['recent']['accessionNumber'][0]
+
+    assert load_entity_data_from_dataset(320193, dataset_dir) is None
+    assert load_entity_data_from_dataset(TESLA, dataset_dir.parent / 'nowhere') is None
+
+
+def test_read_filings_filters(dataset_dir):
+    tenks = read_submissions_filings(forms=['10-K'], dataset_dir=dataset_dir)
+    assert set(tenks['form'].to_pylist()) == {'10-K'}
+    assert set(tenks['cik'].to_pylist()) == {TESLA, 1000018}
+
+    in_2021 = read_submissions_filings(ciks=[TESLA], filing_date='2021-01-01:2021-12-31', dataset_dir=dataset_dir)
+    assert in_2021.num_rows > 0
+    assert pc.min(in_2021['filing_date']).as_py() >= datetime.date(2021, 1, 1)
+    assert pc.max(in_2021['filing_date']).as_py() <= datetime.date(2021, 12, 31)
+
+
+def test_read_entities(dataset_dir, tesla):
+    entities = read_submissions_entities(dataset_dir=dataset_dir)
+    assert sorted(entities['cik'].to_pylist()) == [1000001, 1000018, TESLA]
+    assert 'submissions' not in entities.column_names
+    tesla_row = read_submissions_entities(ciks=[TESLA], dataset_dir=dataset_dir).to_pylist()[0]
+    assert tesla_row['tickers'] == tesla['tickers']
+    assert tesla_row['filing_count'] == len(tesla['filings']['recent']['accessionNumber'])
+    assert tesla_row['latest_filing_date'] == datetime.date(2022, 11, 30)
+
+
+def test_update_merges_new_filings(tmp_path, submissions_dir, tesla):
+    dataset_dir = build_submissions_dataset(submissions_dir, tmp_path / 'submissions', buckets=4,
+                                            show_progress=False)
+    before = read_submissions_filings(ciks=[TESLA], dataset_dir=dataset_dir)
+
+    # The API lists the newest filings: one new 8-K, and the rest already in the dataset
+    latest = copy.deepcopy(tesla)
+    recent = latest['filings']['recent']
+    for key, values in recent.items():
+        recent[key] = values[:1] + values[:10]
+    recent['accessionNumber'][0] = '0001318605-22-999999'
+    recent['filingDate'][0] = '2022-12-01'
+    recent['form'][0] = '8-K'
+    latest['name'] = 'Tesla Motors'
+    latest['filings']['files'] = []
+
+    assert update_submissions_dataset([latest], dataset_dir) == 1
+    after = read_submissions_filings(ciks=[TESLA], dataset_dir=dataset_dir)
+    assert after.num_rows == before.num_rows + 1
+    assert after['accession_number'][0].as_py() == '0001318605-22-999999'
+    assert after.slice(1).equals(before)
+
+    entity = read_submissions_entities(ciks=[TESLA], dataset_dir=dataset_dir).to_pylist()[0]
+    assert entity['name'] == 'Tesla Motors'
+    assert entity['filing_count'] == after.num_rows
+    assert entity['latest_filing_date'] == datetime.date(2022, 12, 1)
+    # Other entities are untouched
+    assert read_submissions_filings(ciks=[1000001, 1000018], dataset_dir=dataset_dir).num_rows == 3
+
+
+def test_build_from_zip(tmp_path, submissions_dir, dataset_dir):
+    archive = tmp_path / 'submissions.zip'
+    with zipfile.ZipFile(archive, 'w') as z:
+        for path in submissions_dir.iterdir():
+            z.write(path, path.name)
+    rebuilt = build_submissions_dataset(archive, tmp_path / 'rebuilt', buckets=4, show_progress=False)
+    assert read_submissions_filings(dataset_dir=rebuilt).equals(read_submissions_filings(dataset_dir=dataset_dir))
+
+
+def test_missing_dataset(tmp_path):
+    with pytest.raises(FileNotFoundError, match='build_submissions_dataset'):
+        read_submissions_filings(dataset_dir=tmp_path / 'nowhere')
+    with pytest.raises(FileNotFoundError, match='download_submissions'):
+        build_submissions_dataset(tmp_path / 'missing', tmp_path / 'dataset', show_progress=False)
+
+
+def test_local_entity_submissions_read_dataset(tmp_path, monkeypatch, submissions_dir):
+    from edgar.entity.submissions import get_entity_submissions
+
+    build_submissions_dataset(submissions_dir, tmp_path / 'submissions_dataset', buckets=4, show_progress=False)
+    monkeypatch.setenv('EDGAR_LOCAL_DATA_DIR', str(tmp_path))
+    monkeypatch.setenv('EDGAR_USE_LOCAL_DATA', '1')
+    data = get_entity_submissions(1000018)
+    assert data.name == 'Second Co'
+    assert data.filings.to_pandas()['form'].tolist() == ['10-K']
+
+
+def test_local_entity_submissions_prefer_newer_json(tmp_path, monkeypatch, submissions_dir, tesla):
+    from edgar.entity.submissions import get_entity_submissions
+
+    dataset = build_submissions_dataset(submissions_dir, tmp_path / 'submissions_dataset', buckets=4,
+                                        show_progress=False)
+    monkeypatch.setenv('EDGAR_LOCAL_DATA_DIR', str(tmp_path))
+    monkeypatch.setenv('EDGAR_USE_LOCAL_DATA', '1')
+    built = (dataset / 'dataset.json').stat().st_mtime
+    (tmp_path / 'submissions').mkdir()
+    submissions_file = tmp_path / 'submissions' / 'CIK0001000018.json'
+    submissions_file.write_text(json.dumps(_other_entity(tesla, 1000018, 'Second Co Renamed', ['10-K', '8-K'])))
+
+    # JSON from before the dataset was built is what the dataset already has
+    os.utime(submissions_file, (built - 60, built - 60))
+    assert get_entity_submissions(1000018).name == 'Second Co'
+
+    # Downloaded again since, the JSON is newer than the dataset
+    os.utime(submissions_file, (built + 60, built + 60))
+    data = get_entity_submissions(1000018)
+    assert data.name == 'Second Co Renamed'
+    assert data.filings.to_pandas()['form'].tolist() == ['10-K', '8-K']
+
+
+def test_unfinished_bucket_writes_are_not_read(tmp_path, monkeypatch, submissions_dir, tesla):
+    import pyarrow.parquet as pq
+
+    from edgar.reference import _bucketed
+
+    dataset = build_submissions_dataset(submissions_dir, tmp_path / 'dataset', buckets=4, show_progress=False)
+    expected = read_submissions_filings(dataset_dir=dataset)
+
+    def crash_while_writing(table, path, **kwargs):
+        Path(path).write_bytes(b'not parquet yet')
+        raise OSError('disk full')
+
+    monkeypatch.setattr(_bucketed.pq, 'write_table', crash_while_writing)
+    with pytest.raises(OSError):
+        update_submissions_dataset([_other_entity(tesla, 1000018, 'Second Co', ['10-K', '8-K'])], dataset)
+    monkeypatch.setattr(_bucketed.pq, 'write_table', pq.write_table)
+
+    # The partly written file is removed, and readers still see the dataset as it was
+    assert not list(dataset.glob('*/bucket=*/.part-0.parquet.*.tmp'))
+    assert read_submissions_filings(dataset_dir=dataset).equals(expected)
@@ -0,0 +1,99 @@
+"""One-pass section text index for TOC section extraction.
+
+The index replaces a tree walk per section with one walk per document, so it has
+to reproduce the walk's text exactly. These tests compare the two on every
+boundary of a real filing, in both the clean and raw forms.
+"""
+from pathlib import Path
+
+import pytest
+from lxml import html as lxml_html
+
+from edgar.documents import HTMLParser, ParserConfig
+from edgar.documents.extractors.toc_section_extractor import SECSectionExtractor, SectionBoundary
+from edgar.documents.utils.section_text_index import SectionTextIndex
+
+SAMPLE = """
+<html><body>
+  <div id="toc"><a href="#one">Item 1</a></div>
+  <div><p id="one">Item 1. Business</p><p>We make <b>things</b>.</p>
+    <table><tr><td>Revenue</td><td>10</td></tr></table>
+  </div>
+  <p>tail of item one</p>
+  <div><span id="two">Item 2. Properties</span> We own land.</div>
+  <p id="dup">first</p><p id="dup">second</p>
+</body></html>
+"""
+
+
+class _NoIndex:
+    """Stands in for the index so the extractor walks the tree"""
+
+    def section_text(self, *args):
+        return None
+
+
+@pytest.mark.fast
+def test_section_text_is_sliced_between_anchors():
+    tree = lxml_html.fromstring(SAMPLE)
+    index = SectionTextIndex.build(tree)
+
+    text = index.section_text(tree, 'one', 'two')
+    # The start anchor's own text is left out and the end anchor stops the section
+    assert 'Item 1. Business' not in text
+    assert 'We make things.' in text
+    assert 'Revenue10' in text
+    assert 'tail of item one' in text
+    assert 'Properties' not in text
+
+    # Without an end the section runs to the end of the document
+    assert index.section_text(tree, 'two').startswith(' We own land.')
+    # Repeated start anchors are left to the tree walk
+    assert index.section_text(tree, 'dup') is None
+    assert index.section_text(tree, 'missing') is None
+
+
+@pytest.mark.fast
+def test_section_text_ignores_end_anchors_before_the_start():
+    tree = lxml_html.fromstring(SAMPLE)
+    index = SectionTextIndex.build(tree)
+    # `toc` comes before `two`, so the section runs to the end of the document
+    assert index.section_text(tree, 'two', 'toc') == index.section_text(tree, 'two')
+
+
+@pytest.mark.fast
+def test_index_matches_the_tree_walk_on_a_filing():
+    html = Path('data/html/Apple.10-K.html').read_text()
+    document = HTMLParser(ParserConfig(form='10-K')).parse(html)
+    extractor = SECSectionExtractor(document, form='10-K')
+    assert extractor.section_boundaries
+
+    boundaries = list(extractor.section_boundaries.values())
+    boundaries.append(SectionBoundary(name='to the end', anchor_id=boundaries[-1].anchor_id))
+    for boundary in boundaries:
+        for clean in (True, False):
+            indexed = extractor._extract_section_content(html, boundary, True, clean)
+            extractor._text_index, text_index = _NoIndex(), extractor._text_index
+            walked = extractor._extract_section_content(html, boundary, True, clean)
+            extractor._text_index = text_index
+            assert indexed == walked, boundary.name
+
+
+@pytest.mark.fast
+def test_section_text_is_extracted_once():
+    html = Path('data/html/Apple.10-K.html').read_text()
+    document = HTMLParser(ParserConfig(form='10-K')).parse(html)
+    section = document.get_section('Item 1A')
+    assert section is not None
+
+    extractor = document._get_section_extractor()
+    calls = []
+    extract = extractor._extract_section_content
+
+    def counting_extract(*args, **kwargs):
+        calls.append(args)
+        return extract(*args, **kwargs)
+
+    extractor._extract_section_content = counting_extract
+    assert len(section.text()) > 10_000
+    assert calls == []
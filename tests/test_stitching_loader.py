@@ -0,0 +1,56 @@
+"""Concurrent XBRL loading for XBRLS.from_filings.
+
+The filings here are stand-ins whose attachments come from the committed XBRL
+fixtures and whose SGML is already loaded, so nothing touches the network.
+"""
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from edgar.xbrl import XBRLS
+from edgar.xbrl.stitching.loader import load_xbrls
+from edgar.xbrl.xbrl import XBRLAttachments, XBRLFilingWithNoXbrlData
+
+FIXTURES = Path("tests/fixtures/xbrl/nflx")
+
+
+@pytest.fixture
+def filings(xbrl_fixture_filing):
+    return [
+        xbrl_fixture_filing(FIXTURES / '10q_2024', '0001065280-24-000287', date(2024, 10, 18), form='10-Q'),
+        xbrl_fixture_filing(FIXTURES / '10k_2024', '0001065280-24-000030', date(2024, 1, 26)),
+        xbrl_fixture_filing(None, '0000000000-00-000001', date(2023, 1, 1)),
+    ]
+
+
+def test_contents_are_in_parse_order(filings):
+    contents = XBRLAttachments(filings[0].attachments).contents()
+    assert list(contents) == ['schema', 'label', 'presentation', 'calculation', 'definition', 'instance']
+
+
+@pytest.mark.parametrize('max_workers', [1, 2])
+def test_load_xbrls_keeps_order_and_reports_failures(filings, max_workers):
+    xbrl_list, failed = load_xbrls(filings, max_workers=max_workers)
+
+    assert [x.period_of_report for x in xbrl_list] == ['2024-09-30', '2023-12-31']
+    assert list(failed) == ['0000000000-00-000001']
+    assert isinstance(failed['0000000000-00-000001'], XBRLFilingWithNoXbrlData)
+
+
+def test_pool_parse_matches_in_process_parse(filings):
+    pooled, _ = load_xbrls(filings[:2], max_workers=2)
+    in_process, _ = load_xbrls(filings[:2], max_workers=1)
+
+    for from_pool, local in zip(pooled, in_process, strict=True):
+        assert from_pool.entity_name == local.entity_name == 'Netflix, Inc.'
+        assert len(from_pool._facts) == len(local._facts)
+        assert from_pool.reporting_periods == local.reporting_periods
+
+
+def test_from_filings_newest_first_with_failures(filings):
+    xbrls = XBRLS.from_filings(list(reversed(filings)), max_workers=1)
+
+    assert len(xbrls.xbrl_list) == 2
+    assert xbrls.xbrl_list[0].period_of_report == '2024-09-30'
+    assert list(xbrls.failed_filings) == ['0000000000-00-000001']
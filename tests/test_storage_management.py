@@ -318,6 +318,51 @@ def test_compress_decompress_filing(tmp_path):
     decompressed_path.unlink()
 
 
+@pytest.mark.fast
+def test_seekable_compression_reads_documents_without_the_whole_file(tmp_path):
+    """A seekable .gz is ordinary gzip, and FilingSGML reads it through its document index"""
+    import gzip
+    import shutil
+    from edgar.sgml import FilingSGML
+    from edgar.storage import compress_filing
+    from edgar.storage._seekable import SeekableGzip
+
+    source = Path('data/sgml/0001193125-24-100942.txt')
+    test_file = tmp_path / '0001193125-24-100942.nc'
+    shutil.copy(source, test_file)
+
+    compressed_path = compress_filing(test_file, seekable=True)
+
+    assert gzip.decompress(compressed_path.read_bytes()) == source.read_bytes()
+    submission = SeekableGzip.open(compressed_path)
+    assert len(submission.blocks) > 1
+    # A slice across a block boundary
+    assert submission[65000:70000] == source.read_bytes()[65000:70000]
+
+    sgml = FilingSGML.from_source(compressed_path)
+    expected = FilingSGML.from_source(source)
+    assert sgml.header.text == expected.header.text
+    for document in expected._documents_by_name.values():
+        assert sgml.get_document_by_name(document.filename).content == document.content
+
+
+@pytest.mark.fast
+def test_plain_compression_discards_a_stale_seekable_index(tmp_path):
+    """An index left by a seekable compression must not be used for a plain .gz written over it"""
+    from edgar.storage import compress_filing
+    from edgar.storage._seekable import SeekableGzip, seekable_index_path
+
+    test_file = tmp_path / 'test.nc'
+    test_file.write_bytes(Path('data/sgml/0001104659-25-002604.txt').read_bytes())
+    compressed_path = compress_filing(test_file, delete_original=False, seekable=True)
+    assert SeekableGzip.open(compressed_path) is not None
+
+    compress_filing(test_file)
+
+    assert not seekable_index_path(compressed_path).exists()
+    assert SeekableGzip.open(compressed_path) is None
+
+
 @pytest.mark.fast
 def test_compress_already_compressed_raises_error(tmp_path):
     """Test that compressing an already compressed file raises ValueError"""
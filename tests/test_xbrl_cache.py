@@ -0,0 +1,185 @@
+"""Persistent parsed-XBRL cache, run offline against the committed Netflix fixtures and an 8-K submission."""
+import os
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from edgar.sgml import FilingSGML
+from edgar.sgml.filing_summary import FilingSummary
+from edgar.xbrl import XBRL
+from edgar.xbrl.cache import XBRLCache, get_xbrl_cache, set_xbrl_cache
+
+FIXTURE = Path("tests/fixtures/xbrl/nflx/10k_2024")
+ACCESSION = '0001065280-24-000030'
+SUBMISSION = Path("data/sgml/0000943374-24-000509.txt")
+
+
+class SubmissionFiling:
+    """Just enough of a Filing for XBRL.from_filing, backed by a full submission and counting SGML reads."""
+
+    def __init__(self):
+        self.accession_no = '0000943374-24-000509'
+        self.form = '8-K'
+        self.period_of_report = None
+        self._sgml = None
+        self.sgml_reads = 0
+
+    @property
+    def attachments(self):
+        return self.sgml().attachments
+
+    def sgml(self):
+        self.sgml_reads += 1
+        if self._sgml is None:
+            self._sgml = FilingSGML.from_source(SUBMISSION)
+        return self._sgml
+
+
+@pytest.fixture
+def xbrl_cache(tmp_path):
+    cache = XBRLCache(cache_dir=tmp_path / 'xbrl_cache')
+    set_xbrl_cache(cache)
+    yield cache
+    set_xbrl_cache(None)
+
+
+def test_from_filing_parses_once_then_loads_from_cache(xbrl_cache, xbrl_fixture_filing):
+    filing = xbrl_fixture_filing(FIXTURE, ACCESSION, date(2024, 1, 26), period_of_report='2023-12-31')
+    parsed = XBRL.from_filing(filing)
+    assert filing.attachment_reads == 1
+    assert ACCESSION in xbrl_cache
+
+    cached = XBRL.from_filing(filing)
+    assert filing.attachment_reads == 1
+    assert xbrl_cache.get_stats()['cache_hits'] == 1
+
+    assert cached.entity_name == parsed.entity_name
+    assert cached.period_of_report == parsed.period_of_report == '2023-12-31'
+    assert cached.reporting_periods == parsed.reporting_periods
+    assert len(cached._facts) == len(parsed._facts)
+    assert cached.statements.income_statement().to_dataframe().equals(
+        parsed.statements.income_statement().to_dataframe())
+
+
+def test_entries_from_another_version_are_discarded(tmp_path):
+    xbrl = XBRL.from_directory(FIXTURE)
+    XBRLCache(cache_dir=tmp_path, version='old').put(ACCESSION, xbrl)
+
+    upgraded = XBRLCache(cache_dir=tmp_path, version='new')
+    assert upgraded.get(ACCESSION) is None
+    assert ACCESSION not in upgraded
+
+
+def test_corrupt_entries_are_discarded(tmp_path):
+    cache = XBRLCache(cache_dir=tmp_path)
+    cache.put(ACCESSION, XBRL.from_directory(FIXTURE))
+    path = cache.path_for(ACCESSION)
+    path.write_bytes(path.read_bytes()[:200])
+
+    assert cache.get(ACCESSION) is None
+    assert not path.exists()
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = XBRLCache(cache_dir=tmp_path)
+    xbrl = XBRL.from_directory(FIXTURE)
+    for i, accession in enumerate(['a', 'b', 'c']):
+        cache.put(accession, xbrl)
+        os.utime(cache.path_for(accession), (1000 + i, 1000 + i))
+    # Reading 'a' makes 'b' the least recently used
+    assert cache.get('a') is not None
+
+    entry_size = cache.path_for('a').stat().st_size
+    cache.max_size_bytes = entry_size * 2
+    assert cache.evict() == 1
+    assert 'b' not in cache
+    assert 'a' in cache and 'c' in cache
+
+
+def test_put_only_scans_the_cache_when_over_the_limit(tmp_path, monkeypatch):
+    cache = XBRLCache(cache_dir=tmp_path)
+    xbrl = XBRL.from_directory(FIXTURE)
+    cache.put('a', xbrl)
+    entry_size = cache.path_for('a').stat().st_size
+    cache.max_size_bytes = entry_size * 2
+
+    scans = []
+    scan = cache._files.scan
+    monkeypatch.setattr(cache._files, 'scan', lambda: scans.append(1) or scan())
+    cache.put('b', xbrl)
+    cache.put('b', xbrl)
+    assert scans == []
+
+    cache.put('c', xbrl)
+    assert scans == [1]
+    assert 'a' not in cache
+    assert 'b' in cache and 'c' in cache
+
+
+def test_entries_removed_by_another_process_during_eviction_are_skipped(tmp_path, monkeypatch):
+    cache = XBRLCache(cache_dir=tmp_path)
+    xbrl = XBRL.from_directory(FIXTURE)
+    for i, accession in enumerate(['a', 'b', 'c']):
+        cache.put(accession, xbrl)
+        os.utime(cache.path_for(accession), (1000 + i, 1000 + i))
+    entry_size = cache.path_for('a').stat().st_size
+
+    # Another process deletes 'c' between the directory scan and the stat of its entry
+    scan = cache._files.scan
+
+    def scan_then_delete():
+        entries = scan()
+        cache.path_for('c').unlink(missing_ok=True)
+        return entries
+
+    monkeypatch.setattr(cache._files, 'scan', scan_then_delete)
+    cache.max_size_bytes = entry_size
+    assert cache.evict() == 1
+    assert 'a' not in cache and 'c' not in cache
+    assert 'b' in cache
+    assert cache._files._size == entry_size
+
+
+def test_filing_sgml_is_left_out_and_reconnected(tmp_path):
+    cache = XBRLCache(cache_dir=tmp_path)
+    xbrl = XBRL.from_directory(FIXTURE)
+    filing_sgml = FilingSGML.__new__(FilingSGML)
+    filing_summary = FilingSummary.__new__(FilingSummary)
+    filing_summary._filing_sgml = filing_sgml
+    xbrl._filing_summary = filing_summary
+    cache.put(ACCESSION, xbrl)
+
+    assert cache.get(ACCESSION)._filing_summary._filing_sgml is None
+    reconnected = object.__new__(FilingSGML)
+    assert cache.get(ACCESSION, filing_sgml=reconnected)._filing_summary._filing_sgml is reconnected
+
+
+def test_report_content_is_read_from_the_filing_on_a_cache_hit(xbrl_cache):
+    parsed = XBRL.from_filing(SubmissionFiling())
+    expected = next(report for report in parsed._filing_summary.reports if report.html_file_name).content
+    assert expected
+
+    filing = SubmissionFiling()
+    cached = XBRL.from_filing(filing)
+    assert xbrl_cache.get_stats()['cache_hits'] == 1
+    # The submission is only read once report content is wanted
+    assert filing.sgml_reads == 0
+    report = next(report for report in cached._filing_summary.reports if report.html_file_name)
+    assert report.content == expected
+    assert filing.sgml_reads == 1
+
+
+def test_cache_is_off_unless_enabled(monkeypatch, tmp_path):
+    import edgar.xbrl.cache as cache_module
+    monkeypatch.setattr(cache_module, '_global_cache_configured', False)
+    monkeypatch.delenv('EDGAR_XBRL_CACHE', raising=False)
+    assert get_xbrl_cache() is None
+
+    monkeypatch.setattr(cache_module, '_global_cache_configured', False)
+    monkeypatch.setenv('EDGAR_XBRL_CACHE', '1')
+    monkeypatch.setenv('EDGAR_LOCAL_DATA_DIR', str(tmp_path))
+    try:
+        assert get_xbrl_cache().cache_dir == tmp_path / 'xbrl_cache'
+    finally:
+        set_xbrl_cache(None)
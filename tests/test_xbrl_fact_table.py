@@ -0,0 +1,135 @@
+"""The columnar FactTable must answer every FactQuery exactly as the dict scan did.
+
+FactQuery compiles its filters to vectorized masks over FactsView.fact_table and
+converts the matching rows straight from Arrow. These tests run the same query
+both ways against one XBRL instance and require identical output.
+
+Runs offline against the committed Tesla 10-Q fixture.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from edgar.xbrl import XBRL
+from edgar.xbrl.fact_table import FactTable
+
+FIXTURE = "tests/fixtures/xbrl/tsla"
+
+QUERIES = {
+    'bare': lambda q: q,
+    'concept_regex': lambda q: q.by_concept('Revenue'),
+    'concept_exact': lambda q: q.by_concept('us-gaap_Assets', exact=True),
+    'label': lambda q: q.by_label('Total'),
+    'value_range': lambda q: q.by_value((0, 1_000_000)),
+    'value_callable': lambda q: q.by_value(lambda v: v > 1e9),
+    'period_type': lambda q: q.by_period_type('instant'),
+    'statement_type': lambda q: q.by_statement_type('IncomeStatement'),
+    'from_statement': lambda q: q.from_statement('BalanceSheet'),
+    'undimensioned': lambda q: q.by_dimension(None),
+    'dimension': lambda q: q.by_dimension('StatementBusinessSegmentsAxis'),
+    'text': lambda q: q.by_text('cash'),
+    'unit': lambda q: q.by_unit('usd'),
+    'fiscal': lambda q: q.by_fiscal_period('FY').by_fiscal_year(2023),
+    'date_range': lambda q: q.by_date_range('2022-01-01', '2024-12-31'),
+    'instant_before': lambda q: q.by_instant_date('2023-12-31', exact=False),
+    'custom_and_column': lambda q: q.by_custom(lambda f: f.get('decimals') == '-6').by_concept('Income'),
+    'limit': lambda q: q.by_concept('Assets').limit(3),
+    'with_dimensions': lambda q: q.with_dimensions().by_concept('Revenue'),
+    'exclude_contexts': lambda q: q.exclude_contexts().by_period_type('duration'),
+}
+
+
+@pytest.fixture(scope='module')
+def xbrl():
+    return XBRL.from_directory(FIXTURE)
+
+
+def _run_without_fact_table(xbrl, build):
+    facts_view = xbrl.facts
+    facts_view._fact_table, facts_view._fact_table_built = None, True
+    try:
+        query = build(facts_view.query())
+        return query.to_dataframe(), query.execute()
+    finally:
+        facts_view._fact_table_built = False
+
+
+@pytest.mark.parametrize('name', list(QUERIES))
+def test_columnar_query_matches_dict_scan(xbrl, name):
+    build = QUERIES[name]
+    query = build(xbrl.facts.query())
+    columnar_df, columnar_facts = query.to_dataframe(), query.execute()
+    assert xbrl.facts.fact_table is not None
+
+    expected_df, expected_facts = _run_without_fact_table(xbrl, build)
+
+    pd.testing.assert_frame_equal(columnar_df.reset_index(drop=True), expected_df.reset_index(drop=True))
+    assert columnar_facts == expected_facts
+
+
+def test_facts_view_dataframe_matches_dict_scan(xbrl):
+    facts_view = xbrl.facts
+    columnar = facts_view.to_dataframe()
+    facts_view._facts_df_cache = None
+    facts_view._fact_table, facts_view._fact_table_built = None, True
+    try:
+        expected = facts_view.to_dataframe()
+    finally:
+        facts_view._facts_df_cache = None
+        facts_view._fact_table_built = False
+
+    pd.testing.assert_frame_equal(columnar, expected)
+
+
+def test_fact_table_rows_line_up_with_facts(xbrl):
+    facts = xbrl.facts.get_facts()
+    fact_table = xbrl.facts.fact_table
+
+    assert len(fact_table) == len(facts)
+    assert fact_table.table.column('concept').to_pylist() == [f['concept'] for f in facts]
+
+
+def test_clear_cache_drops_the_fact_table(xbrl):
+    facts_view = xbrl.facts
+    first = facts_view.fact_table
+    facts_view.clear_cache()
+    assert facts_view.fact_table is not first
+
+
+class TestFactTable:
+
+    @pytest.fixture
+    def fact_table(self):
+        return FactTable.from_facts([
+            {'concept': 'us-gaap:Assets', 'numeric_value': 10.0, 'dim_srt_SegmentAxis': 'a:OneMember'},
+            {'concept': 'us-gaap:Revenues', 'numeric_value': None},
+            {'concept': 'us-gaap:Assets', 'numeric_value': 30.0, 'unit_ref': 'usd'},
+        ])
+
+    def test_columns_follow_first_appearance(self, fact_table):
+        assert fact_table.column_names == ['concept', 'numeric_value', 'dim_srt_SegmentAxis', 'unit_ref']
+        assert fact_table.dimension_columns == ['dim_srt_SegmentAxis']
+
+    def test_match_evaluates_once_per_distinct_value(self, fact_table):
+        calls = []
+
+        def predicate(value):
+            calls.append(value)
+            return value.endswith('Assets')
+
+        assert fact_table.match('concept', predicate).tolist() == [True, False, True]
+        assert sorted(calls) == ['us-gaap:Assets', 'us-gaap:Revenues']
+
+    def test_nulls_and_missing_columns_never_match(self, fact_table):
+        assert fact_table.match('numeric_value', lambda v: True).tolist() == [True, False, True]
+        assert not fact_table.match('no_such_column', lambda v: True).any()
+        assert fact_table.is_null('no_such_column').all()
+        assert fact_table.equals('unit_ref', None).tolist() == [True, True, False]
+
+    def test_to_pandas_drops_columns_the_rows_do_not_populate(self, fact_table):
+        df = fact_table.to_pandas(np.array([1, 2]))
+        assert list(df.columns) == ['concept', 'numeric_value', 'unit_ref']
+        assert df['concept'].tolist() == ['us-gaap:Revenues', 'us-gaap:Assets']
+
+    def test_mixed_value_types_fall_back_to_none(self):
+        assert FactTable.from_facts([{'value': 1}, {'value': 'text'}]) is None
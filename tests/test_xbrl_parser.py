@@ -54,4 +54,42 @@ def test_extract_context_typed_member():
     # The dimension value should be the text content "Lacker Bidco Limited, One stop 2"
     # not the tag "us-gaap:InvestmentIdentifierAxis.domain"
     dimension_value = context_689.dimensions['us-gaap:InvestmentIdentifierAxis']
-    assert dimension_value == "Lacker Bidco Limited, One stop 2", f"Expected 'Lacker Bidco Limited, One stop 2' but got '{dimension_value}'"
\ No newline at end of file
+    assert dimension_value == "Lacker Bidco Limited, One stop 2", f"Expected 'Lacker Bidco Limited, One stop 2' but got '{dimension_value}'"
+
+def _parse_instance(path, streaming):
+    parser = XBRLParser()
+    parser.instance_parser.parse_instance(path, streaming=streaming)
+    return parser
+
+
+@pytest.mark.parametrize("path", [
+    "data/xbrl/datafiles/gahc/Form10q_htm.xml",
+    "tests/fixtures/xbrl/unp/unp-20121231.xml",
+    "tests/fixtures/xbrl/aapl/aapl-20230930_htm.xml",
+])
+def test_streaming_instance_parse_matches_tree_parse(path):
+    tree = _parse_instance(path, streaming=False)
+    streamed = _parse_instance(path, streaming=True)
+
+    assert list(streamed.facts) == list(tree.facts)
+    assert [f.model_dump() for f in streamed.facts.values()] == [f.model_dump() for f in tree.facts.values()]
+    assert [c.model_dump() for c in streamed.contexts.values()] == [c.model_dump() for c in tree.contexts.values()]
+    assert streamed.units == tree.units
+    assert {k: f.model_dump() for k, f in streamed.footnotes.items()} == \
+           {k: f.model_dump() for k, f in tree.footnotes.items()}
+    assert streamed.entity_info == tree.entity_info
+    assert streamed.reporting_periods == tree.reporting_periods
+
+
+def test_large_instance_content_is_streamed(monkeypatch):
+    from edgar.xbrl.parsers import instance
+
+    instance_content = Path("data/xbrl/datafiles/gahc/Form10q_htm.xml").read_text()
+    monkeypatch.setattr(instance, 'STREAMING_THRESHOLD_BYTES', len(instance_content))
+    parser = XBRLParser()
+    streamed = []
+    monkeypatch.setattr(parser.instance_parser, 'parse_instance_stream',
+                        lambda source: streamed.append(source))
+
+    parser.parse_instance_content(instance_content)
+    assert len(streamed) == 1